@@ -10,9 +10,8 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'lib', 'lexer', 'afds'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'lib', 'parser'))
 
-from lexer3 import Lexer
-from parser import Parser, ParseError
-from semantic_analyzer import SemanticAnalyzer, SemanticError
+import cache_frontend
+from semantic_analyzer import SemanticError
 from interpreter import Interpreter, InterpreterError
 
 def executar_arquivo_lsd(arquivo_lsd):
@@ -46,17 +45,17 @@ def executar_arquivo_lsd(arquivo_lsd):
         # [2] Parsing
         print("\n[2] ANALISE LEXICA E SINTATICA")
         print("-" * 80)
-        lexer = Lexer(palavras_chave=["If", "Print", "End", "CalculateMean", "CalculateSum"])
-        parser = Parser(lexer)
-        ast = parser.parse(codigo)
-        print("[OK] Parsing concluido com sucesso!")
+        # lexer, parser e análise semântica, ou o resultado do cache (mesmo código fonte)
+        frontend = cache_frontend.analisar_frontend(
+            codigo, ["If", "Print", "End", "CalculateMean", "CalculateSum"])
+        ast = frontend['ast']
+        print("[OK] Parsing concluido com sucesso!" + (" (cache)" if frontend['from_cache'] else ""))
         print(f"    - Numero de statements: {len(ast.statements)}")
         
         # [3] Análise Semântica
         print("\n[3] ANALISE SEMANTICA")
         print("-" * 80)
-        analyzer = SemanticAnalyzer()
-        result = analyzer.analyze(ast)
+        result = frontend['analysis']
         
         if result['errors']:
             print("[ERRO] Erros semanticos encontrados:")
@@ -90,7 +89,7 @@ def executar_arquivo_lsd(arquivo_lsd):
         
         return True
         
-    except ParseError as e:
+    except cache_frontend.ParseError as e:
         print(f"\n[ERRO] Erro de parsing: {e.message}")
         if e.token:
             print(f"  Token: {e.token.type} ('{e.token.lexeme}') linha {e.token.line}, col {e.token.col}")
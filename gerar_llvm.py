@@ -9,9 +9,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'lib', 'lexer', 'afds'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'lib', 'parser'))
 
-from lexer3 import Lexer
-from parser import Parser, ParseError
-from semantic_analyzer import SemanticAnalyzer
+import cache_frontend
 from code_generator import CodeGenerator, CodeGeneratorError
 
 def gerar_llvm(arquivo_lsd, arquivo_saida="output.ll"):
@@ -41,16 +39,16 @@ def gerar_llvm(arquivo_lsd, arquivo_saida="output.ll"):
         # [2] Parsing
         print("\n[2] PARSING")
         print("-" * 80)
-        lexer = Lexer(palavras_chave=["If", "Print", "End", "CalculateMean", "CalculateSum"])
-        parser = Parser(lexer)
-        ast = parser.parse(codigo)
-        print("[OK] Parsing concluido!")
+        # lexer, parser e análise semântica, ou o resultado do cache (mesmo código fonte)
+        frontend = cache_frontend.analisar_frontend(
+            codigo, ["If", "Print", "End", "CalculateMean", "CalculateSum"])
+        ast = frontend['ast']
+        print("[OK] Parsing concluido!" + (" (cache)" if frontend['from_cache'] else ""))
         
         # [3] Análise Semântica
         print("\n[3] ANALISE SEMANTICA")
         print("-" * 80)
-        analyzer = SemanticAnalyzer()
-        result = analyzer.analyze(ast)
+        result = frontend['analysis']
         
         if result['errors']:
             print("[AVISO] Erros semanticos encontrados:")
@@ -78,7 +76,7 @@ def gerar_llvm(arquivo_lsd, arquivo_saida="output.ll"):
         
         return True
         
-    except ParseError as e:
+    except cache_frontend.ParseError as e:
         print(f"\n[ERRO] Erro de parsing: {e.message}")
         return False
     except CodeGeneratorError as e:
@@ -1,3 +1,58 @@
+from bisect import bisect_right
+
+# Símbolos das transições: um caractere ou uma faixa (inicio, fim) de code points,
+# inclusiva. Faixas cobrem caracteres não-ASCII (ex.: letras Unicode) sem uma
+# entrada por code point; o ASCII continua caractere a caractere.
+FAIXA_MAX = 0x10FFFF
+
+def e_faixa(simbolo):
+    return isinstance(simbolo, tuple)
+
+def chave_simbolo(simbolo):
+    """Ordem dos símbolos: caracteres primeiro, depois faixas pelo início."""
+    if isinstance(simbolo, tuple):
+        return (1, "", simbolo[0])
+    return (0, simbolo, 0)
+
+def particionar_faixas(faixas):
+    """
+    Divide faixas que podem se sobrepor em faixas disjuntas (átomos), cortando em
+    todo início e fim: cada faixa original vira uma sequência de átomos inteiros.
+    Só os trechos cobertos por alguma faixa entram. Retorna a lista em ordem.
+    """
+    eventos = {}
+    for inicio, fim in faixas:
+        eventos[inicio] = eventos.get(inicio, 0) + 1
+        eventos[fim + 1] = eventos.get(fim + 1, 0) - 1
+    atomos = []
+    cobertura = 0
+    anterior = None
+    for ponto in sorted(eventos):
+        if cobertura > 0:
+            atomos.append((anterior, ponto - 1))
+        cobertura += eventos[ponto]
+        anterior = ponto
+    return atomos
+
+def atomos_da_faixa(faixa, atomos, inicios=None):
+    """Átomos de particionar_faixas() contidos em `faixa` (inicios = [a[0] for a in atomos])."""
+    if inicios is None:
+        inicios = [a[0] for a in atomos]
+    i = bisect_right(inicios, faixa[0]) - 1
+    saida = []
+    while i < len(atomos) and atomos[i][0] <= faixa[1]:
+        if atomos[i][0] >= faixa[0]:
+            saida.append(atomos[i])
+        i += 1
+    return saida
+
+def faixa_de(o, faixas, inicios):
+    """Faixa de `faixas` (em ordem, disjuntas; inicios = seus inícios) que contém o code point o."""
+    i = bisect_right(inicios, o) - 1
+    if i >= 0 and o <= faixas[i][1]:
+        return faixas[i]
+    return None
+
 class AutomatoFinitoD:
     def __init__(self, estados, alfabeto, transicoes, inicial, finais):
         self.estados = estados
@@ -6,10 +61,36 @@ class AutomatoFinitoD:
         self.inicial = inicial
         self.finais = finais
 
+    def _faixas(self):
+        # faixas do alfabeto em ordem, para busca binária (calculado no primeiro uso)
+        faixas = self.__dict__.get("_indice_faixas")
+        if faixas is None:
+            faixas = sorted(s for s in self.alfabeto if e_faixa(s))
+            faixas = self._indice_faixas = (faixas, [f[0] for f in faixas])
+        return faixas
+
+    def simbolo(self, c):
+        """Símbolo do alfabeto que casa com o caractere c: ele mesmo ou a faixa que o contém."""
+        if c < "\x80":
+            return c
+        faixas, inicios = self._faixas()
+        faixa = faixa_de(ord(c), faixas, inicios) if faixas else None
+        return faixa if faixa is not None else c
+
+    def proximo(self, estado, c):
+        """Estado seguinte lendo o caractere c, ou None se não há transição."""
+        row = self.transicoes.get(estado)
+        if not row:
+            return None
+        dest = row.get(c)
+        if dest is None and c >= "\x80":
+            dest = row.get(self.simbolo(c))
+        return dest
+
     def aceita(self, palavra):
         estado_atual = self.inicial
         for simbolo in palavra:
-            if simbolo not in self.alfabeto or estado_atual not in self.transicoes or simbolo not in self.transicoes[estado_atual]:
+            estado_atual = self.proximo(estado_atual, simbolo)
+            if estado_atual is None:
                 return False
-            estado_atual = self.transicoes[estado_atual][simbolo]
-        return estado_atual in self.finais
\ No newline at end of file
+        return estado_atual in self.finais
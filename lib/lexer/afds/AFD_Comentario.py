@@ -1,9 +1,9 @@
-from AFD_Base import AutomatoFinitoD
+from AFD_Base import AutomatoFinitoD, FAIXA_MAX
 
 class AFD_Comentario(AutomatoFinitoD):
     def __init__(self):
         estados = ['q0', 'q1', 'q2', 'q3']
-        alfabeto = [chr(i) for i in range(32, 127)] + ['\n', '/']
+        alfabeto = [chr(i) for i in range(32, 127)] + ['\n', '/', (0xA0, FAIXA_MAX)]
         transicoes = {'q0': {}, 'q1': {}, 'q2': {}}
         transicoes['q0']['/'] = 'q1'
         transicoes['q1']['/'] = 'q2'
@@ -1,11 +1,12 @@
 from AFD_Base import AutomatoFinitoD
+from letras_unicode import LETRAS
 
 class AFD_Identificador(AutomatoFinitoD):
     def __init__(self):
         estados = ['q0', 'q1']
         alfabeto = [chr(c) for c in range(65, 91)] + \
                    [chr(c) for c in range(97, 123)] + \
-                   [str(i) for i in range(10)] + ['_']
+                   [str(i) for i in range(10)] + ['_'] + list(LETRAS)
         transicoes = {
             'q0': {},
             'q1': {}
@@ -14,6 +15,10 @@ class AFD_Identificador(AutomatoFinitoD):
         for c in [chr(i) for i in range(65, 91)] + [chr(i) for i in range(97, 123)] + ['_']:
             transicoes['q0'][c] = 'q1'
             transicoes['q1'][c] = 'q1'
+        # Letras Unicode (á, ç, ñ, ...) em faixas de code points
+        for faixa in LETRAS:
+            transicoes['q0'][faixa] = 'q1'
+            transicoes['q1'][faixa] = 'q1'
         # Dígitos só no estado q1
         for d in [str(i) for i in range(10)]:
             transicoes['q1'][d] = 'q1'
@@ -1,9 +1,10 @@
-from AFD_Base import AutomatoFinitoD
+from AFD_Base import AutomatoFinitoD, FAIXA_MAX
 
 class AFD_String(AutomatoFinitoD):
     def __init__(self):
         estados = ['q0', 'q1', 'q2']
-        alfabeto = [chr(i) for i in range(32,127) if chr(i) != '"'] + ['"']
+        # ASCII imprimível e todo caractere não-ASCII fora dos controles (a partir de U+00A0)
+        alfabeto = [chr(i) for i in range(32,127) if chr(i) != '"'] + ['"', (0xA0, FAIXA_MAX)]
         transicoes = {'q0': {}, 'q1': {}, 'q2': {}}
         transicoes['q0']['"'] = 'q1'
         for c in alfabeto:
@@ -21,7 +21,8 @@ def testar(nome, instancia, exemplos):
 afd_id = AFD_Identificador()
 testar("Identificador", afd_id, [
     "Data", "mean1", "_ok", "X_2", "var123",
-    "1Invalid", "!", "data space"
+    "1Invalid", "!", "data space",
+    "ação", "变量", "π2", "𝑥", "€uro", "x😀"
 ])
 
 # 2. Atribuição
@@ -76,5 +77,6 @@ testar("Separador", afd_sep, [
 afd_str = AFD_String()
 testar("String", afd_str, [
     '"Hello"', '"123"', '""', '"with space"',
-    '"bad\n"', '"unclosed', 'noquotes'
+    '"bad\n"', '"unclosed', 'noquotes',
+    '"ação €"', '"😀"'
 ])
\ No newline at end of file
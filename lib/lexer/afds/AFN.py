@@ -1,3 +1,8 @@
+import marshal
+import os
+import sys
+import zlib
+
 EPS = None  # símbolo para epsilon nas transições do NFA
 
 from AFD_Comentario import AFD_Comentario
@@ -8,10 +13,31 @@ from AFD_NotacaoCientifica import AFD_NotacaoCientifica
 from AFD_Operadores import AFD_Operadores
 from AFD_Separador import AFD_Separador
 from AFD_String import AFD_String
-from AFD_Base import AutomatoFinitoD
+import AFD_Base
+import dfa_compilado
+from AFD_Base import AutomatoFinitoD, atomos_da_faixa, chave_simbolo, e_faixa, particionar_faixas
 
 # --- Combinação AFDs -> AFN com mapeamento de token ---
+def _faixas_nao_ascii(afds):
+    """Faixas (e caracteres não-ASCII, como faixas de um code point) usadas nos AFDs."""
+    faixas = []
+    for afd in afds:
+        for row in afd.transicoes.values():
+            for sym in row:
+                if e_faixa(sym):
+                    faixas.append(sym)
+                elif sym is not EPS and len(sym) == 1 and sym >= "\x80":
+                    faixas.append((ord(sym), ord(sym)))
+    return faixas
+
 def combine_afds_to_nfa(afds, token_types):
+    """
+    AFN com uma transição ε do inicial global para o inicial de cada AFD.
+    Faixas de AFDs diferentes podem se sobrepor (ex.: letras no identificador e
+    qualquer caractere na string), então o não-ASCII é dividido em faixas
+    disjuntas (átomos) e cada faixa de um AFD vira as transições pelos seus
+    átomos: no AFN, assim como nos caracteres, símbolos diferentes nunca se cruzam.
+    """
     estados = set()
     alfabeto = set()
     transicoes = {}
@@ -22,6 +48,10 @@ def combine_afds_to_nfa(afds, token_types):
     estados.add(start)
     transicoes[start] = {}
 
+    atomos = particionar_faixas(_faixas_nao_ascii(afds))
+    inicios = [a[0] for a in atomos]
+    alfabeto.update(atomos)
+
     for i, (afd, ttype) in enumerate(zip(afds, token_types)):
         prefix = f"A{i}_"  # prefixo para renomear
         for s in afd.estados:
@@ -30,13 +60,19 @@ def combine_afds_to_nfa(afds, token_types):
             transicoes.setdefault(ns, {})
 
         for sym in afd.alfabeto:
-            alfabeto.add(sym)
+            if not e_faixa(sym) and sym < "\x80":
+                alfabeto.add(sym)
 
         for s, row in afd.transicoes.items():
             ns = prefix + s
             for sym, dest in row.items():
                 nd = prefix + dest
-                transicoes[ns].setdefault(sym, set()).add(nd)
+                if e_faixa(sym) or sym >= "\x80":
+                    faixa = sym if e_faixa(sym) else (ord(sym), ord(sym))
+                    for atomo in atomos_da_faixa(faixa, atomos, inicios):
+                        transicoes[ns].setdefault(atomo, set()).add(nd)
+                else:
+                    transicoes[ns].setdefault(sym, set()).add(nd)
 
         # ligação por epsilon do estado inicial global para o inicial do afd
         transicoes[start].setdefault(EPS, set()).add(prefix + afd.inicial)
@@ -82,53 +118,342 @@ def move(states, symbol, trans):
     return resultados
 
 # --- AFN -> AFD com prioridade de token ---
-def nfa_to_dfa(nfa, token_priority):
+def _bits(conjunto):
+    """Índices dos bits ligados de um bitset, em ordem crescente."""
+    while conjunto:
+        menor = conjunto & -conjunto
+        yield menor.bit_length() - 1
+        conjunto ^= menor
+
+def nfa_to_dfa(nfa, token_priority, minimizar=False):
+    """
+    Construção de subconjuntos. Os estados do AFN viram inteiros e cada conjunto
+    é um bitset (int, bit i = estado i); o fecho-ε de cada estado é calculado uma
+    vez, e as transições de cada estado do AFN ficam agrupadas por símbolo já com
+    o fecho dos destinos, então um estado do AFD só percorre os símbolos que
+    realmente saem dele. Os estados do AFD são numerados em largura, com os
+    símbolos em ordem (caracteres antes das faixas, ver chave_simbolo).
+    """
     trans = nfa["transicoes"]
-    alphabet = set(nfa["alfabeto"])
     start = nfa["inicial"]
     finals_nfa = nfa["finais"]
     token_map = nfa["token_map"]
 
-    start_closure = frozenset(epsilon_closure({start}, trans))
+    nomes = [start] + sorted(s for s in trans if s != start)
+    indice = {s: i for i, s in enumerate(nomes)}
+    fechos = []
+    for s in nomes:
+        bits = 0
+        for d in epsilon_closure({s}, trans):
+            bits |= 1 << indice[d]
+        fechos.append(bits)
+    # saidas[i] = {símbolo: bitset do fecho dos destinos}
+    saidas = []
+    for s in nomes:
+        row = {}
+        for sym, dests in trans[s].items():
+            if sym is EPS:
+                continue
+            bits = 0
+            for d in dests:
+                bits |= fechos[indice[d]]
+            row[sym] = bits
+        saidas.append(row)
+    mascara_finais = 0
+    for s in finals_nfa:
+        if s in indice:
+            mascara_finais |= 1 << indice[s]
 
+    start_closure = fechos[0]
     dfa_states_map = {start_closure: "D0"}
-    dfa_rev = {"D0": start_closure}
     dfa_trans = {}
     dfa_finals = {}  # estado -> token_type
     queue = [start_closure]
     counter = 1
 
-    while queue:
-        T = queue.pop(0)
+    for T in queue:
         T_name = dfa_states_map[T]
-        dfa_trans[T_name] = {}
+        row = dfa_trans[T_name] = {}
 
         # Se algum estado é final no NFA, define token com maior prioridade
-        final_tokens = [token_map[s] for s in T if s in finals_nfa]
-        if final_tokens:
+        finais_T = T & mascara_finais
+        if finais_T:
             # escolher token com menor valor (maior prioridade)
-            dfa_finals[T_name] = min(final_tokens, key=lambda t: token_priority[t])
+            dfa_finals[T_name] = min((token_map[nomes[i]] for i in _bits(finais_T)),
+                                     key=lambda t: token_priority[t])
 
-        for a in sorted(alphabet):
-            moved = move(T, a, trans)
-            if not moved:
-                continue
-            closure = frozenset(epsilon_closure(moved, trans))
-            if closure not in dfa_states_map:
-                dfa_states_map[closure] = f"D{counter}"
-                dfa_rev[f"D{counter}"] = closure
+        por_simbolo = {}
+        for i in _bits(T):
+            for a, dest in saidas[i].items():
+                por_simbolo[a] = por_simbolo.get(a, 0) | dest
+        for a in sorted(por_simbolo, key=chave_simbolo):
+            closure = por_simbolo[a]
+            nome = dfa_states_map.get(closure)
+            if nome is None:
+                nome = dfa_states_map[closure] = f"D{counter}"
                 counter += 1
                 queue.append(closure)
-            dfa_trans[T_name][a] = dfa_states_map[closure]
+            row[a] = nome
 
+    dfa_rev = {nome: frozenset(nomes[i] for i in _bits(T)) for T, nome in dfa_states_map.items()}
     dfa_estados = list(dfa_trans.keys())
     dfa_inicial = dfa_states_map[start_closure]
-    dfa_alfabeto = sorted(list(alphabet))
+    dfa_alfabeto = sorted(set(nfa["alfabeto"]), key=chave_simbolo)
     dfa_finais_list = sorted(list(dfa_finals.keys()))
 
     dfa = AutomatoFinitoD(dfa_estados, dfa_alfabeto, dfa_trans, dfa_inicial, dfa_finais_list)
     dfa.token_finals = dfa_finals  # guarda o tipo de token em cada estado final
 
+    if minimizar:
+        return minimize_dfa(dfa, dfa_rev)
+    return dfa, dfa_rev
+
+# --- Minimização (Hopcroft) ---
+def minimize_dfa(dfa, dfa_rev=None):
+    """
+    Minimiza o AFD pelo algoritmo de Hopcroft. A partição inicial separa os estados
+    finais pelo tipo de token (token_finals), então estados só são unidos quando
+    reconhecem exatamente as mesmas palavras com o mesmo tipo: o lexer produz os
+    mesmos tokens. Transições ausentes vão para um estado morto implícito; estados
+    equivalentes a ele (que nunca chegam a um final) são removidos.
+
+    Cada estado mínimo mantém o nome do seu primeiro representante (o inicial
+    continua D0) e, em dfa_rev, a união dos conjuntos do AFN dos estados unidos.
+    Retorna (dfa, dfa_rev); dfa.estados_antes guarda o número de estados original.
+    """
+    MORTO = None
+    # só os estados alcançáveis a partir do inicial
+    estados = [dfa.inicial]
+    vistos = {dfa.inicial}
+    for s in estados:
+        for dest in dfa.transicoes.get(s, {}).values():
+            if dest not in vistos:
+                vistos.add(dest)
+                estados.append(dest)
+    estados_antes = len(dfa.estados)
+    todos = estados + [MORTO]
+    alfabeto = sorted(dfa.alfabeto, key=chave_simbolo)
+    finais = set(dfa.finais)
+    token_finals = getattr(dfa, "token_finals", {})
+
+    # símbolos com a mesma coluna (mesmo destino em todo estado) dividem os blocos
+    # do mesmo jeito: basta um representante de cada (com faixas Unicode, os
+    # milhares de átomos viram poucas colunas)
+    rows = [dfa.transicoes.get(s, {}) for s in estados]
+    colunas = {}
+    for a in alfabeto:
+        colunas.setdefault(tuple(row.get(a, MORTO) for row in rows), a)
+    representantes = list(colunas.values())
+
+    # predecessores: pred[a][t] = estados que vão para t lendo a
+    pred = {a: {} for a in representantes}
+    for s, row in zip(estados, rows):
+        for a in representantes:
+            pred[a].setdefault(row.get(a, MORTO), set()).add(s)
+    for a in representantes:
+        pred[a].setdefault(MORTO, set()).add(MORTO)
+
+    # partição inicial: não finais + um bloco por tipo de token
+    grupos = {}
+    for s in todos:
+        grupos.setdefault(token_finals.get(s, "UNKNOWN") if s in finais else None, set()).add(s)
+    blocos = list(grupos.values())
+    bloco_de = {s: i for i, b in enumerate(blocos) for s in b}
+    pendentes = set(range(len(blocos)))
+
+    while pendentes:
+        divisor = set(blocos[pendentes.pop()])
+        for a in representantes:
+            pa = pred[a]
+            afetados = {}
+            for t in divisor:
+                for s in pa.get(t, ()):
+                    afetados.setdefault(bloco_de[s], set()).add(s)
+            for y, parte in afetados.items():
+                resto = blocos[y]
+                if len(parte) == len(resto):
+                    continue
+                resto -= parte
+                novo = len(blocos)
+                blocos.append(parte)
+                for s in parte:
+                    bloco_de[s] = novo
+                if y in pendentes or len(parte) <= len(resto):
+                    pendentes.add(novo)
+                else:
+                    pendentes.add(y)
+
+    # monta o AFD mínimo (sem o bloco do estado morto)
+    morto = bloco_de[MORTO]
+    ordem = {s: i for i, s in enumerate(estados)}
+    nomes = {}
+    for i, b in enumerate(blocos):
+        if i != morto:
+            nomes[i] = min((s for s in b), key=ordem.__getitem__)
+    if bloco_de[dfa.inicial] == morto:
+        # linguagem vazia: sobra só o inicial, sem transições
+        morto = len(blocos)
+        bloco_de = {dfa.inicial: 0}
+        blocos = [{dfa.inicial}]
+        nomes = {0: dfa.inicial}
+
+    inicial = nomes[bloco_de[dfa.inicial]]
+    novos_estados = [inicial] + sorted((n for n in nomes.values() if n != inicial), key=ordem.__getitem__)
+    transicoes = {}
+    for nome in novos_estados:
+        row = {}
+        for a, dest in dfa.transicoes.get(nome, {}).items():
+            b = bloco_de.get(dest, morto)
+            if b != morto:
+                row[a] = nomes[b]
+        transicoes[nome] = row
+    novos_finais = sorted(n for n in novos_estados if n in finais)
+    novo_dfa = AutomatoFinitoD(novos_estados, list(alfabeto), transicoes, inicial, novos_finais)
+    novo_dfa.token_finals = {n: token_finals[n] for n in novos_finais if n in token_finals}
+    novo_dfa.estados_antes = estados_antes
+
+    novo_rev = None
+    if dfa_rev is not None:
+        novo_rev = {}
+        for i, nome in nomes.items():
+            novo_rev[nome] = frozenset().union(*(dfa_rev.get(s, ()) for s in blocos[i] if s is not MORTO))
+    return novo_dfa, novo_rev
+
+# --- Cache em disco do AFD combinado ---
+# Versão do formato do arquivo de cache; incrementar ao mudar o conteúdo salvo.
+DFA_CACHE_VERSION = 3
+DFA_CACHE_DIR = os.environ.get("LSD_DFA_CACHE_DIR") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "__pycache__")
+DFA_CACHE_PREFIX = "lsd_dfa"
+
+def dfa_cache_key(afds, token_types, token_priority, minimizar=True):
+    """
+    Chave do cache: definições dos AFDs, tipos/prioridades de token e o próprio
+    código de construção (este arquivo, AFD_Base.py e dfa_compilado.py). Qualquer mudança em um AFD_*.py
+    altera a chave e força a reconstrução do AFD.
+
+    A chave completa é guardada no arquivo e comparada na leitura, então o
+    crc32 usado no nome do arquivo não precisa ser resistente a colisões
+    (e evita o custo de importar hashlib/json a cada execução). A chave é o
+    marshal (versão 2, sem referências: os mesmos bytes em toda execução) das
+    definições na ordem em que o AFD as declara — com as faixas de letras
+    Unicode são milhares de símbolos, e ordenar ou usar repr custaria mais que
+    ler o cache.
+    """
+    definicoes = []
+    for afd in afds:
+        definicoes.append((
+            list(afd.estados),
+            list(afd.alfabeto),
+            [(s, list(row.items())) for s, row in afd.transicoes.items()],
+            afd.inicial,
+            sorted(afd.finais),
+        ))
+    fontes = []
+    # construção, particionamento das faixas e formato da tabela compilada
+    for modulo in (__file__, AFD_Base.__file__, dfa_compilado.__file__):
+        with open(os.path.abspath(modulo), "rb") as f:
+            fontes.append(f.read())
+    return marshal.dumps((DFA_CACHE_VERSION, definicoes, list(token_types), sorted(token_priority.items()),
+                          bool(minimizar), fontes), 2)
+
+def _dfa_cache_path(chave):
+    # marshal não é portável entre versões do Python: a tag entra no nome, como nos .pyc
+    tag = sys.implementation.cache_tag or "py"
+    crc = zlib.crc32(chave)
+    return os.path.join(DFA_CACHE_DIR, f"{DFA_CACHE_PREFIX}.{tag}.v{DFA_CACHE_VERSION}.{crc:08x}.bin")
+
+def _load_dfa_cache(caminho, chave):
+    try:
+        with open(caminho, "rb") as f:
+            dados = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(dados, dict) or dados.get("versao") != DFA_CACHE_VERSION or dados.get("chave") != chave:
+        return None
+
+    dfa = AutomatoFinitoD(dados["estados"], dados["alfabeto"], dados["transicoes"],
+                          dados["inicial"], dados["finais"])
+    dfa.token_finals = dados["token_finals"]
+    dfa.estados_antes = dados["estados_antes"]
+    if dados["compilado"] is not None:
+        # tabela do Lexer já pronta (compile_dfa devolve a que está no AFD)
+        dfa._compilado = dfa_compilado.CompiledDFA.de_campos(dados["compilado"])
+    return dfa, dados["dfa_rev"]
+
+def _store_dfa_cache(caminho, chave, dfa, dfa_rev):
+    try:
+        compilado = dfa_compilado.compile_dfa(dfa).campos()
+    except ValueError:
+        compilado = None
+    dados = {
+        "versao": DFA_CACHE_VERSION,
+        "chave": chave,
+        "estados": dfa.estados,
+        "alfabeto": dfa.alfabeto,
+        "transicoes": dfa.transicoes,
+        "inicial": dfa.inicial,
+        "finais": dfa.finais,
+        "token_finals": dfa.token_finals,
+        "estados_antes": dfa.estados_antes,
+        "dfa_rev": dfa_rev,
+        "compilado": compilado,
+    }
+    # grava em arquivo temporário e renomeia: outro processo nunca lê um cache pela metade
+    tmp = f"{caminho}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(marshal.dumps(dados))
+        os.replace(tmp, caminho)
+    except (OSError, ValueError):
+        # diretório somente leitura etc.: o cache é só uma otimização
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return
+
+    # remove caches antigos (AFDs ou versão diferentes) desta versão do Python
+    nome_atual = os.path.basename(caminho)
+    prefixo = nome_atual[:nome_atual.index(f".v{DFA_CACHE_VERSION}.")]
+    try:
+        for nome in os.listdir(DFA_CACHE_DIR):
+            if nome.startswith(prefixo + ".v") and nome.endswith(".bin") and nome != nome_atual:
+                try:
+                    os.remove(os.path.join(DFA_CACHE_DIR, nome))
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+def build_dfa(afds, token_types, token_priority, usar_cache=None, minimizar=True):
+    """
+    Constrói o AFD combinado (AFDs -> AFN -> AFD), reutilizando o cache em disco
+    quando as definições não mudaram. Retorna (dfa, dfa_rev) como nfa_to_dfa.
+    Com minimizar=True (padrão) o AFD passa por minimize_dfa; dfa.estados_antes
+    guarda o número de estados antes da minimização.
+    O cache pode ser desligado com LSD_DFA_CACHE=0.
+    """
+    if usar_cache is None:
+        usar_cache = os.environ.get("LSD_DFA_CACHE", "1") != "0"
+
+    chave = caminho = None
+    if usar_cache:
+        chave = dfa_cache_key(afds, token_types, token_priority, minimizar)
+        caminho = _dfa_cache_path(chave)
+        resultado = _load_dfa_cache(caminho, chave)
+        if resultado is not None:
+            resultado[0].from_cache = True
+            return resultado
+
+    nfa = combine_afds_to_nfa(afds, token_types)
+    dfa, dfa_rev = nfa_to_dfa(nfa, token_priority, minimizar)
+    if not minimizar:
+        dfa.estados_antes = len(dfa.estados)
+    dfa.from_cache = False
+    if usar_cache:
+        _store_dfa_cache(caminho, chave, dfa, dfa_rev)
     return dfa, dfa_rev
 
 # --- Execução ---
@@ -165,8 +490,18 @@ token_priority = {
     "SEPARADOR": 8,
 }
 
-nfa = combine_afds_to_nfa(afds, token_types)
-dfa, dfa_rev = nfa_to_dfa(nfa, token_priority)
+def __getattr__(nome):
+    # dfa/dfa_rev são construídos (ou lidos do cache) no primeiro acesso, não no
+    # import: quem usa só o AFD preguiçoso (dfa_preguicoso.py) não paga por eles
+    if nome in ("dfa", "dfa_rev"):
+        global dfa, dfa_rev
+        dfa, dfa_rev = build_dfa(afds, token_types, token_priority)
+        return globals()[nome]
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+if __name__ == "__main__":
+    dfa, dfa_rev = build_dfa(afds, token_types, token_priority)
+    print("AFD combinado gerado com sucesso!" + (" (cache)" if dfa.from_cache else ""))
+    print("AFD possui:", len(dfa.estados), "estados,", len(dfa.finais), "estados finais",
+          f"({dfa.estados_antes} antes da minimização)")
 
-print("AFD combinado gerado com sucesso!")
-print("AFD possui:", len(dfa.estados), "estados,", len(dfa.finais), "estados finais")
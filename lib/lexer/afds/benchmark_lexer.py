@@ -0,0 +1,763 @@
+"""
+Benchmarks do analisador léxico LSD.
+
+Uso:
+    python benchmark_lexer.py              # roda todos os cenários
+    python benchmark_lexer.py startup      # roda só o cenário indicado
+"""
+
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+AQUI = os.path.dirname(os.path.abspath(__file__))
+
+
+def _tempo_processo(codigo, env, repeticoes):
+    """Menor tempo de parede (em ms) de `python -c codigo` — o mínimo é o menos ruidoso."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, "-c", codigo], cwd=AQUI, env=env, check=True,
+                       stdout=subprocess.DEVNULL)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return min(tempos)
+
+
+def bench_startup(repeticoes=15):
+    """Tempo de `import lexer3` + Lexer() com o cache do AFD frio (vazio) e quente."""
+    print("== startup: import lexer3 + Lexer() ==")
+    # o AFD combinado é construído (ou lido do cache) no primeiro Lexer(), não no import
+    codigo = "from lexer3 import Lexer; Lexer()"
+    cache_dir = tempfile.mkdtemp(prefix="lsd_dfa_cache_")
+    try:
+        env = dict(os.environ, LSD_DFA_CACHE_DIR=cache_dir)
+
+        base = _tempo_processo("pass", env, repeticoes)
+
+        frio = []
+        for _ in range(repeticoes):
+            for nome in os.listdir(cache_dir):
+                os.remove(os.path.join(cache_dir, nome))
+            frio.append(_tempo_processo(codigo, env, 1))
+        frio = min(frio)
+
+        # a última execução fria deixou o cache pronto
+        quente = _tempo_processo(codigo, env, repeticoes)
+
+        sem_cache = _tempo_processo(codigo, dict(env, LSD_DFA_CACHE="0"), repeticoes)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    print(f"  interpretador vazio : {base:8.1f} ms")
+    print(f"  sem cache           : {sem_cache:8.1f} ms  (lexer {sem_cache - base:6.1f} ms)")
+    print(f"  cache frio          : {frio:8.1f} ms  (lexer {frio - base:6.1f} ms)")
+    print(f"  cache quente        : {quente:8.1f} ms  (lexer {quente - base:6.1f} ms)")
+
+    # mesmo custo medido dentro do processo, sem o ruído de subir o interpretador
+    import AFN
+    construir, carregar = [], []
+    chave = AFN.dfa_cache_key(AFN.afds, AFN.token_types, AFN.token_priority)
+    caminho = AFN._dfa_cache_path(chave)
+    AFN.build_dfa(AFN.afds, AFN.token_types, AFN.token_priority)
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        AFN.build_dfa(AFN.afds, AFN.token_types, AFN.token_priority, usar_cache=False)
+        construir.append((time.perf_counter() - inicio) * 1000)
+        inicio = time.perf_counter()
+        AFN._load_dfa_cache(caminho, AFN.dfa_cache_key(AFN.afds, AFN.token_types, AFN.token_priority))
+        carregar.append((time.perf_counter() - inicio) * 1000)
+    print(f"  construção do AFD   : {statistics.median(construir):8.2f} ms")
+    print(f"  chave + leitura     : {statistics.median(carregar):8.2f} ms")
+
+
+def gerar_corpus(linhas, semente=42, cientifica=True, unicode=False):
+    """
+    Programa LSD sintético com `linhas` linhas (atribuições, If/End, Print, comentários).
+    Com cientifica=False não gera literais em notação científica (que o Parser não aceita);
+    com unicode=True os identificadores, strings e comentários têm letras não-ASCII.
+    """
+    rnd = random.Random(semente)
+    nomes = [f"var_{i}" for i in range(50)] + ["nota", "media", "soma", "Total", "x1", "_tmp"]
+    if unicode:
+        nomes = [f"{p}_{i}" for i, p in enumerate(["变量", "média", "ação", "π", "Σx", "𝑥"] * 8)]
+    ops = ["+", "-", "*", "/"]
+    rels = [">", "<", ">=", "<=", "==", "!="]
+
+    def termo():
+        r = rnd.random()
+        if r < 0.4:
+            return rnd.choice(nomes)
+        if r < 0.65:
+            return str(rnd.randint(1, 99999))
+        if r < 0.85 or not cientifica:
+            return f"{rnd.randint(1, 999)}.{rnd.randint(0, 99)}"
+        return f"{rnd.randint(1, 9)}.{rnd.randint(0, 9)}e-{rnd.randint(1, 9)}"
+
+    def expressao():
+        partes = [termo()]
+        for _ in range(rnd.randint(0, 4)):
+            partes.append(rnd.choice(ops))
+            partes.append(termo())
+        if rnd.random() < 0.2:
+            return "(" + " ".join(partes) + ")"
+        return " ".join(partes)
+
+    saida = []
+    abertos = 0
+    while len(saida) + abertos < linhas:
+        r = rnd.random()
+        if r < 0.55:
+            linha = f"{rnd.choice(nomes)} = {expressao()}"
+        elif r < 0.7:
+            linha = f'Print "texto da linha {len(saida)} com alguns caracteres!"'
+            if unicode:
+                linha = f'Print "linha {len(saida)}: ação é €5 — 数据 😀"'
+        elif r < 0.8:
+            linha = f"Print {expressao()}"
+        elif r < 0.88 and abertos < 5 and len(saida) + abertos + 2 < linhas:
+            linha = f"If {expressao()} {rnd.choice(rels)} {termo()}"
+            abertos += 1
+        elif r < 0.94 and abertos:
+            linha = "End"
+            abertos -= 1
+        else:
+            linha = f"// comentario numero {len(saida)} sobre o calculo"
+            if unicode:
+                linha = f"// comentário nº {len(saida)} sobre o cálculo"
+        if rnd.random() < 0.1:
+            linha += "  // fim de linha"
+        saida.append(linha)
+    saida.extend(["End"] * abertos)
+    return "\n".join(saida) + "\n"
+
+
+def _campos(token):
+    return token.type, token.lexeme, token.line, token.col
+
+
+def _melhor_tempo(funcao, repeticoes):
+    melhor = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempo = time.perf_counter() - inicio
+        melhor = tempo if melhor is None else min(melhor, tempo)
+    return melhor
+
+
+def bench_tabela(linhas=50000, repeticoes=5):
+    """Vazão de Lexer.tokenize: AFD de dicionários vs tabela compilada."""
+    from lexer3 import Lexer
+    print(f"== tabela: tokenize em corpus de {linhas} linhas ==")
+    texto = gerar_corpus(linhas)
+    resultados = {}
+    for nome, usar_tabela in (("dicionario", False), ("tabela", True)):
+        lexer = Lexer(usar_tabela=usar_tabela)
+        tokens, _ = lexer.tokenize(texto)
+        resultados[nome] = _melhor_tempo(lambda: lexer.tokenize(texto), repeticoes)
+        mb_s = len(texto) / resultados[nome] / 1e6
+        print(f"  {nome:10}: {resultados[nome] * 1000:8.1f} ms  {mb_s:6.2f} MB/s  {len(tokens) / resultados[nome]:10.0f} tokens/s")
+    print(f"  ganho     : {resultados['dicionario'] / resultados['tabela']:.2f}x  ({len(texto)} caracteres)")
+
+
+def bench_linhas(tamanhos=(1000, 10000, 100000, 1000000)):
+    """
+    Escalabilidade com o número de linhas: o tempo por linha deve ficar constante.
+    Usa next_token descartando os tokens, para o caso de 1M de linhas caber em memória.
+    """
+    from lexer3 import Lexer, InputBuffer
+    print("== linhas: next_token até EOF (linha/coluna incluídas) ==")
+    lexer = Lexer()
+    base = gerar_corpus(10000)
+    for linhas in tamanhos:
+        texto = base * (linhas // 10000) + "\n".join(base.split("\n")[:linhas % 10000])
+        def varrer():
+            buffer = InputBuffer(texto)
+            next_token = lexer.next_token
+            while True:
+                tok, err = next_token(buffer)
+                if err is None and tok.type == "EOF":
+                    return
+        tempo = _melhor_tempo(varrer, 3 if linhas < 1000000 else 1)
+        print(f"  {linhas:>8} linhas: {tempo * 1000:10.1f} ms  {tempo / linhas * 1e6:6.2f} us/linha")
+
+
+_CODIGO_STREAM = """
+import resource, sys, time
+from lexer3 import Lexer
+
+def pico_kb():
+    # VmHWM é do próprio processo; ru_maxrss no Linux herda o pico do pai antes do exec
+    try:
+        with open("/proc/self/status") as status:
+            for linha in status:
+                if linha.startswith("VmHWM:"):
+                    return int(linha.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+lexer = Lexer()
+inicio = time.perf_counter()
+with open(sys.argv[1], encoding="utf-8") as f:
+    if sys.argv[2] == "stream":
+        n = sum(1 for _ in lexer.iter_tokens(f, chunk_size=int(sys.argv[3])))
+    else:
+        n = len(lexer.tokenize(f.read())[0])
+tempo = time.perf_counter() - inicio
+print(n, tempo, pico_kb())
+"""
+
+
+def bench_stream(linhas=500000, chunk_size=1 << 16):
+    """
+    Lexer.iter_tokens (arquivo lido em blocos) vs tokenize(f.read()): tempo e pico
+    de memória (RSS) de um processo novo para cada modo, no mesmo arquivo.
+    """
+    print(f"== stream: iter_tokens vs tokenize em arquivo de {linhas} linhas ==")
+    from lexer3 import Lexer
+    import io
+    # mesma saída, inclusive com blocos pequenos que cortam tokens no meio
+    lexer = Lexer()
+    amostra = gerar_corpus(2000)
+    esperado = [(t.type, t.lexeme, t.line, t.col) for t in lexer.tokenize(amostra)[0]]
+    for tamanho in (1, 7, 100, 4096):
+        obtido = [(t.type, t.lexeme, t.line, t.col)
+                  for t in lexer.iter_tokens(io.StringIO(amostra), chunk_size=tamanho)]
+        assert obtido == esperado, f"iter_tokens difere de tokenize com chunk_size={tamanho}"
+
+    fd, caminho = tempfile.mkstemp(suffix=".lsd")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(gerar_corpus(linhas))
+        tamanho_mb = os.path.getsize(caminho) / 1e6
+        for modo in ("tokenize", "stream"):
+            saida = subprocess.run([sys.executable, "-c", _CODIGO_STREAM, caminho, modo, str(chunk_size)],
+                                   cwd=AQUI, check=True, capture_output=True, text=True).stdout
+            n, tempo, rss = saida.split()
+            print(f"  {modo:8}: {float(tempo) * 1000:9.1f} ms  pico RSS {int(rss) / 1024:8.1f} MB  ({n} tokens, arquivo {tamanho_mb:.1f} MB)")
+    finally:
+        os.remove(caminho)
+
+
+_CODIGO_MMAP = """
+import sys, time, tracemalloc
+from lexer3 import Lexer, InputBuffer, MmapBuffer
+lexer = Lexer()
+
+def varrer():
+    if sys.argv[2] == "mmap":
+        buffer = MmapBuffer(sys.argv[1])
+    else:
+        with open(sys.argv[1], encoding="utf-8") as f:
+            buffer = InputBuffer(f.read())
+    next_token = lexer.next_token
+    n = 0
+    while True:
+        tok, err = next_token(buffer)
+        n += 1
+        if err is None and tok.type == "EOF":
+            return n
+
+inicio = time.perf_counter()
+n = varrer()
+tempo = time.perf_counter() - inicio
+pico = 0
+with open("/proc/self/status") as status:
+    for linha in status:
+        if linha.startswith("VmHWM:"):
+            pico = int(linha.split()[1])
+tracemalloc.start()
+varrer()
+print(n, tempo, pico, tracemalloc.get_traced_memory()[1])
+"""
+
+
+def bench_mmap(linhas=200000):
+    """
+    MmapBuffer vs InputBuffer(f.read()) num laço de next_token que descarta os tokens.
+    Mostra o pico de RSS (VmHWM, inclui as páginas do arquivo mapeadas, que são cache
+    de disco descartável) e o pico de memória alocada pelo Python (tracemalloc).
+    """
+    print(f"== mmap: next_token em MmapBuffer vs str, arquivo de {linhas} linhas ==")
+    if not os.path.exists("/proc/self/status"):
+        print("  (requer /proc/self/status — Linux)")
+        return
+    from lexer3 import Lexer, MmapBuffer
+    fd, caminho = tempfile.mkstemp(suffix=".lsd")
+    try:
+        # mesmos tokens e erros, inclusive com caracteres não-ASCII
+        amostra = gerar_corpus(2000) + 'Print "ação" $ é\n'
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(amostra)
+        lexer = Lexer()
+        esperado = lexer.tokenize(amostra)
+        with MmapBuffer(caminho) as buffer:
+            obtido = lexer.tokenize(buffer)
+        assert [_campos(t) for t in obtido[0]] == [_campos(t) for t in esperado[0]], "tokens diferentes"
+        assert obtido[1] == esperado[1], "erros diferentes"
+
+        with open(caminho, "w", encoding="utf-8") as f:
+            f.write(gerar_corpus(linhas))
+        tamanho_mb = os.path.getsize(caminho) / 1e6
+        for modo in ("str", "mmap"):
+            saida = subprocess.run([sys.executable, "-c", _CODIGO_MMAP, caminho, modo],
+                                   cwd=AQUI, check=True, capture_output=True, text=True).stdout
+            n, tempo, rss, alocado = saida.split()
+            print(f"  {modo:5}: {float(tempo) * 1000:9.1f} ms  pico RSS {int(rss) / 1024:7.1f} MB  "
+                  f"pico alocado {int(alocado) / 1e6:7.1f} MB  ({n} tokens, arquivo {tamanho_mb:.1f} MB)")
+    finally:
+        os.remove(caminho)
+
+
+def afd_palavra(palavra):
+    """AFD que aceita só `palavra` (estados p0..pN)."""
+    from AFD_Base import AutomatoFinitoD
+    estados = [f"p{i}" for i in range(len(palavra) + 1)]
+    transicoes = {estados[i]: {c: estados[i + 1]} for i, c in enumerate(palavra)}
+    transicoes[estados[-1]] = {}
+    return AutomatoFinitoD(estados, sorted(set(palavra)), transicoes, estados[0], [estados[-1]])
+
+
+def bench_minimizacao(repeticoes=5):
+    """
+    Número de estados do AFD combinado antes/depois de minimize_dfa e custo da
+    construção. Além do AFD da LSD, mede um caso com redundância: um AFD por
+    palavra-chave, com tipo IDENTIFICADOR, somado aos AFDs da LSD.
+    """
+    import AFN
+    from lexer3 import Lexer
+    print("== minimizacao: estados do AFD combinado ==")
+    palavras = ["If", "Print", "End", "CalculateMean", "CalculateSum"]
+    casos = [
+        ("LSD", AFN.afds, AFN.token_types),
+        ("LSD + palavras-chave", AFN.afds + [afd_palavra(p) for p in palavras],
+         AFN.token_types + ["IDENTIFICADOR"] * len(palavras)),
+    ]
+    texto = gerar_corpus(5000)
+    for nome, afds, tipos in casos:
+        resultado = {}
+        for minimizar in (False, True):
+            tempo = _melhor_tempo(lambda: AFN.build_dfa(afds, tipos, AFN.token_priority,
+                                                        usar_cache=False, minimizar=minimizar), repeticoes)
+            dfa, _ = AFN.build_dfa(afds, tipos, AFN.token_priority, usar_cache=False, minimizar=minimizar)
+            tokens, erros = Lexer(dfa_obj=dfa).tokenize(texto)
+            resultado[minimizar] = [_campos(t) for t in tokens], erros
+            print(f"  {nome:22} {'minimizado' if minimizar else 'original':10}: {len(dfa.estados):4} estados "
+                  f"({len(dfa.finais)} finais)  construção {tempo * 1000:7.2f} ms")
+        assert resultado[False] == resultado[True], "tokens diferentes com o AFD minimizado"
+
+
+def bench_subconjuntos(quantidades=(25, 50, 100, 200), repeticoes=5):
+    """
+    Custo da construção de subconjuntos (nfa_to_dfa) num conjunto grande de
+    tokens sintético: os AFDs da LSD mais N AFDs de palavra-chave (tipo
+    IDENTIFICADOR, palavras aleatórias de 1 a 9 letras).
+    """
+    import AFN
+    print("== subconjuntos: nfa_to_dfa com N AFDs de palavra-chave ==")
+    rnd = random.Random(7)
+    sorteadas = set()
+    while len(sorteadas) < max(quantidades):
+        sorteadas.add("".join(rnd.choice("abcdeLMNxyz_") for _ in range(rnd.randint(1, 9))))
+    sorteadas = sorted(sorteadas)
+    rnd.shuffle(sorteadas)
+    for n in quantidades:
+        afds = AFN.afds + [afd_palavra(p) for p in sorteadas[:n]]
+        tipos = AFN.token_types + ["IDENTIFICADOR"] * n
+        nfa = AFN.combine_afds_to_nfa(afds, tipos)
+        dfa, _ = AFN.nfa_to_dfa(nfa, AFN.token_priority)
+        conversao = _melhor_tempo(lambda: AFN.nfa_to_dfa(nfa, AFN.token_priority), repeticoes)
+        completa = _melhor_tempo(lambda: AFN.build_dfa(afds, tipos, AFN.token_priority, usar_cache=False),
+                                 repeticoes)
+        print(f"  {n:4} palavras: AFN {len(nfa['estados']):5} estados -> AFD {len(dfa.estados):5} estados  "
+              f"nfa_to_dfa {conversao * 1000:8.2f} ms  build_dfa (com minimização) {completa * 1000:8.2f} ms")
+
+
+def bench_scanner(linhas=50000, repeticoes=5):
+    """Vazão de Lexer.tokenize: tabela compilada vs scanner gerado (gerar_scanner.py)."""
+    import AFN
+    from gerar_scanner import carregar_scanner, escrever_scanner
+    from lexer3 import Lexer
+    print(f"== scanner: tokenize em corpus de {linhas} linhas ==")
+    fd, caminho = tempfile.mkstemp(suffix=".py")
+    os.close(fd)
+    try:
+        escrever_scanner(AFN.dfa, caminho)
+        scanner = carregar_scanner(caminho)
+    finally:
+        os.remove(caminho)
+
+    texto = gerar_corpus(linhas)
+    resultados = {}
+    saidas = {}
+    for nome, lexer in (("tabela", Lexer()), ("scanner", Lexer(scanner=scanner))):
+        tokens, erros = lexer.tokenize(texto)
+        saidas[nome] = [_campos(t) for t in tokens], erros
+        resultados[nome] = _melhor_tempo(lambda: lexer.tokenize(texto), repeticoes)
+        mb_s = len(texto) / resultados[nome] / 1e6
+        print(f"  {nome:8}: {resultados[nome] * 1000:8.1f} ms  {mb_s:6.2f} MB/s  {len(tokens) / resultados[nome]:10.0f} tokens/s")
+    assert saidas["tabela"] == saidas["scanner"], "scanner e tabela produziram tokens diferentes"
+    print(f"  ganho   : {resultados['tabela'] / resultados['scanner']:.2f}x  ({len(texto)} caracteres)")
+
+
+def bench_tokens(linhas=100000, repeticoes=3):
+    """
+    Memória retida pelos tokens de um corpus: lista de Token como era antes
+    (objeto com __dict__), lista de Token com __slots__ e TokenStream (colunas).
+    """
+    import gc
+    import tracemalloc
+    from lexer3 import Lexer
+    print(f"== tokens: memória e tempo para {linhas} linhas ==")
+
+    class TokenComDict:
+        def __init__(self, tipo, lexema, linha, coluna):
+            self.type = tipo
+            self.lexeme = lexema
+            self.line = linha
+            self.col = coluna
+
+    lexer = Lexer()
+    texto = gerar_corpus(linhas)
+
+    def lista_dict():
+        return [TokenComDict(t.type, t.lexeme, t.line, t.col) for t in lexer.tokenize(texto)[0]]
+
+    def lista_slots():
+        return lexer.tokenize(texto)[0]
+
+    def stream():
+        return lexer.tokenize_stream(texto)[0]
+
+    stream_tokens = [_campos(t) for t in stream()]
+    assert stream_tokens == [_campos(t) for t in lista_slots()], "TokenStream difere de tokenize"
+
+    for nome, funcao in (("Token com __dict__", lista_dict), ("Token com __slots__", lista_slots),
+                         ("TokenStream", stream)):
+        gc.collect()
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        resultado = funcao()
+        retido = tracemalloc.get_traced_memory()[0] - base
+        tracemalloc.stop()
+        del resultado
+        tempo = _melhor_tempo(funcao, repeticoes) if funcao is not lista_dict else None
+        extra = f"  tokenização {tempo * 1000:8.1f} ms" if tempo else ""
+        print(f"  {nome:20}: {retido / 1e6:7.1f} MB retidos  ({retido / len(stream_tokens):5.1f} B/token){extra}")
+    print(f"  texto fonte         : {len(texto) / 1e6:7.1f} MB  ({len(stream_tokens)} tokens)")
+
+
+def bench_paralelo(linhas=200000, repeticoes=3):
+    """
+    Lexer.tokenize_parallel com 1, 2, 4, ... processos (até os núcleos da máquina,
+    no mínimo 2) vs tokenize sequencial, com o pool já criado.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from lexer3 import Lexer
+    nucleos = os.cpu_count() or 1
+    print(f"== paralelo: tokenize_parallel em corpus de {linhas} linhas ({nucleos} núcleos) ==")
+    texto = gerar_corpus(linhas)
+    lexer = Lexer()
+    tokens, erros = lexer.tokenize(texto)
+    sequencial = _melhor_tempo(lambda: lexer.tokenize(texto), repeticoes)
+    print(f"  sequencial : {sequencial * 1000:8.1f} ms  {len(tokens) / sequencial:10.0f} tokens/s")
+
+    workers = 1
+    while True:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            def paralelo():
+                return lexer.tokenize_parallel(texto, workers=workers, executor=executor,
+                                               trecho_minimo=1)
+            obtido = paralelo()
+            assert [_campos(t) for t in obtido[0]] == [_campos(t) for t in tokens] and obtido[1] == erros, \
+                "tokenize_parallel difere de tokenize"
+            tempo = _melhor_tempo(paralelo, repeticoes)
+        print(f"  {workers:2} processo(s): {tempo * 1000:8.1f} ms  speedup {sequencial / tempo:5.2f}x")
+        if workers >= max(2, nucleos):
+            break
+        workers *= 2
+
+
+def bench_relex(linhas=100000, edicoes=200):
+    """
+    Latência de Lexer.relex para edições de um caractere (inserir, apagar, trocar,
+    em posições aleatórias e digitando em sequência) vs tokenize_stream do texto inteiro.
+    """
+    from lexer3 import Lexer
+    print(f"== relex: edições de um caractere em corpus de {linhas} linhas ==")
+    rnd = random.Random(7)
+    texto = gerar_corpus(linhas)
+    lexer = Lexer()
+    stream, _ = lexer.tokenize_stream(texto)
+    completo = _melhor_tempo(lambda: lexer.tokenize_stream(texto), 2)
+    print(f"  tokenize_stream : {completo * 1000:8.1f} ms  ({len(stream)} tokens)")
+
+    def medir(nome, gerar_edicao):
+        nonlocal texto, stream
+        tempos = []
+        for _ in range(edicoes):
+            inicio, fim, novo = gerar_edicao()
+            t0 = time.perf_counter()
+            stream, _ = lexer.relex(stream, (inicio, fim), novo)
+            tempos.append(time.perf_counter() - t0)
+            texto = texto[:inicio] + novo + texto[fim:]
+        tempos.sort()
+        mediana = tempos[len(tempos) // 2]
+        print(f"  {nome:16}: mediana {mediana * 1000:6.2f} ms  p95 {tempos[int(len(tempos) * 0.95)] * 1000:6.2f} ms"
+              f"  máx {tempos[-1] * 1000:6.2f} ms  ({completo / mediana:5.0f}x mais rápido)")
+
+    caracteres = "abcxyz019+-*=\"( \n"
+    medir("inserir", lambda: (lambda i: (i, i, rnd.choice(caracteres)))(rnd.randrange(len(texto))))
+    medir("apagar", lambda: (lambda i: (i, i + 1, ""))(rnd.randrange(len(texto) - 1)))
+    medir("trocar", lambda: (lambda i: (i, i + 1, rnd.choice(caracteres)))(rnd.randrange(len(texto) - 1)))
+    cursor = [len(texto) // 2]
+
+    def digitar():
+        cursor[0] += 1
+        return cursor[0] - 1, cursor[0] - 1, rnd.choice(caracteres)
+
+    medir("digitar", digitar)
+    esperado, _ = lexer.tokenize_stream(texto)
+    assert [_campos(t) for t in stream] == [_campos(t) for t in esperado], "relex difere de tokenize_stream"
+
+
+def bench_adversario(tamanhos=(2500, 5000, 10000, 20000, 40000), limite_s=5.0):
+    """
+    Entradas adversárias para o maximal munch: tokenize no modo tabela vs modo
+    linear (Lexer(linear=True), memória de falhas). "/" repetido sem quebra de
+    linha no fim é um comentário que nunca termina: cada "/" anda até o fim do
+    texto. Tamanhos cujo tempo passaria de `limite_s` são pulados.
+    """
+    from lexer3 import Lexer
+    print("== adversario: tempo (ms) por tamanho; razão entre tamanhos vizinhos (2 = linear, 4 = quadrático) ==")
+    entradas = {
+        'aspas  """...': '"',
+        "cifrao $$$...": "$",
+        "barras ///...": "/",
+        "'// a' sem \\n": "// a",
+    }
+    lexers = {"tabela": Lexer(), "linear": Lexer(linear=True)}
+    for nome, pedaco in entradas.items():
+        for modo, lexer in lexers.items():
+            tempos = []
+            for tamanho in tamanhos:
+                if tempos and tempos[-1] * (tamanho / tamanhos[len(tempos) - 1]) ** 2 > limite_s:
+                    break
+                texto = pedaco * (tamanho // len(pedaco))
+                tempos.append(_melhor_tempo(lambda: lexer.tokenize(texto), 1))
+            razoes = [b / a for a, b in zip(tempos, tempos[1:])]
+            colunas = "  ".join(f"{t * 1000:8.1f}" for t in tempos)
+            print(f"  {nome:14} {modo:6}: {colunas}   razões {' '.join(f'{r:.1f}' for r in razoes)}")
+        amostra = pedaco * 500
+        resultados = [([_campos(t) for t in tokens], erros)
+                      for tokens, erros in (lexer.tokenize(amostra) for lexer in lexers.values())]
+        assert resultados[0] == resultados[1], "modo linear difere do modo tabela"
+    print(f"  tamanhos: {', '.join(map(str, tamanhos))} caracteres")
+
+    texto = gerar_corpus(20000)
+    for modo, lexer in lexers.items():
+        tempo = _melhor_tempo(lambda: lexer.tokenize(texto), 3)
+        print(f"  corpus normal ({len(texto)} caracteres), {modo}: {tempo * 1000:8.1f} ms")
+
+
+def bench_preguicoso(linhas=50000, repeticoes=5):
+    """
+    AFD preguiçoso (Lexer(preguicoso=True), estados construídos sob demanda) vs
+    AFD construído antes: tempo até o primeiro Lexer pronto, primeira tokenização
+    (com o AFD preguiçoso ainda vazio) e vazão estável; também com um cache de
+    poucos estados, descartado o tempo todo.
+    """
+    import AFN
+    from dfa_compilado import compile_dfa
+    from dfa_preguicoso import lazy_dfa
+    from lexer3 import Lexer
+    print(f"== preguicoso: AFD sob demanda vs AFD construído antes ({linhas} linhas) ==")
+
+    cache_dir = tempfile.mkdtemp(prefix="lsd_dfa_cache_")
+    try:
+        env = dict(os.environ, LSD_DFA_CACHE_DIR=cache_dir)
+        base = _tempo_processo("pass", env, repeticoes)
+        processos = {
+            "tabela, sem cache": ("from lexer3 import Lexer; Lexer()", dict(env, LSD_DFA_CACHE="0")),
+            "tabela, cache quente": ("from lexer3 import Lexer; Lexer()", env),
+            "preguicoso": ("from lexer3 import Lexer; Lexer(preguicoso=True)", env),
+        }
+        _tempo_processo(processos["tabela, cache quente"][0], env, 1)  # deixa o cache pronto
+        for nome, (codigo, ambiente) in processos.items():
+            tempo = _tempo_processo(codigo, ambiente, repeticoes)
+            print(f"  startup {nome:20}: {tempo:8.1f} ms  (lexer {tempo - base:6.1f} ms)")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    # dentro do processo: construir o AFD (+ tabela) vs preparar o AFD preguiçoso
+    def ansioso():
+        dfa, _ = AFN.build_dfa(AFN.afds, AFN.token_types, AFN.token_priority, usar_cache=False)
+        compile_dfa(dfa)
+
+    construir = _melhor_tempo(ansioso, repeticoes)
+    preparar = _melhor_tempo(lambda: lazy_dfa(AFN.afds, AFN.token_types, AFN.token_priority), repeticoes)
+    print(f"  construção do AFD + tabela  : {construir * 1000:8.2f} ms")
+    print(f"  preparo do AFD preguiçoso   : {preparar * 1000:8.2f} ms")
+
+    texto = gerar_corpus(linhas)
+    pequeno = gerar_corpus(20)
+    referencia = [_campos(t) for t in Lexer().tokenize(texto)[0]]
+    modos = {
+        "dicionario": lambda: Lexer(usar_tabela=False),
+        "tabela": lambda: Lexer(),
+        "preguicoso": lambda: Lexer(preguicoso=True, dfa_obj=lazy_dfa(AFN.afds, AFN.token_types,
+                                                                       AFN.token_priority)),
+        "preg. 4 est.": lambda: Lexer(preguicoso=True, dfa_obj=lazy_dfa(AFN.afds, AFN.token_types,
+                                                                         AFN.token_priority, max_estados=4)),
+    }
+    for nome, criar in modos.items():
+        lexer = criar()
+        primeira = _melhor_tempo(lambda: lexer.tokenize(pequeno), 1)
+        tokens, _ = lexer.tokenize(texto)
+        assert [_campos(t) for t in tokens] == referencia, f"modo {nome} difere do modo tabela"
+        tempo = _melhor_tempo(lambda: lexer.tokenize(texto), repeticoes)
+        extra = ""
+        if lexer.preguicoso:
+            afd = lexer.dfa
+            extra = f"  {len(afd)} estados no cache, {afd.construidos} construídos, {afd.descartes} descartes"
+        print(f"  {nome:12}: 1ª tokenização ({len(pequeno)} car.) {primeira * 1000:6.2f} ms   "
+              f"estável {tempo * 1000:8.1f} ms  {len(texto) / tempo / 1e6:6.2f} MB/s{extra}")
+    print(f"  AFD completo: {len(AFN.dfa.estados)} estados")
+
+
+def bench_unicode(linhas=50000, repeticoes=5):
+    """
+    Transições por faixa de code points: vazão de cada modo num corpus ASCII e num
+    com identificadores, strings e comentários Unicode, e o tamanho do AFD/tabela.
+    """
+    import AFN
+    from dfa_compilado import compile_dfa
+    from gerar_scanner import SAIDA_PADRAO
+    from lexer3 import Lexer
+    print(f"== unicode: corpus ASCII vs Unicode ({linhas} linhas) ==")
+    dfa = AFN.dfa
+    tabela = compile_dfa(dfa)
+    faixas = sum(1 for row in dfa.transicoes.values() for c in row if isinstance(c, tuple))
+    transicoes = sum(len(row) for row in dfa.transicoes.values())
+    print(f"  AFD: {len(dfa.estados)} estados, {transicoes} transições ({faixas} por faixa)")
+    print(f"  tabela: {tabela.n_classes} classes, {len(tabela.transicoes)} entradas, "
+          f"{len(tabela.faixas)} faixas não-ASCII na busca binária")
+
+    corpora = {"ascii": gerar_corpus(linhas), "unicode": gerar_corpus(linhas, unicode=True)}
+    modos = {
+        "dicionario": Lexer(usar_tabela=False),
+        "tabela": Lexer(),
+        "scanner": Lexer(scanner=SAIDA_PADRAO),
+        "linear": Lexer(linear=True),
+        "preguicoso": Lexer(preguicoso=True),
+    }
+    for nome_corpus, texto in corpora.items():
+        referencia = None
+        for nome, lexer in modos.items():
+            tokens, erros = lexer.tokenize(texto)
+            saida = [_campos(t) for t in tokens], erros
+            if referencia is None:
+                referencia = saida
+                assert not erros, f"erros léxicos no corpus {nome_corpus}"
+            assert saida == referencia, f"modo {nome} difere no corpus {nome_corpus}"
+            tempo = _melhor_tempo(lambda: lexer.tokenize(texto), repeticoes)
+            print(f"  {nome_corpus:7} {nome:10}: {tempo * 1000:8.1f} ms  {len(texto) / tempo / 1e6:6.2f} Mcar/s  "
+                  f"{len(tokens) / tempo:10.0f} tokens/s")
+
+
+def bench_prevarredura(linhas=200000, repeticoes=3):
+    """
+    Prevarredura (prevarredura.py: índice de linhas, classes e trechos de espaço
+    calculados antes do laço do AFD): custo dela sozinha, com e sem NumPy, e
+    tokenize/tokenize_stream com e sem ela.
+    """
+    from lexer3 import Lexer
+    from prevarredura import numpy_disponivel, prevarrer
+    print(f"== prevarredura: corpus de {linhas} linhas ==")
+    texto = gerar_corpus(linhas)
+    tabela = Lexer().tabela
+    versoes = [("python", False)] + ([("numpy", True)] if numpy_disponivel() else [])
+    for nome, usar_numpy in versoes:
+        tempo = _melhor_tempo(lambda: prevarrer(texto, tabela, usar_numpy=usar_numpy), repeticoes)
+        print(f"  prevarredura ({nome:6}): {tempo * 1000:8.1f} ms  {len(texto) / tempo / 1e6:6.2f} Mcar/s")
+    if not numpy_disponivel():
+        print("  NumPy não instalado: Lexer(prevarredura=True) usa a versão em Python puro")
+
+    referencia = None
+    for nome, prevarredura in (("sem", False), ("com", True)):
+        lexer = Lexer(prevarredura=prevarredura)
+        tokens, erros = lexer.tokenize(texto)
+        saida = [_campos(t) for t in tokens], erros
+        referencia = referencia or saida
+        assert saida == referencia, "a prevarredura mudou os tokens"
+        tokenize = _melhor_tempo(lambda: lexer.tokenize(texto), repeticoes)
+        stream = _melhor_tempo(lambda: lexer.tokenize_stream(texto), repeticoes)
+        print(f"  {nome} prevarredura: tokenize {tokenize * 1000:8.1f} ms   tokenize_stream {stream * 1000:8.1f} ms")
+
+
+def bench_lote(quantidade=50000, linhas_por_texto=2, repeticoes=3):
+    """
+    Muitos textos pequenos: tokenize e tokenize_stream texto a texto vs
+    Lexer.tokenize_many (um buffer e uma passada de classes para o lote), também
+    com um pool de processos. Em textos por segundo.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from lexer3 import Lexer
+    print(f"== lote: {quantidade} textos de {linhas_por_texto} linhas ==")
+    linhas = gerar_corpus(quantidade * linhas_por_texto).split("\n")
+    textos = ["\n".join(linhas[i:i + linhas_por_texto]) for i in range(0, len(linhas), linhas_por_texto)]
+    textos = textos[:quantidade]
+    lexer = Lexer()
+
+    stream, faixas, _ = lexer.tokenize_many(textos)
+    esperado = [len(lexer.tokenize_stream(t)[0]) for t in textos]
+    assert [faixas[k + 1] - faixas[k] for k in range(len(textos))] == esperado, "tokenize_many difere"
+
+    def medir(nome, funcao):
+        tempo = _melhor_tempo(funcao, repeticoes)
+        print(f"  {nome:26}: {tempo * 1000:8.1f} ms  {len(textos) / tempo:10.0f} textos/s")
+
+    medir("tokenize por texto", lambda: [lexer.tokenize(t) for t in textos])
+    medir("tokenize_stream por texto", lambda: [lexer.tokenize_stream(t) for t in textos])
+    medir("tokenize_many", lambda: lexer.tokenize_many(textos))
+    workers = max(2, os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        lexer.tokenize_many(textos, workers=workers, executor=executor)
+        medir(f"tokenize_many ({workers} processos)",
+              lambda: lexer.tokenize_many(textos, workers=workers, executor=executor))
+
+
+CENARIOS = {
+    "startup": bench_startup,
+    "tabela": bench_tabela,
+    "linhas": bench_linhas,
+    "stream": bench_stream,
+    "mmap": bench_mmap,
+    "minimizacao": bench_minimizacao,
+    "subconjuntos": bench_subconjuntos,
+    "scanner": bench_scanner,
+    "tokens": bench_tokens,
+    "paralelo": bench_paralelo,
+    "relex": bench_relex,
+    "adversario": bench_adversario,
+    "preguicoso": bench_preguicoso,
+    "unicode": bench_unicode,
+    "prevarredura": bench_prevarredura,
+    "lote": bench_lote,
+}
+
+
+if __name__ == "__main__":
+    escolhidos = sys.argv[1:] or list(CENARIOS)
+    for nome in escolhidos:
+        if nome not in CENARIOS:
+            print(f"Cenário desconhecido: {nome!r}. Disponíveis: {', '.join(CENARIOS)}")
+            sys.exit(1)
+        CENARIOS[nome]()
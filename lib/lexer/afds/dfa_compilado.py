@@ -0,0 +1,293 @@
+"""
+Forma compilada (tabela plana) do AFD combinado usado pelo Lexer.
+
+- cada caractere do alfabeto é mapeado para uma classe de equivalência
+  (caracteres com exatamente as mesmas transições em todos os estados);
+- os estados viram inteiros densos, guardados já multiplicados pelo número de
+  classes (deslocamento da linha), assim o passo do AFD é um único acesso
+  `transicoes[estado + classe]`;
+- transições e o tipo de token de cada estado final ficam em `array`/`bytes`.
+- a classe de um caractere ASCII vem de uma tabela de 128 posições; a de um
+  não-ASCII, de uma busca binária em faixas de code points (classe por faixa),
+  então letras Unicode não custam uma entrada por caractere.
+
+A classe 0 é reservada para "nenhuma transição" e -1 é o estado morto.
+"""
+
+import codecs
+from array import array
+from bisect import bisect_right
+
+from AFD_Base import atomos_da_faixa, chave_simbolo, particionar_faixas
+
+# caracteres fora de latin-1 viram \x80 ao montar a string de classes; a classe
+# deles é corrigida depois (classes_de)
+_ERRO_CLASSE = "lsd_classe"
+codecs.register_error(_ERRO_CLASSE, lambda e: ("\x80" * (e.end - e.start), e.end))
+
+
+class _MapaDeClasses(dict):
+    """ord(c) -> chr(classe de c), para str.translate; preenchido sob demanda."""
+    def __init__(self, compilado):
+        super().__init__()
+        self._compilado = compilado
+
+    def __missing__(self, o):
+        compilado = self._compilado
+        classe = self[o] = chr(compilado.classe_ascii[o] if o < 128 else compilado.classe_unicode(o))
+        return classe
+
+
+class CompiledDFA:
+    def __init__(self, n_estados, n_classes, inicial, transicoes, final_kind,
+                 classe_ascii, faixas, tipos, nomes):
+        self.n_estados = n_estados
+        self.n_classes = n_classes
+        self.inicial = inicial            # deslocamento da linha do estado inicial
+        self.transicoes = transicoes      # array('i'): [estado + classe] -> estado | -1
+        self.final_kind = final_kind      # bytes: [estado] -> índice em tipos (0 = não final)
+        self.classe_ascii = classe_ascii  # bytes(128): ord(c) -> classe
+        self.faixas = faixas              # [(inicio, fim, classe)] dos code points >= 128, em ordem
+        self.tipos = tipos                # [None, "COMENTARIO", ...]
+        self.nomes = nomes                # deslocamento // n_classes -> nome do estado no AFD
+        self._faixas_inicio = [f[0] for f in faixas]
+
+        # tabela de tradução byte -> classe para montar a string de classes de um texto
+        # inteiro de uma vez (encode + bytes.translate, tudo em C)
+        self._traducao = bytes(classe_ascii) + bytes(self.classe_unicode(o) for o in range(128, 256))
+        # lista com os mesmos valores do array: no CPython o acesso a list não cria
+        # um novo int a cada passo, o que deixa o laço do AFD mais rápido
+        self._passos = transicoes.tolist()
+        self._mapa = _MapaDeClasses(self)
+
+    def classe_unicode(self, o):
+        """Classe do code point o >= 128 (0 se nenhuma faixa o contém)."""
+        faixas = self.faixas
+        i = bisect_right(self._faixas_inicio, o) - 1
+        if i >= 0 and o <= faixas[i][1]:
+            return faixas[i][2]
+        return 0
+
+    def classes_de(self, texto):
+        """bytes com a classe de cada caractere de `texto` (mesmo comprimento)."""
+        codificado = texto.encode("latin-1", _ERRO_CLASSE)
+        classes = codificado.translate(self._traducao)
+        if texto.isascii() or b"\x80" not in codificado:
+            return classes
+        mapa = self._mapa
+        if codificado.count(b"\x80") > len(texto) >> 5:
+            # muitos caracteres fora de latin-1: str.translate com as classes memorizadas
+            return texto.translate(mapa).encode("latin-1")
+        # \x80 é U+0080 ou um caractere acima de U+00FF: estes pegam a classe nas faixas
+        corrigidas = bytearray(classes)
+        j = codificado.find(b"\x80")
+        while j != -1:
+            corrigidas[j] = ord(mapa[ord(texto[j])])
+            j = codificado.find(b"\x80", j + 1)
+        return bytes(corrigidas)
+
+    def longest_match_classes(self, classes, start, n=None):
+        """Como longest_match, mas sobre a string de classes de classes_de()."""
+        passos = self._passos
+        final_kind = self.final_kind
+        estado = self.inicial
+        ultimo = 0
+        fim = start
+        j = start
+        if n is None:
+            n = len(classes)
+
+        while j < n:
+            estado = passos[estado + classes[j]]
+            if estado < 0:
+                break
+            j += 1
+            k = final_kind[estado]
+            if k:
+                ultimo = k
+                fim = j
+        return fim - start, ultimo
+
+    def longest_match(self, texto, start, n=None):
+        """
+        Maior prefixo reconhecido a partir de `start` (em texto[:n], se informado).
+        Retorna (tamanho_do_lexema, indice_do_tipo); indice 0 = nada reconhecido.
+        """
+        classe_ascii = self.classe_ascii
+        classe_unicode = self.classe_unicode
+        trans = self._passos
+        final_kind = self.final_kind
+        estado = self.inicial
+        ultimo = 0
+        fim = start
+        j = start
+        if n is None:
+            n = len(texto)
+
+        while j < n:
+            c = texto[j]
+            o = ord(c)
+            estado = trans[estado + (classe_ascii[o] if o < 128 else classe_unicode(o))]
+            if estado < 0:
+                break
+            j += 1
+            k = final_kind[estado]
+            if k:
+                ultimo = k
+                fim = j
+        return fim - start, ultimo
+
+    def longest_match_memo(self, texto, start, falhas, n=None):
+        """
+        longest_match com memória de falhas (Reps, "Maximal-munch tokenization in
+        linear time", 1998). `falhas` guarda chaves posição * len(_passos) + estado
+        de onde o AFD já andou sem chegar a nenhum estado final; uma busca que
+        reencontra uma delas para ali. Cada par (estado, posição) é percorrido
+        sem sucesso no máximo uma vez por texto, então tokenizar é O(n * estados).
+        """
+        classe_ascii = self.classe_ascii
+        classe_unicode = self.classe_unicode
+        trans = self._passos
+        final_kind = self.final_kind
+        tamanho = len(trans)
+        estado = self.inicial
+        ultimo = 0
+        fim = start
+        j = start
+        if n is None:
+            n = len(texto)
+        trilha = []  # pares depois do último estado final
+
+        while j < n:
+            chave = j * tamanho + estado
+            if chave in falhas:
+                break
+            trilha.append(chave)
+            c = texto[j]
+            o = ord(c)
+            estado = trans[estado + (classe_ascii[o] if o < 128 else classe_unicode(o))]
+            if estado < 0:
+                break
+            j += 1
+            k = final_kind[estado]
+            if k:
+                ultimo = k
+                fim = j
+                trilha.clear()
+        falhas.update(trilha)
+        return fim - start, ultimo
+
+    def campos(self):
+        """Argumentos de CompiledDFA(...) em tipos do marshal (para o cache em disco do AFN)."""
+        return (self.n_estados, self.n_classes, self.inicial, self.transicoes.tobytes(), self.final_kind,
+                self.classe_ascii, self.faixas, self.tipos, self.nomes)
+
+    @classmethod
+    def de_campos(cls, campos):
+        n_estados, n_classes, inicial, transicoes, *resto = campos
+        tabela = array("i")
+        tabela.frombytes(transicoes)
+        return cls(n_estados, n_classes, inicial, tabela, *resto)
+
+    def state_name(self, estado):
+        """Nome original (no AFD de dicionários) de um estado compilado."""
+        return self.nomes[estado // self.n_classes]
+
+
+def compile_dfa(dfa):
+    """
+    Compila um AutomatoFinitoD com `token_finals` para CompiledDFA.
+    O resultado é memorizado no próprio objeto do AFD.
+    Lança ValueError se as transições não forem indexadas por caractere ou faixa.
+    """
+    compilado = getattr(dfa, "_compilado", None)
+    if compilado is not None:
+        return compilado
+
+    nomes = [dfa.inicial] + [s for s in dfa.transicoes if s != dfa.inicial]
+    vistos = set(nomes)
+    for row in dfa.transicoes.values():
+        for dest in row.values():
+            if dest not in vistos:
+                vistos.add(dest)
+                nomes.append(dest)
+    indice = {s: i for i, s in enumerate(nomes)}
+
+    # símbolos: caracteres ASCII um a um; o não-ASCII em faixas disjuntas (átomos,
+    # ver AFD_Base.particionar_faixas), com caracteres não-ASCII como faixas de um code point
+    linhas = [dfa.transicoes.get(s, {}) for s in nomes]
+    faixas = set()
+    for row in linhas:
+        for c in row:
+            if type(c) is tuple:
+                faixas.add(c)
+            elif not isinstance(c, str) or len(c) != 1:
+                raise ValueError(f"Transição com símbolo {c!r}: a tabela compilada exige caracteres ou faixas")
+            elif c >= "\x80":
+                faixas.add((ord(c), ord(c)))
+    atomos = particionar_faixas(faixas)
+    conjunto_atomos = set(atomos)
+    inicios = [a[0] for a in atomos]
+
+    # coluna de cada símbolo: pares (estado, destino) dos estados com transição nele.
+    # Nos AFDs de nfa_to_dfa as faixas das linhas já são átomos; nos demais, cada
+    # faixa (ou caractere não-ASCII) é dividida nos átomos que contém
+    colunas = {}
+    for i, row in enumerate(linhas):
+        for c, dest in row.items():
+            if type(c) is tuple and c in conjunto_atomos or type(c) is str and c < "\x80":
+                colunas.setdefault(c, []).append((i, dest))
+            else:
+                faixa = c if type(c) is tuple else (ord(c), ord(c))
+                for a in atomos_da_faixa(faixa, atomos, inicios):
+                    colunas.setdefault(a, []).append((i, dest))
+
+    # classes de equivalência: mesma coluna em todos os estados
+    assinaturas = {}
+    classe_de = {}
+    for c in sorted(colunas, key=chave_simbolo):
+        assinatura = tuple(colunas[c])
+        if assinatura not in assinaturas:
+            assinaturas[assinatura] = len(assinaturas) + 1
+        classe_de[c] = assinaturas[assinatura]
+    n_classes = len(assinaturas) + 1
+    if n_classes > 256:
+        raise ValueError("Classes de caracteres demais para a tabela compilada")
+
+    transicoes = array("i", [-1]) * (len(nomes) * n_classes)
+    for c, pares in colunas.items():
+        k = classe_de[c]
+        for i, dest in pares:
+            transicoes[i * n_classes + k] = indice[dest] * n_classes
+
+    # mesmo critério do modo dicionário: estado em `finais`, tipo em `token_finals`
+    tipos = [None]
+    final_kind = bytearray(len(nomes) * n_classes)
+    for s in dfa.finais:
+        if s not in indice:
+            continue
+        tipo = dfa.token_finals.get(s, "UNKNOWN")
+        if tipo not in tipos:
+            tipos.append(tipo)
+        final_kind[indice[s] * n_classes] = tipos.index(tipo)
+    if len(tipos) > 256:
+        raise ValueError("Tipos de token demais para a tabela compilada")
+
+    classe_ascii = bytearray(128)
+    for c, k in classe_de.items():
+        if type(c) is str:
+            classe_ascii[ord(c)] = k
+    # átomos vizinhos da mesma classe viram uma faixa só
+    classe_faixas = []
+    for inicio, fim in atomos:
+        k = classe_de[(inicio, fim)]
+        if classe_faixas and classe_faixas[-1][2] == k and classe_faixas[-1][1] + 1 == inicio:
+            classe_faixas[-1] = (classe_faixas[-1][0], fim, k)
+        else:
+            classe_faixas.append((inicio, fim, k))
+
+    compilado = CompiledDFA(len(nomes), n_classes, indice[dfa.inicial] * n_classes, transicoes,
+                            bytes(final_kind), bytes(classe_ascii), classe_faixas, tipos, nomes)
+    dfa._compilado = compilado
+    return compilado
+
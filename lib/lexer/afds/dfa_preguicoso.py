@@ -0,0 +1,200 @@
+"""
+AFD preguiçoso (construído sob demanda) do AFN combinado, no estilo do RE2.
+
+Em vez de materializar todos os estados com nfa_to_dfa antes de tokenizar, cada
+estado do AFD (um conjunto de estados do AFN, já fechado por ε) só é criado na
+primeira vez que o lexer passa por ele, e cada transição só é calculada na
+primeira vez que um caractere é lido naquele estado. Caminhos raros nunca são
+construídos e o custo de partida fica no fecho-ε de cada estado do AFN.
+
+Os estados ficam numa tabela limitada (max_estados). Quando ela enche, o cache
+inteiro é descartado e reconstruído a partir do estado atual, como no RE2: os
+ids continuam densos e o laço do lexer não precisa saber do descarte, só usar
+o estado devolvido por _passo().
+
+As linhas do cache são indexadas por caractere; um caractere não-ASCII é
+traduzido para a faixa (átomo) do AFN que o contém só ao calcular a transição.
+
+O estado 0 é sempre o inicial e -1 é o estado morto. Para código que espera um
+AutomatoFinitoD (transicoes/finais/token_finals), completo() monta o AFD inteiro
+com nfa_to_dfa — o Lexer no modo preguiçoso nunca precisa dele.
+"""
+
+import AFN
+from AFD_Base import e_faixa, faixa_de
+from AFN import EPS, combine_afds_to_nfa, epsilon_closure, nfa_to_dfa
+
+MORTO = -1
+# estados guardados antes de descartar o cache (o AFD da LSD tem 16)
+MAX_ESTADOS = 4096
+
+
+class LazyDFA:
+    def __init__(self, nfa, token_priority, max_estados=MAX_ESTADOS):
+        if max_estados < 3:
+            # depois de um descarte cabem o inicial, o estado atual e o destino
+            raise ValueError("max_estados deve ser pelo menos 3")
+        self.max_estados = max_estados
+        self._nfa = nfa
+        self._prioridade = token_priority
+        self._completo = None
+
+        # AFN com estados inteiros (o inicial é 0); fecho-ε de cada estado calculado uma vez
+        trans = nfa["transicoes"]
+        nomes = [nfa["inicial"]] + sorted(s for s in nfa["estados"] if s != nfa["inicial"])
+        indice = {s: i for i, s in enumerate(nomes)}
+        self._fechos = [frozenset(indice[d] for d in epsilon_closure({s}, trans)) for s in nomes]
+        self._mover = [{sym: tuple(indice[d] for d in dests)
+                        for sym, dests in trans.get(s, {}).items() if sym is not EPS}
+                       for s in nomes]
+        # faixas disjuntas do não-ASCII (símbolos do AFN), para a busca binária em _passo
+        self._atomos = sorted(sym for sym in nfa["alfabeto"] if e_faixa(sym))
+        self._inicios = [a[0] for a in self._atomos]
+
+        # tipos em ordem de prioridade: o menor índice final de um conjunto é o token dele
+        token_map = nfa["token_map"]
+        self.tipos = [None] + sorted(set(token_map.values()), key=lambda t: (token_priority[t], t))
+        kind_do_tipo = {t: k for k, t in enumerate(self.tipos) if k}
+        self._kind_nfa = [kind_do_tipo[token_map[s]] if s in nfa["finais"] else 0 for s in nomes]
+
+        # cache: conjunto -> id, e por id o conjunto, a linha (caractere -> id | MORTO)
+        # e o índice do tipo em tipos (0 = não final); esvaziado no lugar ao descartar
+        self._ids = {}
+        self._conjuntos = []
+        self._linhas = []
+        self._final_kind = []
+        self.construidos = 0  # estados criados, contando os recriados depois de um descarte
+        self.descartes = 0
+        self._estado(self._fechos[0])
+
+    def _estado(self, conjunto):
+        estado = self._ids.get(conjunto)
+        if estado is None:
+            estado = self._ids[conjunto] = len(self._conjuntos)
+            self._conjuntos.append(conjunto)
+            self._linhas.append({})
+            kind_nfa = self._kind_nfa
+            self._final_kind.append(min((kind_nfa[s] for s in conjunto if kind_nfa[s]), default=0))
+            self.construidos += 1
+        return estado
+
+    def _descartar(self):
+        self._ids.clear()
+        del self._conjuntos[:]
+        del self._linhas[:]
+        del self._final_kind[:]
+        self.descartes += 1
+        self._estado(self._fechos[0])
+
+    def _passo(self, estado, c):
+        """Transição ainda não calculada de `estado` lendo `c`; devolve o destino (ou MORTO)."""
+        conjunto = self._conjuntos[estado]
+        mover = self._mover
+        simbolo = c if c < "\x80" else faixa_de(ord(c), self._atomos, self._inicios)
+        destinos = set()
+        for s in conjunto:
+            d = mover[s].get(simbolo)
+            if d:
+                destinos.update(d)
+        if not destinos:
+            prox = MORTO
+        else:
+            fechos = self._fechos
+            fecho = frozenset().union(*(fechos[d] for d in destinos))
+            prox = self._ids.get(fecho)
+            if prox is None:
+                if len(self._conjuntos) >= self.max_estados:
+                    self._descartar()
+                    estado = self._estado(conjunto)
+                prox = self._estado(fecho)
+        self._linhas[estado][c] = prox
+        return prox
+
+    def longest_match(self, texto, start, n=None):
+        """
+        Maior prefixo reconhecido a partir de `start` (em texto[:n], se informado),
+        construindo o que faltar.
+        Retorna (tamanho_do_lexema, indice_do_tipo); indice 0 = nada reconhecido.
+        """
+        linhas = self._linhas
+        final_kind = self._final_kind
+        passo = self._passo
+        estado = 0
+        ultimo = 0
+        fim = j = start
+        if n is None:
+            n = len(texto)
+
+        while j < n:
+            c = texto[j]
+            prox = linhas[estado].get(c)
+            if prox is None:
+                prox = passo(estado, c)
+            if prox < 0:
+                break
+            estado = prox
+            j += 1
+            k = final_kind[estado]
+            if k:
+                ultimo = k
+                fim = j
+        return fim - start, ultimo
+
+    def quebra_de_linha_delimita(self):
+        """True se nenhum token continua depois de consumir um "\\n" (sem construir o AFD)."""
+        mover = self._mover
+        for row in mover:
+            for d in row.get("\n", ()):
+                if any(mover[s] for s in self._fechos[d]):
+                    return False
+        return True
+
+    def __len__(self):
+        return len(self._conjuntos)
+
+    # --- interface de AutomatoFinitoD (constrói o AFD inteiro) ---
+    def completo(self):
+        """AFD inteiro (nfa_to_dfa, sem minimizar); memorizado."""
+        if self._completo is None:
+            self._completo, _ = nfa_to_dfa(self._nfa, self._prioridade)
+        return self._completo
+
+    @property
+    def estados(self):
+        return self.completo().estados
+
+    @property
+    def alfabeto(self):
+        return self.completo().alfabeto
+
+    @property
+    def transicoes(self):
+        return self.completo().transicoes
+
+    @property
+    def inicial(self):
+        return self.completo().inicial
+
+    @property
+    def finais(self):
+        return self.completo().finais
+
+    @property
+    def token_finals(self):
+        return self.completo().token_finals
+
+
+def lazy_dfa(afds, token_types, token_priority, max_estados=MAX_ESTADOS):
+    """LazyDFA para os AFDs dados (como build_dfa, mas sem construir estados)."""
+    return LazyDFA(combine_afds_to_nfa(afds, token_types), token_priority, max_estados)
+
+
+_padrao = None
+
+
+def afd_preguicoso():
+    """LazyDFA dos AFDs da LSD (AFN.afds), compartilhado pelos Lexers do processo."""
+    global _padrao
+    if _padrao is None:
+        _padrao = lazy_dfa(AFN.afds, AFN.token_types, AFN.token_priority)
+    return _padrao
@@ -0,0 +1,59 @@
+"""
+Gera letras_unicode.py: as letras Unicode fora do ASCII (str.isalpha()) como
+faixas de code points, usadas pelos AFDs de identificador.
+
+A tabela é versionada em vez de calculada no import: percorrer os 1,1 milhão de
+code points custa centenas de ms, e com a tabela fixa o lexer reconhece as
+mesmas letras em qualquer versão do Python.
+
+Uso:
+    python gerar_letras.py [saida.py]     # padrão: letras_unicode.py nesta pasta
+"""
+
+import os
+import sys
+import unicodedata
+
+AQUI = os.path.dirname(os.path.abspath(__file__))
+SAIDA_PADRAO = os.path.join(AQUI, "letras_unicode.py")
+
+
+def faixas_de_letras():
+    """Faixas (inicio, fim), inclusivas, dos code points >= 128 com isalpha()."""
+    faixas = []
+    inicio = None
+    for o in range(128, sys.maxunicode + 2):
+        letra = o <= sys.maxunicode and chr(o).isalpha()
+        if letra and inicio is None:
+            inicio = o
+        elif not letra and inicio is not None:
+            faixas.append((inicio, o - 1))
+            inicio = None
+    return faixas
+
+
+def gerar_letras():
+    faixas = faixas_de_letras()
+    saida = [
+        '"""',
+        "Letras Unicode fora do ASCII (str.isalpha()) em faixas de code points,",
+        "geradas por gerar_letras.py — não editar à mão.",
+        "Regenerar com: python gerar_letras.py",
+        '"""',
+        "",
+        f"UNIDATA_VERSION = {unicodedata.unidata_version!r}",
+        "",
+        "# (inicio, fim) inclusivos, em ordem e sem sobreposição",
+        "LETRAS = (",
+    ]
+    for i in range(0, len(faixas), 4):
+        saida.append("    " + " ".join(f"(0x{a:05X}, 0x{b:05X})," for a, b in faixas[i:i + 4]))
+    saida.append(")")
+    return "\n".join(saida) + "\n"
+
+
+if __name__ == "__main__":
+    caminho = sys.argv[1] if len(sys.argv) > 1 else SAIDA_PADRAO
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write(gerar_letras())
+    print(f"Letras Unicode gravadas em {caminho} (Unicode {unicodedata.unidata_version})")
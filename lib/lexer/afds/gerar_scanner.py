@@ -0,0 +1,245 @@
+"""
+Gera um módulo Python especializado (scanner) a partir do AFD combinado.
+
+Em vez de interpretar `dfa.transicoes` a cada caractere, o scanner gerado
+traduz o AFD para um único padrão mestre do `re` (compilado uma vez, percorrido
+em C): uma chamada de `match` por token pula os espaços e reconhece o maior
+lexema, e o grupo que casou diz o tipo do token.
+
+Uso:
+    python gerar_scanner.py [saida.py]     # padrão: scanner_lsd.py nesta pasta
+
+O módulo gerado expõe:
+    TIPOS          tupla de tipos de token (índice 0 = nada reconhecido)
+    ASSINATURA     assinatura_dfa() do AFD de origem
+    MESTRE         re: grupo 1 = espaços, m.lastindex -> GRUPO_TIPO -> TIPOS
+    longest_match(texto, i, n) -> (tamanho, indice_do_tipo)
+
+e é carregado com Lexer(scanner=modulo) ou Lexer(scanner="caminho/scanner.py").
+"""
+
+import importlib.util
+import os
+import sys
+import zlib
+
+from AFD_Base import chave_simbolo, e_faixa
+
+AQUI = os.path.dirname(os.path.abspath(__file__))
+SAIDA_PADRAO = os.path.join(AQUI, "scanner_lsd.py")
+
+
+def assinatura_dfa(dfa):
+    """crc32 da estrutura do AFD (estados, transições, finais e tipos)."""
+    estrutura = (
+        dfa.inicial,
+        sorted((s, sorted(row.items(), key=lambda t: chave_simbolo(t[0]))) for s, row in dfa.transicoes.items()),
+        sorted((s, dfa.token_finals.get(s, "UNKNOWN")) for s in dfa.finais),
+    )
+    return zlib.crc32(repr(estrutura).encode("utf-8"))
+
+
+def _ordem_topologica(dfa):
+    """Estados em ordem topológica ignorando laços em si mesmo; None se houver ciclo."""
+    visitando, feito, ordem = set(), set(), []
+
+    def visitar(s):
+        if s in feito:
+            return True
+        if s in visitando:
+            return False
+        visitando.add(s)
+        for dest in dfa.transicoes.get(s, {}).values():
+            if dest != s and not visitar(dest):
+                return False
+        visitando.discard(s)
+        feito.add(s)
+        ordem.append(s)
+        return True
+
+    return ordem if visitar(dfa.inicial) else None
+
+
+# primeiro code point fora do BMP
+_ASTRAL = 0x10000
+
+
+def _faixa_re(inicio, fim):
+    return f"\\U{inicio:08x}" if inicio == fim else f"\\U{inicio:08x}-\\U{fim:08x}"
+
+
+def _partes_da_classe(simbolos):
+    """
+    Conjuntos do re para caracteres e faixas (inicio, fim), com faixas vizinhas unidas:
+    (conjunto do BMP, conjunto fora do BMP); cada um é "" se vazio. O re testa o BMP
+    num mapa de bits, mas as faixas acima de U+FFFF uma a uma — por isso ficam à parte.
+    """
+    especiais = "\\]^-["
+    chars = [c for c in simbolos if not e_faixa(c)]
+    bmp = "".join("\\" + c if c in especiais else c for c in sorted(chars))
+    faixas = []
+    for inicio, fim in sorted(c for c in simbolos if e_faixa(c)):
+        if faixas and faixas[-1][1] + 1 == inicio:
+            faixas[-1][1] = fim
+        else:
+            faixas.append([inicio, fim])
+    astral = ""
+    for inicio, fim in faixas:
+        if inicio < _ASTRAL:
+            bmp += _faixa_re(inicio, min(fim, _ASTRAL - 1))
+        if fim >= _ASTRAL:
+            astral += _faixa_re(max(inicio, _ASTRAL), fim)
+    return ("[" + bmp + "]" if bmp else ""), ("[" + astral + "]" if astral else "")
+
+
+# guarda barata antes do conjunto fora do BMP: um caractere do BMP falha numa faixa só
+_GUARDA_ASTRAL = f"(?=[{_faixa_re(_ASTRAL, 0x10FFFF)}])"
+
+
+def _classe(simbolos):
+    """Um caractere de `simbolos` (caracteres e faixas)."""
+    bmp, astral = _partes_da_classe(simbolos)
+    if not astral:
+        return bmp
+    astral = _GUARDA_ASTRAL + astral
+    return f"(?:{bmp}|{astral})" if bmp else astral
+
+
+def _laco(simbolos):
+    """Zero ou mais caracteres de `simbolos`, sem devolver nenhum (o laço de um estado)."""
+    bmp, astral = _partes_da_classe(simbolos)
+    if not astral:
+        return bmp + "*+"
+    # laço desenrolado: o conjunto do BMP (o caso comum) continua um único [...]*+
+    astral = _GUARDA_ASTRAL + astral
+    if not bmp:
+        return f"(?:{astral})*+"
+    return f"{bmp}*+(?:{astral}{bmp}*+)*+"
+
+
+class _Gerador:
+    """
+    Monta a expressão regular do AFD. Vale para AFDs cujo grafo, sem os laços de
+    um estado nele mesmo, é acíclico (caso dos AFDs da LSD). Para o estado s:
+
+        R(s) = [laço]*+ (?: [c1] R(d1) | [c2] R(d2) | ... | () )
+
+    O `()` final só existe se s é final. Como o AFD é determinístico, no máximo
+    uma alternativa casa o próximo caractere, e os caracteres do laço nunca saem
+    do estado: a regex percorre o mesmo caminho do AFD, e o `?` de cada final faz
+    o casamento voltar ao último final visto — o maior lexema. O grupo vazio do
+    final onde o casamento terminou é o último grupo fechado (m.lastindex).
+    """
+
+    def __init__(self, dfa):
+        self.dfa = dfa
+        self.tipos = [None]
+        for s in sorted(dfa.finais):
+            tipo = dfa.token_finals.get(s, "UNKNOWN")
+            if tipo not in self.tipos:
+                self.tipos.append(tipo)
+        # grupo 1 é reservado (espaços em MESTRE, vazio em TOKEN_RE)
+        self.grupo_tipo = [0, 0]
+
+    def tipo(self, estado):
+        return self.tipos.index(self.dfa.token_finals.get(estado, "UNKNOWN"))
+
+    def regex(self, estado):
+        row = self.dfa.transicoes.get(estado, {})
+        laco = [c for c, d in row.items() if d == estado]
+        grupos = {}
+        for c, dest in row.items():
+            if dest != estado:
+                grupos.setdefault(dest, []).append(c)
+
+        saida = _laco(laco) if laco else ""
+        alternativas = []
+        # grupos maiores primeiro: em geral são os caracteres mais comuns
+        for dest, chars in sorted(grupos.items(), key=lambda g: (-len(g[1]), g[0])):
+            alternativas.append(_classe(chars) + self.regex(dest))
+        if estado in self.dfa.finais:
+            self.grupo_tipo.append(self.tipo(estado))
+            alternativas.append("()")
+        if not alternativas:
+            return saida + "(?!)"  # estado sem saída e não final: nunca casa
+        return saida + "(?:" + "|".join(alternativas) + ")"
+
+    def gerar(self):
+        if _ordem_topologica(self.dfa) is None:
+            raise ValueError("AFD com ciclos entre estados distintos: não há expressão regular direta")
+        token = self.regex(self.dfa.inicial)
+        if len(self.grupo_tipo) > 100:
+            raise ValueError("AFD grande demais para o padrão mestre (limite de grupos do re)")
+
+        saida = [
+            '"""',
+            "Scanner do AFD combinado da LSD gerado por gerar_scanner.py — não editar à mão.",
+            "Regenerar com: python gerar_scanner.py",
+            '"""',
+            "",
+            "import re",
+            "import sys",
+            "",
+            f"TIPOS = {tuple(self.tipos)!r}",
+            f"ASSINATURA = {assinatura_dfa(self.dfa)}",
+            f"ESTADOS = {len(self.dfa.estados)}",
+            "",
+            "# m.lastindex -> índice em TIPOS (0 = nenhum token)",
+            f"GRUPO_TIPO = {tuple(self.grupo_tipo)!r}",
+            "",
+            f"TOKEN = {token!r}",
+            'ESPACOS = " \\t\\r\\n"',
+            "",
+            "",
+            "def _compilar(padrao):",
+            "    if sys.version_info < (3, 11):",
+            "        # sem quantificador possessivo; os laços não devolvem caracteres de qualquer forma",
+            '        padrao = padrao.replace("]*+", "]*").replace(")*+", ")*")',
+            "    return re.compile(padrao)",
+            "",
+            "",
+            "# espaços em branco (grupo 1) seguidos do maior token",
+            'MESTRE = _compilar("([" + ESPACOS + "]*+)(?:" + TOKEN + ")?")',
+            'TOKEN_RE = _compilar("()(?:" + TOKEN + ")?")',
+            "",
+            "",
+            "def longest_match(texto, i, n):",
+            '    """Maior lexema em texto[i:n]: (tamanho, índice em TIPOS); (0, 0) se nenhum."""',
+            "    m = TOKEN_RE.match(texto, i, n)",
+            "    k = GRUPO_TIPO[m.lastindex]",
+            "    return (m.end() - i, k) if k else (0, 0)",
+        ]
+        return "\n".join(saida) + "\n"
+
+
+def gerar_scanner(dfa):
+    """Código-fonte do módulo scanner para `dfa` (AFD com transições por caractere ou faixa)."""
+    for row in dfa.transicoes.values():
+        for c in row:
+            if not e_faixa(c) and (not isinstance(c, str) or len(c) != 1):
+                raise ValueError(f"Transição com símbolo {c!r}: o scanner exige caracteres ou faixas")
+    return _Gerador(dfa).gerar()
+
+
+def escrever_scanner(dfa, caminho=SAIDA_PADRAO):
+    codigo = gerar_scanner(dfa)
+    tmp = f"{caminho}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(codigo)
+    os.replace(tmp, caminho)
+    return caminho
+
+
+def carregar_scanner(caminho=SAIDA_PADRAO):
+    """Importa o módulo scanner gerado a partir do caminho do arquivo."""
+    nome = os.path.splitext(os.path.basename(caminho))[0]
+    spec = importlib.util.spec_from_file_location(nome, caminho)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+if __name__ == "__main__":
+    from AFN import dfa
+    caminho = escrever_scanner(dfa, sys.argv[1] if len(sys.argv) > 1 else SAIDA_PADRAO)
+    print(f"Scanner gerado em {caminho} ({len(dfa.estados)} estados)")
@@ -1,5 +1,5 @@
 # Importa a função que constrói o AFD combinado
-from AFN import combine_afds_to_nfa, nfa_to_dfa
+from AFN import combine_afds_to_nfa, nfa_to_dfa, minimize_dfa
 from AFD_Comentario import AFD_Comentario
 from AFD_Decimal import AFD_Decimal
 from AFD_Identificador import AFD_Identificador
@@ -42,6 +42,10 @@ dfa, dfa_rev = nfa_to_dfa(nfa, token_priority)
 print("AFD combinado gerado com sucesso!")
 print("AFD possui:", len(dfa.estados), "estados,", len(dfa.finais), "estados finais")
 
+# Minimização (Hopcroft): mesmos tokens com o menor número de estados
+dfa_min, _ = minimize_dfa(dfa, dfa_rev)
+print("AFD minimizado possui:", len(dfa_min.estados), "estados,", len(dfa_min.finais), "estados finais")
+
 
 # --- Função de teste genérica ---
 def testar(nome, exemplos):
@@ -103,3 +107,10 @@ testar("String", [
     '"Hello"', '"123"', '""', '"with space"',
     '"bad\n"', '"unclosed', 'noquotes'
 ])
+
+# --- AFD minimizado: deve dar o mesmo resultado em todos os casos acima ---
+casos = ["Data", "mean1", "1Invalid", "// teste\n", "3.14", "1.", "0005", "1.23e-4", "1.2e+",
+         "==", "=>", "  \n\t", ",", '"Hello"', '"unclosed']
+for cadeia in casos:
+    assert dfa.aceita(cadeia) == dfa_min.aceita(cadeia), cadeia
+print("\nAFD minimizado confere com o original em", len(casos), "cadeias")
@@ -1,22 +1,166 @@
 # --- lexer3_adaptado.py ---
-from AFN import dfa, dfa_rev  # mantém compatibilidade
-from typing import Optional
+import codecs
+import mmap
+import os
+from array import array
+from bisect import bisect_left
+from functools import partial
+
+import AFN
+from dfa_compilado import compile_dfa
+from dfa_preguicoso import LazyDFA, afd_preguicoso
+from prevarredura import PREVARREDURA_MINIMA, numpy_disponivel, prevarrer
+from token_kinds import (KIND_COMENTARIO, KIND_EOF, KIND_KEYWORD, KIND_SEPARADOR, KIND_UNKNOWN,
+                         PALAVRAS_CHAVE, TIPO_DO_KIND, kind_de_tipo, kind_de_token)
+
+def __getattr__(nome):
+    # lexer3.dfa / lexer3.dfa_rev: mantém compatibilidade sem construir o AFD no import
+    if nome in ("dfa", "dfa_rev"):
+        return getattr(AFN, nome)
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
 
 class Token:
-    def __init__(self, tipo, lexema, linha, coluna):
+    __slots__ = ("type", "lexeme", "line", "col", "kind")
+
+    def __init__(self, tipo, lexema, linha, coluna, kind=None):
         self.type = tipo
         self.lexeme = lexema
         self.line = linha
         self.col = coluna
+        # tipo como inteiro (token_kinds.py): o lexer já passa resolvido
+        self.kind = kind if kind is not None else kind_de_token(tipo, lexema)
 
     def __repr__(self):
         return f"Token({self.type!r}, {self.lexeme!r}, line={self.line}, col={self.col})"
 
+class TokenStream:
+    """
+    Sequência de tokens em colunas: kind (token_kinds.py), início/fim no texto,
+    linha e coluna ficam em arrays paralelos, sem um objeto por token. Indexar
+    devolve um Token criado na hora, com o lexema recortado do texto só então.
+    Gerado por Lexer.tokenize_stream; Parser.parse aceita um TokenStream direto.
+
+    Depois de Lexer.relex, os tokens a partir de `_corte` podem ter um
+    deslocamento pendente (início/fim + _dpos, linha + _dlinha) que ainda não
+    foi aplicado aos arrays: leia com inicio(i)/fim(i)/linha(i), ou chame
+    materializar() antes de usar os arrays diretamente.
+    """
+    def __init__(self, texto, erros=None, separadores=frozenset(), eof=True):
+        self.texto = texto
+        # opções de tokenize_stream que geraram o stream (Lexer.relex as repete)
+        self.separadores = separadores
+        self.eof = eof
+        self.kinds = array("H")
+        self.inicios = array("q")
+        self.fins = array("q")
+        self.linhas = array("i")
+        self.colunas = array("i")
+        self.erros = erros if erros is not None else []
+        self._vistas = {}      # últimos Tokens criados (o parser relê o token atual várias vezes)
+        self._corte = 0
+        self._dpos = 0
+        self._dlinha = 0
+
+    def append(self, kind, inicio, fim, linha, coluna):
+        self.kinds.append(kind)
+        self.inicios.append(inicio)
+        self.fins.append(fim)
+        self.linhas.append(linha)
+        self.colunas.append(coluna)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def tipo(self, i):
+        return TIPO_DO_KIND[self.kinds[i]]
+
+    def inicio(self, i):
+        return self.inicios[i] + self._dpos if i >= self._corte else self.inicios[i]
+
+    def fim(self, i):
+        return self.fins[i] + self._dpos if i >= self._corte else self.fins[i]
+
+    def linha(self, i):
+        linha = self.linhas[i]
+        return linha + self._dlinha if i >= self._corte and self.kinds[i] != KIND_EOF else linha  # EOF fica em -1
+
+    def lexema(self, i):
+        if i < 0:
+            i += len(self)
+        texto = self.texto[self.inicio(i):self.fim(i)]
+        return texto if isinstance(texto, str) else texto.decode("utf-8", "replace")
+
+    def buscar(self, posicao, lo=0):
+        """Primeiro índice >= lo de um token que começa em `posicao` ou depois."""
+        corte = self._corte
+        if lo < corte:
+            j = bisect_left(self.inicios, posicao, lo, corte)
+            if j < corte:
+                return j
+            lo = corte
+        return bisect_left(self.inicios, posicao - self._dpos, lo)
+
+    def _deslocar(self, inicio, fim, dpos, dlinha):
+        """Soma dpos a início/fim e dlinha à linha dos tokens inicio..fim-1."""
+        if dpos:
+            self.inicios[inicio:fim] = array("q", map(dpos.__add__, self.inicios[inicio:fim]))
+            self.fins[inicio:fim] = array("q", map(dpos.__add__, self.fins[inicio:fim]))
+        fim = min(fim, len(self))
+        if fim > inicio and self.kinds[fim - 1] == KIND_EOF:
+            fim -= 1
+        if dlinha:
+            self.linhas[inicio:fim] = array("i", map(dlinha.__add__, self.linhas[inicio:fim]))
+
+    def materializar(self):
+        """Aplica aos arrays o deslocamento pendente deixado por Lexer.relex."""
+        if self._dpos or self._dlinha:
+            self._deslocar(self._corte, len(self), self._dpos, self._dlinha)
+        self._corte = self._dpos = self._dlinha = 0
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        tok = self._vistas.get(i)
+        if tok is None:
+            if i < 0:
+                return self[i + len(self)]
+            if len(self._vistas) >= 64:
+                self._vistas.clear()
+            kind = self.kinds[i]
+            tok = self._vistas[i] = Token(TIPO_DO_KIND[kind], self.lexema(i),
+                                          self.linha(i), self.colunas[i], kind)
+        return tok
+
+    def __iter__(self):
+        for i in range(len(self)):
+            kind = self.kinds[i]
+            yield Token(TIPO_DO_KIND[kind], self.lexema(i), self.linha(i), self.colunas[i], kind)
+
+    def __repr__(self):
+        return f"TokenStream({len(self)} tokens)"
+
 class InputBuffer:
+    binario = False  # texto é str; MmapBuffer guarda bytes
+    lote = False     # LoteBuffer: vários textos num só (Lexer.tokenize_many)
+
     def __init__(self, texto: str):
         self.texto = texto
         self.pos = 0
         self.len = len(texto)
+        self.classes = None  # (tabela, classes) preenchido pelo Lexer no modo tabela
+        self.falhas = None   # memória de falhas do modo linear (Lexer(linear=True))
+        self.prevarredura = None  # prevarredura.Prevarredura do texto (Lexer._preparar_prevarredura)
+        self.base = 0        # índice absoluto de texto[0] (> 0 só em StreamBuffer)
+
+        # cursor de linha/coluna: posições pedidas em ordem crescente custam só
+        # o trecho novo do texto (tokenização linear em vez de quadrática)
+        self._cursor = 0
+        self._linha = 1
+        self._inicio_linha = 0
+        # linha e início de linha de _origem (texto[0], fora do LoteBuffer), para recomeçar o cursor
+        self._linha0 = 1
+        self._inicio0 = 0
+        self._origem = 0
 
     def peek(self, offset=0):
         idx = self.pos + offset
@@ -41,25 +185,359 @@ class InputBuffer:
     def index(self):
         return self.pos
 
+    def posicao(self, index):
+        """(linha, coluna), ambas a partir de 1, do caractere em `index`."""
+        cursor = self._cursor
+        if index < cursor:
+            # voltou (raro): recomeça do início do texto
+            cursor = self._cursor = self._origem
+            self._linha = self._linha0
+            self._inicio_linha = self._inicio0
+        if index > cursor:
+            texto = self.texto
+            quebras = texto.count("\n", cursor, index)
+            if quebras:
+                self._linha += quebras
+                self._inicio_linha = texto.rfind("\n", cursor, index) + 1
+            self._cursor = index
+        return self._linha, index - self._inicio_linha + 1
+
+    def indice(self, index):
+        """Índice absoluto, em caracteres, de `index` (campo "index" dos erros)."""
+        return self.base + index
+
+# bytes de continuação UTF-8 (10xxxxxx): não começam um caractere
+_CONTINUACAO = bytes(range(0x80, 0xC0))
+
+class MmapBuffer(InputBuffer):
+    """
+    InputBuffer sobre um arquivo UTF-8 mapeado em memória: o arquivo nunca é copiado
+    para uma str. `texto` é o próprio mmap e pos/len são contados em bytes; o Lexer
+    percorre o AFD direto nos bytes e só decodifica o lexema ao criar cada Token.
+    Linha, coluna e o "index" dos erros continuam contados em caracteres.
+    Aceita um caminho ou um arquivo aberto em modo binário.
+    """
+    binario = True
+
+    def __init__(self, arquivo):
+        if isinstance(arquivo, (str, bytes, os.PathLike)):
+            with open(arquivo, "rb") as f:
+                dados = self._mapear(f)
+        else:
+            dados = self._mapear(arquivo)
+        super().__init__(dados)
+        # bytes de continuação em [inicio_linha, cursor) e em [0, cursor)
+        self._continuacoes = 0
+        self._continuacoes_total = 0
+
+    @staticmethod
+    def _mapear(f):
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b""  # arquivo vazio não pode ser mapeado
+
+    def fechar(self):
+        if isinstance(self.texto, mmap.mmap):
+            self.texto.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def _fim_caractere(self, idx):
+        texto = self.texto
+        idx += 1
+        while idx < self.len and 0x80 <= texto[idx] < 0xC0:
+            idx += 1
+        return idx
+
+    def peek(self, offset=0):
+        idx = self.pos
+        for _ in range(offset):
+            if idx >= self.len:
+                return None
+            idx = self._fim_caractere(idx)
+        return self.trecho(idx, self._fim_caractere(idx)) if idx < self.len else None
+
+    def next(self):
+        if self.pos < self.len:
+            inicio = self.pos
+            self.pos = self._fim_caractere(inicio)
+            return self.trecho(inicio, self.pos)
+        return None
+
+    def trecho(self, inicio, fim):
+        """Decodifica texto[inicio:fim] (índices em bytes)."""
+        return self.texto[inicio:fim].decode("utf-8", "replace")
+
+    def contexto(self, inicio, fim, margem=10):
+        """trecho(inicio, fim) com até `margem` caracteres de cada lado."""
+        texto = self.texto
+        for _ in range(margem):
+            if inicio == 0:
+                break
+            inicio -= 1
+            while inicio > 0 and 0x80 <= texto[inicio] < 0xC0:
+                inicio -= 1
+        for _ in range(margem):
+            if fim >= self.len:
+                break
+            fim = self._fim_caractere(fim)
+        return self.trecho(inicio, fim)
+
+    def posicao(self, index):
+        cursor = self._cursor
+        if index < cursor:
+            cursor = self._cursor = 0
+            self._linha = 1
+            self._inicio_linha = 0
+            self._continuacoes = self._continuacoes_total = 0
+        if index > cursor:
+            trecho = self.texto[cursor:index]  # só o trecho novo é copiado
+            ascii = trecho.isascii()
+            continuacoes = 0 if ascii else len(trecho) - len(trecho.translate(None, _CONTINUACAO))
+            self._continuacoes_total += continuacoes
+            nl = trecho.rfind(b"\n")
+            if nl != -1:
+                self._linha += trecho.count(b"\n")
+                self._inicio_linha = cursor + nl + 1
+                resto = trecho[nl + 1:]
+                self._continuacoes = 0 if ascii else len(resto) - len(resto.translate(None, _CONTINUACAO))
+            else:
+                self._continuacoes += continuacoes
+            self._cursor = index
+        return self._linha, index - self._inicio_linha - self._continuacoes + 1
+
+    def indice(self, index):
+        self.posicao(index)
+        return index - self._continuacoes_total
+
+class LoteBuffer(InputBuffer):
+    """
+    InputBuffer sobre vários textos de uma vez (Lexer.tokenize_many): ficam
+    concatenados em `texto`, separados por "\0", e selecionar(k) faz o buffer se
+    comportar como se só o k-ésimo existisse (pos, len, linha/coluna e o "index"
+    dos erros relativos a ele). Nenhum AFD da LSD tem transição em "\0", então
+    nenhum token atravessa o separador; as classes do modo tabela são calculadas
+    uma vez para todos os textos.
+    """
+    lote = True
+    SEPARADOR = "\0"
+
+    def __init__(self, textos):
+        textos = list(textos)
+        super().__init__(self.SEPARADOR.join(textos))
+        # início de cada texto em `texto` (e o fim do último + 1)
+        self.inicios = array("q", [0])
+        for t in textos:
+            self.inicios.append(self.inicios[-1] + len(t) + 1)
+
+    def __len__(self):
+        return len(self.inicios) - 1
+
+    def selecionar(self, k):
+        inicio = self.inicios[k]
+        self.pos = self._cursor = self._inicio_linha = self._inicio0 = self._origem = inicio
+        self.len = self.inicios[k + 1] - 1
+        self._linha = self._linha0 = 1
+        self.base = -inicio
+
+class StreamBuffer(InputBuffer):
+    """
+    InputBuffer sobre um arquivo lido em blocos (usado por Lexer.iter_tokens).
+
+    Guarda só uma janela do texto: o trecho ainda não tokenizado mais CONTEXTO
+    caracteres antes dele (usados no contexto das mensagens de erro). Os índices
+    de `texto`/`pos` são relativos à janela; `base` é o índice absoluto de texto[0].
+    Aceita arquivos em modo texto ou binário (decodificado como UTF-8).
+    """
+    CONTEXTO = 10
+
+    def __init__(self, fileobj, chunk_size=1 << 16, quebra_delimita=True):
+        super().__init__("")
+        self.fileobj = fileobj
+        self.chunk_size = chunk_size
+        # se nenhum token atravessa "\n", tudo até a última quebra de linha lida é seguro
+        self.quebra_delimita = quebra_delimita
+        self.eof = False
+        self.limite = 0
+        self._decoder = None
+
+    def _ler_bloco(self):
+        bloco = self.fileobj.read(self.chunk_size)
+        if isinstance(bloco, (bytes, bytearray)):
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder("utf-8")()
+            if not bloco:
+                self.eof = True
+            return self._decoder.decode(bloco, final=self.eof)
+        if not bloco:
+            self.eof = True
+        return bloco
+
+    def _limite_seguro(self):
+        """Tokens que começam antes deste índice cabem inteiros na janela."""
+        if not self.quebra_delimita:
+            return 0
+        fim = self.len - self.CONTEXTO
+        if fim <= self.pos:
+            return 0
+        nl = self.texto.rfind("\n", self.pos, fim)
+        return nl + 1 if nl != -1 else 0
+
+    def carregar(self):
+        """Lê blocos até haver trecho seguro depois de `pos` (ou até o fim do arquivo)."""
+        while not self.eof:
+            limite = self._limite_seguro()
+            if limite > self.pos:
+                self.limite = limite
+                return
+            self._acrescentar(self._ler_bloco())
+        self.limite = self.len
+
+    def _acrescentar(self, novo):
+        # descarta o que já foi tokenizado, mantendo CONTEXTO caracteres
+        corte = max(0, self.pos - self.CONTEXTO)
+        if corte:
+            texto = self.texto
+            self.posicao(self.pos)
+            linha_corte = self._linha - texto.count("\n", corte, self.pos)
+            nl = texto.rfind("\n", 0, corte)
+            inicio_corte = nl + 1 if nl != -1 else self._inicio0
+            self._linha0 = linha_corte
+            self._inicio0 = inicio_corte - corte
+            self._cursor -= corte
+            self._inicio_linha -= corte
+            self.base += corte
+            self.pos -= corte
+            self.texto = texto[corte:] + novo
+        elif novo:
+            self.texto += novo
+        self.len = len(self.texto)
+        self.classes = None
+        self.falhas = None
+        self.prevarredura = None
+
+def _tokenizar_lote(lexer, sources, separadores, eof):
+    """Lexer.tokenize_many de um lote de textos em um processo (ou thread) de um executor."""
+    stream, faixas, erros = lexer.tokenize_many(sources, separadores, eof)
+    return (stream.kinds, stream.inicios, stream.fins, stream.linhas, stream.colunas, faixas, erros,
+            list(TIPO_DO_KIND))
+
+def _tokenizar_trecho(lexer, janela, base, linha0, inicio0, pos, limite):
+    """
+    Tokeniza janela[pos:limite] em um processo de Lexer.tokenize_parallel. `janela`
+    é o trecho com alguns caracteres de contexto em volta; `base`, `linha0` e
+    `inicio0` posicionam janela[0] no texto inteiro (como em StreamBuffer).
+    Devolve colunas (kinds, lexemas, linhas, colunas), os erros e os nomes dos kinds.
+    """
+    buffer = InputBuffer(janela)
+    buffer.base = base
+    buffer._linha = buffer._linha0 = linha0
+    buffer._inicio_linha = buffer._inicio0 = inicio0
+    buffer.pos = pos
+    tokens = []
+    erros = []
+    lexer._varrer(buffer, limite, tokens, erros)
+    kinds = array("H", [t.kind for t in tokens])
+    return (kinds, [t.lexeme for t in tokens], array("i", [t.line for t in tokens]),
+            array("i", [t.col for t in tokens]), erros, list(TIPO_DO_KIND))
+
 class Lexer:
-    def __init__(self, palavras_chave=None, dfa_obj=None, ignorar_whitespace=True):
-        # permite passar dfa explicitamente (ou usa importado)
-        self.dfa = dfa_obj if dfa_obj is not None else dfa
-        self.dfa_rev = dfa_rev
+    def __init__(self, palavras_chave=None, dfa_obj=None, ignorar_whitespace=True, usar_tabela=True,
+                 scanner=None, linear=False, preguicoso=False, prevarredura=None):
+        # modo preguiçoso: AFD construído sob demanda durante a tokenização
+        # (dfa_preguicoso.LazyDFA); dispensa a tabela, o scanner e o modo linear
+        self.preguicoso = preguicoso
+        if preguicoso:
+            if scanner is not None or linear:
+                raise ValueError("O modo preguiçoso não combina com scanner nem com o modo linear")
+            self.dfa = dfa_obj if dfa_obj is not None else afd_preguicoso()
+            if not isinstance(self.dfa, LazyDFA):
+                raise ValueError("O modo preguiçoso exige um dfa_preguicoso.LazyDFA")
+            self.dfa_rev = None
+        else:
+            # permite passar dfa explicitamente (ou usa importado)
+            self.dfa = dfa_obj if dfa_obj is not None else AFN.dfa
+            self.dfa_rev = AFN.dfa_rev if dfa_obj is None else None
+
+            # validar formato mínimo do DFA e dar mensagens úteis
+            self._validate_dfa_shape()
+
+        # modo tabela (padrão): AFD compilado em arrays planos; se o AFD não puder
+        # ser compilado (ex.: transições por classe em vez de caractere), usa os dicionários
+        self.tabela = None
+        if usar_tabela and not preguicoso:
+            try:
+                self.tabela = compile_dfa(self.dfa)
+            except ValueError:
+                self.tabela = None
+
+        # scanner gerado por gerar_scanner.py (módulo ou caminho do .py): tem
+        # precedência sobre a tabela para textos str
+        self.scanner = None
+        if scanner is not None:
+            from gerar_scanner import assinatura_dfa, carregar_scanner
+            if isinstance(scanner, str):
+                scanner = carregar_scanner(scanner)
+            if scanner.ASSINATURA != assinatura_dfa(self.dfa):
+                raise ValueError("O scanner foi gerado para outro AFD; regenere com: python gerar_scanner.py")
+            self.scanner = scanner
+
+        # modo linear: maximal munch com memória de falhas (pior caso O(n) para textos
+        # str); usa o AFD compilado e dispensa o scanner e os laços especializados
+        self.linear = linear
+        if linear and self.tabela is None:
+            raise ValueError("O modo linear exige o AFD compilado (usar_tabela=True)")
 
-        # validar formato mínimo do DFA e dar mensagens úteis
-        self._validate_dfa_shape()
+        # prevarredura (prevarredura.py): índice de linhas, classes e trechos de espaço
+        # calculados antes do laço do AFD. None = só para textos grandes com o NumPy
+        # instalado; True = sempre (em Python puro sem o NumPy); False = nunca
+        self.prevarredura = prevarredura
 
         raw_kws = palavras_chave or ["If", "Print", "CalculateMean", "CalculateSum", "End"]
         self.palavras_chave = set(k.lower() for k in raw_kws)
+        # palavra-chave -> kind: as da LSD têm kind próprio, as extras ficam com KIND_KEYWORD
+        self.kind_palavra = {k: PALAVRAS_CHAVE.get(k, KIND_KEYWORD) for k in self.palavras_chave}
 
         self.ignorar_whitespace = ignorar_whitespace
         self.whitespace_chars = set(" \t\r\n")
 
+        # (passos, inicial, final_kind, tipos, classe_ascii, whitespace, classe_unicode) p/ MmapBuffer
+        self._bytes = None
+
+        # tipos de token cujo lexema pode ser uma palavra-chave: só neles o lexema é
+        # normalizado com lower(); os demais já saem do AFD com o kind final
+        self.tipos_palavra = set()
+        for k in raw_kws:
+            for forma in (k, k.lower(), k.upper()):
+                tamanho, tipo = self._match(forma, 0)
+                if tipo is not None and tamanho == len(forma):
+                    self.tipos_palavra.add(tipo)
+        self._kinds_tabela = self._kinds_de(self.tabela.tipos) if self.tabela is not None else None
+        self._kinds_scanner = self._kinds_de(self.scanner.TIPOS) if self.scanner is not None else None
+        self._kinds_preguicoso = self._kinds_de(self.dfa.tipos) if preguicoso else None
+
         # heurísticas opcionais
         self.operator_start_chars = set("+-*/%=!<>&|^:.?")
         self.operator_types = {"OPERADOR", "ATRIBUICAO"}
 
+    def __getstate__(self):
+        # o scanner é um módulo: vai pelo caminho do arquivo (ex.: para tokenize_parallel)
+        estado = self.__dict__.copy()
+        if self.scanner is not None:
+            estado["scanner"] = self.scanner.__file__
+        return estado
+
+    def __setstate__(self, estado):
+        if isinstance(estado.get("scanner"), str):
+            from gerar_scanner import carregar_scanner
+            estado["scanner"] = carregar_scanner(estado["scanner"])
+        self.__dict__.update(estado)
+
     def _validate_dfa_shape(self):
         # checagens leves para dar mensagens claras
         missing = []
@@ -70,11 +548,19 @@ class Lexer:
             raise ValueError(f"DFA fornecido está incompleto — faltando atributos: {missing}. "
                              "O DFA deve ter 'inicial', 'finais', 'transicoes', 'token_finals'.")
 
-    def _pos_from_index(self, texto, index):
-        linha = texto.count("\n", 0, index) + 1
-        ultimo_n = texto.rfind("\n", 0, index)
-        col = index - ultimo_n if ultimo_n != -1 else index + 1
-        return linha, col
+    def _kinds_de(self, tipos):
+        """Para uma lista de tipos (tabela/scanner): kind de cada um e se pode ser palavra-chave."""
+        kinds = [kind_de_tipo(t) if t is not None else 0 for t in tipos]
+        checar = [t in self.tipos_palavra for t in tipos]
+        return kinds, checar
+
+    def _kind(self, tipo, lexema):
+        """Kind final de um lexema reconhecido como `tipo` (palavras-chave à parte)."""
+        if tipo in self.tipos_palavra:
+            kind = self.kind_palavra.get(lexema.lower())
+            if kind is not None:
+                return kind
+        return kind_de_tipo(tipo)
 
     def _longest_match_from(self, texto, start):
         """
@@ -86,6 +572,8 @@ class Lexer:
         tamanho = 0
         j = start
         n = len(texto)
+        # caracteres não-ASCII casam com faixas (inicio, fim) do alfabeto (AFD_Base)
+        simbolo = getattr(self.dfa, "simbolo", None)
 
         # Se o DFA usar transições com chaves não-exatas, este método
         # precisa ser alinhado com a representação do seu DFA.
@@ -97,87 +585,661 @@ class Lexer:
 
             # trans_row é esperado como dict: símbolo_char -> próximo_estado
             # se seu DFA usa classes (ex: 'DIGIT') você pode adaptar aqui
-            if c not in trans_row:
+            prox = trans_row.get(c)
+            if prox is None and c >= "\x80" and simbolo is not None:
+                prox = trans_row.get(simbolo(c))
+            if prox is None:
                 break
-            estado = trans_row[c]
+            estado = prox
             j += 1
             if estado in self.dfa.finais:
                 ultimo_final = estado
                 tamanho = j - start
         return tamanho, ultimo_final
 
-    def next_token(self, buffer: InputBuffer):
-        texto = buffer.texto
-        n = buffer.len
+    def _match(self, texto, start, classes=None, falhas=None):
+        """
+        Maior lexema a partir de `start` no modo ativo (tabela, preguiçoso ou dicionário).
+        Retorna (tamanho, tipo_do_token) ou (0, None) se nada for reconhecido.
+        Com `falhas` (modo linear), usa a busca com memória de falhas.
+        """
+        if falhas is not None:
+            tamanho, kind = self.tabela.longest_match_memo(texto, start, falhas)
+            return tamanho, self.tabela.tipos[kind]
+        if self.scanner is not None:
+            tamanho, kind = self.scanner.longest_match(texto, start, len(texto))
+            return tamanho, self.scanner.TIPOS[kind]
+        if self.preguicoso:
+            tamanho, kind = self.dfa.longest_match(texto, start)
+            return tamanho, self.dfa.tipos[kind]
+        if self.tabela is not None:
+            if classes is not None:
+                tamanho, kind = self.tabela.longest_match_classes(classes, start)
+            else:
+                tamanho, kind = self.tabela.longest_match(texto, start)
+            return tamanho, self.tabela.tipos[kind]
+        tamanho, ultimo_final = self._longest_match_from(texto, start)
+        if ultimo_final is None:
+            return tamanho, None
+        return tamanho, self.dfa.token_finals.get(ultimo_final, "UNKNOWN")
 
-        # consumir whitespace
-        while not buffer.at_end() and self.ignorar_whitespace and buffer.peek() in self.whitespace_chars:
-            buffer.next()
+    def _pular_whitespace(self, buffer):
+        if self.ignorar_whitespace:
+            pre = buffer.prevarredura
+            if pre is not None and pre.tabela is self.tabela and pre.espacos == self.whitespace_chars:
+                buffer.pos = pre.pular(buffer.pos)
+                return
+            texto = buffer.texto
+            n = buffer.len
+            whitespace_chars = self.whitespace_chars
+            i = buffer.pos
+            while i < n and texto[i] in whitespace_chars:
+                i += 1
+            buffer.pos = i
 
-        if buffer.at_end():
-            return Token("EOF", "", -1, -1), None
+    def _classes_do_buffer(self, buffer):
+        # classes de todos os caracteres calculadas uma vez por buffer (modo tabela)
+        cache = buffer.classes
+        if cache is None or cache[0] is not self.tabela:
+            cache = buffer.classes = (self.tabela, self.tabela.classes_de(buffer.texto))
+        return cache[1]
 
-        i = buffer.index()
-        tamanho, ultimo_final = self._longest_match_from(texto, i)
-
-        if ultimo_final is None or tamanho == 0:
-            # erro léxico: avançar minimamente para evitar loop infinito
-            k = i + 1
-            while k < n and texto[k] not in self.whitespace_chars:
-                look_t, look_f = self._longest_match_from(texto, k)
-                if look_f is not None:
+    def _preparar_prevarredura(self, buffer):
+        """
+        Prevarredura do buffer (também guardada em buffer.prevarredura, com as classes
+        em buffer.classes), ou None se este Lexer não a usa para o buffer.
+        """
+        if self.prevarredura is False or buffer.binario or buffer.lote:
+            return None
+        pre = buffer.prevarredura
+        if pre is not None and pre.tabela is self.tabela and pre.espacos == self.whitespace_chars:
+            return pre
+        if self.prevarredura is None and (buffer.len < PREVARREDURA_MINIMA or not numpy_disponivel()):
+            return None
+        pre = buffer.prevarredura = prevarrer(buffer.texto, self.tabela, self.whitespace_chars,
+                                              buffer._linha0, buffer._inicio0)
+        if pre.classes is not None:
+            buffer.classes = (self.tabela, pre.classes)
+        return pre
+
+    def _falhas_do_buffer(self, buffer):
+        # memória de falhas do modo linear: vale enquanto o texto do buffer não muda
+        if buffer.falhas is None:
+            buffer.falhas = set()
+        return buffer.falhas
+
+    def _quebra_de_linha_delimita(self):
+        """True se nenhum token continua depois de consumir um "\n" (vale para os AFDs da LSD)."""
+        if self.preguicoso:
+            return self.dfa.quebra_de_linha_delimita()
+        transicoes = self.dfa.transicoes
+        for row in transicoes.values():
+            dest = row.get("\n")
+            if dest is not None and transicoes.get(dest):
+                return False
+        return True
+
+    def _tabela_bytes(self):
+        """
+        AFD compilado indexado por byte, para buffers binários (MmapBuffer). Bytes
+        ASCII usam a tabela de classes direto; um byte >= 0x80 começa uma sequência
+        UTF-8, decodificada para achar a classe do code point nas faixas (sequências
+        inválidas ficam sem transição).
+        """
+        if self._bytes is None:
+            try:
+                tabela = compile_dfa(self.dfa)
+            except ValueError:
+                raise ValueError("MmapBuffer exige um AFD compilável") from None
+            whitespace = frozenset(ord(c) for c in self.whitespace_chars if ord(c) < 128)
+            self._bytes = (tabela._passos, tabela.inicial, tabela.final_kind, tabela.tipos,
+                           tabela.classe_ascii, whitespace, tabela.classe_unicode)
+        return self._bytes
+
+    def _longest_match_bytes(self, texto, start, n):
+        passos, estado, final_kind, _, classe_ascii, _, classe_unicode = self._tabela_bytes()
+        ultimo = 0
+        fim = j = start
+        while j < n:
+            b = texto[j]
+            if b < 128:
+                estado = passos[estado + classe_ascii[b]]
+                j += 1
+            else:
+                tamanho = 2 if b < 0xE0 else 3 if b < 0xF0 else 4
+                try:
+                    o = ord(texto[j:j + tamanho].decode("utf-8"))
+                except UnicodeDecodeError:
+                    break
+                estado = passos[estado + classe_unicode(o)]
+                j += tamanho
+            if estado < 0:
+                break
+            k = final_kind[estado]
+            if k:
+                ultimo = k
+                fim = j
+        return fim - start, ultimo
+
+    def _next_token_bytes(self, buffer):
+        """next_token para MmapBuffer: mesmo resultado, AFD percorrido nos bytes."""
+        _, _, _, tipos, _, whitespace, _ = self._tabela_bytes()
+        texto = buffer.texto
+        n = buffer.len
+        i = buffer.pos
+        if self.ignorar_whitespace:
+            while i < n and texto[i] in whitespace:
+                i += 1
+            buffer.pos = i
+        if i >= n:
+            return Token("EOF", "", -1, -1, KIND_EOF), None
+
+        tamanho, kind = self._longest_match_bytes(texto, i, n)
+        if not kind or tamanho == 0:
+            # o lexema inválido avança caractere a caractere, nunca no meio de um UTF-8
+            k = buffer._fim_caractere(i)
+            while k < n and texto[k] not in whitespace:
+                if self._longest_match_bytes(texto, k, n)[1]:
                     break
-                k += 1
-            lex_err = texto[i:k]
-            linha, col = self._pos_from_index(texto, i)
-            contexto = texto[max(0, i-10):min(n, k+10)].replace("\n", "\\n")
+                k = buffer._fim_caractere(k)
+            lex_err = buffer.trecho(i, k)
+            linha, col = buffer.posicao(i)
+            contexto = buffer.contexto(i, k).replace("\n", "\\n")
             erro = {
                 "lexema": lex_err,
-                "index": i,
+                "index": buffer.indice(i),
                 "line": linha,
                 "col": col,
                 "msg": f"Token inválido: {lex_err!r} at line {linha} col {col}; contexto='{contexto}'"
             }
-            # avança buffer para não travar
             buffer.advance(max(1, k - i))
             return None, erro
 
-        lexema = texto[i:i+tamanho]
-        ultimo_final_state = ultimo_final
-        # depois de obter lexema e token_type do DFA:
-        token_type = self.dfa.token_finals.get(ultimo_final_state, "UNKNOWN")
-        if token_type == "IDENTIFIER" and lexema.lower() in self.palavras_chave:
-            # usar nome do keyword como token type (preserva qual keyword)
-            tipo_final = lexema  # ou lexema.capitalize() / lexema.upper() conforme sua convenção
+        lexema = texto[i:i + tamanho].decode("utf-8")
+        kind = self._kind(tipos[kind], lexema)
+        linha, col = buffer.posicao(i)
+        buffer.pos = i + tamanho
+        return Token(TIPO_DO_KIND[kind], lexema, linha, col, kind), None
+
+    def _erro_lexico(self, buffer, i, classes=None):
+        """Erro léxico em `i` (buffer de str): o lexema inválido vai até um espaço ou um token válido."""
+        # erro léxico: avançar minimamente para evitar loop infinito
+        texto = buffer.texto
+        n = buffer.len
+        falhas = self._falhas_do_buffer(buffer) if self.linear else None
+        k = i + 1
+        while k < n and texto[k] not in self.whitespace_chars:
+            look_t, look_tipo = self._match(texto, k, classes, falhas)
+            if look_tipo is not None:
+                break
+            k += 1
+        linha, col = buffer.posicao(i)
+        erro = self._erro(texto, i, k, linha, col, buffer.base + i, buffer._origem, n)
+        # avança buffer para não travar
+        buffer.advance(max(1, k - i))
+        return erro
+
+    @staticmethod
+    def _erro(texto, i, k, linha, col, indice, inicio=0, fim=None):
+        # o contexto fica dentro de texto[inicio:fim] (um só texto de um LoteBuffer)
+        lex_err = texto[i:k]
+        fim = len(texto) if fim is None else fim
+        contexto = texto[max(inicio, i-10):min(fim, k+10)].replace("\n", "\\n")
+        return {
+            "lexema": lex_err,
+            "index": indice,
+            "line": linha,
+            "col": col,
+            "msg": f"Token inválido: {lex_err!r} at line {linha} col {col}; contexto='{contexto}'"
+        }
+
+    def next_token(self, buffer: InputBuffer):
+        if buffer.binario:
+            return self._next_token_bytes(buffer)
+        texto = buffer.texto
+        n = buffer.len
+
+        # consumir whitespace
+        self._pular_whitespace(buffer)
+
+        if buffer.at_end():
+            return Token("EOF", "", -1, -1, KIND_EOF), None
+
+        i = buffer.index()
+        classes = None
+        tabela = self.tabela
+        if self.linear:
+            tamanho, token_type = self._match(texto, i, falhas=self._falhas_do_buffer(buffer))
+        elif self.scanner is not None:
+            tamanho, token_type = self._match(texto, i)
+        elif tabela is not None:
+            classes = self._classes_do_buffer(buffer)
+            tamanho, kind = tabela.longest_match_classes(classes, i)
+            token_type = tabela.tipos[kind]
         else:
-            tipo_final = token_type
+            tamanho, token_type = self._match(texto, i)
 
+        if token_type is None or tamanho == 0:
+            return None, self._erro_lexico(buffer, i, classes)
 
-        tipo_final = "KEYWORD" if lexema.lower() in self.palavras_chave else token_type
-        linha, col = self._pos_from_index(texto, i)
+        lexema = texto[i:i+tamanho]
+        # palavras-chave viram KEYWORD (preserva o lexema original)
+        kind = self._kind(token_type, lexema)
+        linha, col = buffer.posicao(i)
         buffer.advance(tamanho)
 
-        tok = Token(tipo_final, lexema, linha, col)
+        tok = Token(TIPO_DO_KIND[kind], lexema, linha, col, kind)
         return tok, None
 
     def tokenize(self, texto):
-        buffer = InputBuffer(texto)
+        # aceita também um InputBuffer pronto (ex.: MmapBuffer)
+        buffer = texto if isinstance(texto, InputBuffer) else InputBuffer(texto)
         tokens = []
         erros = []
+        self._varrer(buffer, buffer.len, tokens, erros)
+        return tokens, erros
+
+    def tokenize_stream(self, texto, separadores=(), eof=True):
+        """
+        Como tokenize, mas devolve (TokenStream, erros): os tokens ficam em colunas,
+        sem criar um Token por lexema. `separadores` lista os lexemas de SEPARADOR que
+        devem ser mantidos (o Parser mantém parênteses, colchetes e vírgula); com
+        eof=False o token EOF não entra no stream. `texto` pode ser um InputBuffer.
+        """
+        buffer = texto if isinstance(texto, InputBuffer) else InputBuffer(texto)
+        separadores = frozenset(separadores)
+        stream = TokenStream(buffer.texto, separadores=separadores, eof=eof)
+        self._varrer_stream(buffer, stream, separadores, eof)
+        return stream, stream.erros
+
+    def _varrer_stream(self, buffer, stream, separadores, eof):
+        """Tokeniza `buffer` a partir de buffer.pos acrescentando nas colunas de `stream`."""
+        if self.tabela is not None and not buffer.binario and self.scanner is None and not self.linear:
+            self._varrer_colunas(buffer, stream, separadores, eof)
+            return
+
+        # demais modos: next_token, guardando só as colunas
+        if self.scanner is None:
+            self._preparar_prevarredura(buffer)
+        erros = stream.erros
+        safety_counter = 0
+        max_steps = max(1000000, buffer.len * 20)
+        while True:
+            safety_counter += 1
+            if safety_counter > max_steps:
+                raise RuntimeError("Tokenization exceeded maximum steps — possível loop infinito.")
+            tok, err = self.next_token(buffer)
+            if err:
+                erros.append(err)
+                if buffer.at_end():
+                    break
+                continue
+            if tok.kind == KIND_EOF:
+                if eof:
+                    stream.append(KIND_EOF, buffer.len, buffer.len, -1, -1)
+                break
+            if tok.kind == KIND_COMENTARIO or (tok.kind == KIND_SEPARADOR and tok.lexeme not in separadores):
+                continue
+            # no MmapBuffer as posições são em bytes: lexemas não-ASCII ocupam mais de um
+            tamanho = len(tok.lexeme)
+            if buffer.binario and not tok.lexeme.isascii():
+                tamanho = len(tok.lexeme.encode("utf-8"))
+            stream.append(tok.kind, buffer.pos - tamanho, buffer.pos, tok.line, tok.col)
+
+    def tokenize_lazy(self, texto, separadores=(), erros=None):
+        """
+        Gera os tokens de tokenize_stream(texto, separadores, eof=False) um a um, sob
+        demanda: cada token só é reconhecido quando o anterior é consumido, sem lista
+        nem colunas com todos eles (o Parser puxa os tokens assim). COMENTARIO e os
+        SEPARADOR fora de `separadores` são descartados na hora; os erros léxicos vão
+        para `erros`, se informado, conforme aparecem. `texto` pode ser um InputBuffer.
+        """
+        buffer = texto if isinstance(texto, InputBuffer) else InputBuffer(texto)
+        separadores = frozenset(separadores)
+        if erros is None:
+            erros = []
+        if self.scanner is None:
+            self._preparar_prevarredura(buffer)
+        next_token = self.next_token
+        while True:
+            tok, err = next_token(buffer)
+            if err:
+                erros.append(err)
+                if buffer.at_end():
+                    return
+                continue
+            kind = tok.kind
+            if kind == KIND_EOF:
+                return
+            if kind == KIND_COMENTARIO or (kind == KIND_SEPARADOR and tok.lexeme not in separadores):
+                continue
+            yield tok
+
+    def tokenize_many(self, sources, separadores=(), eof=True, workers=None, executor=None, lote_minimo=256):
+        """
+        Tokeniza vários textos numa chamada, com o resultado de tokenize_stream de cada
+        um. Devolve (stream, faixas, erros): um TokenStream só com os tokens de todos os
+        textos (stream.texto é a concatenação de um LoteBuffer, e inicio/fim de cada token
+        são posições nela), `faixas` com faixas[k]:faixas[k + 1] = tokens do texto k, e
+        erros[k] = lista de erros do texto k (com "index" relativo ao texto).
+
+        Os textos dividem um único buffer e uma única passada de classes (LoteBuffer).
+        Com workers > 1 (ou um `executor`, de threads ou de processos), lotes de pelo
+        menos `lote_minimo` textos são tokenizados em paralelo e juntados em ordem.
+        """
+        sources = list(sources)
+        separadores = frozenset(separadores)
+        if executor is not None or (workers or 1) > 1:
+            partes = min(workers or os.cpu_count() or 1, len(sources) // max(1, lote_minimo))
+            if executor is not None or partes > 1:
+                return self._tokenize_many_paralelo(sources, separadores, eof, max(1, partes), executor)
+
+        buffer = LoteBuffer(sources)
+        stream = TokenStream(buffer.texto, separadores=separadores, eof=eof)
+        faixas = array("q", [0])
+        erros = []
+        for k in range(len(buffer)):
+            buffer.selecionar(k)
+            antes = len(stream.erros)
+            self._varrer_stream(buffer, stream, separadores, eof)
+            faixas.append(len(stream))
+            erros.append(stream.erros[antes:])
+        return stream, faixas, erros
+
+    def _tokenize_many_paralelo(self, sources, separadores, eof, partes, executor):
+        from concurrent.futures import ProcessPoolExecutor
+
+        cortes = [len(sources) * k // partes for k in range(partes + 1)]
+        lotes = [sources[a:b] for a, b in zip(cortes, cortes[1:])]
+        proprio = executor is None
+        if proprio:
+            executor = ProcessPoolExecutor(max_workers=partes)
+        try:
+            resultados = list(executor.map(_tokenizar_lote, [self] * len(lotes), lotes,
+                                           [separadores] * len(lotes), [eof] * len(lotes)))
+        finally:
+            if proprio:
+                executor.shutdown()
+
+        # junta os lotes em ordem: posições somadas ao início do lote no texto concatenado
+        stream = TokenStream(LoteBuffer.SEPARADOR.join(sources), separadores=separadores, eof=eof)
+        faixas = array("q", [0])
+        erros = []
+        deslocamento = 0
+        for lote, (kinds, inicios, fins, linhas, colunas, faixas_lote, erros_lote, tipos) in zip(lotes, resultados):
+            if tipos != TIPO_DO_KIND:
+                # tipos registrados só em um dos processos: renumera pelo nome
+                renumera = [k if k <= KIND_UNKNOWN else kind_de_tipo(t) for k, t in enumerate(tipos)]
+                kinds = array("H", [renumera[k] for k in kinds])
+            total = len(stream)
+            stream.kinds.extend(kinds)
+            stream.inicios.extend(array("q", map(deslocamento.__add__, inicios)))
+            stream.fins.extend(array("q", map(deslocamento.__add__, fins)))
+            stream.linhas.extend(linhas)
+            stream.colunas.extend(colunas)
+            faixas.extend(array("q", map(total.__add__, faixas_lote[1:])))
+            erros.extend(erros_lote)
+            for erros_texto in erros_lote:
+                stream.erros.extend(erros_texto)
+            deslocamento += sum(map(len, lote)) + len(lote)
+        return stream, faixas, erros
+
+    def _varrer_colunas(self, buffer, stream, separadores, eof):
+        # _varrer_lexemas escrevendo direto nas colunas do TokenStream
+        pre = self._preparar_prevarredura(buffer)
+        add_kind = stream.kinds.append
+        add_inicio = stream.inicios.append
+        add_fim = stream.fins.append
+        add_linha = stream.linhas.append
+        add_coluna = stream.colunas.append
+        for kind, inicio, fim, linha, col in self._lexemas(buffer, buffer.len, stream.erros, separadores, eof, pre):
+            add_kind(kind)
+            add_inicio(inicio)
+            add_fim(fim)
+            add_linha(linha)
+            add_coluna(col)
+
+    def relex(self, old_tokens, edit_range, new_text):
+        """
+        Retokeniza depois de uma edição: old_tokens é o TokenStream de um texto
+        (tokenize_stream ou relex) e o trecho edit_range = (inicio, fim) desse texto
+        é trocado por new_text. Devolve (TokenStream, erros) iguais aos de
+        tokenize_stream(texto_novo) com as mesmas opções.
+
+        O AFD recomeça no início da linha da edição (nenhum token da LSD atravessa
+        uma quebra de linha, então ali o lexer sempre começa um token) e para no
+        primeiro token, depois da edição, que começa onde um token antigo começava:
+        daí em diante os tokens antigos são reaproveitados, com início/fim, linha
+        e coluna deslocados. Sem essa garantia do AFD, retokeniza o texto inteiro.
+        """
+        if not isinstance(old_tokens, TokenStream) or not isinstance(old_tokens.texto, str):
+            raise TypeError("relex espera o TokenStream (de texto str) de tokenize_stream ou relex")
+        antigo = old_tokens.texto
+        inicio, fim = edit_range
+        if not 0 <= inicio <= fim <= len(antigo):
+            raise ValueError(f"edit_range {edit_range!r} fora do texto ({len(antigo)} caracteres)")
+        texto = antigo[:inicio] + new_text + antigo[fim:]
+        separadores = old_tokens.separadores
+        eof = old_tokens.eof
+        if "\n" not in self.whitespace_chars or not self._quebra_de_linha_delimita():
+            return self.tokenize_stream(texto, separadores, eof)
+
+        delta = len(new_text) - (fim - inicio)
+        fim_novo = fim + delta
+        n = len(texto)
+
+        # recomeço: início da linha da edição; tokens antes dele ficam como estão
+        comeco = antigo.rfind("\n", 0, inicio) + 1
+        k0 = old_tokens.buscar(comeco)
+        if k0:
+            linha = old_tokens.linha(k0 - 1) + antigo.count("\n", old_tokens.inicio(k0 - 1), comeco)
+        else:
+            linha = antigo.count("\n", 0, comeco) + 1
+        buffer = InputBuffer(texto)
+        buffer.pos = buffer._cursor = buffer._inicio_linha = comeco
+        buffer._linha = linha
+
+        novo = TokenStream(texto, separadores=separadores, eof=eof)
+        for coluna in ("kinds", "inicios", "fins", "linhas", "colunas"):
+            getattr(novo, coluna).extend(getattr(old_tokens, coluna)[:k0])
+        # erros antes do recomeço: o contexto da mensagem (10 caracteres) pode alcançar a edição
+        erros = novo.erros
+        for erro in old_tokens.erros:
+            if erro["index"] >= comeco:
+                break
+            i = erro["index"]
+            k = i + len(erro["lexema"])
+            if k + 10 > inicio:
+                erro = self._erro(texto, i, k, erro["line"], erro["col"], i)
+            erros.append(erro)
+
+        # retokeniza até reencontrar o início de um token antigo depois da edição
+        sincronia = None
+        for kind, i, fim, linha, col in self._lexemas(buffer, n, erros, separadores, eof, por_classes=False):
+            if i >= fim_novo and kind != KIND_EOF:
+                j = old_tokens.buscar(i - delta, k0)
+                if j < len(old_tokens) and old_tokens.inicio(j) == i - delta:
+                    sincronia = j
+                    break
+            novo.append(kind, i, fim, linha, col)
+
+        base = len(novo)
+        delta_linha = 0
+        if sincronia is not None:
+            # cauda reaproveitada: copiada como está; posições e linhas são deslocadas
+            # abaixo e as colunas mudam só na linha do primeiro token reaproveitado
+            linha_antiga = old_tokens.linha(sincronia)
+            delta_linha = linha - linha_antiga
+            dcol = col - old_tokens.colunas[sincronia]
+            for coluna in ("kinds", "inicios", "fins", "linhas", "colunas"):
+                getattr(novo, coluna).extend(getattr(old_tokens, coluna)[sincronia:])
+            if dcol:
+                j = sincronia
+                while j < len(old_tokens) and old_tokens.linha(j) == linha_antiga:
+                    novo.colunas[base + j - sincronia] += dcol
+                    j += 1
+
+            inicio_antigo = old_tokens.inicio(sincronia)
+            for erro in old_tokens.erros:
+                if erro["index"] < inicio_antigo:
+                    continue
+                i = erro["index"] + delta
+                linha = erro["line"] + delta_linha
+                col = erro["col"] + dcol if erro["line"] == linha_antiga else erro["col"]
+                erros.append(self._erro(texto, i, i + len(erro["lexema"]), linha, col, i))
+        self._deslocar_cauda(old_tokens, novo, k0, sincronia, base, delta, delta_linha)
+        return novo, erros
+
+    @staticmethod
+    def _deslocar_cauda(antigo, novo, k0, sincronia, base, delta, delta_linha):
+        """
+        Deslocamentos de relex. `novo` tem antigo[:k0] (arrays como estavam), os tokens
+        retokenizados (até `base`) e antigo[sincronia:]. Os tokens antigos a partir de
+        antigo._corte ainda têm o deslocamento pendente de antigo; a cauda precisa
+        também de (delta, delta_linha). Com um só deslocamento pendente por stream,
+        aplica já o que for menor, de modo que edições próximas custem pouco.
+        """
+        corte, dpos, dlinha = antigo._corte, antigo._dpos, antigo._dlinha
+        cauda = len(novo) - base
+        if not (dpos or dlinha):
+            novo._corte, novo._dpos, novo._dlinha = base, delta, delta_linha
+        elif k0 <= corte:
+            # cauda = A (antes do corte antigo, sem pendência) + B (com a pendência antiga)
+            meio = base + max(0, min(cauda, corte - sincronia)) if cauda else base
+            if meio - base <= len(novo) - meio:
+                novo._deslocar(base, meio, delta, delta_linha)
+                novo._corte, novo._dpos, novo._dlinha = meio, dpos + delta, dlinha + delta_linha
+            else:
+                novo._deslocar(meio, len(novo), dpos, dlinha)
+                novo._corte, novo._dpos, novo._dlinha = base, delta, delta_linha
+        elif k0 - corte <= cauda:
+            novo._deslocar(corte, k0, dpos, dlinha)
+            novo._corte, novo._dpos, novo._dlinha = base, dpos + delta, dlinha + delta_linha
+        else:
+            # mantém a pendência antiga a partir do corte: os retokenizados a descontam
+            novo._deslocar(k0, base, -dpos, -dlinha)
+            novo._deslocar(base, len(novo), delta, delta_linha)
+            novo._corte, novo._dpos, novo._dlinha = corte, dpos, dlinha
+        if not (novo._dpos or novo._dlinha):
+            novo._corte = 0
+
+    def iter_tokens(self, fileobj, chunk_size=1 << 16, erros=None):
+        """
+        Gera os mesmos tokens de tokenize(fileobj.read()), lendo o arquivo em blocos
+        de `chunk_size` caracteres (ou bytes, em modo binário). A memória usada é
+        limitada pelo tamanho do bloco e da maior linha, não pelo tamanho do arquivo.
+        Erros léxicos são acrescentados em `erros`, se informado.
+        """
+        if erros is None:
+            erros = []
+        buffer = StreamBuffer(fileobj, chunk_size, self._quebra_de_linha_delimita())
+        tokens = []
+        while True:
+            buffer.carregar()
+            terminou = self._varrer(buffer, buffer.limite, tokens, erros)
+            yield from tokens
+            tokens.clear()
+            if terminou:
+                return
+
+    def tokenize_parallel(self, source, workers=None, executor=None, trecho_minimo=1 << 16):
+        """
+        Mesmo resultado de tokenize(source), com o texto dividido em até `workers`
+        trechos (padrão: os.cpu_count()) tokenizados em processos separados.
+
+        Os cortes ficam logo depois de um "\n". No AFD da LSD nenhum token (nem
+        string, nem comentário // , nem lexema inválido) continua depois de uma
+        quebra de linha, então o lexer sequencial sempre recomeça ali: cada trecho
+        é tokenizado como se o texto inteiro estivesse sendo lido. Com um AFD ou
+        espaços em branco em que isso não vale, cai no tokenize sequencial.
+        `executor` permite reaproveitar um ProcessPoolExecutor entre chamadas;
+        trechos têm pelo menos `trecho_minimo` caracteres.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        if isinstance(source, InputBuffer):
+            return self.tokenize(source)
+        workers = workers or os.cpu_count() or 1
+        n = len(source)
+        partes = min(workers, n // max(1, trecho_minimo))
+        if partes <= 1 or "\n" not in self.whitespace_chars or not self._quebra_de_linha_delimita():
+            return self.tokenize(source)
+
+        cortes = [0]
+        for k in range(1, partes):
+            corte = source.find("\n", max(cortes[-1], n * k // partes)) + 1
+            if corte == 0 or corte >= n:
+                break
+            if corte > cortes[-1]:
+                cortes.append(corte)
+        cortes.append(n)
+
+        contexto = StreamBuffer.CONTEXTO
+        tarefas = []
+        linha, inicio_linha, fim_contado = 1, 0, 0
+        for inicio, fim in zip(cortes, cortes[1:]):
+            janela_ini = max(0, inicio - contexto)
+            janela_fim = fim + contexto if fim < n else n
+            quebras = source.count("\n", fim_contado, janela_ini)
+            if quebras:
+                linha += quebras
+                inicio_linha = source.rfind("\n", fim_contado, janela_ini) + 1
+            fim_contado = janela_ini
+            tarefas.append((self, source[janela_ini:janela_fim], janela_ini, linha,
+                            inicio_linha - janela_ini, inicio - janela_ini, fim - janela_ini))
+
+        proprio = executor is None
+        if proprio:
+            executor = ProcessPoolExecutor(max_workers=min(workers, len(tarefas)))
+        try:
+            resultados = executor.map(_tokenizar_trecho, *zip(*tarefas))
+            tokens = []
+            erros = []
+            for kinds, lexemas, linhas, colunas, erros_trecho, tipos in resultados:
+                if tipos != TIPO_DO_KIND:
+                    # tipos registrados só em um dos processos: renumera pelo nome
+                    renumera = [k if k <= KIND_UNKNOWN else kind_de_tipo(t) for k, t in enumerate(tipos)]
+                    kinds = [renumera[k] for k in kinds]
+                tokens.extend(map(Token, map(TIPO_DO_KIND.__getitem__, kinds), lexemas, linhas, colunas,
+                                  kinds))
+                erros.extend(erros_trecho)
+        finally:
+            if proprio:
+                executor.shutdown()
+        return tokens, erros
+
+    def _varrer(self, buffer, limite, tokens, erros):
+        """
+        Tokeniza `buffer` a partir de buffer.pos, acrescentando em `tokens` (sem
+        COMENTARIO/SEPARADOR) e `erros`. Com limite < buffer.len, para antes de um
+        token que começaria em `limite` ou depois e retorna False; retorna True
+        quando chega ao fim do texto.
+        """
+        if not buffer.binario:
+            if self.scanner is not None and not self.linear:
+                return self._varrer_scanner(buffer, limite, tokens, erros)
+            if self.linear or self.preguicoso or self.tabela is not None:
+                return self._varrer_lexemas(buffer, limite, tokens, erros)
+            self._preparar_prevarredura(buffer)  # usada por _pular_whitespace
+
         safety_counter = 0
-        max_steps = max(1000000, len(texto) * 20)  # evita loops infinitos
+        max_steps = max(1000000, buffer.len * 20)  # evita loops infinitos
 
         while True:
             safety_counter += 1
             if safety_counter > max_steps:
                 raise RuntimeError("Tokenization exceeded maximum steps — possível loop infinito.")
 
+            self._pular_whitespace(buffer)
+            if limite < buffer.len and buffer.pos >= limite:
+                return False
+
             tok, err = self.next_token(buffer)
             if err:
                 erros.append(err)
                 # continue (já avançamos no buffer em caso de erro)
                 if buffer.at_end():
-                    break
+                    return True
                 else:
                     continue
             if tok is None:
@@ -186,15 +1248,231 @@ class Lexer:
                     buffer.advance(1)
                     continue
                 else:
-                    break
-            if tok.type == "EOF":
+                    return True
+            if tok.kind == KIND_EOF:
                 tokens.append(tok)
-                break
+                return True
             # filtragem opcional (quem chama decide se quer filtrar)
-            if tok.type in ("COMENTARIO", "SEPARADOR"):
+            if tok.kind == KIND_COMENTARIO or tok.kind == KIND_SEPARADOR:
                 continue
             tokens.append(tok)
-        return tokens, erros
+
+    def _lexemas(self, buffer, limite, erros, separadores=frozenset(), eof=True, pre=None, por_classes=True):
+        """
+        Laço comum das varreduras de texto str. A partir de buffer.pos, pula os espaços
+        (de uma vez com os saltos da prevarredura `pre`), reconhece o maior lexema no
+        modo ativo e gera (kind, inicio, fim, linha, coluna) de cada token, sem
+        COMENTARIO nem SEPARADOR fora de `separadores`. No fim do texto gera o EOF
+        (KIND_EOF, len, len, -1, -1) se eof=True. Um lexema inválido vira um erro em
+        `erros`, como em next_token (e o laço termina sem EOF se ele for até o fim).
+        Com limite < buffer.len, para antes de um token que começaria em `limite` ou
+        depois. buffer.pos fica onde o laço parou.
+
+        Só o passo do AFD muda com o modo: a tabela compilada anda nas classes do
+        buffer (no modo linear, consultando e alimentando a memória de falhas, como
+        CompiledDFA.longest_match_memo), o preguiçoso lê as linhas do cache do LazyDFA,
+        e os demais chamam uma busca por token (casar). Com por_classes=False (relex,
+        que não quer calcular as classes do texto inteiro) a tabela também usa casar.
+        """
+        texto = buffer.texto
+        n = buffer.len
+        tabela = self.tabela
+        passos = linhas = casar = classes = falhas = None
+        if self.linear:
+            kinds, checar = self._kinds_tabela
+            falhas = self._falhas_do_buffer(buffer)
+            if por_classes:
+                classes = self._classes_do_buffer(buffer)
+                passos = tabela._passos
+            else:
+                casar = partial(tabela.longest_match_memo, texto, falhas=falhas, n=n)
+        elif self.scanner is not None:
+            kinds, checar = self._kinds_scanner
+            casar = partial(self.scanner.longest_match, texto, n=n)
+        elif self.preguicoso:
+            kinds, checar = self._kinds_preguicoso
+            # listas esvaziadas no lugar quando o cache é descartado: continuam válidas
+            linhas = self.dfa._linhas
+            final_kind = self.dfa._final_kind
+            passo = self.dfa._passo
+        elif tabela is not None:
+            kinds, checar = self._kinds_tabela
+            if por_classes:
+                classes = self._classes_do_buffer(buffer)
+                passos = tabela._passos
+            else:
+                casar = partial(tabela.longest_match, texto, n=n)
+        else:
+            # AFD de dicionários (só no relex, com buffer.len == len(texto)): tipos pelo nome
+            tipos = set(self.dfa.token_finals.values()) | {"UNKNOWN"}
+            kinds = {t: kind_de_tipo(t) for t in tipos}
+            checar = {t: t in self.tipos_palavra for t in tipos}
+            casar = partial(self._match, texto)
+        if passos is not None:
+            final_kind = tabela.final_kind
+            inicial = tabela.inicial
+            tamanho_passos = len(passos)
+
+        kind_palavra = self.kind_palavra
+        whitespace_chars = self.whitespace_chars
+        ignorar_whitespace = self.ignorar_whitespace
+        # com a prevarredura: linha/coluna por busca binária e trechos de espaço pulados de uma vez
+        posicao = pre.posicao if pre is not None else buffer.posicao
+        saltos = pre.saltos if pre is not None and ignorar_whitespace else None
+
+        i = buffer.pos
+        while True:
+            if saltos is not None:
+                pulo = saltos[i]
+                while pulo:
+                    i += pulo
+                    pulo = saltos[i]
+            elif ignorar_whitespace:
+                while i < n and texto[i] in whitespace_chars:
+                    i += 1
+            if limite < n and i >= limite:
+                buffer.pos = i
+                return
+            if i >= n:
+                buffer.pos = i
+                if eof:
+                    yield KIND_EOF, n, n, -1, -1
+                return
+
+            # maior lexema a partir de i: fim e tipo do último estado final (0 = nenhum)
+            ultimo = 0
+            fim = j = i
+            if passos is not None:
+                estado = inicial
+                if falhas is None:
+                    while j < n:
+                        estado = passos[estado + classes[j]]
+                        if estado < 0:
+                            break
+                        j += 1
+                        k = final_kind[estado]
+                        if k:
+                            ultimo = k
+                            fim = j
+                else:
+                    trilha = []  # pares (posição, estado) depois do último estado final
+                    while j < n:
+                        chave = j * tamanho_passos + estado
+                        if chave in falhas:
+                            break
+                        trilha.append(chave)
+                        estado = passos[estado + classes[j]]
+                        if estado < 0:
+                            break
+                        j += 1
+                        k = final_kind[estado]
+                        if k:
+                            ultimo = k
+                            fim = j
+                            trilha.clear()
+                    falhas.update(trilha)
+            elif linhas is not None:
+                estado = 0
+                while j < n:
+                    c = texto[j]
+                    prox = linhas[estado].get(c)
+                    if prox is None:
+                        prox = passo(estado, c)
+                    if prox < 0:
+                        break
+                    estado = prox
+                    j += 1
+                    k = final_kind[estado]
+                    if k:
+                        ultimo = k
+                        fim = j
+            else:
+                tamanho, ultimo = casar(i)
+                fim = i + tamanho
+
+            if not ultimo or fim == i:
+                buffer.pos = i
+                erros.append(self._erro_lexico(buffer, i, classes))
+                i = buffer.pos
+                if i >= n:
+                    return
+                continue
+
+            kind = kinds[ultimo]
+            if checar[ultimo]:
+                kind = kind_palavra.get(texto[i:fim].lower(), kind)
+            if kind != KIND_COMENTARIO and (kind != KIND_SEPARADOR or texto[i:fim] in separadores):
+                linha, col = posicao(i)
+                yield kind, i, fim, linha, col
+            i = fim
+
+    def _varrer_lexemas(self, buffer, limite, tokens, erros):
+        """
+        _varrer() nos modos tabela, preguiçoso, linear e scanner (com espaços diferentes
+        dos do padrão mestre): o laço de _lexemas, sem uma chamada de next_token por
+        token. Produz exatamente os mesmos tokens e erros que o laço genérico.
+        """
+        pre = self._preparar_prevarredura(buffer) if self.linear or self.scanner is None else None
+        texto = buffer.texto
+        tipo_do_kind = TIPO_DO_KIND
+        append = tokens.append
+        for kind, inicio, fim, linha, col in self._lexemas(buffer, limite, erros, pre=pre):
+            append(Token(tipo_do_kind[kind], texto[inicio:fim], linha, col, kind))
+        # False: parou antes de `limite`
+        return limite >= buffer.len or buffer.pos < limite
+
+    def _varrer_scanner(self, buffer, limite, tokens, erros):
+        """
+        _varrer() com o scanner gerado: uma chamada do padrão mestre por token pula
+        os espaços e reconhece o maior lexema (ver gerar_scanner.py).
+        """
+        scanner = self.scanner
+        if not (self.ignorar_whitespace and self.whitespace_chars == set(scanner.ESPACOS)):
+            # espaços configurados diferentes dos do padrão mestre: pula em Python
+            return self._varrer_lexemas(buffer, limite, tokens, erros)
+
+        texto = buffer.texto
+        mestre = scanner.MESTRE.match
+        grupo_tipo = scanner.GRUPO_TIPO
+        kinds, checar = self._kinds_scanner
+        kind_palavra = self.kind_palavra
+        tipo_do_kind = TIPO_DO_KIND
+        posicao = buffer.posicao
+
+        append = tokens.append
+        n = buffer.len
+        i = buffer.pos
+
+        while True:
+            m = mestre(texto, i, n)
+            inicio = m.end(1)
+            if limite < n and inicio >= limite:
+                buffer.pos = inicio
+                return False
+            if inicio >= n:
+                buffer.pos = inicio
+                append(Token("EOF", "", -1, -1, KIND_EOF))
+                return True
+
+            kind = grupo_tipo[m.lastindex]
+            if not kind:
+                buffer.pos = inicio
+                tok, err = self.next_token(buffer)
+                erros.append(err)
+                i = buffer.pos
+                if i >= n:
+                    return True
+                continue
+
+            i = m.end()
+            lexema = texto[inicio:i]
+            tipo = kind
+            kind = kinds[tipo]
+            if checar[tipo]:
+                kind = kind_palavra.get(lexema.lower(), kind)
+            if kind != KIND_COMENTARIO and kind != KIND_SEPARADOR:
+                linha, col = posicao(inicio)
+                append(Token(tipo_do_kind[kind], lexema, linha, col, kind))
 
 # fim lexer3_adaptado.py
 if __name__ == "__main__":
@@ -0,0 +1,174 @@
+"""
+Pré-varredura vetorizada do texto, feita uma vez antes do laço do AFD.
+
+Para um texto inteiro (str), calcula de uma vez:
+
+- `quebras`: posições de todos os "\\n" (índice de linhas), e com elas a
+  linha/coluna de qualquer posição sem recontar o texto;
+- `classes`: a classe de cada caractere no AFD compilado (como
+  CompiledDFA.classes_de);
+- `saltos`: bytes com, em cada posição de espaço em branco, quantos caracteres
+  do trecho de espaços faltam (no máximo 255; 0 fora dos espaços). O Lexer pula
+  um trecho inteiro com `i += saltos[i]` em vez de testar caractere a caractere.
+
+Com NumPy instalado tudo é feito em operações vetorizadas (np.flatnonzero,
+busca das classes por indexação e searchsorted, acumulação para os trechos de
+espaço). Sem NumPy há uma versão em Python puro com o mesmo resultado, mais
+lenta que o laço normal do Lexer: ela só é usada quando a pré-varredura é
+pedida explicitamente (Lexer(prevarredura=True)) e serve de referência nos testes.
+"""
+
+from array import array
+from bisect import bisect_left
+
+# textos menores que isto não compensam a pré-varredura automática (Lexer(prevarredura=None))
+PREVARREDURA_MINIMA = 1 << 20
+
+# [255, 254, ..., 1]: saltos de um trecho de espaços de até 255 caracteres
+_DESCENDO = bytes(range(255, 0, -1))
+
+_numpy = None
+_tem_numpy = None
+
+
+def numpy_disponivel():
+    """True se o NumPy pode ser importado (verificado uma vez, sem importá-lo)."""
+    global _tem_numpy
+    if _tem_numpy is None:
+        import importlib.util  # importados só quando usados: o import do lexer fica rápido
+        _tem_numpy = importlib.util.find_spec("numpy") is not None
+    return _tem_numpy
+
+
+def _importar_numpy():
+    global _numpy
+    if _numpy is None:
+        import numpy
+        _numpy = numpy
+    return _numpy
+
+
+class Prevarredura:
+    __slots__ = ("quebras", "classes", "saltos", "tabela", "espacos", "linha0", "inicio0", "_cursor")
+
+    def __init__(self, quebras, classes, saltos, tabela, espacos, linha0=1, inicio0=0):
+        self.quebras = quebras  # array('q') com as posições dos "\n", em ordem
+        self.classes = classes  # bytes: classe de cada caractere (None sem tabela)
+        self.saltos = saltos    # bytes de len(texto) + 1 posições (a última é 0)
+        self.tabela = tabela    # CompiledDFA usado nas classes
+        self.espacos = espacos  # frozenset dos caracteres de espaço em branco
+        self.linha0 = linha0    # linha e início de linha de texto[0] (ver StreamBuffer)
+        self.inicio0 = inicio0
+        self._cursor = 0        # quantos "\n" vêm antes da última posição pedida
+
+    def posicao(self, index):
+        """
+        (linha, coluna), como InputBuffer.posicao. Posições pedidas em ordem crescente
+        avançam um cursor sobre `quebras`; uma posição anterior usa busca binária.
+        """
+        quebras = self.quebras
+        k = self._cursor
+        if k and quebras[k - 1] >= index:
+            k = bisect_left(quebras, index)
+        else:
+            n = len(quebras)
+            while k < n and quebras[k] < index:
+                k += 1
+        self._cursor = k
+        return self.linha0 + k, index - (quebras[k - 1] + 1 if k else self.inicio0) + 1
+
+    def pular(self, i):
+        """Primeira posição >= i que não é espaço em branco."""
+        saltos = self.saltos
+        pulo = saltos[i]
+        while pulo:
+            i += pulo
+            pulo = saltos[i]
+        return i
+
+
+def _saltos_python(texto, espacos):
+    import re
+    saltos = bytearray(len(texto) + 1)
+    if not espacos:
+        return bytes(saltos)
+    trecho = re.compile("[" + "".join(re.escape(c) for c in sorted(espacos)) + "]+")
+    for m in trecho.finditer(texto):
+        a, b = m.span()
+        tamanho = b - a
+        if tamanho <= 255:
+            saltos[a:b] = _DESCENDO[255 - tamanho:]
+        else:
+            saltos[a:b] = b"\xff" * (tamanho - 255) + _DESCENDO
+    return bytes(saltos)
+
+
+def _prevarrer_python(texto, tabela, espacos):
+    quebras = array("q")
+    j = texto.find("\n")
+    while j != -1:
+        quebras.append(j)
+        j = texto.find("\n", j + 1)
+    classes = tabela.classes_de(texto) if tabela is not None else None
+    return quebras, classes, _saltos_python(texto, espacos)
+
+
+def _prevarrer_numpy(texto, tabela, espacos):
+    np = _importar_numpy()
+    n = len(texto)
+    if texto.isascii():
+        codigos = np.frombuffer(texto.encode("ascii"), dtype=np.uint8)
+    else:
+        # um uint32 por caractere; surrogatepass aceita surrogates soltos na str
+        codigos = np.frombuffer(texto.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+
+    quebras = array("q")
+    quebras.frombytes(np.flatnonzero(codigos == 10).astype(np.int64).tobytes())
+
+    classes = None
+    if tabela is not None:
+        classe_ascii = np.frombuffer(tabela.classe_ascii, dtype=np.uint8)
+        if codigos.dtype == np.uint8:
+            classes = classe_ascii[codigos].tobytes()
+        else:
+            saida = np.zeros(n, dtype=np.uint8)
+            ascii = codigos < 128
+            saida[ascii] = classe_ascii[codigos[ascii]]
+            outros = ~ascii
+            if tabela.faixas and outros.any():
+                inicios = np.array([f[0] for f in tabela.faixas], dtype=np.uint32)
+                fins = np.array([f[1] for f in tabela.faixas], dtype=np.uint32)
+                classe_faixa = np.array([f[2] for f in tabela.faixas], dtype=np.uint8)
+                valores = codigos[outros]
+                k = np.searchsorted(inicios, valores, side="right") - 1
+                dentro = k >= 0
+                k = np.maximum(k, 0)
+                dentro &= valores <= fins[k]
+                saida[outros] = np.where(dentro, classe_faixa[k], 0)
+            classes = saida.tobytes()
+
+    # saltos: distância até o próximo caractere que não é espaço, limitada a 255
+    espaco = np.zeros(n + 1, dtype=bool)
+    if espacos:
+        espaco[:n] = np.isin(codigos, np.array(sorted(ord(c) for c in espacos), dtype=np.uint32))
+    posicoes = np.arange(n + 1, dtype=np.int64)
+    proximo = np.where(espaco, n, posicoes)
+    proximo = np.minimum.accumulate(proximo[::-1])[::-1]
+    saltos = np.minimum(proximo - posicoes, 255).astype(np.uint8).tobytes()
+    return quebras, classes, saltos
+
+
+def prevarrer(texto, tabela=None, espacos=" \t\r\n", linha0=1, inicio0=0, usar_numpy=None):
+    """
+    Prevarredura de `texto` (str). `tabela` é o CompiledDFA para as classes (None:
+    sem classes); `espacos`, os caracteres pulados pelo Lexer. usar_numpy=None usa o
+    NumPy se ele estiver instalado; False força a versão em Python puro.
+    """
+    espacos = frozenset(espacos)
+    if usar_numpy is None:
+        usar_numpy = numpy_disponivel()
+    if usar_numpy:
+        quebras, classes, saltos = _prevarrer_numpy(texto, tabela, espacos)
+    else:
+        quebras, classes, saltos = _prevarrer_python(texto, tabela, espacos)
+    return Prevarredura(quebras, classes, saltos, tabela, espacos, linha0, inicio0)
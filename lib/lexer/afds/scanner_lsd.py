@@ -0,0 +1,36 @@
+"""
+Scanner do AFD combinado da LSD gerado por gerar_scanner.py — não editar à mão.
+Regenerar com: python gerar_scanner.py
+"""
+
+import re
+import sys
+
+TIPOS = (None, 'SEPARADOR', 'COMENTARIO', 'DECIMAL', 'NOT_CIEN', 'OPERADOR', 'INTEIRO', 'IDENTIFICADOR', 'STRING')
+ASSINATURA = 3396354771
+ESTADOS = 16
+
+# m.lastindex -> índice em TIPOS (0 = nenhum token)
+GRUPO_TIPO = (0, 0, 7, 4, 4, 4, 4, 3, 6, 1, 5, 5, 8, 5, 2, 5)
+
+TOKEN = '(?:(?:[ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz\\U000000aa\\U000000b5\\U000000ba\\U000000c0-\\U000000d6\\U000000d8-\\U000000f6\\U000000f8-\\U000002c1\\U000002c6-\\U000002d1\\U000002e0-\\U000002e4\\U000002ec\\U000002ee\\U00000370-\\U00000374\\U00000376-\\U00000377\\U0000037a-\\U0000037d\\U0000037f\\U00000386\\U00000388-\\U0000038a\\U0000038c\\U0000038e-\\U000003a1\\U000003a3-\\U000003f5\\U000003f7-\\U00000481\\U0000048a-\\U0000052f\\U00000531-\\U00000556\\U00000559\\U00000560-\\U00000588\\U000005d0-\\U000005ea\\U000005ef-\\U000005f2\\U00000620-\\U0000064a\\U0000066e-\\U0000066f\\U00000671-\\U000006d3\\U000006d5\\U000006e5-\\U000006e6\\U000006ee-\\U000006ef\\U000006fa-\\U000006fc\\U000006ff\\U00000710\\U00000712-\\U0000072f\\U0000074d-\\U000007a5\\U000007b1\\U000007ca-\\U000007ea\\U000007f4-\\U000007f5\\U000007fa\\U00000800-\\U00000815\\U0000081a\\U00000824\\U00000828\\U00000840-\\U00000858\\U00000860-\\U0000086a\\U00000870-\\U00000887\\U00000889-\\U0000088e\\U000008a0-\\U000008c9\\U00000904-\\U00000939\\U0000093d\\U00000950\\U00000958-\\U00000961\\U00000971-\\U00000980\\U00000985-\\U0000098c\\U0000098f-\\U00000990\\U00000993-\\U000009a8\\U000009aa-\\U000009b0\\U000009b2\\U000009b6-\\U000009b9\\U000009bd\\U000009ce\\U000009dc-\\U000009dd\\U000009df-\\U000009e1\\U000009f0-\\U000009f1\\U000009fc\\U00000a05-\\U00000a0a\\U00000a0f-\\U00000a10\\U00000a13-\\U00000a28\\U00000a2a-\\U00000a30\\U00000a32-\\U00000a33\\U00000a35-\\U00000a36\\U00000a38-\\U00000a39\\U00000a59-\\U00000a5c\\U00000a5e\\U00000a72-\\U00000a74\\U00000a85-\\U00000a8d\\U00000a8f-\\U00000a91\\U00000a93-\\U00000aa8\\U00000aaa-\\U00000ab0\\U00000ab2-\\U00000ab3\\U00000ab5-\\U00000ab9\\U00000abd\\U00000ad0\\U00000ae0-\\U00000ae1\\U00000af9\\U00000b05-\\U00000b0c\\U00000b0f-\\U00000b10\\U00000b13-\\U00000b28\\U00000b2a-\\U00000b30\\U00000b32-\\U00000b33\\U00000b35-\\U00000b39\\U00000b3d\\U00000b5c-\\U00000b5d\\U00000b5f-\\U00000b61\\U00000b71\\U00000b83\\U00000b85-\\U00000b8a\\U00000b8e-\\U00000b90\\U00000b92-\\U00000b95\\U00000b99-\\U00000b9a\\U00000b9c\\U00000b9e-\\U00000b9f\\U00000ba3-\\U00000ba4\\U00000ba8-\\U00000baa\\U00000bae-\\U00000bb9\\U00000bd0\\U00000c05-\\U00000c0c\\U00000c0e-\\U00000c10\\U00000c12-\\U00000c28\\U00000c2a-\\U00000c39\\U00000c3d\\U00000c58-\\U00000c5a\\U00000c5d\\U00000c60-\\U00000c61\\U00000c80\\U00000c85-\\U00000c8c\\U00000c8e-\\U00000c90\\U00000c92-\\U00000ca8\\U00000caa-\\U00000cb3\\U00000cb5-\\U00000cb9\\U00000cbd\\U00000cdd-\\U00000cde\\U00000ce0-\\U00000ce1\\U00000cf1-\\U00000cf2\\U00000d04-\\U00000d0c\\U00000d0e-\\U00000d10\\U00000d12-\\U00000d3a\\U00000d3d\\U00000d4e\\U00000d54-\\U00000d56\\U00000d5f-\\U00000d61\\U00000d7a-\\U00000d7f\\U00000d85-\\U00000d96\\U00000d9a-\\U00000db1\\U00000db3-\\U00000dbb\\U00000dbd\\U00000dc0-\\U00000dc6\\U00000e01-\\U00000e30\\U00000e32-\\U00000e33\\U00000e40-\\U00000e46\\U00000e81-\\U00000e82\\U00000e84\\U00000e86-\\U00000e8a\\U00000e8c-\\U00000ea3\\U00000ea5\\U00000ea7-\\U00000eb0\\U00000eb2-\\U00000eb3\\U00000ebd\\U00000ec0-\\U00000ec4\\U00000ec6\\U00000edc-\\U00000edf\\U00000f00\\U00000f40-\\U00000f47\\U00000f49-\\U00000f6c\\U00000f88-\\U00000f8c\\U00001000-\\U0000102a\\U0000103f\\U00001050-\\U00001055\\U0000105a-\\U0000105d\\U00001061\\U00001065-\\U00001066\\U0000106e-\\U00001070\\U00001075-\\U00001081\\U0000108e\\U000010a0-\\U000010c5\\U000010c7\\U000010cd\\U000010d0-\\U000010fa\\U000010fc-\\U00001248\\U0000124a-\\U0000124d\\U00001250-\\U00001256\\U00001258\\U0000125a-\\U0000125d\\U00001260-\\U00001288\\U0000128a-\\U0000128d\\U00001290-\\U000012b0\\U000012b2-\\U000012b5\\U000012b8-\\U000012be\\U000012c0\\U000012c2-\\U000012c5\\U000012c8-\\U000012d6\\U000012d8-\\U00001310\\U00001312-\\U00001315\\U00001318-\\U0000135a\\U00001380-\\U0000138f\\U000013a0-\\U000013f5\\U000013f8-\\U000013fd\\U00001401-\\U0000166c\\U0000166f-\\U0000167f\\U00001681-\\U0000169a\\U000016a0-\\U000016ea\\U000016f1-\\U000016f8\\U00001700-\\U00001711\\U0000171f-\\U00001731\\U00001740-\\U00001751\\U00001760-\\U0000176c\\U0000176e-\\U00001770\\U00001780-\\U000017b3\\U000017d7\\U000017dc\\U00001820-\\U00001878\\U00001880-\\U00001884\\U00001887-\\U000018a8\\U000018aa\\U000018b0-\\U000018f5\\U00001900-\\U0000191e\\U00001950-\\U0000196d\\U00001970-\\U00001974\\U00001980-\\U000019ab\\U000019b0-\\U000019c9\\U00001a00-\\U00001a16\\U00001a20-\\U00001a54\\U00001aa7\\U00001b05-\\U00001b33\\U00001b45-\\U00001b4c\\U00001b83-\\U00001ba0\\U00001bae-\\U00001baf\\U00001bba-\\U00001be5\\U00001c00-\\U00001c23\\U00001c4d-\\U00001c4f\\U00001c5a-\\U00001c7d\\U00001c80-\\U00001c88\\U00001c90-\\U00001cba\\U00001cbd-\\U00001cbf\\U00001ce9-\\U00001cec\\U00001cee-\\U00001cf3\\U00001cf5-\\U00001cf6\\U00001cfa\\U00001d00-\\U00001dbf\\U00001e00-\\U00001f15\\U00001f18-\\U00001f1d\\U00001f20-\\U00001f45\\U00001f48-\\U00001f4d\\U00001f50-\\U00001f57\\U00001f59\\U00001f5b\\U00001f5d\\U00001f5f-\\U00001f7d\\U00001f80-\\U00001fb4\\U00001fb6-\\U00001fbc\\U00001fbe\\U00001fc2-\\U00001fc4\\U00001fc6-\\U00001fcc\\U00001fd0-\\U00001fd3\\U00001fd6-\\U00001fdb\\U00001fe0-\\U00001fec\\U00001ff2-\\U00001ff4\\U00001ff6-\\U00001ffc\\U00002071\\U0000207f\\U00002090-\\U0000209c\\U00002102\\U00002107\\U0000210a-\\U00002113\\U00002115\\U00002119-\\U0000211d\\U00002124\\U00002126\\U00002128\\U0000212a-\\U0000212d\\U0000212f-\\U00002139\\U0000213c-\\U0000213f\\U00002145-\\U00002149\\U0000214e\\U00002183-\\U00002184\\U00002c00-\\U00002ce4\\U00002ceb-\\U00002cee\\U00002cf2-\\U00002cf3\\U00002d00-\\U00002d25\\U00002d27\\U00002d2d\\U00002d30-\\U00002d67\\U00002d6f\\U00002d80-\\U00002d96\\U00002da0-\\U00002da6\\U00002da8-\\U00002dae\\U00002db0-\\U00002db6\\U00002db8-\\U00002dbe\\U00002dc0-\\U00002dc6\\U00002dc8-\\U00002dce\\U00002dd0-\\U00002dd6\\U00002dd8-\\U00002dde\\U00002e2f\\U00003005-\\U00003006\\U00003031-\\U00003035\\U0000303b-\\U0000303c\\U00003041-\\U00003096\\U0000309d-\\U0000309f\\U000030a1-\\U000030fa\\U000030fc-\\U000030ff\\U00003105-\\U0000312f\\U00003131-\\U0000318e\\U000031a0-\\U000031bf\\U000031f0-\\U000031ff\\U00003400-\\U00004dbf\\U00004e00-\\U0000a48c\\U0000a4d0-\\U0000a4fd\\U0000a500-\\U0000a60c\\U0000a610-\\U0000a61f\\U0000a62a-\\U0000a62b\\U0000a640-\\U0000a66e\\U0000a67f-\\U0000a69d\\U0000a6a0-\\U0000a6e5\\U0000a717-\\U0000a71f\\U0000a722-\\U0000a788\\U0000a78b-\\U0000a7ca\\U0000a7d0-\\U0000a7d1\\U0000a7d3\\U0000a7d5-\\U0000a7d9\\U0000a7f2-\\U0000a801\\U0000a803-\\U0000a805\\U0000a807-\\U0000a80a\\U0000a80c-\\U0000a822\\U0000a840-\\U0000a873\\U0000a882-\\U0000a8b3\\U0000a8f2-\\U0000a8f7\\U0000a8fb\\U0000a8fd-\\U0000a8fe\\U0000a90a-\\U0000a925\\U0000a930-\\U0000a946\\U0000a960-\\U0000a97c\\U0000a984-\\U0000a9b2\\U0000a9cf\\U0000a9e0-\\U0000a9e4\\U0000a9e6-\\U0000a9ef\\U0000a9fa-\\U0000a9fe\\U0000aa00-\\U0000aa28\\U0000aa40-\\U0000aa42\\U0000aa44-\\U0000aa4b\\U0000aa60-\\U0000aa76\\U0000aa7a\\U0000aa7e-\\U0000aaaf\\U0000aab1\\U0000aab5-\\U0000aab6\\U0000aab9-\\U0000aabd\\U0000aac0\\U0000aac2\\U0000aadb-\\U0000aadd\\U0000aae0-\\U0000aaea\\U0000aaf2-\\U0000aaf4\\U0000ab01-\\U0000ab06\\U0000ab09-\\U0000ab0e\\U0000ab11-\\U0000ab16\\U0000ab20-\\U0000ab26\\U0000ab28-\\U0000ab2e\\U0000ab30-\\U0000ab5a\\U0000ab5c-\\U0000ab69\\U0000ab70-\\U0000abe2\\U0000ac00-\\U0000d7a3\\U0000d7b0-\\U0000d7c6\\U0000d7cb-\\U0000d7fb\\U0000f900-\\U0000fa6d\\U0000fa70-\\U0000fad9\\U0000fb00-\\U0000fb06\\U0000fb13-\\U0000fb17\\U0000fb1d\\U0000fb1f-\\U0000fb28\\U0000fb2a-\\U0000fb36\\U0000fb38-\\U0000fb3c\\U0000fb3e\\U0000fb40-\\U0000fb41\\U0000fb43-\\U0000fb44\\U0000fb46-\\U0000fbb1\\U0000fbd3-\\U0000fd3d\\U0000fd50-\\U0000fd8f\\U0000fd92-\\U0000fdc7\\U0000fdf0-\\U0000fdfb\\U0000fe70-\\U0000fe74\\U0000fe76-\\U0000fefc\\U0000ff21-\\U0000ff3a\\U0000ff41-\\U0000ff5a\\U0000ff66-\\U0000ffbe\\U0000ffc2-\\U0000ffc7\\U0000ffca-\\U0000ffcf\\U0000ffd2-\\U0000ffd7\\U0000ffda-\\U0000ffdc]|(?=[\\U00010000-\\U0010ffff])[\\U00010000-\\U0001000b\\U0001000d-\\U00010026\\U00010028-\\U0001003a\\U0001003c-\\U0001003d\\U0001003f-\\U0001004d\\U00010050-\\U0001005d\\U00010080-\\U000100fa\\U00010280-\\U0001029c\\U000102a0-\\U000102d0\\U00010300-\\U0001031f\\U0001032d-\\U00010340\\U00010342-\\U00010349\\U00010350-\\U00010375\\U00010380-\\U0001039d\\U000103a0-\\U000103c3\\U000103c8-\\U000103cf\\U00010400-\\U0001049d\\U000104b0-\\U000104d3\\U000104d8-\\U000104fb\\U00010500-\\U00010527\\U00010530-\\U00010563\\U00010570-\\U0001057a\\U0001057c-\\U0001058a\\U0001058c-\\U00010592\\U00010594-\\U00010595\\U00010597-\\U000105a1\\U000105a3-\\U000105b1\\U000105b3-\\U000105b9\\U000105bb-\\U000105bc\\U00010600-\\U00010736\\U00010740-\\U00010755\\U00010760-\\U00010767\\U00010780-\\U00010785\\U00010787-\\U000107b0\\U000107b2-\\U000107ba\\U00010800-\\U00010805\\U00010808\\U0001080a-\\U00010835\\U00010837-\\U00010838\\U0001083c\\U0001083f-\\U00010855\\U00010860-\\U00010876\\U00010880-\\U0001089e\\U000108e0-\\U000108f2\\U000108f4-\\U000108f5\\U00010900-\\U00010915\\U00010920-\\U00010939\\U00010980-\\U000109b7\\U000109be-\\U000109bf\\U00010a00\\U00010a10-\\U00010a13\\U00010a15-\\U00010a17\\U00010a19-\\U00010a35\\U00010a60-\\U00010a7c\\U00010a80-\\U00010a9c\\U00010ac0-\\U00010ac7\\U00010ac9-\\U00010ae4\\U00010b00-\\U00010b35\\U00010b40-\\U00010b55\\U00010b60-\\U00010b72\\U00010b80-\\U00010b91\\U00010c00-\\U00010c48\\U00010c80-\\U00010cb2\\U00010cc0-\\U00010cf2\\U00010d00-\\U00010d23\\U00010e80-\\U00010ea9\\U00010eb0-\\U00010eb1\\U00010f00-\\U00010f1c\\U00010f27\\U00010f30-\\U00010f45\\U00010f70-\\U00010f81\\U00010fb0-\\U00010fc4\\U00010fe0-\\U00010ff6\\U00011003-\\U00011037\\U00011071-\\U00011072\\U00011075\\U00011083-\\U000110af\\U000110d0-\\U000110e8\\U00011103-\\U00011126\\U00011144\\U00011147\\U00011150-\\U00011172\\U00011176\\U00011183-\\U000111b2\\U000111c1-\\U000111c4\\U000111da\\U000111dc\\U00011200-\\U00011211\\U00011213-\\U0001122b\\U00011280-\\U00011286\\U00011288\\U0001128a-\\U0001128d\\U0001128f-\\U0001129d\\U0001129f-\\U000112a8\\U000112b0-\\U000112de\\U00011305-\\U0001130c\\U0001130f-\\U00011310\\U00011313-\\U00011328\\U0001132a-\\U00011330\\U00011332-\\U00011333\\U00011335-\\U00011339\\U0001133d\\U00011350\\U0001135d-\\U00011361\\U00011400-\\U00011434\\U00011447-\\U0001144a\\U0001145f-\\U00011461\\U00011480-\\U000114af\\U000114c4-\\U000114c5\\U000114c7\\U00011580-\\U000115ae\\U000115d8-\\U000115db\\U00011600-\\U0001162f\\U00011644\\U00011680-\\U000116aa\\U000116b8\\U00011700-\\U0001171a\\U00011740-\\U00011746\\U00011800-\\U0001182b\\U000118a0-\\U000118df\\U000118ff-\\U00011906\\U00011909\\U0001190c-\\U00011913\\U00011915-\\U00011916\\U00011918-\\U0001192f\\U0001193f\\U00011941\\U000119a0-\\U000119a7\\U000119aa-\\U000119d0\\U000119e1\\U000119e3\\U00011a00\\U00011a0b-\\U00011a32\\U00011a3a\\U00011a50\\U00011a5c-\\U00011a89\\U00011a9d\\U00011ab0-\\U00011af8\\U00011c00-\\U00011c08\\U00011c0a-\\U00011c2e\\U00011c40\\U00011c72-\\U00011c8f\\U00011d00-\\U00011d06\\U00011d08-\\U00011d09\\U00011d0b-\\U00011d30\\U00011d46\\U00011d60-\\U00011d65\\U00011d67-\\U00011d68\\U00011d6a-\\U00011d89\\U00011d98\\U00011ee0-\\U00011ef2\\U00011fb0\\U00012000-\\U00012399\\U00012480-\\U00012543\\U00012f90-\\U00012ff0\\U00013000-\\U0001342e\\U00014400-\\U00014646\\U00016800-\\U00016a38\\U00016a40-\\U00016a5e\\U00016a70-\\U00016abe\\U00016ad0-\\U00016aed\\U00016b00-\\U00016b2f\\U00016b40-\\U00016b43\\U00016b63-\\U00016b77\\U00016b7d-\\U00016b8f\\U00016e40-\\U00016e7f\\U00016f00-\\U00016f4a\\U00016f50\\U00016f93-\\U00016f9f\\U00016fe0-\\U00016fe1\\U00016fe3\\U00017000-\\U000187f7\\U00018800-\\U00018cd5\\U00018d00-\\U00018d08\\U0001aff0-\\U0001aff3\\U0001aff5-\\U0001affb\\U0001affd-\\U0001affe\\U0001b000-\\U0001b122\\U0001b150-\\U0001b152\\U0001b164-\\U0001b167\\U0001b170-\\U0001b2fb\\U0001bc00-\\U0001bc6a\\U0001bc70-\\U0001bc7c\\U0001bc80-\\U0001bc88\\U0001bc90-\\U0001bc99\\U0001d400-\\U0001d454\\U0001d456-\\U0001d49c\\U0001d49e-\\U0001d49f\\U0001d4a2\\U0001d4a5-\\U0001d4a6\\U0001d4a9-\\U0001d4ac\\U0001d4ae-\\U0001d4b9\\U0001d4bb\\U0001d4bd-\\U0001d4c3\\U0001d4c5-\\U0001d505\\U0001d507-\\U0001d50a\\U0001d50d-\\U0001d514\\U0001d516-\\U0001d51c\\U0001d51e-\\U0001d539\\U0001d53b-\\U0001d53e\\U0001d540-\\U0001d544\\U0001d546\\U0001d54a-\\U0001d550\\U0001d552-\\U0001d6a5\\U0001d6a8-\\U0001d6c0\\U0001d6c2-\\U0001d6da\\U0001d6dc-\\U0001d6fa\\U0001d6fc-\\U0001d714\\U0001d716-\\U0001d734\\U0001d736-\\U0001d74e\\U0001d750-\\U0001d76e\\U0001d770-\\U0001d788\\U0001d78a-\\U0001d7a8\\U0001d7aa-\\U0001d7c2\\U0001d7c4-\\U0001d7cb\\U0001df00-\\U0001df1e\\U0001e100-\\U0001e12c\\U0001e137-\\U0001e13d\\U0001e14e\\U0001e290-\\U0001e2ad\\U0001e2c0-\\U0001e2eb\\U0001e7e0-\\U0001e7e6\\U0001e7e8-\\U0001e7eb\\U0001e7ed-\\U0001e7ee\\U0001e7f0-\\U0001e7fe\\U0001e800-\\U0001e8c4\\U0001e900-\\U0001e943\\U0001e94b\\U0001ee00-\\U0001ee03\\U0001ee05-\\U0001ee1f\\U0001ee21-\\U0001ee22\\U0001ee24\\U0001ee27\\U0001ee29-\\U0001ee32\\U0001ee34-\\U0001ee37\\U0001ee39\\U0001ee3b\\U0001ee42\\U0001ee47\\U0001ee49\\U0001ee4b\\U0001ee4d-\\U0001ee4f\\U0001ee51-\\U0001ee52\\U0001ee54\\U0001ee57\\U0001ee59\\U0001ee5b\\U0001ee5d\\U0001ee5f\\U0001ee61-\\U0001ee62\\U0001ee64\\U0001ee67-\\U0001ee6a\\U0001ee6c-\\U0001ee72\\U0001ee74-\\U0001ee77\\U0001ee79-\\U0001ee7c\\U0001ee7e\\U0001ee80-\\U0001ee89\\U0001ee8b-\\U0001ee9b\\U0001eea1-\\U0001eea3\\U0001eea5-\\U0001eea9\\U0001eeab-\\U0001eebb\\U00020000-\\U0002a6df\\U0002a700-\\U0002b738\\U0002b740-\\U0002b81d\\U0002b820-\\U0002cea1\\U0002ceb0-\\U0002ebe0\\U0002f800-\\U0002fa1d\\U00030000-\\U0003134a])[0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz\\U000000aa\\U000000b5\\U000000ba\\U000000c0-\\U000000d6\\U000000d8-\\U000000f6\\U000000f8-\\U000002c1\\U000002c6-\\U000002d1\\U000002e0-\\U000002e4\\U000002ec\\U000002ee\\U00000370-\\U00000374\\U00000376-\\U00000377\\U0000037a-\\U0000037d\\U0000037f\\U00000386\\U00000388-\\U0000038a\\U0000038c\\U0000038e-\\U000003a1\\U000003a3-\\U000003f5\\U000003f7-\\U00000481\\U0000048a-\\U0000052f\\U00000531-\\U00000556\\U00000559\\U00000560-\\U00000588\\U000005d0-\\U000005ea\\U000005ef-\\U000005f2\\U00000620-\\U0000064a\\U0000066e-\\U0000066f\\U00000671-\\U000006d3\\U000006d5\\U000006e5-\\U000006e6\\U000006ee-\\U000006ef\\U000006fa-\\U000006fc\\U000006ff\\U00000710\\U00000712-\\U0000072f\\U0000074d-\\U000007a5\\U000007b1\\U000007ca-\\U000007ea\\U000007f4-\\U000007f5\\U000007fa\\U00000800-\\U00000815\\U0000081a\\U00000824\\U00000828\\U00000840-\\U00000858\\U00000860-\\U0000086a\\U00000870-\\U00000887\\U00000889-\\U0000088e\\U000008a0-\\U000008c9\\U00000904-\\U00000939\\U0000093d\\U00000950\\U00000958-\\U00000961\\U00000971-\\U00000980\\U00000985-\\U0000098c\\U0000098f-\\U00000990\\U00000993-\\U000009a8\\U000009aa-\\U000009b0\\U000009b2\\U000009b6-\\U000009b9\\U000009bd\\U000009ce\\U000009dc-\\U000009dd\\U000009df-\\U000009e1\\U000009f0-\\U000009f1\\U000009fc\\U00000a05-\\U00000a0a\\U00000a0f-\\U00000a10\\U00000a13-\\U00000a28\\U00000a2a-\\U00000a30\\U00000a32-\\U00000a33\\U00000a35-\\U00000a36\\U00000a38-\\U00000a39\\U00000a59-\\U00000a5c\\U00000a5e\\U00000a72-\\U00000a74\\U00000a85-\\U00000a8d\\U00000a8f-\\U00000a91\\U00000a93-\\U00000aa8\\U00000aaa-\\U00000ab0\\U00000ab2-\\U00000ab3\\U00000ab5-\\U00000ab9\\U00000abd\\U00000ad0\\U00000ae0-\\U00000ae1\\U00000af9\\U00000b05-\\U00000b0c\\U00000b0f-\\U00000b10\\U00000b13-\\U00000b28\\U00000b2a-\\U00000b30\\U00000b32-\\U00000b33\\U00000b35-\\U00000b39\\U00000b3d\\U00000b5c-\\U00000b5d\\U00000b5f-\\U00000b61\\U00000b71\\U00000b83\\U00000b85-\\U00000b8a\\U00000b8e-\\U00000b90\\U00000b92-\\U00000b95\\U00000b99-\\U00000b9a\\U00000b9c\\U00000b9e-\\U00000b9f\\U00000ba3-\\U00000ba4\\U00000ba8-\\U00000baa\\U00000bae-\\U00000bb9\\U00000bd0\\U00000c05-\\U00000c0c\\U00000c0e-\\U00000c10\\U00000c12-\\U00000c28\\U00000c2a-\\U00000c39\\U00000c3d\\U00000c58-\\U00000c5a\\U00000c5d\\U00000c60-\\U00000c61\\U00000c80\\U00000c85-\\U00000c8c\\U00000c8e-\\U00000c90\\U00000c92-\\U00000ca8\\U00000caa-\\U00000cb3\\U00000cb5-\\U00000cb9\\U00000cbd\\U00000cdd-\\U00000cde\\U00000ce0-\\U00000ce1\\U00000cf1-\\U00000cf2\\U00000d04-\\U00000d0c\\U00000d0e-\\U00000d10\\U00000d12-\\U00000d3a\\U00000d3d\\U00000d4e\\U00000d54-\\U00000d56\\U00000d5f-\\U00000d61\\U00000d7a-\\U00000d7f\\U00000d85-\\U00000d96\\U00000d9a-\\U00000db1\\U00000db3-\\U00000dbb\\U00000dbd\\U00000dc0-\\U00000dc6\\U00000e01-\\U00000e30\\U00000e32-\\U00000e33\\U00000e40-\\U00000e46\\U00000e81-\\U00000e82\\U00000e84\\U00000e86-\\U00000e8a\\U00000e8c-\\U00000ea3\\U00000ea5\\U00000ea7-\\U00000eb0\\U00000eb2-\\U00000eb3\\U00000ebd\\U00000ec0-\\U00000ec4\\U00000ec6\\U00000edc-\\U00000edf\\U00000f00\\U00000f40-\\U00000f47\\U00000f49-\\U00000f6c\\U00000f88-\\U00000f8c\\U00001000-\\U0000102a\\U0000103f\\U00001050-\\U00001055\\U0000105a-\\U0000105d\\U00001061\\U00001065-\\U00001066\\U0000106e-\\U00001070\\U00001075-\\U00001081\\U0000108e\\U000010a0-\\U000010c5\\U000010c7\\U000010cd\\U000010d0-\\U000010fa\\U000010fc-\\U00001248\\U0000124a-\\U0000124d\\U00001250-\\U00001256\\U00001258\\U0000125a-\\U0000125d\\U00001260-\\U00001288\\U0000128a-\\U0000128d\\U00001290-\\U000012b0\\U000012b2-\\U000012b5\\U000012b8-\\U000012be\\U000012c0\\U000012c2-\\U000012c5\\U000012c8-\\U000012d6\\U000012d8-\\U00001310\\U00001312-\\U00001315\\U00001318-\\U0000135a\\U00001380-\\U0000138f\\U000013a0-\\U000013f5\\U000013f8-\\U000013fd\\U00001401-\\U0000166c\\U0000166f-\\U0000167f\\U00001681-\\U0000169a\\U000016a0-\\U000016ea\\U000016f1-\\U000016f8\\U00001700-\\U00001711\\U0000171f-\\U00001731\\U00001740-\\U00001751\\U00001760-\\U0000176c\\U0000176e-\\U00001770\\U00001780-\\U000017b3\\U000017d7\\U000017dc\\U00001820-\\U00001878\\U00001880-\\U00001884\\U00001887-\\U000018a8\\U000018aa\\U000018b0-\\U000018f5\\U00001900-\\U0000191e\\U00001950-\\U0000196d\\U00001970-\\U00001974\\U00001980-\\U000019ab\\U000019b0-\\U000019c9\\U00001a00-\\U00001a16\\U00001a20-\\U00001a54\\U00001aa7\\U00001b05-\\U00001b33\\U00001b45-\\U00001b4c\\U00001b83-\\U00001ba0\\U00001bae-\\U00001baf\\U00001bba-\\U00001be5\\U00001c00-\\U00001c23\\U00001c4d-\\U00001c4f\\U00001c5a-\\U00001c7d\\U00001c80-\\U00001c88\\U00001c90-\\U00001cba\\U00001cbd-\\U00001cbf\\U00001ce9-\\U00001cec\\U00001cee-\\U00001cf3\\U00001cf5-\\U00001cf6\\U00001cfa\\U00001d00-\\U00001dbf\\U00001e00-\\U00001f15\\U00001f18-\\U00001f1d\\U00001f20-\\U00001f45\\U00001f48-\\U00001f4d\\U00001f50-\\U00001f57\\U00001f59\\U00001f5b\\U00001f5d\\U00001f5f-\\U00001f7d\\U00001f80-\\U00001fb4\\U00001fb6-\\U00001fbc\\U00001fbe\\U00001fc2-\\U00001fc4\\U00001fc6-\\U00001fcc\\U00001fd0-\\U00001fd3\\U00001fd6-\\U00001fdb\\U00001fe0-\\U00001fec\\U00001ff2-\\U00001ff4\\U00001ff6-\\U00001ffc\\U00002071\\U0000207f\\U00002090-\\U0000209c\\U00002102\\U00002107\\U0000210a-\\U00002113\\U00002115\\U00002119-\\U0000211d\\U00002124\\U00002126\\U00002128\\U0000212a-\\U0000212d\\U0000212f-\\U00002139\\U0000213c-\\U0000213f\\U00002145-\\U00002149\\U0000214e\\U00002183-\\U00002184\\U00002c00-\\U00002ce4\\U00002ceb-\\U00002cee\\U00002cf2-\\U00002cf3\\U00002d00-\\U00002d25\\U00002d27\\U00002d2d\\U00002d30-\\U00002d67\\U00002d6f\\U00002d80-\\U00002d96\\U00002da0-\\U00002da6\\U00002da8-\\U00002dae\\U00002db0-\\U00002db6\\U00002db8-\\U00002dbe\\U00002dc0-\\U00002dc6\\U00002dc8-\\U00002dce\\U00002dd0-\\U00002dd6\\U00002dd8-\\U00002dde\\U00002e2f\\U00003005-\\U00003006\\U00003031-\\U00003035\\U0000303b-\\U0000303c\\U00003041-\\U00003096\\U0000309d-\\U0000309f\\U000030a1-\\U000030fa\\U000030fc-\\U000030ff\\U00003105-\\U0000312f\\U00003131-\\U0000318e\\U000031a0-\\U000031bf\\U000031f0-\\U000031ff\\U00003400-\\U00004dbf\\U00004e00-\\U0000a48c\\U0000a4d0-\\U0000a4fd\\U0000a500-\\U0000a60c\\U0000a610-\\U0000a61f\\U0000a62a-\\U0000a62b\\U0000a640-\\U0000a66e\\U0000a67f-\\U0000a69d\\U0000a6a0-\\U0000a6e5\\U0000a717-\\U0000a71f\\U0000a722-\\U0000a788\\U0000a78b-\\U0000a7ca\\U0000a7d0-\\U0000a7d1\\U0000a7d3\\U0000a7d5-\\U0000a7d9\\U0000a7f2-\\U0000a801\\U0000a803-\\U0000a805\\U0000a807-\\U0000a80a\\U0000a80c-\\U0000a822\\U0000a840-\\U0000a873\\U0000a882-\\U0000a8b3\\U0000a8f2-\\U0000a8f7\\U0000a8fb\\U0000a8fd-\\U0000a8fe\\U0000a90a-\\U0000a925\\U0000a930-\\U0000a946\\U0000a960-\\U0000a97c\\U0000a984-\\U0000a9b2\\U0000a9cf\\U0000a9e0-\\U0000a9e4\\U0000a9e6-\\U0000a9ef\\U0000a9fa-\\U0000a9fe\\U0000aa00-\\U0000aa28\\U0000aa40-\\U0000aa42\\U0000aa44-\\U0000aa4b\\U0000aa60-\\U0000aa76\\U0000aa7a\\U0000aa7e-\\U0000aaaf\\U0000aab1\\U0000aab5-\\U0000aab6\\U0000aab9-\\U0000aabd\\U0000aac0\\U0000aac2\\U0000aadb-\\U0000aadd\\U0000aae0-\\U0000aaea\\U0000aaf2-\\U0000aaf4\\U0000ab01-\\U0000ab06\\U0000ab09-\\U0000ab0e\\U0000ab11-\\U0000ab16\\U0000ab20-\\U0000ab26\\U0000ab28-\\U0000ab2e\\U0000ab30-\\U0000ab5a\\U0000ab5c-\\U0000ab69\\U0000ab70-\\U0000abe2\\U0000ac00-\\U0000d7a3\\U0000d7b0-\\U0000d7c6\\U0000d7cb-\\U0000d7fb\\U0000f900-\\U0000fa6d\\U0000fa70-\\U0000fad9\\U0000fb00-\\U0000fb06\\U0000fb13-\\U0000fb17\\U0000fb1d\\U0000fb1f-\\U0000fb28\\U0000fb2a-\\U0000fb36\\U0000fb38-\\U0000fb3c\\U0000fb3e\\U0000fb40-\\U0000fb41\\U0000fb43-\\U0000fb44\\U0000fb46-\\U0000fbb1\\U0000fbd3-\\U0000fd3d\\U0000fd50-\\U0000fd8f\\U0000fd92-\\U0000fdc7\\U0000fdf0-\\U0000fdfb\\U0000fe70-\\U0000fe74\\U0000fe76-\\U0000fefc\\U0000ff21-\\U0000ff3a\\U0000ff41-\\U0000ff5a\\U0000ff66-\\U0000ffbe\\U0000ffc2-\\U0000ffc7\\U0000ffca-\\U0000ffcf\\U0000ffd2-\\U0000ffd7\\U0000ffda-\\U0000ffdc]*+(?:(?=[\\U00010000-\\U0010ffff])[\\U00010000-\\U0001000b\\U0001000d-\\U00010026\\U00010028-\\U0001003a\\U0001003c-\\U0001003d\\U0001003f-\\U0001004d\\U00010050-\\U0001005d\\U00010080-\\U000100fa\\U00010280-\\U0001029c\\U000102a0-\\U000102d0\\U00010300-\\U0001031f\\U0001032d-\\U00010340\\U00010342-\\U00010349\\U00010350-\\U00010375\\U00010380-\\U0001039d\\U000103a0-\\U000103c3\\U000103c8-\\U000103cf\\U00010400-\\U0001049d\\U000104b0-\\U000104d3\\U000104d8-\\U000104fb\\U00010500-\\U00010527\\U00010530-\\U00010563\\U00010570-\\U0001057a\\U0001057c-\\U0001058a\\U0001058c-\\U00010592\\U00010594-\\U00010595\\U00010597-\\U000105a1\\U000105a3-\\U000105b1\\U000105b3-\\U000105b9\\U000105bb-\\U000105bc\\U00010600-\\U00010736\\U00010740-\\U00010755\\U00010760-\\U00010767\\U00010780-\\U00010785\\U00010787-\\U000107b0\\U000107b2-\\U000107ba\\U00010800-\\U00010805\\U00010808\\U0001080a-\\U00010835\\U00010837-\\U00010838\\U0001083c\\U0001083f-\\U00010855\\U00010860-\\U00010876\\U00010880-\\U0001089e\\U000108e0-\\U000108f2\\U000108f4-\\U000108f5\\U00010900-\\U00010915\\U00010920-\\U00010939\\U00010980-\\U000109b7\\U000109be-\\U000109bf\\U00010a00\\U00010a10-\\U00010a13\\U00010a15-\\U00010a17\\U00010a19-\\U00010a35\\U00010a60-\\U00010a7c\\U00010a80-\\U00010a9c\\U00010ac0-\\U00010ac7\\U00010ac9-\\U00010ae4\\U00010b00-\\U00010b35\\U00010b40-\\U00010b55\\U00010b60-\\U00010b72\\U00010b80-\\U00010b91\\U00010c00-\\U00010c48\\U00010c80-\\U00010cb2\\U00010cc0-\\U00010cf2\\U00010d00-\\U00010d23\\U00010e80-\\U00010ea9\\U00010eb0-\\U00010eb1\\U00010f00-\\U00010f1c\\U00010f27\\U00010f30-\\U00010f45\\U00010f70-\\U00010f81\\U00010fb0-\\U00010fc4\\U00010fe0-\\U00010ff6\\U00011003-\\U00011037\\U00011071-\\U00011072\\U00011075\\U00011083-\\U000110af\\U000110d0-\\U000110e8\\U00011103-\\U00011126\\U00011144\\U00011147\\U00011150-\\U00011172\\U00011176\\U00011183-\\U000111b2\\U000111c1-\\U000111c4\\U000111da\\U000111dc\\U00011200-\\U00011211\\U00011213-\\U0001122b\\U00011280-\\U00011286\\U00011288\\U0001128a-\\U0001128d\\U0001128f-\\U0001129d\\U0001129f-\\U000112a8\\U000112b0-\\U000112de\\U00011305-\\U0001130c\\U0001130f-\\U00011310\\U00011313-\\U00011328\\U0001132a-\\U00011330\\U00011332-\\U00011333\\U00011335-\\U00011339\\U0001133d\\U00011350\\U0001135d-\\U00011361\\U00011400-\\U00011434\\U00011447-\\U0001144a\\U0001145f-\\U00011461\\U00011480-\\U000114af\\U000114c4-\\U000114c5\\U000114c7\\U00011580-\\U000115ae\\U000115d8-\\U000115db\\U00011600-\\U0001162f\\U00011644\\U00011680-\\U000116aa\\U000116b8\\U00011700-\\U0001171a\\U00011740-\\U00011746\\U00011800-\\U0001182b\\U000118a0-\\U000118df\\U000118ff-\\U00011906\\U00011909\\U0001190c-\\U00011913\\U00011915-\\U00011916\\U00011918-\\U0001192f\\U0001193f\\U00011941\\U000119a0-\\U000119a7\\U000119aa-\\U000119d0\\U000119e1\\U000119e3\\U00011a00\\U00011a0b-\\U00011a32\\U00011a3a\\U00011a50\\U00011a5c-\\U00011a89\\U00011a9d\\U00011ab0-\\U00011af8\\U00011c00-\\U00011c08\\U00011c0a-\\U00011c2e\\U00011c40\\U00011c72-\\U00011c8f\\U00011d00-\\U00011d06\\U00011d08-\\U00011d09\\U00011d0b-\\U00011d30\\U00011d46\\U00011d60-\\U00011d65\\U00011d67-\\U00011d68\\U00011d6a-\\U00011d89\\U00011d98\\U00011ee0-\\U00011ef2\\U00011fb0\\U00012000-\\U00012399\\U00012480-\\U00012543\\U00012f90-\\U00012ff0\\U00013000-\\U0001342e\\U00014400-\\U00014646\\U00016800-\\U00016a38\\U00016a40-\\U00016a5e\\U00016a70-\\U00016abe\\U00016ad0-\\U00016aed\\U00016b00-\\U00016b2f\\U00016b40-\\U00016b43\\U00016b63-\\U00016b77\\U00016b7d-\\U00016b8f\\U00016e40-\\U00016e7f\\U00016f00-\\U00016f4a\\U00016f50\\U00016f93-\\U00016f9f\\U00016fe0-\\U00016fe1\\U00016fe3\\U00017000-\\U000187f7\\U00018800-\\U00018cd5\\U00018d00-\\U00018d08\\U0001aff0-\\U0001aff3\\U0001aff5-\\U0001affb\\U0001affd-\\U0001affe\\U0001b000-\\U0001b122\\U0001b150-\\U0001b152\\U0001b164-\\U0001b167\\U0001b170-\\U0001b2fb\\U0001bc00-\\U0001bc6a\\U0001bc70-\\U0001bc7c\\U0001bc80-\\U0001bc88\\U0001bc90-\\U0001bc99\\U0001d400-\\U0001d454\\U0001d456-\\U0001d49c\\U0001d49e-\\U0001d49f\\U0001d4a2\\U0001d4a5-\\U0001d4a6\\U0001d4a9-\\U0001d4ac\\U0001d4ae-\\U0001d4b9\\U0001d4bb\\U0001d4bd-\\U0001d4c3\\U0001d4c5-\\U0001d505\\U0001d507-\\U0001d50a\\U0001d50d-\\U0001d514\\U0001d516-\\U0001d51c\\U0001d51e-\\U0001d539\\U0001d53b-\\U0001d53e\\U0001d540-\\U0001d544\\U0001d546\\U0001d54a-\\U0001d550\\U0001d552-\\U0001d6a5\\U0001d6a8-\\U0001d6c0\\U0001d6c2-\\U0001d6da\\U0001d6dc-\\U0001d6fa\\U0001d6fc-\\U0001d714\\U0001d716-\\U0001d734\\U0001d736-\\U0001d74e\\U0001d750-\\U0001d76e\\U0001d770-\\U0001d788\\U0001d78a-\\U0001d7a8\\U0001d7aa-\\U0001d7c2\\U0001d7c4-\\U0001d7cb\\U0001df00-\\U0001df1e\\U0001e100-\\U0001e12c\\U0001e137-\\U0001e13d\\U0001e14e\\U0001e290-\\U0001e2ad\\U0001e2c0-\\U0001e2eb\\U0001e7e0-\\U0001e7e6\\U0001e7e8-\\U0001e7eb\\U0001e7ed-\\U0001e7ee\\U0001e7f0-\\U0001e7fe\\U0001e800-\\U0001e8c4\\U0001e900-\\U0001e943\\U0001e94b\\U0001ee00-\\U0001ee03\\U0001ee05-\\U0001ee1f\\U0001ee21-\\U0001ee22\\U0001ee24\\U0001ee27\\U0001ee29-\\U0001ee32\\U0001ee34-\\U0001ee37\\U0001ee39\\U0001ee3b\\U0001ee42\\U0001ee47\\U0001ee49\\U0001ee4b\\U0001ee4d-\\U0001ee4f\\U0001ee51-\\U0001ee52\\U0001ee54\\U0001ee57\\U0001ee59\\U0001ee5b\\U0001ee5d\\U0001ee5f\\U0001ee61-\\U0001ee62\\U0001ee64\\U0001ee67-\\U0001ee6a\\U0001ee6c-\\U0001ee72\\U0001ee74-\\U0001ee77\\U0001ee79-\\U0001ee7c\\U0001ee7e\\U0001ee80-\\U0001ee89\\U0001ee8b-\\U0001ee9b\\U0001eea1-\\U0001eea3\\U0001eea5-\\U0001eea9\\U0001eeab-\\U0001eebb\\U00020000-\\U0002a6df\\U0002a700-\\U0002b738\\U0002b740-\\U0002b81d\\U0002b820-\\U0002cea1\\U0002ceb0-\\U0002ebe0\\U0002f800-\\U0002fa1d\\U00030000-\\U0003134a][0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz\\U000000aa\\U000000b5\\U000000ba\\U000000c0-\\U000000d6\\U000000d8-\\U000000f6\\U000000f8-\\U000002c1\\U000002c6-\\U000002d1\\U000002e0-\\U000002e4\\U000002ec\\U000002ee\\U00000370-\\U00000374\\U00000376-\\U00000377\\U0000037a-\\U0000037d\\U0000037f\\U00000386\\U00000388-\\U0000038a\\U0000038c\\U0000038e-\\U000003a1\\U000003a3-\\U000003f5\\U000003f7-\\U00000481\\U0000048a-\\U0000052f\\U00000531-\\U00000556\\U00000559\\U00000560-\\U00000588\\U000005d0-\\U000005ea\\U000005ef-\\U000005f2\\U00000620-\\U0000064a\\U0000066e-\\U0000066f\\U00000671-\\U000006d3\\U000006d5\\U000006e5-\\U000006e6\\U000006ee-\\U000006ef\\U000006fa-\\U000006fc\\U000006ff\\U00000710\\U00000712-\\U0000072f\\U0000074d-\\U000007a5\\U000007b1\\U000007ca-\\U000007ea\\U000007f4-\\U000007f5\\U000007fa\\U00000800-\\U00000815\\U0000081a\\U00000824\\U00000828\\U00000840-\\U00000858\\U00000860-\\U0000086a\\U00000870-\\U00000887\\U00000889-\\U0000088e\\U000008a0-\\U000008c9\\U00000904-\\U00000939\\U0000093d\\U00000950\\U00000958-\\U00000961\\U00000971-\\U00000980\\U00000985-\\U0000098c\\U0000098f-\\U00000990\\U00000993-\\U000009a8\\U000009aa-\\U000009b0\\U000009b2\\U000009b6-\\U000009b9\\U000009bd\\U000009ce\\U000009dc-\\U000009dd\\U000009df-\\U000009e1\\U000009f0-\\U000009f1\\U000009fc\\U00000a05-\\U00000a0a\\U00000a0f-\\U00000a10\\U00000a13-\\U00000a28\\U00000a2a-\\U00000a30\\U00000a32-\\U00000a33\\U00000a35-\\U00000a36\\U00000a38-\\U00000a39\\U00000a59-\\U00000a5c\\U00000a5e\\U00000a72-\\U00000a74\\U00000a85-\\U00000a8d\\U00000a8f-\\U00000a91\\U00000a93-\\U00000aa8\\U00000aaa-\\U00000ab0\\U00000ab2-\\U00000ab3\\U00000ab5-\\U00000ab9\\U00000abd\\U00000ad0\\U00000ae0-\\U00000ae1\\U00000af9\\U00000b05-\\U00000b0c\\U00000b0f-\\U00000b10\\U00000b13-\\U00000b28\\U00000b2a-\\U00000b30\\U00000b32-\\U00000b33\\U00000b35-\\U00000b39\\U00000b3d\\U00000b5c-\\U00000b5d\\U00000b5f-\\U00000b61\\U00000b71\\U00000b83\\U00000b85-\\U00000b8a\\U00000b8e-\\U00000b90\\U00000b92-\\U00000b95\\U00000b99-\\U00000b9a\\U00000b9c\\U00000b9e-\\U00000b9f\\U00000ba3-\\U00000ba4\\U00000ba8-\\U00000baa\\U00000bae-\\U00000bb9\\U00000bd0\\U00000c05-\\U00000c0c\\U00000c0e-\\U00000c10\\U00000c12-\\U00000c28\\U00000c2a-\\U00000c39\\U00000c3d\\U00000c58-\\U00000c5a\\U00000c5d\\U00000c60-\\U00000c61\\U00000c80\\U00000c85-\\U00000c8c\\U00000c8e-\\U00000c90\\U00000c92-\\U00000ca8\\U00000caa-\\U00000cb3\\U00000cb5-\\U00000cb9\\U00000cbd\\U00000cdd-\\U00000cde\\U00000ce0-\\U00000ce1\\U00000cf1-\\U00000cf2\\U00000d04-\\U00000d0c\\U00000d0e-\\U00000d10\\U00000d12-\\U00000d3a\\U00000d3d\\U00000d4e\\U00000d54-\\U00000d56\\U00000d5f-\\U00000d61\\U00000d7a-\\U00000d7f\\U00000d85-\\U00000d96\\U00000d9a-\\U00000db1\\U00000db3-\\U00000dbb\\U00000dbd\\U00000dc0-\\U00000dc6\\U00000e01-\\U00000e30\\U00000e32-\\U00000e33\\U00000e40-\\U00000e46\\U00000e81-\\U00000e82\\U00000e84\\U00000e86-\\U00000e8a\\U00000e8c-\\U00000ea3\\U00000ea5\\U00000ea7-\\U00000eb0\\U00000eb2-\\U00000eb3\\U00000ebd\\U00000ec0-\\U00000ec4\\U00000ec6\\U00000edc-\\U00000edf\\U00000f00\\U00000f40-\\U00000f47\\U00000f49-\\U00000f6c\\U00000f88-\\U00000f8c\\U00001000-\\U0000102a\\U0000103f\\U00001050-\\U00001055\\U0000105a-\\U0000105d\\U00001061\\U00001065-\\U00001066\\U0000106e-\\U00001070\\U00001075-\\U00001081\\U0000108e\\U000010a0-\\U000010c5\\U000010c7\\U000010cd\\U000010d0-\\U000010fa\\U000010fc-\\U00001248\\U0000124a-\\U0000124d\\U00001250-\\U00001256\\U00001258\\U0000125a-\\U0000125d\\U00001260-\\U00001288\\U0000128a-\\U0000128d\\U00001290-\\U000012b0\\U000012b2-\\U000012b5\\U000012b8-\\U000012be\\U000012c0\\U000012c2-\\U000012c5\\U000012c8-\\U000012d6\\U000012d8-\\U00001310\\U00001312-\\U00001315\\U00001318-\\U0000135a\\U00001380-\\U0000138f\\U000013a0-\\U000013f5\\U000013f8-\\U000013fd\\U00001401-\\U0000166c\\U0000166f-\\U0000167f\\U00001681-\\U0000169a\\U000016a0-\\U000016ea\\U000016f1-\\U000016f8\\U00001700-\\U00001711\\U0000171f-\\U00001731\\U00001740-\\U00001751\\U00001760-\\U0000176c\\U0000176e-\\U00001770\\U00001780-\\U000017b3\\U000017d7\\U000017dc\\U00001820-\\U00001878\\U00001880-\\U00001884\\U00001887-\\U000018a8\\U000018aa\\U000018b0-\\U000018f5\\U00001900-\\U0000191e\\U00001950-\\U0000196d\\U00001970-\\U00001974\\U00001980-\\U000019ab\\U000019b0-\\U000019c9\\U00001a00-\\U00001a16\\U00001a20-\\U00001a54\\U00001aa7\\U00001b05-\\U00001b33\\U00001b45-\\U00001b4c\\U00001b83-\\U00001ba0\\U00001bae-\\U00001baf\\U00001bba-\\U00001be5\\U00001c00-\\U00001c23\\U00001c4d-\\U00001c4f\\U00001c5a-\\U00001c7d\\U00001c80-\\U00001c88\\U00001c90-\\U00001cba\\U00001cbd-\\U00001cbf\\U00001ce9-\\U00001cec\\U00001cee-\\U00001cf3\\U00001cf5-\\U00001cf6\\U00001cfa\\U00001d00-\\U00001dbf\\U00001e00-\\U00001f15\\U00001f18-\\U00001f1d\\U00001f20-\\U00001f45\\U00001f48-\\U00001f4d\\U00001f50-\\U00001f57\\U00001f59\\U00001f5b\\U00001f5d\\U00001f5f-\\U00001f7d\\U00001f80-\\U00001fb4\\U00001fb6-\\U00001fbc\\U00001fbe\\U00001fc2-\\U00001fc4\\U00001fc6-\\U00001fcc\\U00001fd0-\\U00001fd3\\U00001fd6-\\U00001fdb\\U00001fe0-\\U00001fec\\U00001ff2-\\U00001ff4\\U00001ff6-\\U00001ffc\\U00002071\\U0000207f\\U00002090-\\U0000209c\\U00002102\\U00002107\\U0000210a-\\U00002113\\U00002115\\U00002119-\\U0000211d\\U00002124\\U00002126\\U00002128\\U0000212a-\\U0000212d\\U0000212f-\\U00002139\\U0000213c-\\U0000213f\\U00002145-\\U00002149\\U0000214e\\U00002183-\\U00002184\\U00002c00-\\U00002ce4\\U00002ceb-\\U00002cee\\U00002cf2-\\U00002cf3\\U00002d00-\\U00002d25\\U00002d27\\U00002d2d\\U00002d30-\\U00002d67\\U00002d6f\\U00002d80-\\U00002d96\\U00002da0-\\U00002da6\\U00002da8-\\U00002dae\\U00002db0-\\U00002db6\\U00002db8-\\U00002dbe\\U00002dc0-\\U00002dc6\\U00002dc8-\\U00002dce\\U00002dd0-\\U00002dd6\\U00002dd8-\\U00002dde\\U00002e2f\\U00003005-\\U00003006\\U00003031-\\U00003035\\U0000303b-\\U0000303c\\U00003041-\\U00003096\\U0000309d-\\U0000309f\\U000030a1-\\U000030fa\\U000030fc-\\U000030ff\\U00003105-\\U0000312f\\U00003131-\\U0000318e\\U000031a0-\\U000031bf\\U000031f0-\\U000031ff\\U00003400-\\U00004dbf\\U00004e00-\\U0000a48c\\U0000a4d0-\\U0000a4fd\\U0000a500-\\U0000a60c\\U0000a610-\\U0000a61f\\U0000a62a-\\U0000a62b\\U0000a640-\\U0000a66e\\U0000a67f-\\U0000a69d\\U0000a6a0-\\U0000a6e5\\U0000a717-\\U0000a71f\\U0000a722-\\U0000a788\\U0000a78b-\\U0000a7ca\\U0000a7d0-\\U0000a7d1\\U0000a7d3\\U0000a7d5-\\U0000a7d9\\U0000a7f2-\\U0000a801\\U0000a803-\\U0000a805\\U0000a807-\\U0000a80a\\U0000a80c-\\U0000a822\\U0000a840-\\U0000a873\\U0000a882-\\U0000a8b3\\U0000a8f2-\\U0000a8f7\\U0000a8fb\\U0000a8fd-\\U0000a8fe\\U0000a90a-\\U0000a925\\U0000a930-\\U0000a946\\U0000a960-\\U0000a97c\\U0000a984-\\U0000a9b2\\U0000a9cf\\U0000a9e0-\\U0000a9e4\\U0000a9e6-\\U0000a9ef\\U0000a9fa-\\U0000a9fe\\U0000aa00-\\U0000aa28\\U0000aa40-\\U0000aa42\\U0000aa44-\\U0000aa4b\\U0000aa60-\\U0000aa76\\U0000aa7a\\U0000aa7e-\\U0000aaaf\\U0000aab1\\U0000aab5-\\U0000aab6\\U0000aab9-\\U0000aabd\\U0000aac0\\U0000aac2\\U0000aadb-\\U0000aadd\\U0000aae0-\\U0000aaea\\U0000aaf2-\\U0000aaf4\\U0000ab01-\\U0000ab06\\U0000ab09-\\U0000ab0e\\U0000ab11-\\U0000ab16\\U0000ab20-\\U0000ab26\\U0000ab28-\\U0000ab2e\\U0000ab30-\\U0000ab5a\\U0000ab5c-\\U0000ab69\\U0000ab70-\\U0000abe2\\U0000ac00-\\U0000d7a3\\U0000d7b0-\\U0000d7c6\\U0000d7cb-\\U0000d7fb\\U0000f900-\\U0000fa6d\\U0000fa70-\\U0000fad9\\U0000fb00-\\U0000fb06\\U0000fb13-\\U0000fb17\\U0000fb1d\\U0000fb1f-\\U0000fb28\\U0000fb2a-\\U0000fb36\\U0000fb38-\\U0000fb3c\\U0000fb3e\\U0000fb40-\\U0000fb41\\U0000fb43-\\U0000fb44\\U0000fb46-\\U0000fbb1\\U0000fbd3-\\U0000fd3d\\U0000fd50-\\U0000fd8f\\U0000fd92-\\U0000fdc7\\U0000fdf0-\\U0000fdfb\\U0000fe70-\\U0000fe74\\U0000fe76-\\U0000fefc\\U0000ff21-\\U0000ff3a\\U0000ff41-\\U0000ff5a\\U0000ff66-\\U0000ffbe\\U0000ffc2-\\U0000ffc7\\U0000ffca-\\U0000ffcf\\U0000ffd2-\\U0000ffd7\\U0000ffda-\\U0000ffdc]*+)*+(?:())|[123456789][0123456789]*+(?:[Ee](?:[0123456789][0123456789]*+(?:())|[+\\-](?:[0123456789][0123456789]*+(?:())))|[.](?:[0123456789][0123456789]*+(?:[Ee](?:[0123456789][0123456789]*+(?:())|[+\\-](?:[0123456789][0123456789]*+(?:())))|()))|())|[\n (),.\\[\\]](?:())|[!*+\\-<=>](?:[=](?:())|())|["][ !#$%&\'()*+,\\-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ\\[\\\\\\]\\^_`abcdefghijklmnopqrstuvwxyz{|}~\\U000000a0-\\U0000ffff]*+(?:(?=[\\U00010000-\\U0010ffff])[\\U00010000-\\U0010ffff][ !#$%&\'()*+,\\-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ\\[\\\\\\]\\^_`abcdefghijklmnopqrstuvwxyz{|}~\\U000000a0-\\U0000ffff]*+)*+(?:["](?:()))|[/](?:[=](?:())|[/][ !"#$%&\'()*+,\\-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ\\[\\\\\\]\\^_`abcdefghijklmnopqrstuvwxyz{|}~\\U000000a0-\\U0000ffff]*+(?:(?=[\\U00010000-\\U0010ffff])[\\U00010000-\\U0010ffff][ !"#$%&\'()*+,\\-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ\\[\\\\\\]\\^_`abcdefghijklmnopqrstuvwxyz{|}~\\U000000a0-\\U0000ffff]*+)*+(?:[\n](?:()))|()))'
+ESPACOS = " \t\r\n"
+
+
+def _compilar(padrao):
+    if sys.version_info < (3, 11):
+        # sem quantificador possessivo; os laços não devolvem caracteres de qualquer forma
+        padrao = padrao.replace("]*+", "]*").replace(")*+", ")*")
+    return re.compile(padrao)
+
+
+# espaços em branco (grupo 1) seguidos do maior token
+MESTRE = _compilar("([" + ESPACOS + "]*+)(?:" + TOKEN + ")?")
+TOKEN_RE = _compilar("()(?:" + TOKEN + ")?")
+
+
+def longest_match(texto, i, n):
+    """Maior lexema em texto[i:n]: (tamanho, índice em TIPOS); (0, 0) se nenhum."""
+    m = TOKEN_RE.match(texto, i, n)
+    k = GRUPO_TIPO[m.lastindex]
+    return (m.end() - i, k) if k else (0, 0)
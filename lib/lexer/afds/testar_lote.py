@@ -0,0 +1,69 @@
+"""
+Teste diferencial de Lexer.tokenize_many: lotes de textos aleatórios pequenos
+(inclusive vazios, com erros e comentários sem fim no final de um texto) devem
+dar, texto a texto, os mesmos tokens e erros que tokenize_stream de cada um,
+nos modos dicionário, tabela, scanner, linear, preguiçoso e com a prevarredura.
+Parte dos lotes passa pela versão paralela, com threads e com processos.
+
+Uso:
+    python testar_lote.py [quantidade_de_lotes]
+"""
+
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from lexer3 import Lexer
+from gerar_scanner import SAIDA_PADRAO
+from testar_scanner import texto_aleatorio
+
+FINAIS = ["", "", "// sem fim", '"aberta', "$", "1.", "\n"]
+
+
+def tokens(stream, primeiro, ultimo, deslocamento):
+    return [(stream.kinds[i], stream.inicio(i) - deslocamento, stream.fim(i) - deslocamento,
+             stream.linha(i), stream.colunas[i], stream[i].lexeme) for i in range(primeiro, ultimo)]
+
+
+def main(quantidade=300):
+    lexers = {
+        "dicionario": Lexer(usar_tabela=False),
+        "tabela": Lexer(),
+        "scanner": Lexer(scanner=SAIDA_PADRAO),
+        "linear": Lexer(linear=True),
+        "preguicoso": Lexer(preguicoso=True),
+        "prevarredura": Lexer(prevarredura=True),
+    }
+    rnd = random.Random(2027)
+    with ThreadPoolExecutor(max_workers=3) as threads, ProcessPoolExecutor(max_workers=2) as processos:
+        for n in range(quantidade):
+            textos = [texto_aleatorio(rnd, rnd.randint(0, 40)) + rnd.choice(FINAIS)
+                      for _ in range(rnd.randint(0, 30))]
+            separadores = rnd.choice([(), ("(", ")", "[", "]", ",")])
+            eof = rnd.random() < 0.7
+            executor = rnd.choice([None, None, threads, processos])
+            for nome, lexer in lexers.items():
+                if executor is None:
+                    stream, faixas, erros = lexer.tokenize_many(textos, separadores, eof)
+                else:
+                    stream, faixas, erros = lexer.tokenize_many(textos, separadores, eof, workers=3,
+                                                                executor=executor, lote_minimo=1)
+                if len(faixas) != len(textos) + 1 or len(erros) != len(textos):
+                    print(f"DIFERENÇA no lote {n} ({nome}): {len(faixas)} faixas para {len(textos)} textos")
+                    sys.exit(1)
+                deslocamento = 0
+                for k, texto in enumerate(textos):
+                    esperado, esperados = lexer.tokenize_stream(texto, separadores, eof)
+                    obtido = tokens(stream, faixas[k], faixas[k + 1], deslocamento)
+                    if obtido != tokens(esperado, 0, len(esperado), 0) or erros[k] != esperados:
+                        print(f"DIFERENÇA no lote {n}, texto {k} ({nome}): {texto!r}")
+                        sys.exit(1)
+                    deslocamento += len(texto) + 1
+                if stream.erros != [e for lista in erros for e in lista]:
+                    print(f"DIFERENÇA no lote {n} ({nome}): stream.erros fora de ordem")
+                    sys.exit(1)
+    print(f"OK: {quantidade} lotes aleatórios, tokenize_many igual a tokenize_stream em {len(lexers)} modos")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,47 @@
+"""
+Teste diferencial de Lexer.tokenize_parallel: em textos aleatórios cortados em
+trechos pequenos (muitos cortes por texto), o resultado deve ser idêntico ao de
+Lexer.tokenize nos modos dicionário, tabela, scanner e preguiçoso.
+
+Uso:
+    python testar_paralelo.py [quantidade_de_textos]
+"""
+
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from lexer3 import Lexer
+from gerar_scanner import SAIDA_PADRAO
+from testar_scanner import texto_aleatorio
+
+
+def resultado(tokens_erros):
+    tokens, erros = tokens_erros
+    return [(t.type, t.lexeme, t.line, t.col, t.kind) for t in tokens], erros
+
+
+def main(quantidade=500):
+    lexers = {
+        "dicionario": Lexer(usar_tabela=False),
+        "tabela": Lexer(),
+        "scanner": Lexer(scanner=SAIDA_PADRAO),
+    }
+    rnd = random.Random(2025)
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        for n in range(quantidade):
+            texto = texto_aleatorio(rnd, rnd.randint(0, 600))
+            workers = rnd.randint(2, 6)
+            trecho_minimo = rnd.randint(1, 60)
+            for nome, lexer in lexers.items():
+                esperado = resultado(lexer.tokenize(texto))
+                obtido = resultado(lexer.tokenize_parallel(texto, workers=workers, executor=executor,
+                                                           trecho_minimo=trecho_minimo))
+                if obtido != esperado:
+                    print(f"DIFERENÇA no texto {n} ({nome}, {workers} trechos): {texto!r}")
+                    sys.exit(1)
+    print(f"OK: {quantidade} textos aleatórios, tokenize_parallel igual a tokenize nos 4 modos")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,63 @@
+"""
+Teste diferencial de Lexer.relex: sequências de edições aleatórias (inserções,
+remoções e trocas, inclusive de quebras de linha e aspas) aplicadas em cadeia,
+cada uma comparada com tokenize_stream do texto editado inteiro, nos modos
+dicionário, tabela, scanner, preguiçoso e com a prevarredura.
+
+Uso:
+    python testar_relex.py [quantidade_de_textos]
+"""
+
+import random
+import sys
+
+from lexer3 import Lexer
+from gerar_scanner import SAIDA_PADRAO
+from testar_scanner import texto_aleatorio
+
+EDICOES_POR_TEXTO = 12
+
+
+def resultado(stream, erros):
+    tokens = [(stream.kinds[i], stream.inicio(i), stream.fim(i), stream.linha(i), stream.colunas[i])
+              for i in range(len(stream))]
+    return tokens, [(t.type, t.lexeme, t.line, t.col) for t in stream], erros
+
+
+def colunas(stream):
+    return [list(getattr(stream, nome)) for nome in ("kinds", "inicios", "fins", "linhas", "colunas")]
+
+
+def main(quantidade=1000):
+    lexers = [Lexer(usar_tabela=False), Lexer(), Lexer(scanner=SAIDA_PADRAO), Lexer(preguicoso=True),
+              Lexer(prevarredura=True)]
+    rnd = random.Random(2026)
+    edicoes = 0
+    for n in range(quantidade):
+        lexer = lexers[n % len(lexers)]
+        texto = texto_aleatorio(rnd, rnd.randint(0, 300))
+        separadores = rnd.choice([(), ("(", ")", "[", "]", ",")])
+        eof = rnd.random() < 0.5
+        stream, erros = lexer.tokenize_stream(texto, separadores, eof)
+        for _ in range(EDICOES_POR_TEXTO):
+            inicio = rnd.randint(0, len(texto))
+            fim = min(len(texto), inicio + rnd.choice([0, 0, 1, 1, 2, 5, 20]))
+            novo = texto_aleatorio(rnd, rnd.choice([0, 1, 1, 2, 4]))
+            stream, erros = lexer.relex(stream, (inicio, fim), novo)
+            texto = texto[:inicio] + novo + texto[fim:]
+            edicoes += 1
+            esperado, erros_esperados = lexer.tokenize_stream(texto, separadores, eof)
+            if resultado(stream, erros) != resultado(esperado, erros_esperados):
+                print(f"DIFERENÇA no texto {n} depois de trocar {(inicio, fim)} por {novo!r}: {texto!r}")
+                sys.exit(1)
+            # com o deslocamento pendente aplicado, os arrays ficam iguais aos de tokenize_stream
+            if rnd.random() < 0.2:
+                stream.materializar()
+                if colunas(stream) != colunas(esperado):
+                    print(f"DIFERENÇA nos arrays do texto {n} depois de materializar(): {texto!r}")
+                    sys.exit(1)
+    print(f"OK: {quantidade} textos, {edicoes} edições em cadeia, relex igual a tokenize_stream nos {len(lexers)} modos")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,110 @@
+"""
+Teste diferencial do scanner gerado (gerar_scanner.py): em um corpus aleatório
+grande, Lexer(scanner=...) deve produzir exatamente os mesmos tokens e erros
+que o AFD em tabela e o AFD de dicionários. O modo linear (Lexer(linear=True))
+e o preguiçoso (Lexer(preguicoso=True), também com um cache de só 3 estados,
+descartado o tempo todo) entram na mesma comparação, assim como a prevarredura
+(Lexer(prevarredura=True), nos modos tabela e dicionário). Em todos os modos,
+Lexer.tokenize_lazy (tokens sob demanda, usado pelo Parser) deve gerar os mesmos
+tokens e erros que tokenize_stream. Com o NumPy instalado, a prevarredura
+vetorizada também é comparada com a em Python puro.
+
+Uso:
+    python testar_scanner.py [quantidade_de_textos]
+"""
+
+import os
+import random
+import sys
+import tempfile
+
+import AFN
+from AFN import dfa
+from dfa_preguicoso import lazy_dfa
+from lexer3 import Lexer
+from prevarredura import numpy_disponivel, prevarrer
+from gerar_scanner import SAIDA_PADRAO, assinatura_dfa, carregar_scanner, escrever_scanner
+
+# pedaços que exercitam todos os tokens, erros e cortes no meio de um lexema
+PEDACOS = list('abcxyzXYZ_019.eE+-*/=!<>()[],"$%#@ \t\n') + [
+    "//", "If", "Print", "End", "CalculateMean", '"ab c"', "1.5e-3", "12.5", "2E+10",
+    "// comentario\n", "á", "ç", "\r\n",
+    # letras Unicode (também fora do BMP) e não-letras: valem em strings e comentários
+    "变量", "π", "𝑥", "€", "😀", "\u00a0", "\u0080", '"ação"',
+]
+
+
+def texto_aleatorio(rnd, tamanho):
+    return "".join(rnd.choice(PEDACOS) for _ in range(tamanho))
+
+
+def resultado(lexer, texto):
+    tokens, erros = lexer.tokenize(texto)
+    return [(t.type, t.lexeme, t.line, t.col) for t in tokens], erros
+
+
+def comparar_sob_demanda(lexer, texto, separadores=("(", ")", "[", "]", ",")):
+    stream, erros = lexer.tokenize_stream(texto, separadores, eof=False)
+    erros_lazy = []
+    lazy = [(t.type, t.lexeme, t.line, t.col, t.kind) for t in lexer.tokenize_lazy(texto, separadores, erros_lazy)]
+    return lazy == [(t.type, t.lexeme, t.line, t.col, t.kind) for t in stream] and erros_lazy == erros
+
+
+def comparar_prevarreduras(lexer, texto):
+    campos = ("quebras", "classes", "saltos")
+    vetorizada = prevarrer(texto, lexer.tabela, lexer.whitespace_chars, usar_numpy=True)
+    pura = prevarrer(texto, lexer.tabela, lexer.whitespace_chars, usar_numpy=False)
+    return all(getattr(vetorizada, c) == getattr(pura, c) for c in campos)
+
+
+def main(quantidade=2000):
+    # o scanner versionado precisa estar em dia com o AFD
+    if os.path.exists(SAIDA_PADRAO):
+        atual = carregar_scanner(SAIDA_PADRAO)
+        if atual.ASSINATURA != assinatura_dfa(dfa):
+            print("scanner_lsd.py desatualizado: rode python gerar_scanner.py")
+            sys.exit(1)
+
+    fd, caminho = tempfile.mkstemp(suffix=".py")
+    os.close(fd)
+    try:
+        escrever_scanner(dfa, caminho)
+        lexers = {
+            "dicionario": Lexer(usar_tabela=False),
+            "tabela": Lexer(),
+            "scanner": Lexer(scanner=caminho),
+            "linear": Lexer(linear=True),
+            "preguicoso": Lexer(preguicoso=True),
+            "descarte": Lexer(preguicoso=True, dfa_obj=lazy_dfa(AFN.afds, AFN.token_types,
+                                                                 AFN.token_priority, max_estados=3)),
+            "prevarredura": Lexer(prevarredura=True),
+            "prevarredura_dicionario": Lexer(usar_tabela=False, prevarredura=True),
+        }
+    finally:
+        os.remove(caminho)
+
+    rnd = random.Random(2024)
+    caracteres = 0
+    for n in range(quantidade):
+        texto = texto_aleatorio(rnd, rnd.randint(0, 400))
+        caracteres += len(texto)
+        esperado = resultado(lexers["dicionario"], texto)
+        for nome in lexers:
+            obtido = resultado(lexers[nome], texto)
+            if obtido != esperado:
+                print(f"DIFERENÇA no texto {n} ({nome}): {texto!r}")
+                sys.exit(1)
+            if not comparar_sob_demanda(lexers[nome], texto):
+                print(f"DIFERENÇA em tokenize_lazy no texto {n} ({nome}): {texto!r}")
+                sys.exit(1)
+        if numpy_disponivel() and not comparar_prevarreduras(lexers["tabela"], texto):
+            print(f"DIFERENÇA na prevarredura com NumPy no texto {n}: {texto!r}")
+            sys.exit(1)
+    print(f"OK: {quantidade} textos aleatórios ({caracteres} caracteres), mesmos tokens e erros "
+          f"nos {len(lexers)} modos")
+    if not numpy_disponivel():
+        print("  (NumPy não instalado: prevarredura vetorizada não testada)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,73 @@
+"""
+Tipos de token como inteiros (Token.kind), compartilhados por lexer e parser.
+
+Token.type continua sendo a string de sempre ("IDENTIFICADOR", "KEYWORD", ...);
+Token.kind é um int resolvido uma vez no lexer, e as palavras-chave da LSD têm
+cada uma o seu kind (KIND_IF, KIND_PRINT, ...), então o parser compara inteiros
+em vez de normalizar strings com upper()/lower().
+"""
+
+KIND_EOF = 0
+KIND_COMENTARIO = 1
+KIND_DECIMAL = 2
+KIND_IDENTIFICADOR = 3
+KIND_INTEIRO = 4
+KIND_NOT_CIEN = 5
+KIND_OPERADOR = 6
+KIND_SEPARADOR = 7
+KIND_STRING = 8
+KIND_KEYWORD = 9          # palavra-chave extra (passada em Lexer(palavras_chave=...))
+KIND_IF = 10
+KIND_PRINT = 11
+KIND_END = 12
+KIND_CALCULATEMEAN = 13
+KIND_CALCULATESUM = 14
+KIND_UNKNOWN = 15
+
+# kind -> Token.type
+TIPO_DO_KIND = [
+    "EOF", "COMENTARIO", "DECIMAL", "IDENTIFICADOR", "INTEIRO", "NOT_CIEN", "OPERADOR",
+    "SEPARADOR", "STRING", "KEYWORD", "KEYWORD", "KEYWORD", "KEYWORD", "KEYWORD", "KEYWORD",
+    "UNKNOWN",
+]
+
+# tipo (string) -> kind; tipos novos (AFDs fornecidos pelo usuário) ganham kinds novos
+_KIND_DO_TIPO = {tipo: k for k, tipo in enumerate(TIPO_DO_KIND) if k <= KIND_KEYWORD or k == KIND_UNKNOWN}
+
+# palavras-chave da LSD (minúsculas) -> kind próprio
+PALAVRAS_CHAVE = {
+    "if": KIND_IF,
+    "print": KIND_PRINT,
+    "end": KIND_END,
+    "calculatemean": KIND_CALCULATEMEAN,
+    "calculatesum": KIND_CALCULATESUM,
+}
+
+# kind -> grafia usada na gramática (docs/grammar.md)
+NOME_DO_KIND = {
+    KIND_IF: "If",
+    KIND_PRINT: "Print",
+    KIND_END: "End",
+    KIND_CALCULATEMEAN: "CalculateMean",
+    KIND_CALCULATESUM: "CalculateSum",
+}
+
+# If, Print e End delimitam statements; não podem aparecer em expressões
+KINDS_CONTROLE = frozenset({KIND_IF, KIND_PRINT, KIND_END})
+KINDS_PALAVRA = frozenset({KIND_KEYWORD}) | frozenset(PALAVRAS_CHAVE.values())
+
+
+def kind_de_tipo(tipo):
+    """Kind de um tipo de token (registra tipos desconhecidos)."""
+    k = _KIND_DO_TIPO.get(tipo)
+    if k is None:
+        k = _KIND_DO_TIPO[tipo] = len(TIPO_DO_KIND)
+        TIPO_DO_KIND.append(tipo)
+    return k
+
+
+def kind_de_token(tipo, lexema):
+    """Kind de um token criado fora do lexer (ex.: Token("KEYWORD", "If", 1, 1))."""
+    if tipo == "KEYWORD":
+        return PALAVRAS_CHAVE.get(lexema.lower(), KIND_KEYWORD)
+    return kind_de_tipo(tipo)
@@ -12,7 +12,8 @@ from .lsd_ast import (
     Program, Statement, Assignment, ConditionalStatement, PrintStatement,
     Expression, RelationalExpression, AdditiveExpression, MultiplicativeExpression,
     UnaryExpression, PrimaryExpression, IntegerLiteral, DecimalLiteral,
-    StringLiteral, Identifier, FunctionCall, ListExpression, ParenthesizedExpression
+    StringLiteral, Identifier, FunctionCall, ListExpression, ParenthesizedExpression,
+    BinaryOp, UnaryOp, ErrorStatement, ErrorExpression
 )
 from .semantic_analyzer import SemanticAnalyzer, SemanticError, Type, SymbolTable
 from .interpreter import Interpreter, InterpreterError
@@ -24,6 +25,7 @@ __all__ = [
     'Expression', 'RelationalExpression', 'AdditiveExpression', 'MultiplicativeExpression',
     'UnaryExpression', 'PrimaryExpression', 'IntegerLiteral', 'DecimalLiteral',
     'StringLiteral', 'Identifier', 'FunctionCall', 'ListExpression', 'ParenthesizedExpression',
+    'BinaryOp', 'UnaryOp', 'ErrorStatement', 'ErrorExpression',
     'SemanticAnalyzer', 'SemanticError', 'Type', 'SymbolTable',
     'Interpreter', 'InterpreterError',
     'CodeGenerator', 'CodeGeneratorError'
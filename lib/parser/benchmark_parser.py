@@ -0,0 +1,403 @@
+"""
+Benchmarks do parser LSD e do front end (parser, análise semântica, interpretador e
+gerador de código sobre a AST). Os do analisador léxico ficam em
+../lexer/afds/benchmark_lexer.py, de onde vêm o corpus e a medição de tempo.
+
+Uso:
+    python benchmark_parser.py             # roda todos os cenários
+    python benchmark_parser.py pratt       # roda só o cenário indicado
+"""
+
+import gc
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lexer', 'afds'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lexer3 import Lexer
+from token_kinds import KIND_IDENTIFICADOR, KIND_IF, KIND_PRINT, KINDS_CONTROLE
+from parser import Parser, ParseError
+from semantic_analyzer import SemanticAnalyzer
+from interpreter import Interpreter
+from code_generator import CodeGenerator
+import cache_frontend
+import lsd_ast
+from benchmark_lexer import _melhor_tempo, gerar_corpus
+
+AQUI = os.path.dirname(os.path.abspath(__file__))
+RAIZ = os.path.join(AQUI, "..", "..")
+
+
+def bench_parser(linhas=20000, repeticoes=3):
+    """
+    Vazão de Parser.parse e custo do despacho por tipo de token: comparação de
+    strings normalizadas (como o parser fazia) vs Token.kind inteiro.
+    """
+    print(f"== parser: parse em corpus de {linhas} linhas ==")
+    texto = gerar_corpus(linhas, cientifica=False)
+    lexer = Lexer()
+    tokens = lexer.tokenize(texto)[0]
+
+    def parse():
+        return Parser(lexer).parse(texto)
+
+    programa = parse()
+    tempo = _melhor_tempo(parse, repeticoes)
+    print(f"  parse     : {tempo * 1000:8.1f} ms  {len(tokens) / tempo:10.0f} tokens/s"
+          f"  ({len(programa.statements)} statements)")
+
+    # pico de memória durante o parse vs o que fica retido (a AST): com os tokens
+    # puxados sob demanda o pico fica perto da AST; com um TokenStream pronto, soma as colunas
+    del programa
+    for nome, funcao in (("sob demanda", parse),
+                         ("TokenStream", lambda: Parser(lexer).parse(
+                             lexer.tokenize_stream(texto, separadores=Parser.SEPARADORES, eof=False)[0]))):
+        gc.collect()
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        programa = funcao()
+        retido, pico = (m - base for m in tracemalloc.get_traced_memory())
+        tracemalloc.stop()
+        del programa
+        print(f"  memória ({nome:11}): pico {pico / 1e6:6.1f} MB  AST {retido / 1e6:6.1f} MB")
+
+    # as perguntas que o parser faz a cada token, nas duas formas
+    def por_string():
+        n = 0
+        for t in tokens:
+            if t.type == "KEYWORD" and t.lexeme.upper() in ("IF", "PRINT", "END"):
+                n += 1
+            elif (t.type == "IDENTIFICADOR" or t.type.upper() == "IF" or t.lexeme.upper() == "IF"
+                  or t.type.upper() == "PRINT" or t.lexeme.upper() == "PRINT"):
+                n += 1
+        return n
+
+    def por_kind():
+        n = 0
+        for t in tokens:
+            kind = t.kind
+            if kind in KINDS_CONTROLE:
+                n += 1
+            elif kind == KIND_IDENTIFICADOR or kind == KIND_IF or kind == KIND_PRINT:
+                n += 1
+        return n
+
+    assert por_string() == por_kind()
+    t_string = _melhor_tempo(por_string, repeticoes)
+    t_kind = _melhor_tempo(por_kind, repeticoes)
+    print(f"  despacho  : strings {t_string * 1000:7.1f} ms  kind {t_kind * 1000:7.1f} ms"
+          f"  ({t_string / t_kind:.2f}x, {len(tokens)} tokens)")
+
+
+def _contar_nos(raiz):
+    """Número de nós da AST (dataclasses de lsd_ast) por tipo."""
+    contagem = {}
+    pilha = [raiz]
+    while pilha:
+        node = pilha.pop()
+        if isinstance(node, list):
+            pilha.extend(node)
+        elif isinstance(node, tuple):
+            pilha.extend(node[1:])  # (operador, expressão) de operations
+        elif hasattr(node, "__dataclass_fields__"):
+            nome = type(node).__name__
+            contagem[nome] = contagem.get(nome, 0) + 1
+            pilha.extend(getattr(node, campo) for campo in node.__dataclass_fields__)
+    return contagem
+
+
+def bench_pratt(copias=2000, repeticoes=3):
+    """
+    AST com os níveis da gramática vs AST compacta (Parser(pratt=True), BinaryOp/UnaryOp)
+    para exemplo_completo.lsd repetido `copias` vezes: nós, memória retida, tempo de
+    parse e das etapas que percorrem a árvore (análise semântica, interpretador, LLVM).
+    """
+    with open(os.path.join(RAIZ, "exemplo_completo.lsd"), encoding="utf-8") as f:
+        texto = "\n".join([f.read().strip()] * copias)
+    print(f"== pratt: exemplo_completo.lsd x {copias} ({texto.count(chr(10)) + 1} linhas) ==")
+    lexer = Lexer(palavras_chave=["If", "Print", "End", "CalculateMean", "CalculateSum"])
+
+    saidas = []
+    for nome, pratt in (("níveis", False), ("compacta", True)):
+        gc.collect()
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        programa = Parser(lexer, pratt=pratt).parse(texto)
+        retido = tracemalloc.get_traced_memory()[0] - base
+        tracemalloc.stop()
+        contagem = _contar_nos(programa)
+        total = sum(contagem.values())
+        expressoes = total - contagem["Program"] - sum(contagem.get(n, 0) for n in
+                                                        ("Assignment", "ConditionalStatement", "PrintStatement"))
+        print(f"  AST {nome:8}: {total:8} nós ({expressoes} de expressão)  {retido / 1e6:6.1f} MB retidos"
+              f"  ({retido / len(programa.statements):6.0f} B/statement)")
+
+        etapas = (("parse", lambda: Parser(lexer, pratt=pratt).parse(texto)),
+                  ("semântica", lambda: SemanticAnalyzer().analyze(programa)),
+                  ("interpretador", lambda: Interpreter().interpret(programa)),
+                  ("LLVM", lambda: CodeGenerator().generate(programa)))
+        saida = []
+        tempos = []
+        for etapa, funcao in etapas:
+            resultado = funcao()
+            if etapa != "parse":
+                saida.append(repr(resultado))
+            tempos.append(f"{etapa} {_melhor_tempo(funcao, repeticoes) * 1000:7.1f} ms")
+        saidas.append(saida)
+        print("    " + "   ".join(tempos))
+        del programa
+    assert saidas[0] == saidas[1], "a AST compacta mudou o resultado das etapas"
+
+
+def bench_ast(copias=4000, repeticoes=5):
+    """
+    Memória e tempo de construção da AST (nós de lsd_ast) para exemplo_completo.lsd
+    repetido `copias` vezes: bytes retidos por statement de nível superior, com e sem
+    pratt, e o tempo de parse (lexer incluso) com o coletor de ciclos ligado, como numa
+    execução normal.
+    """
+    with open(os.path.join(RAIZ, "exemplo_completo.lsd"), encoding="utf-8") as f:
+        texto = "\n".join([f.read().strip()] * copias)
+    lexer = Lexer(palavras_chave=["If", "Print", "End", "CalculateMean", "CalculateSum"])
+    slots = hasattr(lsd_ast.Identifier, "__slots__")
+    print(f"== ast: exemplo_completo.lsd x {copias} ({texto.count(chr(10)) + 1} linhas, nós "
+          f"{'com' if slots else 'sem'} __slots__) ==")
+    for pratt in (False, True):
+        gc.collect()
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        programa = Parser(lexer, pratt=pratt).parse(texto)
+        retido = tracemalloc.get_traced_memory()[0] - base
+        tracemalloc.stop()
+        statements = len(programa.statements)
+        nos = sum(_contar_nos(programa).values())
+        del programa
+        gc.collect()
+        tempo = _melhor_tempo(lambda: Parser(lexer, pratt=pratt).parse(texto), repeticoes)
+        print(f"  pratt={pratt!s:5}: {statements} statements, {nos} nós  {retido / 1e6:6.1f} MB retidos"
+              f"  {retido / statements:6.0f} B/statement  {retido / nos:5.1f} B/nó"
+              f"  parse {tempo * 1000:7.1f} ms ({tempo / statements * 1e6:5.2f} us/statement)")
+
+
+def bench_profundidade(profundidades=(1000, 10000, 100000)):
+    """
+    Parse, análise semântica, interpretador e LLVM de parênteses e If aninhados:
+    sem recursão o custo por nível deve ficar constante com a profundidade.
+    """
+    print("== profundidade: expressões e If aninhados (µs por nível) ==")
+    for profundidade in profundidades:
+        textos = (("parênteses", "x = " + "(" * profundidade + "1" + ")" * profundidade),
+                  ("ifs", "x = 1\n" + "If x == 1\n" * profundidade + "Print x\n" + "End\n" * profundidade))
+        for nome, texto in textos:
+            tempos = []
+            inicio = time.perf_counter()
+            programa = Parser(Lexer()).parse(texto)
+            tempos.append(("parse", time.perf_counter() - inicio))
+            for etapa, funcao in (("semântica", SemanticAnalyzer().analyze),
+                                  ("interpretador", Interpreter().interpret),
+                                  ("LLVM", CodeGenerator().generate)):
+                inicio = time.perf_counter()
+                funcao(programa)
+                tempos.append((etapa, time.perf_counter() - inicio))
+            print(f"  {nome:10} {profundidade:7}: "
+                  + "   ".join(f"{etapa} {t * 1e6 / profundidade:6.2f}" for etapa, t in tempos))
+
+
+def bench_recuperacao(copias=200, erros=(1, 10, 100), repeticoes=3):
+    """
+    Validação de exemplo_completo.lsd repetido com erros de sintaxe semeados: uma
+    passada de Parser(recuperar=True) acha todos; no modo normal é uma execução por
+    erro (corrige o erro lançado e roda de novo, como num ciclo de CI).
+    """
+    with open(os.path.join(RAIZ, "exemplo_completo.lsd"), encoding="utf-8") as f:
+        linhas = "\n".join([f.read().strip()] * copias).split("\n")
+    print(f"== recuperacao: exemplo_completo.lsd x {copias} ({len(linhas)} linhas) com erros semeados ==")
+    lexer = Lexer(palavras_chave=["If", "Print", "End", "CalculateMean", "CalculateSum"])
+    candidatas = [n for n, linha in enumerate(linhas) if linha.strip() and linha.strip() != "End"]
+    rnd = random.Random(2029)
+
+    for quantidade in erros:
+        # linhas não vizinhas: cada uma é exatamente um erro
+        semeadas = sorted(rnd.sample(candidatas[::2], quantidade))
+        erradas = list(linhas)
+        for n in semeadas:
+            primeira, _, resto = erradas[n].partition(" ")
+            erradas[n] = f"{primeira} * {resto}"
+
+        parser = Parser(lexer, recuperar=True)
+        parser.parse("\n".join(erradas))
+        achados = len(parser.errors)
+        uma_passada = _melhor_tempo(lambda: Parser(lexer, recuperar=True).parse("\n".join(erradas)), repeticoes)
+
+        execucoes = 0
+        inicio = time.perf_counter()
+        while True:
+            execucoes += 1
+            try:
+                Parser(lexer).parse("\n".join(erradas))
+                break
+            except ParseError as e:
+                n = e.token.line - 1
+                erradas[n] = linhas[n]
+        normal = time.perf_counter() - inicio
+        print(f"  {quantidade:4} erros: recuperar=True {uma_passada * 1000:8.1f} ms ({achados} erros, 1 passada)"
+              f"   normal {normal * 1000:9.1f} ms ({execucoes} execuções)   {normal / uma_passada:6.1f}x")
+
+
+def bench_reparse(copias=2000, edicoes=100):
+    """
+    Latência de Parser.reparse (edição -> AST) para edições de uma linha em
+    exemplo_completo.lsd repetido (~50 mil linhas) vs Parser.parse do texto inteiro.
+    """
+    with open(os.path.join(RAIZ, "exemplo_completo.lsd"), encoding="utf-8") as f:
+        texto = "\n".join([f.read().strip()] * copias)
+    lexer = Lexer(palavras_chave=["If", "Print", "End", "CalculateMean", "CalculateSum"])
+    parser = Parser(lexer)
+    programa = parser.parse(texto)
+    print(f"== reparse: edições de uma linha em {texto.count(chr(10)) + 1} linhas "
+          f"({len(programa.statements)} statements) ==")
+    completo = _melhor_tempo(lambda: parser.parse(texto), 2)
+    print(f"  parse completo  : {completo * 1000:8.1f} ms")
+    rnd = random.Random(11)
+
+    def linha_com(trecho):
+        """(início, fim) de uma linha sorteada que contém `trecho`."""
+        while True:
+            i = texto.find(trecho, rnd.randrange(len(texto)))
+            if i != -1:
+                return texto.rfind("\n", 0, i) + 1, texto.find("\n", i)
+
+    def medir(nome, gerar_edicao):
+        nonlocal texto, programa
+        tempos = []
+        for _ in range(edicoes):
+            inicio, fim, novo = gerar_edicao()
+            t0 = time.perf_counter()
+            programa = parser.reparse(programa, texto, (inicio, fim), novo)
+            tempos.append(time.perf_counter() - t0)
+            texto = texto[:inicio] + novo + texto[fim:]
+        tempos.sort()
+        mediana = tempos[len(tempos) // 2]
+        print(f"  {nome:16}: mediana {mediana * 1000:6.2f} ms  p95 {tempos[int(len(tempos) * 0.95)] * 1000:6.2f} ms"
+              f"  máx {tempos[-1] * 1000:6.2f} ms  ({completo / mediana:5.0f}x mais rápido)")
+
+    medir("trocar número", lambda: (lambda a, b: (a, b, f"nota1 = {rnd.randint(1, 9)}.5"))(*linha_com("nota1 =")))
+    medir("inserir linha", lambda: (lambda a, b: (a, a, f"extra = {rnd.randint(1, 9)}\n"))(*linha_com("Print")))
+    medir("apagar linha", lambda: (lambda a, b: (a, b + 1, ""))(*linha_com("Print \"")))
+    medir("condição do If", lambda: (lambda a, b: (a, b, f"If media >= {rnd.randint(1, 9)}.0"))(*linha_com("If media >=")))
+    t0 = time.perf_counter()
+    programa.materializar()
+    print(f"  materializar    : {(time.perf_counter() - t0) * 1000:8.1f} ms  (linhas pendentes, uma vez)")
+    assert programa == parser.parse(texto), "reparse difere de parse"
+
+
+def bench_frontend(repeticoes=10, copias=2000):
+    """
+    Cache do front end (cache_frontend.py): executar_lsd.py e gerar_llvm.py de ponta
+    a ponta sem cache, com o cache frio (vazio: roda o front end e grava) e quente
+    (lê a AST e a análise); e só o front end em exemplo_completo.lsd repetido.
+    """
+    raiz = RAIZ
+    cache_dir = tempfile.mkdtemp(prefix="lsd_frontend_cache_")
+    cache_frontend.FRONTEND_CACHE_DIR = cache_dir
+    saida = os.path.join(cache_dir, "saida.ll")
+    try:
+        env = dict(os.environ, LSD_FRONTEND_CACHE_DIR=cache_dir)
+        print("== frontend: scripts de ponta a ponta (menor tempo de parede) ==")
+        for script, argumentos in (("executar_lsd.py", ["exemplo_completo.lsd"]),
+                                   ("gerar_llvm.py", ["gerar_llvm.lsd", saida])):
+            def rodar(env):
+                inicio = time.perf_counter()
+                subprocess.run([sys.executable, script] + argumentos, cwd=raiz, env=env,
+                               check=True, stdout=subprocess.DEVNULL)
+                return (time.perf_counter() - inicio) * 1000
+            sem_cache = min(rodar(dict(env, LSD_FRONTEND_CACHE="0")) for _ in range(repeticoes))
+            frio = []
+            for _ in range(repeticoes):
+                cache_frontend.limpar_cache()
+                frio.append(rodar(env))
+            frio = min(frio)
+            # a última execução fria deixou a entrada pronta
+            quente = min(rodar(env) for _ in range(repeticoes))
+            print(f"  {script:15}: sem cache {sem_cache:7.1f} ms  frio {frio:7.1f} ms  quente {quente:7.1f} ms"
+                  f"  ({sem_cache / quente:4.2f}x)")
+
+        with open(os.path.join(raiz, "exemplo_completo.lsd"), encoding="utf-8") as f:
+            texto = "\n".join([f.read().strip()] * copias)
+        palavras_chave = ["If", "Print", "End", "CalculateMean", "CalculateSum"]
+        print(f"== frontend: analisar_frontend em {texto.count(chr(10)) + 1} linhas ==")
+        sem_cache = _melhor_tempo(lambda: cache_frontend.analisar_frontend(texto, palavras_chave, usar_cache=False), 2)
+
+        def frio():
+            cache_frontend.limpar_cache()
+            cache_frontend.analisar_frontend(texto, palavras_chave)
+        frio = _melhor_tempo(frio, 2)
+        quente = _melhor_tempo(lambda: cache_frontend.analisar_frontend(texto, palavras_chave), 3)
+        assert cache_frontend.analisar_frontend(texto, palavras_chave)['from_cache']
+        tamanho = sum(os.path.getsize(os.path.join(cache_dir, nome)) for nome in os.listdir(cache_dir)
+                      if nome.endswith(".pickle"))
+        print(f"  sem cache {sem_cache * 1000:8.1f} ms  frio {frio * 1000:8.1f} ms  quente {quente * 1000:8.1f} ms"
+              f"  ({sem_cache / quente:4.1f}x, entrada de {tamanho / 1e6:.1f} MB)")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def bench_ll1(copias=2000, repeticoes=7):
+    """
+    Descida recursiva vs parser por tabela LL(1) (Parser(ll1=True), tabela gerada de
+    docs/grammar.md) em exemplo_completo.lsd repetido `copias` vezes, com e sem pratt.
+    O lexer, o mesmo nas duas, é medido à parte e descontado; o lexer e os parsers
+    rodam alternados a cada repetição, para o ruído da máquina pesar igual em todos.
+    """
+    with open(os.path.join(RAIZ, "exemplo_completo.lsd"), encoding="utf-8") as f:
+        texto = "\n".join([f.read().strip()] * copias)
+    lexer = Lexer(palavras_chave=["If", "Print", "End", "CalculateMean", "CalculateSum"])
+    print(f"== ll1: exemplo_completo.lsd x {copias} ({texto.count(chr(10)) + 1} linhas) ==")
+    medidas = {"lexer": lambda: deque(lexer.tokenize_lazy(texto, separadores=Parser.SEPARADORES), maxlen=0)}
+    for pratt in (False, True):
+        for nome, ll1 in (("descida recursiva", False), ("tabela LL(1)", True)):
+            parser = Parser(lexer, pratt=pratt, ll1=ll1)
+            medidas[(nome, pratt)] = lambda parser=parser: parser.parse(texto)
+    tempos = {chave: [] for chave in medidas}
+    for _ in range(repeticoes):
+        for chave, funcao in medidas.items():
+            gc.collect()  # cada medida começa com o heap no mesmo estado
+            tempos[chave].append(_melhor_tempo(funcao, 1))
+    lexico = min(tempos.pop("lexer"))
+    print(f"  só o lexer                    {lexico * 1000:7.1f} ms")
+    for pratt in (False, True):
+        parser = {}
+        for nome in ("descida recursiva", "tabela LL(1)"):
+            total = min(tempos[(nome, pratt)])
+            parser[nome] = total - lexico
+            print(f"  {nome:17} pratt={pratt!s:5} {total * 1000:7.1f} ms  (parser {parser[nome] * 1000:6.1f} ms)")
+        print(f"    parser por tabela / recursivo: {parser['tabela LL(1)'] / parser['descida recursiva']:.2f}x")
+
+
+CENARIOS = {
+    "parser": bench_parser,
+    "pratt": bench_pratt,
+    "ast": bench_ast,
+    "profundidade": bench_profundidade,
+    "recuperacao": bench_recuperacao,
+    "reparse": bench_reparse,
+    "frontend": bench_frontend,
+    "ll1": bench_ll1,
+}
+
+
+if __name__ == "__main__":
+    escolhidos = sys.argv[1:] or list(CENARIOS)
+    for nome in escolhidos:
+        if nome not in CENARIOS:
+            print(f"Cenário desconhecido: {nome!r}. Disponíveis: {', '.join(CENARIOS)}")
+            sys.exit(1)
+        CENARIOS[nome]()
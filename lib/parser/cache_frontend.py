@@ -0,0 +1,208 @@
+"""
+Cache em disco do front end (léxico + sintático + semântico) da linguagem LSD.
+
+Como os .pyc do Python: executar_lsd.py e gerar_llvm.py guardam, para cada
+código fonte, a AST e o resultado do SemanticAnalyzer (symbols, errors,
+warnings) em pickle, e numa próxima execução do mesmo código pulam o lexer, o
+parser e a análise semântica. O cache é endereçado pelo conteúdo: o nome do
+arquivo é o hash do código fonte, das opções do parser e da versão do
+compilador (o conteúdo dos módulos do front end), então editar o .lsd ou
+qualquer módulo do front end invalida as entradas antigas sem precisar
+apagá-las. O diretório tem tamanho limitado: quando passa do limite, as
+entradas usadas há mais tempo (mtime, atualizado a cada acerto) são removidas
+(LRU).
+
+Variáveis de ambiente:
+    LSD_FRONTEND_CACHE=0          desliga o cache
+    LSD_FRONTEND_CACHE_DIR=...    diretório do cache (padrão: __pycache__/frontend aqui)
+    LSD_FRONTEND_CACHE_MAX_MB=... tamanho máximo do diretório (padrão: 64)
+
+lexer3 e parser só são importados quando o cache não tem a entrada: numa
+execução com o cache quente o import deles (e do AFD) também fica de fora.
+"""
+
+import gc
+import hashlib
+import os
+import pickle
+
+# Versão do formato das entradas; incrementar ao mudar o conteúdo salvo.
+FRONTEND_CACHE_VERSION = 1
+FRONTEND_CACHE_DIR = os.environ.get("LSD_FRONTEND_CACHE_DIR") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "__pycache__", "frontend")
+FRONTEND_CACHE_MAX_BYTES = int(float(os.environ.get("LSD_FRONTEND_CACHE_MAX_MB", "64")) * 1024 * 1024)
+FRONTEND_CACHE_PREFIX = "lsd_frontend"
+
+_AQUI = os.path.dirname(os.path.abspath(__file__))
+_AFDS = os.path.join(_AQUI, "..", "lexer", "afds")
+# Módulos que `import parser, semantic_analyzer` carrega (testar_cache_frontend.py
+# confere a lista): mudar qualquer um deles muda a versão do compilador.
+MODULOS_DO_FRONTEND = [
+    os.path.join(_AFDS, nome + ".py") for nome in (
+        "lexer3", "AFN", "AFD_Base", "AFD_Comentario", "AFD_Decimal", "AFD_INT",
+        "AFD_Identificador", "AFD_NotacaoCientifica", "AFD_Operadores", "AFD_Separador",
+        "AFD_String", "dfa_compilado", "dfa_preguicoso", "letras_unicode", "prevarredura",
+        "token_kinds")
+] + [
+    os.path.join(_AQUI, nome + ".py") for nome in (
+        "parser", "tabela_ll1", "lsd_ast", "semantic_analyzer", "cache_frontend")
+]
+
+_versao_do_compilador = None
+
+
+def versao_do_compilador():
+    """Hash do código dos módulos do front end (lido uma vez por processo)."""
+    global _versao_do_compilador
+    if _versao_do_compilador is None:
+        h = hashlib.blake2b(digest_size=16)
+        for caminho in MODULOS_DO_FRONTEND:
+            with open(caminho, "rb") as f:
+                h.update(f.read())
+        _versao_do_compilador = h.hexdigest()
+    return _versao_do_compilador
+
+
+def frontend_cache_key(codigo, palavras_chave, pratt=False):
+    """Chave da entrada: código fonte + opções do parser + versão do compilador + formato."""
+    h = hashlib.blake2b(digest_size=20)
+    h.update(repr((FRONTEND_CACHE_VERSION, versao_do_compilador(), list(palavras_chave), pratt)).encode("utf-8"))
+    h.update(codigo.encode("utf-8", "surrogatepass"))
+    return h.hexdigest()
+
+
+def _frontend_cache_path(chave):
+    return os.path.join(FRONTEND_CACHE_DIR, f"{FRONTEND_CACHE_PREFIX}.{chave}.pickle")
+
+
+def _sem_gc(funcao, *args):
+    """
+    funcao(*args) com o coletor de ciclos desligado. Ler ou gravar uma AST grande
+    cria/visita centenas de milhares de objetos, e as coletas disparadas no meio
+    (que não acham nada: a AST não tem ciclos) custam mais que o pickle em si.
+    """
+    ligado = gc.isenabled()
+    gc.disable()
+    try:
+        return funcao(*args)
+    finally:
+        if ligado:
+            gc.enable()
+
+
+def _load_frontend_cache(caminho):
+    try:
+        with open(caminho, "rb") as f:
+            dados = _sem_gc(pickle.load, f)
+    except Exception:
+        # entrada ausente, corrompida ou de classes que mudaram: vale como ausente
+        return None
+    if not isinstance(dados, dict) or dados.get("versao") != FRONTEND_CACHE_VERSION:
+        return None
+    try:
+        os.utime(caminho)  # usado agora: é o último a sair no LRU
+    except OSError:
+        pass
+    return dados
+
+
+def _store_frontend_cache(caminho, dados):
+    try:
+        conteudo = _sem_gc(pickle.dumps, dados, pickle.HIGHEST_PROTOCOL)
+    except RecursionError:
+        # pickle é recursivo: uma AST aninhada demais (ver testar_profundidade.py) fica sem cache
+        return
+    # grava em arquivo temporário e renomeia: outro processo nunca lê uma entrada pela metade
+    tmp = f"{caminho}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(FRONTEND_CACHE_DIR, exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(conteudo)
+        os.replace(tmp, caminho)
+    except OSError:
+        # diretório somente leitura etc.: o cache é só uma otimização
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return
+    despejar(FRONTEND_CACHE_MAX_BYTES)
+
+
+def despejar(limite_bytes):
+    """
+    Remove as entradas usadas há mais tempo até o diretório do cache ficar com
+    no máximo `limite_bytes`. Retorna quantas entradas foram removidas.
+    """
+    entradas = []
+    try:
+        with os.scandir(FRONTEND_CACHE_DIR) as it:
+            for entrada in it:
+                if entrada.name.startswith(FRONTEND_CACHE_PREFIX + ".") and entrada.name.endswith(".pickle"):
+                    try:
+                        info = entrada.stat()
+                    except OSError:
+                        continue
+                    entradas.append((info.st_mtime_ns, info.st_size, entrada.path))
+    except OSError:
+        return 0
+    total = sum(tamanho for _, tamanho, _ in entradas)
+    removidas = 0
+    for _, tamanho, caminho in sorted(entradas):
+        if total <= limite_bytes:
+            break
+        try:
+            os.remove(caminho)
+        except OSError:
+            continue
+        total -= tamanho
+        removidas += 1
+    return removidas
+
+
+def limpar_cache():
+    """Apaga todas as entradas do cache. Retorna quantas foram removidas."""
+    return despejar(-1)
+
+
+def analisar_frontend(codigo, palavras_chave, pratt=False, usar_cache=None):
+    """
+    Lexer + Parser + SemanticAnalyzer de `codigo`, ou o resultado guardado no cache.
+    Retorna {'ast': Program, 'parse_errors': [...], 'analysis': {'errors', 'warnings',
+    'symbols'}, 'from_cache': bool}. ParseError é lançado como em Parser.parse (e não
+    vai para o cache). O cache pode ser desligado com LSD_FRONTEND_CACHE=0.
+    """
+    if usar_cache is None:
+        usar_cache = os.environ.get("LSD_FRONTEND_CACHE", "1") != "0"
+
+    caminho = None
+    if usar_cache:
+        caminho = _frontend_cache_path(frontend_cache_key(codigo, palavras_chave, pratt))
+        dados = _load_frontend_cache(caminho)
+        if dados is not None:
+            return {'ast': dados["ast"], 'parse_errors': dados["parse_errors"],
+                    'analysis': dados["analysis"], 'from_cache': True}
+
+    from lexer3 import Lexer
+    from parser import Parser
+    from semantic_analyzer import SemanticAnalyzer
+    parser = Parser(Lexer(palavras_chave=palavras_chave), pratt=pratt)
+    ast = parser.parse(codigo)
+    analise = SemanticAnalyzer().analyze(ast)
+    if usar_cache:
+        _store_frontend_cache(caminho, {
+            "versao": FRONTEND_CACHE_VERSION,
+            "ast": ast,
+            "parse_errors": parser.errors,
+            "analysis": analise,
+        })
+    return {'ast': ast, 'parse_errors': parser.errors, 'analysis': analise, 'from_cache': False}
+
+
+def __getattr__(nome):
+    # ParseError só é importado (com parser e lexer3) quando alguém o usa, como
+    # o `except cache_frontend.ParseError` dos scripts, avaliado só quando há exceção
+    if nome == "ParseError":
+        from parser import ParseError
+        return ParseError
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
@@ -8,7 +8,8 @@ from lsd_ast import (
     Program, Statement, Assignment, ConditionalStatement, PrintStatement,
     Expression, RelationalExpression, AdditiveExpression, MultiplicativeExpression,
     UnaryExpression, PrimaryExpression, IntegerLiteral, DecimalLiteral,
-    StringLiteral, Identifier, FunctionCall, ListExpression, ParenthesizedExpression
+    StringLiteral, Identifier, FunctionCall, ListExpression,
+    BinaryOp, UnaryOp, OPERADORES_RELACIONAIS, OPERADORES_ADITIVOS, desembrulhar, percorrer
 )
 
 
@@ -38,6 +39,7 @@ class CodeGenerator:
         Gera código LLVM IR a partir da AST.
         Retorna o código LLVM IR completo.
         """
+        program.materializar()  # linhas pendentes de Parser.reparse (mensagens de erro)
         self.llvm_code = []
         self.variable_counter = 0
         self.string_counter = 0
@@ -55,8 +57,7 @@ class CodeGenerator:
         self._emit_function_start("main")
         
         # Gera código para cada statement
-        for statement in program.statements:
-            self._generate_statement(statement)
+        self._generate_statements(program.statements)
         
         # Finaliza função main
         self._emit_function_end()
@@ -112,18 +113,33 @@ class CodeGenerator:
         for string_value, global_name in self.strings.items():
             # Escapa caracteres especiais para LLVM
             escaped = self._escape_string_for_llvm(string_value)
-            str_len = len(string_value) + 1  # +1 para null terminator
+            str_len = self._llvm_byte_length(string_value)
             self.llvm_code.append(f"@{global_name} = private unnamed_addr constant [{str_len} x i8] c\"{escaped}\\00\"")
             self.llvm_code.append("")
     
     def _generate_statement(self, statement: Statement) -> None:
         """Gera código LLVM para um statement."""
-        if isinstance(statement, Assignment):
-            self._generate_assignment(statement)
-        elif isinstance(statement, ConditionalStatement):
-            self._generate_conditional(statement)
-        elif isinstance(statement, PrintStatement):
-            self._generate_print(statement)
+        self._generate_statements((statement,))
+    
+    def _generate_statements(self, statements: List[Statement]) -> None:
+        """
+        Gera código para statements em ordem. O corpo de cada If entra numa pilha
+        junto com o label do fim, emitido quando o corpo termina (sem recursão).
+        """
+        pilha = [(iter(statements), None)]
+        while pilha:
+            corpo, end_label = pilha[-1]
+            statement = next(corpo, None)
+            if statement is None:
+                pilha.pop()
+                if end_label is not None:
+                    self._end_conditional(end_label)
+            elif isinstance(statement, Assignment):
+                self._generate_assignment(statement)
+            elif isinstance(statement, ConditionalStatement):
+                pilha.append((iter(statement.body), self._generate_conditional(statement)))
+            elif isinstance(statement, PrintStatement):
+                self._generate_print(statement)
     
     def _generate_assignment(self, assignment: Assignment) -> None:
         """Gera código para atribuição: identifier = Expression"""
@@ -140,8 +156,12 @@ class CodeGenerator:
         var_reg = self.variables[assignment.identifier]
         self.llvm_code.append(f"  store double {result_reg}, double* {var_reg}, align 8")
     
-    def _generate_conditional(self, conditional: ConditionalStatement) -> None:
-        """Gera código para condicional: If Expression StatementList End"""
+    def _generate_conditional(self, conditional: ConditionalStatement) -> str:
+        """
+        Gera o início de um condicional If Expression StatementList End (condição e
+        branch) e retorna o label do fim; o corpo e _end_conditional ficam com
+        _generate_statements.
+        """
         # Avalia a condição - deve retornar um valor booleano (i1)
         # Se a condição é uma expressão relacional, já retorna i1
         condition_reg = self._generate_expression(conditional.condition)
@@ -163,11 +183,10 @@ class CodeGenerator:
         self.llvm_code.append(f"  br i1 {cmp_reg}, label %{if_label}, label %{end_label}")
         self.llvm_code.append("")
         self.llvm_code.append(f"{if_label}:")
-        
-        # Gera código do corpo
-        for statement in conditional.body:
-            self._generate_statement(statement)
-        
+        return end_label
+    
+    def _end_conditional(self, end_label: str) -> None:
+        """Fecha o corpo de um condicional."""
         # Branch para o fim
         self.llvm_code.append(f"  br label %{end_label}")
         self.llvm_code.append("")
@@ -178,7 +197,8 @@ class CodeGenerator:
         if isinstance(print_stmt.value, str):
             # Print string literal
             global_name = self._get_string_constant(print_stmt.value)
-            self.llvm_code.append(f"  call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([{len(print_stmt.value) + 1} x i8], [{len(print_stmt.value) + 1} x i8]* @{global_name}, i64 0, i64 0))")
+            str_len = self._llvm_byte_length(print_stmt.value)
+            self.llvm_code.append(f"  call i32 (i8*, ...) @printf(i8* getelementptr inbounds ([{str_len} x i8], [{str_len} x i8]* @{global_name}, i64 0, i64 0))")
         else:
             # Print expressão numérica
             value_reg = self._generate_expression(print_stmt.value)
@@ -189,9 +209,22 @@ class CodeGenerator:
     
     def _generate_expression(self, expression: Expression) -> str:
         """
-        Gera código LLVM para uma expressão e retorna o registro do resultado.
+        Gera código LLVM para uma expressão e retorna o registro do resultado
+        (com pilha explícita: ver lsd_ast.percorrer).
+        """
+        return percorrer(expression, self._expandir_registro)
+    
+    def _expandir_registro(self, expression: Expression):
+        """
+        Um passo de _generate_expression: o registro de uma folha ou o gerador do nó,
+        que faz yield das subexpressões e recebe os registros delas.
         """
-        if isinstance(expression, RelationalExpression):
+        expression = desembrulhar(expression)
+        if isinstance(expression, BinaryOp):
+            return self._generate_binary_op(expression)
+        elif isinstance(expression, UnaryOp):
+            return self._generate_unary_op(expression)
+        elif isinstance(expression, RelationalExpression):
             return self._generate_relational_expression(expression)
         elif isinstance(expression, AdditiveExpression):
             return self._generate_additive_expression(expression)
@@ -204,9 +237,42 @@ class CodeGenerator:
         else:
             raise CodeGeneratorError(f"Tipo de expressão não suportado: {type(expression).__name__}")
     
+    def _generate_binary_op(self, expr: BinaryOp) -> str:
+        """Gera código para operação binária (AST compacta)."""
+        if expr.op in OPERADORES_RELACIONAIS:
+            # a < b < c: comparações encadeadas como em RelationalExpression,
+            # com uma só conversão i1 -> double no fim da cadeia
+            cadeia = []
+            left = expr
+            while isinstance(left, BinaryOp) and left.op in OPERADORES_RELACIONAIS:
+                cadeia.append(left)
+                left = left.left
+            result_reg = yield left
+            for node in reversed(cadeia):
+                right_reg = yield node.right
+                result_reg = self._apply_relational_operator(node.op, result_reg, right_reg)
+            bool_reg = self._new_register()
+            self.llvm_code.append(f"  {bool_reg} = uitofp i1 {result_reg} to double")
+            return bool_reg
+        
+        left_reg = yield expr.left
+        right_reg = yield expr.right
+        if expr.op in OPERADORES_ADITIVOS:
+            return self._apply_additive_operator(expr.op, left_reg, right_reg)
+        return self._apply_multiplicative_operator(expr.op, left_reg, right_reg)
+    
+    def _generate_unary_op(self, expr: UnaryOp) -> str:
+        """Gera código para operação unária (AST compacta)."""
+        value_reg = yield expr.operand
+        if expr.op == "-":
+            neg_reg = self._new_register()
+            self.llvm_code.append(f"  {neg_reg} = fneg double {value_reg}")
+            return neg_reg
+        return value_reg
+    
     def _generate_relational_expression(self, expr: RelationalExpression) -> str:
         """Gera código para expressão relacional."""
-        left_reg = self._generate_expression(expr.left)
+        left_reg = yield expr.left
         
         # Se não há operações, retorna o valor do lado esquerdo
         if not expr.operations:
@@ -215,7 +281,7 @@ class CodeGenerator:
         # Avalia cada operação relacional
         result_reg = left_reg
         for op, right_expr in expr.operations:
-            right_reg = self._generate_expression(right_expr)
+            right_reg = yield right_expr
             result_reg = self._apply_relational_operator(op, result_reg, right_reg)
         
         # result_reg agora é i1 (booleano)
@@ -228,27 +294,27 @@ class CodeGenerator:
     
     def _generate_additive_expression(self, expr: AdditiveExpression) -> str:
         """Gera código para expressão aditiva."""
-        result_reg = self._generate_expression(expr.left)
+        result_reg = yield expr.left
         
         for op, right_expr in expr.operations:
-            right_reg = self._generate_expression(right_expr)
+            right_reg = yield right_expr
             result_reg = self._apply_additive_operator(op, result_reg, right_reg)
         
         return result_reg
     
     def _generate_multiplicative_expression(self, expr: MultiplicativeExpression) -> str:
         """Gera código para expressão multiplicativa."""
-        result_reg = self._generate_expression(expr.left)
+        result_reg = yield expr.left
         
         for op, right_expr in expr.operations:
-            right_reg = self._generate_expression(right_expr)
+            right_reg = yield right_expr
             result_reg = self._apply_multiplicative_operator(op, result_reg, right_reg)
         
         return result_reg
     
     def _generate_unary_expression(self, expr: UnaryExpression) -> str:
         """Gera código para expressão unária."""
-        value_reg = self._generate_expression(expr.expression)
+        value_reg = yield expr.expression
         
         if expr.operator == "+":
             return value_reg
@@ -312,9 +378,8 @@ class CodeGenerator:
             return self._generate_function_call(expr)
         elif isinstance(expr, ListExpression):
             raise CodeGeneratorError("ListExpression não suportado na geração de código LLVM")
-        elif isinstance(expr, ParenthesizedExpression):
-            return self._generate_expression(expr.expression)
         else:
+            # ParenthesizedExpression já foi desembrulhada em _expandir_registro
             raise CodeGeneratorError(f"Tipo de expressão primária não suportado: {type(expr).__name__}")
     
     def _generate_function_call(self, func_call: FunctionCall) -> str:
@@ -420,7 +485,10 @@ class CodeGenerator:
         """Escapa uma string para uso em LLVM IR."""
         result = []
         for char in s:
-            if char == '\\':
+            if ord(char) > 126:
+                # Caracteres não-ASCII - escapa cada byte do UTF-8 como hex
+                result.extend(f'\\{b:02X}' for b in char.encode('utf-8'))
+            elif char == '\\':
                 result.append('\\5C')
             elif char == '\n':
                 result.append('\\0A')
@@ -430,11 +498,15 @@ class CodeGenerator:
                 result.append('\\09')
             elif char == '"':
                 result.append('\\22')
-            elif ord(char) < 32 or ord(char) > 126:
-                # Caracteres não-ASCII ou especiais - escapa como hex
+            elif ord(char) < 32:
+                # Caracteres de controle - escapa como hex
                 result.append(f'\\{ord(char):02X}')
             else:
                 # Caracteres normais, incluindo '%' que não precisa ser escapado aqui
                 result.append(char)
         return ''.join(result)
 
+    def _llvm_byte_length(self, s: str) -> int:
+        """Tamanho em bytes (UTF-8) da constante de string, com o null terminator."""
+        return len(s.encode('utf-8')) + 1
+
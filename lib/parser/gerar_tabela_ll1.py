@@ -0,0 +1,314 @@
+"""
+Gera a tabela LL(1) do parser por tabela (Parser(lexer, ll1=True)) a partir da
+gramática fatorada em docs/grammar.md (bloco ```ll1 da seção 5).
+
+Passos: lê as produções (com as ações @acao, o predicado {nome} e a marca !
+de preferência), calcula FIRST e FOLLOW, monta a tabela M[não terminal][terminal]
+e confere que ela é LL(1): uma célula com duas produções só é aceita se uma delas
+tem ! (vence) ou {predicado} (decidido pelo parser na hora, olhando mais um token).
+
+Uso:
+    python gerar_tabela_ll1.py [saida.py]     # padrão: tabela_ll1.py nesta pasta
+
+O módulo gerado expõe:
+    TERMINAIS      nomes dos terminais; o índice 0 é "$" (fim) e o último é "outro"
+    NAO_TERMINAIS  nomes dos não terminais; o primeiro é o símbolo inicial
+    ACOES          nomes das ações; PREDICADOS, nomes dos predicados
+    EXPANSOES      o que empilhar em cada célula, já invertido: o lado direito da
+                   produção com o não terminal mais à esquerda trocado pela produção
+                   dele para o mesmo terminal, e assim por diante (ver expandir)
+    TABELA         TABELA[não terminal][terminal] -> expansão; -1 = erro; -2 - k =
+                   CELULAS_COM_PREDICADO[k] = (predicado, expansão se sim, se não)
+    VAZIAS         VAZIAS[não terminal] -> expansão da produção que deriva ε, usada
+                   pelo parser numa célula de erro (-1 se o não terminal não é anulável)
+    ASSINATURA     crc32 do bloco da gramática de origem
+"""
+
+import os
+import re
+import sys
+import zlib
+
+AQUI = os.path.dirname(os.path.abspath(__file__))
+GRAMATICA_PADRAO = os.path.join(AQUI, "..", "..", "docs", "grammar.md")
+SAIDA_PADRAO = os.path.join(AQUI, "tabela_ll1.py")
+
+# terminais escritos sem aspas na gramática
+TERMINAIS_NOMEADOS = ("identifier", "integer_literal", "decimal_literal", "string_literal", "keyword")
+EPSILON = "ε"
+FIM = "$"
+OUTRO = "outro"  # qualquer token que não é terminal da gramática (sempre erro)
+
+
+class Producao:
+    def __init__(self, cabeca, simbolos, preferida=False, predicado=None):
+        self.cabeca = cabeca
+        self.simbolos = simbolos  # terminais, não terminais e "@acao", em ordem
+        self.preferida = preferida
+        self.predicado = predicado
+
+    def __repr__(self):
+        marca = "! " if self.preferida else f"{{{self.predicado}}} " if self.predicado else ""
+        return f"{self.cabeca} → {marca}{' '.join(self.simbolos) or EPSILON}"
+
+
+def bloco_da_gramatica(texto):
+    """Conteúdo do bloco ```ll1 de docs/grammar.md."""
+    m = re.search(r"^```ll1\n(.*?)^```", texto, re.S | re.M)
+    if not m:
+        raise ValueError("bloco ```ll1 não encontrado na gramática")
+    return m.group(1)
+
+
+def ler_gramatica(bloco):
+    """Lista de Producao na ordem do bloco; a cabeça da primeira é o símbolo inicial."""
+    producoes = []
+    cabeca = None
+    for numero, linha in enumerate(bloco.split("\n"), 1):
+        linha = linha.strip()
+        if not linha:
+            continue
+        if "→" in linha:
+            cabeca, _, linha = linha.partition("→")
+            cabeca = cabeca.strip()
+        elif linha.startswith("|") and cabeca is not None:
+            linha = linha[1:]
+        else:
+            raise ValueError(f"linha {numero} da gramática sem '→' nem '|': {linha!r}")
+        for alternativa in linha.split(" | ") if not linha.strip().startswith("'|'") else [linha]:
+            simbolos = alternativa.split()
+            preferida = bool(simbolos) and simbolos[0] == "!"
+            if preferida:
+                simbolos = simbolos[1:]
+            predicado = None
+            if simbolos and simbolos[0].startswith("{") and simbolos[0].endswith("}"):
+                predicado = simbolos[0][1:-1]
+                simbolos = simbolos[1:]
+            if simbolos == [EPSILON]:
+                simbolos = []
+            producoes.append(Producao(cabeca, simbolos, preferida, predicado))
+    return producoes
+
+
+def e_terminal(simbolo):
+    return simbolo in TERMINAIS_NOMEADOS or (len(simbolo) > 2 and simbolo[0] == simbolo[-1] == "'")
+
+
+def e_acao(simbolo):
+    return simbolo.startswith("@")
+
+
+def primeiros_e_seguintes(producoes):
+    """FIRST e FOLLOW de cada não terminal (ações não contam: derivam ε)."""
+    nao_terminais = list(dict.fromkeys(p.cabeca for p in producoes))
+    for p in producoes:
+        for s in p.simbolos:
+            if not e_terminal(s) and not e_acao(s) and s not in nao_terminais:
+                raise ValueError(f"não terminal {s!r} sem produções (em {p!r})")
+    first = {a: set() for a in nao_terminais}
+    anulavel = set()
+
+    def first_da_sequencia(simbolos):
+        """(FIRST, anulável) de uma sequência de símbolos."""
+        resultado = set()
+        for s in simbolos:
+            if e_acao(s):
+                continue
+            if e_terminal(s):
+                resultado.add(s)
+                return resultado, False
+            resultado |= first[s]
+            if s not in anulavel:
+                return resultado, False
+        return resultado, True
+
+    mudou = True
+    while mudou:
+        mudou = False
+        for p in producoes:
+            conjunto, vazia = first_da_sequencia(p.simbolos)
+            if not conjunto <= first[p.cabeca] or (vazia and p.cabeca not in anulavel):
+                first[p.cabeca] |= conjunto
+                if vazia:
+                    anulavel.add(p.cabeca)
+                mudou = True
+
+    follow = {a: set() for a in nao_terminais}
+    follow[nao_terminais[0]].add(FIM)
+    mudou = True
+    while mudou:
+        mudou = False
+        for p in producoes:
+            for i, s in enumerate(p.simbolos):
+                if e_terminal(s) or e_acao(s):
+                    continue
+                conjunto, vazia = first_da_sequencia(p.simbolos[i + 1:])
+                if vazia:
+                    conjunto = conjunto | follow[p.cabeca]
+                if not conjunto <= follow[s]:
+                    follow[s] |= conjunto
+                    mudou = True
+    return nao_terminais, first, anulavel, follow, first_da_sequencia
+
+
+def montar_tabela(producoes):
+    """
+    (terminais, não terminais, tabela {(A, a): índice da produção}, células com
+    predicado {(A, a): (predicado, sim, não)}, produções vazias {A: índice da
+    produção que deriva ε}, FIRST, FOLLOW). Lança ValueError nos conflitos LL(1)
+    que a gramática não resolve com ! ou {predicado}.
+    """
+    nao_terminais, first, anulavel, follow, first_da_sequencia = primeiros_e_seguintes(producoes)
+    candidatos, vazias = {}, {}
+    for i, p in enumerate(producoes):
+        conjunto, vazia = first_da_sequencia(p.simbolos)
+        if vazia:
+            conjunto = conjunto | follow[p.cabeca]
+            vazias.setdefault(p.cabeca, i)
+        for a in conjunto:
+            candidatos.setdefault((p.cabeca, a), []).append(i)
+
+    tabela, com_predicado, conflitos = {}, {}, []
+    for celula, indices in candidatos.items():
+        preferidas = [i for i in indices if producoes[i].preferida]
+        guardadas = [i for i in indices if producoes[i].predicado]
+        livres = [i for i in indices if not producoes[i].predicado]
+        if len(preferidas) == 1:
+            tabela[celula] = preferidas[0]
+        elif len(guardadas) == 1 and len(livres) <= 1:
+            # a produção com predicado só vale se ele for verdadeiro; senão, a outra (ou erro)
+            com_predicado[celula] = (producoes[guardadas[0]].predicado, guardadas[0],
+                                     livres[0] if livres else -1)
+        elif len(indices) == 1:
+            tabela[celula] = indices[0]
+        else:
+            conflitos.append(f"M[{celula[0]}, {celula[1]}]: " + " / ".join(repr(producoes[i]) for i in indices))
+    if conflitos:
+        raise ValueError("gramática não é LL(1):\n  " + "\n  ".join(sorted(conflitos)))
+
+    terminais = sorted({a for _, a in candidatos} - {FIM} |
+                       {s for p in producoes for s in p.simbolos if e_terminal(s)})
+    return [FIM] + terminais + [OUTRO], nao_terminais, tabela, com_predicado, vazias, first, follow
+
+
+def expandir(producoes, tabela, cabeca, terminal, indice):
+    """
+    Símbolos a empilhar quando `cabeca` vê `terminal` e a tabela escolhe a produção
+    `indice`. O token atual só muda quando um terminal é consumido, então enquanto o
+    primeiro símbolo que não é ação for um não terminal, a célula dele para o mesmo
+    terminal já está decidida e é aplicada aqui, na geração: Expression diante de um
+    inteiro vira de uma vez RelationalExpression ... PrimaryExpression integer_literal,
+    sem passar pela tabela a cada nível. Para numa célula com predicado ou de erro.
+    """
+    simbolos = list(producoes[indice].simbolos)
+    i = 0
+    while i < len(simbolos):
+        s = simbolos[i]
+        if e_acao(s):
+            i += 1
+            continue
+        if e_terminal(s) or (s, terminal) not in tabela:
+            break
+        simbolos[i:i + 1] = producoes[tabela[(s, terminal)]].simbolos
+    return simbolos
+
+
+def gerar_tabela(bloco):
+    """Código-fonte do módulo tabela_ll1 para o bloco da gramática."""
+    producoes = ler_gramatica(bloco)
+    terminais, nao_terminais, tabela, com_predicado, vazias, first, follow = montar_tabela(producoes)
+    acoes = sorted({s[1:] for p in producoes for s in p.simbolos if e_acao(s)})
+    predicados = sorted({p.predicado for p in producoes if p.predicado})
+
+    # símbolos como inteiros: terminais, depois não terminais, depois ações
+    numero = {s: i for i, s in enumerate(terminais)}
+    numero.update({a: len(terminais) + i for i, a in enumerate(nao_terminais)})
+    numero.update({"@" + a: len(terminais) + len(nao_terminais) + i for i, a in enumerate(acoes)})
+    expansoes = {}
+
+    def expansao(a, t, indice):
+        if indice < 0:
+            return -1
+        simbolos = tuple(numero[s] for s in reversed(expandir(producoes, tabela, a, t, indice)))
+        return expansoes.setdefault(simbolos, len(expansoes))
+
+    celulas = sorted(com_predicado.items(), key=lambda item: (numero[item[0][0]], numero[item[0][1]]))
+    indice_da_celula = {celula: k for k, (celula, _) in enumerate(celulas)}
+    linhas = []
+    for a in nao_terminais:
+        linha = []
+        for t in terminais:
+            if (a, t) in indice_da_celula:
+                linha.append(-2 - indice_da_celula[(a, t)])
+            else:
+                linha.append(expansao(a, t, tabela.get((a, t), -1)))
+        linhas.append(tuple(linha))
+    celulas = tuple((predicados.index(predicado), expansao(a, t, sim), expansao(a, t, nao))
+                    for (a, t), (predicado, sim, nao) in celulas)
+    # sem terminal para expandir: o lado direito como está na gramática
+    vazias = tuple(expansoes.setdefault(tuple(numero[s] for s in reversed(producoes[vazias[a]].simbolos)),
+                                        len(expansoes)) if a in vazias else -1
+                   for a in nao_terminais)
+
+    saida = [
+        '"""',
+        "Tabela LL(1) da LSD gerada por gerar_tabela_ll1.py a partir de docs/grammar.md — não editar à mão.",
+        "Regenerar com: python gerar_tabela_ll1.py",
+        "",
+        "Produções:",
+    ]
+    saida += [f"    {i:3}  {p!r}" for i, p in enumerate(producoes)]
+    saida += ["", "FIRST / FOLLOW:"]
+    for a in nao_terminais:
+        saida.append(f"    {a}")
+        saida.append(f"        FIRST  = {{{', '.join(sorted(first[a]))}}}")
+        saida.append(f"        FOLLOW = {{{', '.join(sorted(follow[a]))}}}")
+    saida += [
+        '"""',
+        "",
+        f"ASSINATURA = {zlib.crc32(bloco.encode('utf-8'))}",
+        "",
+        f"TERMINAIS = {tuple(terminais)!r}",
+        f"NAO_TERMINAIS = {tuple(nao_terminais)!r}",
+        f"ACOES = {tuple(acoes)!r}",
+        f"PREDICADOS = {tuple(predicados)!r}",
+        "",
+        "# símbolos: terminais 0..len(TERMINAIS)-1, depois não terminais, depois ações",
+        "# símbolos empilhados por cada célula, invertidos (o primeiro fica no topo da pilha)",
+        "EXPANSOES = (",
+    ]
+    saida += [f"    {simbolos!r}," for simbolos in expansoes]
+    saida += [
+        ")",
+        "",
+        "# TABELA[não terminal][terminal]: expansão; -1 = erro; -2 - k = CELULAS_COM_PREDICADO[k]",
+        "TABELA = (",
+    ]
+    saida += [f"    {linha!r},  # {a}" for a, linha in zip(nao_terminais, linhas)]
+    saida += [
+        ")",
+        "",
+        "# (índice em PREDICADOS, expansão se o predicado é verdadeiro, expansão senão ou -1)",
+        f"CELULAS_COM_PREDICADO = {celulas!r}",
+        "",
+        "# VAZIAS[não terminal]: expansão da produção que deriva ε (-1 = não anulável); numa",
+        "# célula de erro o parser segue por ela, como a descida recursiva, que só acusa o",
+        "# erro no próximo símbolo obrigatório",
+        f"VAZIAS = {vazias!r}",
+    ]
+    return "\n".join(saida) + "\n"
+
+
+def escrever_tabela(gramatica=GRAMATICA_PADRAO, caminho=SAIDA_PADRAO):
+    with open(gramatica, encoding="utf-8") as f:
+        codigo = gerar_tabela(bloco_da_gramatica(f.read()))
+    tmp = f"{caminho}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(codigo)
+    os.replace(tmp, caminho)
+    return caminho
+
+
+if __name__ == "__main__":
+    caminho = escrever_tabela(caminho=sys.argv[1] if len(sys.argv) > 1 else SAIDA_PADRAO)
+    print(f"Tabela LL(1) gerada em {caminho}")
@@ -8,7 +8,8 @@ from lsd_ast import (
     Program, Statement, Assignment, ConditionalStatement, PrintStatement,
     Expression, RelationalExpression, AdditiveExpression, MultiplicativeExpression,
     UnaryExpression, PrimaryExpression, IntegerLiteral, DecimalLiteral,
-    StringLiteral, Identifier, FunctionCall, ListExpression, ParenthesizedExpression
+    StringLiteral, Identifier, FunctionCall, ListExpression,
+    BinaryOp, UnaryOp, OPERADORES_RELACIONAIS, OPERADORES_ADITIVOS, desembrulhar, percorrer
 )
 
 
@@ -32,12 +33,12 @@ class Interpreter:
         """
         Interpreta o programa e retorna a saída.
         """
+        program.materializar()  # linhas pendentes de Parser.reparse (mensagens de erro)
         self.variables = {}
         self.output = []
         
         try:
-            for statement in program.statements:
-                self._execute_statement(statement)
+            self._execute_statements(program.statements)
         except InterpreterError as e:
             self.output.append(f"[ERRO] {e.message}")
             raise
@@ -46,20 +47,33 @@ class Interpreter:
     
     def _execute_statement(self, statement: Statement) -> None:
         """Executa um statement."""
-        if isinstance(statement, Assignment):
-            self._execute_assignment(statement)
-        elif isinstance(statement, ConditionalStatement):
-            self._execute_conditional(statement)
-        elif isinstance(statement, PrintStatement):
-            self._execute_print(statement)
+        self._execute_statements((statement,))
+    
+    def _execute_statements(self, statements: List[Statement]) -> None:
+        """Executa statements em ordem; o corpo de um If verdadeiro entra numa pilha, sem recursão."""
+        pilha = [iter(statements)]
+        while pilha:
+            statement = next(pilha[-1], None)
+            if statement is None:
+                pilha.pop()
+            elif isinstance(statement, Assignment):
+                self._execute_assignment(statement)
+            elif isinstance(statement, ConditionalStatement):
+                if self._execute_conditional(statement):
+                    pilha.append(iter(statement.body))
+            elif isinstance(statement, PrintStatement):
+                self._execute_print(statement)
     
     def _execute_assignment(self, assignment: Assignment) -> None:
         """Executa uma atribuição: identifier = Expression"""
         value = self._evaluate_expression(assignment.expression)
         self.variables[assignment.identifier] = value
     
-    def _execute_conditional(self, conditional: ConditionalStatement) -> None:
-        """Executa um condicional: If Expression StatementList End"""
+    def _execute_conditional(self, conditional: ConditionalStatement) -> bool:
+        """
+        Avalia a condição de um If Expression StatementList End: True se o corpo
+        deve ser executado (o que fica com _execute_statements).
+        """
         condition_value = self._evaluate_expression(conditional.condition)
         
         # A condição deve ser um valor booleano
@@ -70,9 +84,7 @@ class Interpreter:
                 conditional.col
             )
         
-        if condition_value:
-            for statement in conditional.body:
-                self._execute_statement(statement)
+        return condition_value
     
     def _execute_print(self, print_stmt: PrintStatement) -> None:
         """Executa um print: Print Expression ou Print string"""
@@ -85,8 +97,20 @@ class Interpreter:
             self.output.append(str(value))
     
     def _evaluate_expression(self, expression: Expression) -> Any:
-        """Avalia uma expressão e retorna seu valor."""
-        if isinstance(expression, RelationalExpression):
+        """Avalia uma expressão e retorna seu valor (com pilha explícita: ver lsd_ast.percorrer)."""
+        return percorrer(expression, self._expandir_valor)
+    
+    def _expandir_valor(self, expression: Expression):
+        """
+        Um passo de _evaluate_expression: o valor de uma folha ou o gerador do nó,
+        que faz yield das subexpressões e recebe os valores delas.
+        """
+        expression = desembrulhar(expression)
+        if isinstance(expression, BinaryOp):
+            return self._evaluate_binary_op(expression)
+        elif isinstance(expression, UnaryOp):
+            return self._evaluate_unary_op(expression)
+        elif isinstance(expression, RelationalExpression):
             return self._evaluate_relational_expression(expression)
         elif isinstance(expression, AdditiveExpression):
             return self._evaluate_additive_expression(expression)
@@ -99,9 +123,25 @@ class Interpreter:
         else:
             raise InterpreterError(f"Tipo de expressão não suportado: {type(expression).__name__}")
     
+    def _evaluate_binary_op(self, expr: BinaryOp) -> Any:
+        """Avalia operação binária (AST compacta)."""
+        left_value = yield expr.left
+        right_value = yield expr.right
+        op = expr.op
+        if op in OPERADORES_RELACIONAIS:
+            return self._apply_relational_operator(op, left_value, right_value)
+        if op in OPERADORES_ADITIVOS:
+            return self._apply_additive_operator(op, left_value, right_value)
+        return self._apply_multiplicative_operator(op, left_value, right_value)
+    
+    def _evaluate_unary_op(self, expr: UnaryOp) -> Any:
+        """Avalia operação unária (AST compacta)."""
+        value = yield expr.operand
+        return -value if expr.op == "-" else +value
+    
     def _evaluate_relational_expression(self, expr: RelationalExpression) -> Any:
         """Avalia expressão relacional."""
-        left_value = self._evaluate_expression(expr.left)
+        left_value = yield expr.left
         
         # Se não há operações, retorna o valor do lado esquerdo
         if not expr.operations:
@@ -110,34 +150,34 @@ class Interpreter:
         # Avalia cada operação relacional
         result = left_value
         for op, right_expr in expr.operations:
-            right_value = self._evaluate_expression(right_expr)
+            right_value = yield right_expr
             result = self._apply_relational_operator(op, result, right_value)
         
         return result
     
     def _evaluate_additive_expression(self, expr: AdditiveExpression) -> Any:
         """Avalia expressão aditiva."""
-        result = self._evaluate_expression(expr.left)
+        result = yield expr.left
         
         for op, right_expr in expr.operations:
-            right_value = self._evaluate_expression(right_expr)
+            right_value = yield right_expr
             result = self._apply_additive_operator(op, result, right_value)
         
         return result
     
     def _evaluate_multiplicative_expression(self, expr: MultiplicativeExpression) -> Any:
         """Avalia expressão multiplicativa."""
-        result = self._evaluate_expression(expr.left)
+        result = yield expr.left
         
         for op, right_expr in expr.operations:
-            right_value = self._evaluate_expression(right_expr)
+            right_value = yield right_expr
             result = self._apply_multiplicative_operator(op, result, right_value)
         
         return result
     
     def _evaluate_unary_expression(self, expr: UnaryExpression) -> Any:
         """Avalia expressão unária."""
-        value = self._evaluate_expression(expr.expression)
+        value = yield expr.expression
         
         if expr.operator == "+":
             return +value
@@ -147,7 +187,7 @@ class Interpreter:
         return value
     
     def _evaluate_primary_expression(self, expr: PrimaryExpression) -> Any:
-        """Avalia expressão primária."""
+        """Avalia expressão primária (chamadas e listas devolvem o gerador)."""
         if isinstance(expr, IntegerLiteral):
             return expr.value
         elif isinstance(expr, DecimalLiteral):
@@ -166,15 +206,16 @@ class Interpreter:
             return self._evaluate_function_call(expr)
         elif isinstance(expr, ListExpression):
             return self._evaluate_list_expression(expr)
-        elif isinstance(expr, ParenthesizedExpression):
-            return self._evaluate_expression(expr.expression)
         else:
+            # ParenthesizedExpression já foi desembrulhada em _expandir_valor
             raise InterpreterError(f"Tipo de expressão primária não suportado: {type(expr).__name__}")
     
     def _evaluate_function_call(self, func_call: FunctionCall) -> Any:
         """Avalia chamada de função."""
         # Avalia os argumentos
-        args = [self._evaluate_expression(arg) for arg in func_call.arguments]
+        args = []
+        for arg in func_call.arguments:
+            args.append((yield arg))
         
         # Funções conhecidas
         if func_call.name == "CalculateMean":
@@ -217,7 +258,10 @@ class Interpreter:
     
     def _evaluate_list_expression(self, list_expr: ListExpression) -> List[Any]:
         """Avalia expressão de lista."""
-        return [self._evaluate_expression(elem) for elem in list_expr.elements]
+        values = []
+        for elem in list_expr.elements:
+            values.append((yield elem))
+        return values
     
     def _apply_relational_operator(self, op: str, left: Any, right: Any) -> bool:
         """Aplica operador relacional."""
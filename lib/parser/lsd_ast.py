@@ -1,136 +1,296 @@
 """
 Abstract Syntax Tree (AST) para a linguagem LSD.
 Representa a estrutura sintática do programa após o parsing.
+
+Um programa de 100 mil statements tem centenas de milhares de nós, então eles são
+compactos: com Python 3.10+ cada classe tem __slots__ (dataclass(slots=True)), sem
+o __dict__ por instância; as sequências vazias (operations de um nível sem
+operador, argumentos, elementos, corpo de If) são todas a mesma tupla vazia `()`
+em vez de uma lista nova por nó; e o parser interna os operadores e os nomes, para
+que cada um exista uma vez só na memória.
 """
 
-from typing import List, Optional, Union
+import sys
+from typing import List, Optional, Sequence, Union
+from bisect import bisect_right
 from dataclasses import dataclass, field
+from operator import attrgetter
+from types import GeneratorType
+
+# dataclass(slots=True) só existe a partir do Python 3.10; antes, os nós têm __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 # ============ Nós da AST ============
 
-@dataclass
+@dataclass(**_SLOTS)
 class ASTNode:
     """Classe base para todos os nós da AST."""
     line: int = -1
     col: int = -1
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Program(ASTNode):
-    """Programa completo - lista de statements."""
+    """
+    Programa completo - lista de statements.
+    
+    Depois de Parser.reparse, os statements (e todos os nós dentro deles) podem ter
+    deslocamentos de linha pendentes, ainda não aplicados: statements[i] com
+    _cortes[k] <= i < _cortes[k + 1] tem a linha + _dlinhas[k]. Leia a linha de
+    um statement com linha(i), ou chame materializar() antes de usar `line` dos
+    nós diretamente (SemanticAnalyzer, Interpreter e CodeGenerator já chamam).
+    """
     statements: List['Statement'] = None
+    _cortes: List[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _dlinhas: List[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    # o parse registrou erros (léxicos, ou de sintaxe com recuperar=True)
+    _com_erros: bool = field(default=False, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.statements is None:
             self.statements = []
-
-
-@dataclass
+    
+    def linha(self, i: int) -> int:
+        """Linha do statement i, com o deslocamento pendente."""
+        line = self.statements[i].line
+        k = bisect_right(self._cortes, i)
+        return line + self._dlinhas[k - 1] if k and line > 0 else line
+    
+    def materializar(self) -> None:
+        """Aplica aos nós os deslocamentos de linha pendentes deixados por Parser.reparse."""
+        cortes = self._cortes
+        for k, corte in enumerate(cortes):
+            fim = cortes[k + 1] if k + 1 < len(cortes) else len(self.statements)
+            if self._dlinhas[k]:
+                deslocar_linhas(self.statements[corte:fim], self._dlinhas[k])
+        self._cortes = []
+        self._dlinhas = []
+
+
+@dataclass(**_SLOTS)
 class Statement(ASTNode):
     """Classe base para statements."""
     pass
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Assignment(Statement):
     """Atribuição: identifier = Expression"""
     identifier: str = ""
     expression: 'Expression' = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConditionalStatement(Statement):
     """Condicional: If Expression StatementList End"""
     condition: 'Expression' = None
-    body: List['Statement'] = field(default_factory=list)
+    body: Sequence['Statement'] = ()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PrintStatement(Statement):
     """Print: Print Expression ou Print string_literal"""
     value: Union['Expression', str] = None  # Expression ou string literal
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Expression(ASTNode):
     """Classe base para expressões."""
     pass
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RelationalExpression(Expression):
     """Expressão relacional: AdditiveExpression [op AdditiveExpression]*"""
     left: 'AdditiveExpression' = None
-    operations: List[tuple] = field(default_factory=list)  # Lista de (operador, AdditiveExpression)
+    operations: Sequence[tuple] = ()  # Lista de (operador, AdditiveExpression)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AdditiveExpression(Expression):
     """Expressão aditiva: MultiplicativeExpression [op MultiplicativeExpression]*"""
     left: 'MultiplicativeExpression' = None
-    operations: List[tuple] = field(default_factory=list)  # Lista de (operador, MultiplicativeExpression)
+    operations: Sequence[tuple] = ()  # Lista de (operador, MultiplicativeExpression)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MultiplicativeExpression(Expression):
     """Expressão multiplicativa: UnaryExpression [op UnaryExpression]*"""
     left: 'UnaryExpression' = None
-    operations: List[tuple] = field(default_factory=list)  # Lista de (operador, UnaryExpression)
+    operations: Sequence[tuple] = ()  # Lista de (operador, UnaryExpression)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class UnaryExpression(Expression):
     """Expressão unária: [+|-] UnaryExpression ou PrimaryExpression"""
     operator: Optional[str] = None  # '+' ou '-' ou None
     expression: 'Expression' = None  # UnaryExpression ou PrimaryExpression
 
 
-@dataclass
+# ============ Nós de erro (Parser(lexer, recuperar=True)) ============
+# Trechos com erro de sintaxe que o parser pulou para continuar a análise.
+
+@dataclass(**_SLOTS)
+class ErrorStatement(Statement):
+    """Statement com erro de sintaxe, pulado até o próximo início de statement ou End"""
+    message: str = ""
+
+
+@dataclass(**_SLOTS)
+class ErrorExpression(Expression):
+    """Condição de If com erro de sintaxe (o corpo do If continua sendo lido)"""
+    message: str = ""
+
+
+# ============ Expressões compactas (Parser(lexer, pratt=True)) ============
+# Uma operação por nó, sem os níveis da gramática: "a + b * c" vira
+# BinaryOp("+", a, BinaryOp("*", b, c)) e um literal sozinho é só o literal.
+
+OPERADORES_RELACIONAIS = frozenset({">", "<", ">=", "<=", "==", "!="})
+OPERADORES_ADITIVOS = frozenset({"+", "-"})
+OPERADORES_MULTIPLICATIVOS = frozenset({"*", "/"})
+
+
+@dataclass(**_SLOTS)
+class BinaryOp(Expression):
+    """Operação binária: left op right (line/col do operando da esquerda)"""
+    op: str = ""
+    left: 'Expression' = None
+    right: 'Expression' = None
+
+
+@dataclass(**_SLOTS)
+class UnaryOp(Expression):
+    """Operação unária: op operand, com op '+' ou '-'"""
+    op: str = ""
+    operand: 'Expression' = None
+
+
+@dataclass(**_SLOTS)
 class PrimaryExpression(Expression):
     """Expressão primária: literal, identifier, chamada de função, lista, parênteses"""
     pass
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class IntegerLiteral(PrimaryExpression):
     """Literal inteiro."""
     value: int = 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DecimalLiteral(PrimaryExpression):
     """Literal decimal."""
     value: float = 0.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StringLiteral(PrimaryExpression):
     """Literal string."""
     value: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Identifier(PrimaryExpression):
     """Identificador (variável)."""
     name: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FunctionCall(PrimaryExpression):
     """Chamada de função: identifier(ArgumentList)"""
     name: str = ""
-    arguments: List['Expression'] = field(default_factory=list)
+    arguments: Sequence['Expression'] = ()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ListExpression(PrimaryExpression):
     """Lista: [ExpressionList]"""
-    elements: List['Expression'] = field(default_factory=list)
+    elements: Sequence['Expression'] = ()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ParenthesizedExpression(PrimaryExpression):
     """Expressão entre parênteses: (Expression)"""
     expression: 'Expression' = None
 
+
+# ============ Percurso sem recursão ============
+
+# tipo do nó -> função que devolve a tupla com os valores de todos os campos
+# (com __slots__ não há vars(node))
+_CAMPOS = {}
+
+
+def campos(node):
+    """Valores dos campos de `node`, na ordem da dataclass."""
+    leitor = _CAMPOS.get(type(node))
+    if leitor is None:
+        leitor = _CAMPOS[type(node)] = attrgetter(*node.__dataclass_fields__)
+    return leitor(node)
+
+
+def deslocar_linhas(nodes, dlinha):
+    """Soma dlinha à linha de `nodes` e de todos os nós dentro deles (linhas -1 ficam)."""
+    pilha = list(nodes)
+    while pilha:
+        node = pilha.pop()
+        if isinstance(node, ASTNode):
+            if node.line > 0:
+                node.line += dlinha
+            pilha.extend(campos(node))
+        elif isinstance(node, (list, tuple)):
+            pilha.extend(node)
+
+def desembrulhar(expression):
+    """
+    Desce pelos nós que só repassam o valor do filho: os níveis sem operações, o
+    UnaryExpression sem operador e os parênteses.
+    """
+    while True:
+        if isinstance(expression, (RelationalExpression, AdditiveExpression, MultiplicativeExpression)):
+            if expression.operations:
+                return expression
+            expression = expression.left
+        elif isinstance(expression, UnaryExpression):
+            if expression.operator is not None:
+                return expression
+            expression = expression.expression
+        elif isinstance(expression, ParenthesizedExpression):
+            expression = expression.expression
+        else:
+            return expression
+
+
+def percorrer(raiz, expandir):
+    """
+    Avalia `raiz` com uma pilha explícita em vez da pilha de chamadas do Python, para
+    que expressões aninhadas a qualquer profundidade não estourem o limite de recursão.
+    
+    `expandir(node)` devolve o resultado do nó ou, se ele depende dos filhos, um
+    gerador que faz `yield` de cada filho, recebe de volta o resultado dele e termina
+    com `return` do resultado do nó. Os filhos são visitados na ordem dos `yield`,
+    a mesma de uma versão recursiva com as chamadas no lugar dos `yield`.
+    """
+    resultado = expandir(raiz)
+    if type(resultado) is not GeneratorType:
+        return resultado
+    # guarda o `send` de cada gerador: evita buscar o método a cada filho
+    pilha = []
+    send = resultado.send
+    valor = None
+    while True:
+        try:
+            filho = send(valor)
+        except StopIteration as fim:
+            valor = fim.value
+            if not pilha:
+                return valor
+            send = pilha.pop()
+            continue
+        valor = expandir(filho)
+        if type(valor) is GeneratorType:
+            pilha.append(send)
+            send = valor.send
+            valor = None
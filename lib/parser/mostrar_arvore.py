@@ -16,7 +16,8 @@ from lsd_ast import (
     Program, Assignment, ConditionalStatement, PrintStatement,
     RelationalExpression, AdditiveExpression, MultiplicativeExpression,
     UnaryExpression, IntegerLiteral, DecimalLiteral, StringLiteral,
-    Identifier, FunctionCall, ListExpression, ParenthesizedExpression
+    Identifier, FunctionCall, ListExpression, ParenthesizedExpression,
+    BinaryOp, UnaryOp, ErrorStatement, ErrorExpression
 )
 
 # Código LSD para demonstrar a árvore
@@ -75,6 +76,15 @@ def mostrar_arvore(node, indent=0, max_depth=15, current_depth=0):
             print(f"{espacos}  Operador: {op}")
             mostrar_arvore(right, indent + 2, max_depth, current_depth + 1)
     
+    elif isinstance(node, BinaryOp):
+        print(f"{espacos}BinaryOp (operador: {node.op})")
+        mostrar_arvore(node.left, indent + 1, max_depth, current_depth + 1)
+        mostrar_arvore(node.right, indent + 1, max_depth, current_depth + 1)
+    
+    elif isinstance(node, UnaryOp):
+        print(f"{espacos}UnaryOp (operador: {node.op})")
+        mostrar_arvore(node.operand, indent + 1, max_depth, current_depth + 1)
+    
     elif isinstance(node, UnaryExpression):
         op_str = f" (operador: {node.operator})" if node.operator else ""
         print(f"{espacos}UnaryExpression{op_str}")
@@ -108,6 +118,9 @@ def mostrar_arvore(node, indent=0, max_depth=15, current_depth=0):
         print(f"{espacos}ParenthesizedExpression: (Expression)")
         mostrar_arvore(node.expression, indent + 1, max_depth, current_depth + 1)
     
+    elif isinstance(node, (ErrorStatement, ErrorExpression)):
+        print(f"{espacos}{type(node).__name__}: {node.message} (linha {node.line})")
+    
     else:
         print(f"{espacos}{type(node).__name__}")
 
@@ -127,7 +140,8 @@ print("-" * 80)
 try:
     print("\n[1] Criando lexer e parser...")
     lexer = Lexer(palavras_chave=["If", "Print", "End", "CalculateMean", "CalculateSum"])
-    parser = Parser(lexer)
+    # python mostrar_arvore.py --pratt: AST compacta (BinaryOp/UnaryOp)
+    parser = Parser(lexer, pratt="--pratt" in sys.argv)
     print("    [OK] Lexer e parser criados")
     
     print("\n[2] Fazendo parsing...")
@@ -1,8 +1,14 @@
 """
 Parser recursivo descendente para a linguagem LSD.
 Implementa a gramática definida em grammar.md.
+
+Parser(lexer, ll1=True) usa no lugar da descida recursiva a tabela LL(1) gerada de
+docs/grammar.md (seção 5) por gerar_tabela_ll1.py: um laço com pilha de símbolos,
+que monta a mesma AST.
 """
 
+from bisect import bisect_right
+from collections import deque
 from typing import List, Optional
 import sys
 import os
@@ -10,13 +16,19 @@ import os
 # Adiciona o diretório do lexer ao path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lexer', 'afds'))
 
-from lexer3 import Lexer, Token, InputBuffer
+from lexer3 import Lexer, Token, InputBuffer, TokenStream
+from token_kinds import (
+    KIND_DECIMAL, KIND_IDENTIFICADOR, KIND_INTEIRO, KIND_KEYWORD, KIND_OPERADOR, KIND_SEPARADOR, KIND_STRING,
+    KINDS_CONTROLE, KINDS_PALAVRA, NOME_DO_KIND
+)
 from lsd_ast import (
     Program, Statement, Assignment, ConditionalStatement, PrintStatement,
     Expression, RelationalExpression, AdditiveExpression, MultiplicativeExpression,
     UnaryExpression, PrimaryExpression, IntegerLiteral, DecimalLiteral,
-    StringLiteral, Identifier, FunctionCall, ListExpression, ParenthesizedExpression
+    StringLiteral, Identifier, FunctionCall, ListExpression, ParenthesizedExpression,
+    BinaryOp, UnaryOp, ErrorStatement, ErrorExpression, deslocar_linhas
 )
+import tabela_ll1
 
 
 class ParseError(Exception):
@@ -30,103 +42,406 @@ class ParseError(Exception):
             super().__init__(message)
 
 
+# tokens que podem começar um argumento de chamada sem parênteses
+KINDS_ARGUMENTO = frozenset({KIND_INTEIRO, KIND_DECIMAL, KIND_STRING, KIND_IDENTIFICADOR}) | KINDS_PALAVRA
+
+# regras de _parse_expressao: os três níveis binários em ordem, depois a unária e a
+# primária; _PRATT/_PRATT_UNARIA são as do modo pratt
+_RELACIONAL, _ADITIVA, _MULTIPLICATIVA, _UNARIA, _PRIMARIA, _PRATT, _PRATT_UNARIA = range(7)
+_OPERADORES_DO_NIVEL = (
+    frozenset({">", "<", ">=", "<=", "==", "!="}), frozenset({"+", "-"}), frozenset({"*", "/"})
+)
+_CLASSE_DO_NIVEL = (RelationalExpression, AdditiveExpression, MultiplicativeExpression)
+
+# quadros da pilha de _parse_expressao (primeiro elemento de cada quadro)
+(_Q_BINARIA, _Q_PRATT, _Q_UNARIA, _Q_UNARIA_SEM_OPERADOR, _Q_UNARYOP,
+ _Q_PARENTESES, _Q_LISTA, _Q_CHAMADA) = range(8)
+
+# precedência dos operadores binários no modo pratt (maior = liga mais forte);
+# todos associam à esquerda, como os laços dos níveis da gramática
+PRECEDENCIA = {
+    ">": 1, "<": 1, ">=": 1, "<=": 1, "==": 1, "!=": 1,
+    "+": 2, "-": 2,
+    "*": 3, "/": 3,
+}
+
+
+# ============ Parser por tabela (ll1=True) ============
+# Ações de docs/grammar.md (seção 5): cada uma recebe a pilha de valores e o último
+# token consumido, e troca os valores do topo pelo nó que eles formam.
+
+def _ll1_lista(valores, anterior):
+    valores.append([])
+
+def _ll1_junta(valores, anterior):
+    valor = valores.pop()
+    valores[-1].append(valor)
+
+def _ll1_token(valores, anterior):
+    valores.append(anterior)
+
+def _ll1_programa(valores, anterior):
+    valores[-1] = Program(statements=valores[-1], line=1, col=1)
+
+def _ll1_atribuicao(valores, anterior):
+    expr = valores.pop()
+    token = valores[-1]
+    valores[-1] = Assignment(identifier=sys.intern(token.lexeme), expression=expr, line=token.line, col=token.col)
+
+def _ll1_condicional(valores, anterior):
+    body = valores.pop()
+    condition = valores.pop()
+    token = valores[-1]
+    valores[-1] = ConditionalStatement(condition=condition, body=body or (), line=token.line, col=token.col)
+
+def _ll1_escrita(valores, anterior):
+    value = valores.pop()
+    token = valores[-1]
+    valores[-1] = PrintStatement(value=value, line=token.line, col=token.col)
+
+def _ll1_texto(valores, anterior):
+    valores.append(anterior.lexeme.strip('"'))
+
+def _ll1_operacao(valores, anterior):
+    right = valores.pop()
+    operador = valores.pop()
+    valores[-1].append((sys.intern(operador.lexeme), right))
+
+def _ll1_nivel(classe):
+    def acao(valores, anterior):
+        operations = valores.pop()
+        left = valores[-1]
+        valores[-1] = classe(left=left, operations=operations or (), line=left.line, col=left.col)
+    return acao
+
+def _ll1_binarias(valores, anterior):
+    # pratt=True: as operações de um nível viram BinaryOp associando à esquerda
+    operations = valores.pop()
+    left = valores[-1]
+    for op, right in operations:
+        left = BinaryOp(op=op, left=left, right=right, line=left.line, col=left.col)
+    valores[-1] = left
+
+def _ll1_unaria(valores, anterior):
+    expression = valores.pop()
+    operador = valores[-1]
+    valores[-1] = UnaryExpression(operator=sys.intern(operador.lexeme), expression=expression,
+                                  line=operador.line, col=operador.col)
+
+def _ll1_unaryop(valores, anterior):
+    operand = valores.pop()
+    operador = valores[-1]
+    valores[-1] = UnaryOp(op=sys.intern(operador.lexeme), operand=operand, line=operador.line, col=operador.col)
+
+def _ll1_sem_operador(valores, anterior):
+    primaria = valores[-1]
+    valores[-1] = UnaryExpression(operator=None, expression=primaria, line=primaria.line, col=primaria.col)
+
+def _ll1_nada(valores, anterior):
+    pass
+
+def _ll1_inteiro(valores, anterior):
+    valores.append(IntegerLiteral(value=int(anterior.lexeme), line=anterior.line, col=anterior.col))
+
+def _ll1_decimal(valores, anterior):
+    valores.append(DecimalLiteral(value=float(anterior.lexeme), line=anterior.line, col=anterior.col))
+
+def _ll1_string(valores, anterior):
+    valores.append(StringLiteral(value=anterior.lexeme.strip('"'), line=anterior.line, col=anterior.col))
+
+def _ll1_identificador(valores, anterior):
+    token = valores[-1]
+    valores[-1] = Identifier(name=sys.intern(token.lexeme), line=token.line, col=token.col)
+
+def _ll1_chamada(valores, anterior):
+    arguments = valores.pop()
+    token = valores[-1]
+    valores[-1] = FunctionCall(name=sys.intern(token.lexeme), arguments=arguments, line=token.line, col=token.col)
+
+def _ll1_parenteses(valores, anterior):
+    expression = valores.pop()
+    token = valores[-1]
+    valores[-1] = ParenthesizedExpression(expression=expression, line=token.line, col=token.col)
+
+def _ll1_lista_vazia(valores, anterior):
+    token = valores[-1]
+    valores[-1] = ListExpression(elements=(), line=token.line, col=token.col)
+
+def _ll1_lista_com_elementos(valores, anterior):
+    elements = valores.pop()
+    token = valores[-1]
+    valores[-1] = ListExpression(elements=elements, line=token.line, col=token.col)
+
+_ACOES_LL1 = {
+    "lista": _ll1_lista, "junta": _ll1_junta, "token": _ll1_token, "programa": _ll1_programa,
+    "atribuicao": _ll1_atribuicao, "condicional": _ll1_condicional, "escrita": _ll1_escrita,
+    "texto": _ll1_texto, "operacao": _ll1_operacao,
+    "relacional": _ll1_nivel(RelationalExpression), "aditiva": _ll1_nivel(AdditiveExpression),
+    "multiplicativa": _ll1_nivel(MultiplicativeExpression),
+    "unaria": _ll1_unaria, "sem_operador": _ll1_sem_operador,
+    "inteiro": _ll1_inteiro, "decimal": _ll1_decimal, "string": _ll1_string,
+    "identificador": _ll1_identificador, "chamada": _ll1_chamada, "parenteses": _ll1_parenteses,
+    "lista_vazia": _ll1_lista_vazia, "lista_com_elementos": _ll1_lista_com_elementos,
+}
+_ACOES_LL1_PRATT = dict(_ACOES_LL1, relacional=_ll1_binarias, aditiva=_ll1_binarias,
+                        multiplicativa=_ll1_binarias, unaria=_ll1_unaryop, sem_operador=_ll1_nada)
+# na ordem de tabela_ll1.ACOES (o símbolo da ação menos o primeiro índice de ação)
+ACOES_LL1 = tuple(_ACOES_LL1[nome] for nome in tabela_ll1.ACOES)
+ACOES_LL1_PRATT = tuple(_ACOES_LL1_PRATT[nome] for nome in tabela_ll1.ACOES)
+
+# token -> terminal da tabela: pelo kind, ou pelo lexema para operadores e separadores
+_TERMINAL_LL1 = {nome: i for i, nome in enumerate(tabela_ll1.TERMINAIS)}
+_LL1_OUTRO = _TERMINAL_LL1["outro"]
+_LL1_DO_KIND = {
+    KIND_IDENTIFICADOR: _TERMINAL_LL1["identifier"], KIND_INTEIRO: _TERMINAL_LL1["integer_literal"],
+    KIND_DECIMAL: _TERMINAL_LL1["decimal_literal"], KIND_STRING: _TERMINAL_LL1["string_literal"],
+    KIND_KEYWORD: _TERMINAL_LL1["keyword"], KIND_OPERADOR: None, KIND_SEPARADOR: None,
+}
+_LL1_DO_KIND.update({kind: _TERMINAL_LL1[f"'{nome}'"] for kind, nome in NOME_DO_KIND.items()})
+_LL1_DO_LEXEMA = {nome[1:-1]: i for nome, i in _TERMINAL_LL1.items()
+                  if nome.startswith("'") and nome[1:-1] not in NOME_DO_KIND.values()}
+
+
 class Parser:
     """Parser recursivo descendente para LSD."""
     
-    def __init__(self, lexer: Lexer):
+    # separadores que chegam ao parser (os demais são descartados pelo lexer)
+    SEPARADORES = frozenset({"(", ")", "[", "]", ","})
+    
+    def __init__(self, lexer: Lexer, pratt: bool = False, recuperar: bool = False, ll1: bool = False):
         self.lexer = lexer
-        self.tokens: List[Token] = []
-        self.current = 0
+        # pratt=True: expressões por precedence climbing, em nós BinaryOp/UnaryOp
+        # sem os níveis Relational/Additive/Multiplicative/UnaryExpression
+        self.pratt = pratt
+        # recuperar=True: em vez de parar no primeiro ParseError, registra o erro, pula
+        # até o próximo início de statement ou End (modo pânico) e continua; parse()
+        # devolve o Program parcial, com ErrorStatement/ErrorExpression nos trechos pulados
+        self.recuperar = recuperar
+        # ll1=True: parse() percorre a tabela LL(1) de tabela_ll1.py em vez da descida
+        # recursiva (mesma AST, com ou sem pratt; reparse relê o trecho editado pela
+        # descida recursiva, que dá a mesma AST)
+        self.ll1 = ll1
+        self.current = 0  # quantos tokens já foram consumidos
         self.errors: List[str] = []
+        self._erros_sintaticos: List[str] = []
+        # tokens puxados do lexer sob demanda: o token atual e uma janela com os
+        # próximos já lidos por peek_token (a gramática só olha um à frente)
+        self._token: Optional[Token] = None
+        self._janela = deque()
+        self._fonte = iter(())
+        # palavra-chave ("If" ou "IF") -> kind, para as que o lexer já resolve em Token.kind;
+        # as demais caem na comparação de strings
+        self._kind_da_palavra = {}
+        for kind, nome in NOME_DO_KIND.items():
+            if nome.lower() in lexer.kind_palavra:
+                self._kind_da_palavra[nome] = self._kind_da_palavra[nome.upper()] = kind
+        if ll1:
+            if recuperar:
+                raise ValueError("ll1=True não tem recuperação de erros: use recuperar=False")
+            if not all(nome in self._kind_da_palavra for nome in ("If", "Print", "End")):
+                raise ValueError("ll1=True precisa de um lexer que reconheça If, Print e End como palavras-chave")
     
-    def parse(self, source: str) -> Program:
+    def parse(self, source) -> Program:
         """Parse o código fonte e retorna a AST."""
-        # Tokeniza sem filtrar separadores para poder detectar erros
-        from lexer3 import InputBuffer
-        buffer = InputBuffer(source)
-        tokens = []
-        erros = []
-        safety_counter = 0
-        max_steps = max(1000000, len(source) * 20)
-        
-        while True:
-            safety_counter += 1
-            if safety_counter > max_steps:
-                raise RuntimeError("Tokenization exceeded maximum steps")
-            
-            tok, err = self.lexer.next_token(buffer)
-            if err:
-                erros.append(err)
-                if buffer.at_end():
-                    break
-                else:
-                    continue
-            if tok is None:
-                if not buffer.at_end():
-                    buffer.advance(1)
-                    continue
-                else:
-                    break
-            if tok.type == "EOF":
-                tokens.append(tok)
-                break
-            # Não filtra aqui - vamos filtrar depois mantendo separadores importantes
-            tokens.append(tok)
-        
-        if erros:
-            for err in erros:
-                msg = err.get('msg', 'Erro desconhecido')
-                line = err.get('line', 0)
-                col = err.get('col', 0)
-                self.errors.append(f"Erro léxico na linha {line}, coluna {col}: {msg}")
-        
-        # Filtra tokens, mantendo SEPARADOR importantes para detectar erros de sintaxe
-        separadores_importantes = {"(", ")", "[", "]", ","}
-        self.tokens = [
-            t for t in tokens
-            if t.type != "EOF" and (
-                (t.type == "SEPARADOR" and t.lexeme in separadores_importantes) or
-                (t.type != "SEPARADOR" and t.type != "COMENTARIO")
-            )
-        ]
+        # Os tokens são puxados do lexer um a um enquanto o parser avança
+        # (Lexer.tokenize_lazy), sem lista de tokens: só os separadores importantes
+        # para detectar erros de sintaxe chegam aqui. source pode ser o texto, um
+        # InputBuffer pronto (ex.: MmapBuffer) ou um TokenStream já gerado com
+        # lexer.tokenize_stream(texto, separadores=Parser.SEPARADORES, eof=False)
+        if isinstance(source, TokenStream):
+            erros_lexicos = source.erros
+            fonte = iter(source)
+        else:
+            erros_lexicos = []
+            fonte = self.lexer.tokenize_lazy(source, separadores=self.SEPARADORES, erros=erros_lexicos)
         
-        if not self.tokens:
-            return Program(statements=[], line=1, col=1)
+        self.current = 0
+        self._erros_sintaticos = []
+        self._janela.clear()
+        self._fonte = fonte
+        self._token = next(fonte, None)
         
         try:
-            program = self.parse_program()
-            
-            # Verifica se há tokens restantes (erro de sintaxe)
-            if self.current_token():
-                token = self.current_token()
-                raise ParseError(
-                    f"Token inesperado após o fim do programa: {token.type!r} ('{token.lexeme}')",
-                    token
-                )
-            
-            return program
+            if self._token is None:
+                program = Program(statements=[], line=1, col=1)
+            else:
+                program = self._parse_ll1() if self.ll1 else self.parse_program()
+                
+                # Verifica se há tokens restantes (erro de sintaxe)
+                if self.current_token():
+                    token = self.current_token()
+                    raise ParseError(
+                        f"Token inesperado após o fim do programa: {token.type!r} ('{token.lexeme}')",
+                        token
+                    )
         except ParseError as e:
+            self._registrar_erros_lexicos(erros_lexicos)
             self.errors.append(str(e))
             raise
+        
+        self._registrar_erros_lexicos(erros_lexicos)
+        # com recuperar=True, os erros de sintaxe vêm depois dos léxicos, como no modo normal
+        self.errors.extend(self._erros_sintaticos)
+        program._com_erros = bool(self.errors)
+        return program
+    
+    def reparse(self, program: Program, texto: str, edit_range, new_text: str) -> Program:
+        """
+        Atualiza `program`, a AST de `texto`, depois de trocar o trecho
+        edit_range = (inicio, fim) de `texto` por new_text. O resultado é o mesmo de
+        parse(texto_novo), mas só o statement de nível superior que contém a edição
+        (um If inteiro, se for o caso) é relido, a partir do começo dele, até o
+        parser chegar ao início de um statement antigo numa linha depois da edição:
+        daí em diante a gramática e os tokens são os mesmos, e os statements antigos
+        são reaproveitados. `program.statements` é alterado no lugar; as linhas dos
+        statements reaproveitados só são corrigidas quando alguém precisa delas (ver
+        Program.materializar). Com erro léxico ou de sintaxe no trecho relido, analisa
+        o texto novo inteiro com parse(), que registra/lança os erros como sempre; o
+        mesmo vale se o parse de `program` registrou erros (as mensagens citam linhas,
+        e os erros fora do trecho relido não seriam registrados de novo).
+        """
+        inicio, fim = edit_range
+        if not 0 <= inicio <= fim <= len(texto):
+            raise ValueError(f"edit_range {edit_range!r} fora do texto ({len(texto)} caracteres)")
+        novo_texto = texto[:inicio] + new_text + texto[fim:]
+        if program._com_erros:
+            return self._reparse_completo(program, novo_texto)
+        statements = program.statements
+        
+        # posição (linha, coluna) da edição no texto antigo
+        inicio_da_linha = texto.rfind("\n", 0, inicio) + 1
+        linha_edicao = texto.count("\n", 0, inicio) + 1
+        coluna_edicao = inicio - inicio_da_linha + 1
+        linha_fim = linha_edicao + texto.count("\n", inicio, fim)
+        dlinha = new_text.count("\n") - (linha_fim - linha_edicao)
+        
+        # último statement que começa antes da edição: a edição pode mudar onde ele
+        # termina. ErrorStatement (recuperar=True) não marca o começo de um statement
+        def posicao(i):
+            linha = program.linha(i)
+            return (linha, statements[i].col) if linha > 0 else (float("inf"), 0)
+        lo, hi = 0, len(statements)
+        while lo < hi:
+            meio = (lo + hi) // 2
+            if posicao(meio) < (linha_edicao, coluna_edicao):
+                lo = meio + 1
+            else:
+                hi = meio
+        primeiro = lo - 1
+        while primeiro >= 0 and isinstance(statements[primeiro], ErrorStatement):
+            primeiro -= 1
+        if primeiro < 0:
+            primeiro, comeco, inicio_da_linha, linha = 0, 0, 0, 1
+        else:
+            linha = program.linha(primeiro)
+            for _ in range(linha_edicao - linha):
+                inicio_da_linha = texto.rfind("\n", 0, inicio_da_linha - 1) + 1
+            comeco = inicio_da_linha + statements[primeiro].col - 1
+        
+        # tokens do texto novo a partir do começo desse statement (antes da edição o
+        # texto não mudou), com o cursor de linha/coluna no início da linha dele
+        buffer = InputBuffer(novo_texto)
+        buffer.pos = comeco
+        buffer._cursor = buffer._inicio_linha = buffer._inicio0 = buffer._origem = inicio_da_linha
+        buffer._linha = buffer._linha0 = linha
+        erros_lexicos = []
+        self.current = 0
+        self._erros_sintaticos = []
+        self._janela.clear()
+        self._fonte = self.lexer.tokenize_lazy(buffer, separadores=self.SEPARADORES, erros=erros_lexicos)
+        self._token = next(self._fonte, None)
+        
+        # relê statements até o token atual ser o começo de um statement antigo que
+        # está numa linha depois da edição (lá as colunas não mudaram)
+        relidos = []
+        seguinte = primeiro + 1
+        reler_tudo = False
+        try:
+            while True:
+                token = self.current_token()
+                if token is None:
+                    seguinte = len(statements)
+                    break
+                while seguinte < len(statements) and posicao(seguinte) < (token.line - dlinha, token.col):
+                    seguinte += 1
+                if (seguinte < len(statements) and token.line - dlinha > linha_fim and
+                        posicao(seguinte) == (token.line - dlinha, token.col) and
+                        not isinstance(statements[seguinte], ErrorStatement)):
+                    break
+                if not self._is_statement_start():
+                    # token solto no nível superior: parse() reporta o erro
+                    reler_tudo = True
+                    break
+                relidos.append(self.parse_statement())
+        except ParseError:
+            reler_tudo = True
+        # com recuperar=True, o corpo de um If relido pode ter recuperado erros
+        if reler_tudo or erros_lexicos or self._erros_sintaticos:
+            return self._reparse_completo(program, novo_texto)
+        
+        # os statements antigos a partir de `seguinte` ficam com mais dlinha pendente.
+        # Os relidos têm a linha certa, mas ficam sob a pendência de antes de
+        # `primeiro`, que é descontada deles (são poucos)
+        cortes, dlinhas = program._cortes, program._dlinhas
+        k = bisect_right(cortes, primeiro)
+        antes = dlinhas[k - 1] if k else 0
+        if antes:
+            deslocar_linhas(relidos, -antes)
+        m = bisect_right(cortes, seguinte)
+        base = primeiro + len(relidos)
+        statements[primeiro:seguinte] = relidos
+        novos_cortes, novas_dlinhas = cortes[:k], dlinhas[:k]
+        if novos_cortes and novos_cortes[-1] == base:
+            novos_cortes.pop()
+            novas_dlinhas.pop()
+        for corte, acumulado in zip([seguinte] + cortes[m:], [dlinhas[m - 1] if m else 0] + dlinhas[m:]):
+            corte += base - seguinte
+            acumulado += dlinha
+            if corte < len(statements) and acumulado != (novas_dlinhas[-1] if novas_dlinhas else 0):
+                novos_cortes.append(corte)
+                novas_dlinhas.append(acumulado)
+        program._cortes, program._dlinhas = novos_cortes, novas_dlinhas
+        return program
+    
+    def _reparse_completo(self, program: Program, texto: str) -> Program:
+        """reparse pelo caminho normal: parse(texto) inteiro, com o resultado em `program`."""
+        novo = self.parse(texto)
+        program.statements = novo.statements
+        program._cortes, program._dlinhas = [], []
+        program._com_erros = novo._com_erros
+        return program
+    
+    def _registrar_erros_lexicos(self, erros_lexicos):
+        """Lê o resto da entrada (para achar todos os erros léxicos) e os registra em errors."""
+        deque(self._fonte, maxlen=0)
+        for err in erros_lexicos:
+            msg = err.get('msg', 'Erro desconhecido')
+            line = err.get('line', 0)
+            col = err.get('col', 0)
+            self.errors.append(f"Erro léxico na linha {line}, coluna {col}: {msg}")
     
     def current_token(self) -> Optional[Token]:
         """Retorna o token atual."""
-        if self.current < len(self.tokens):
-            return self.tokens[self.current]
-        return None
+        return self._token
     
     def peek_token(self, offset: int = 0) -> Optional[Token]:
         """Retorna o token na posição current + offset."""
-        idx = self.current + offset
-        if idx < len(self.tokens):
-            return self.tokens[idx]
-        return None
+        if offset == 0:
+            return self._token
+        janela = self._janela
+        while len(janela) < offset:
+            token = next(self._fonte, None)
+            if token is None:
+                return None
+            janela.append(token)
+        return janela[offset - 1]
     
     def advance(self) -> Optional[Token]:
         """Avança para o próximo token."""
-        if self.current < len(self.tokens):
+        if self._token is not None:
             self.current += 1
-        return self.current_token()
+            self._token = self._janela.popleft() if self._janela else next(self._fonte, None)
+        return self._token
     
     def match(self, *expected_types: str) -> bool:
         """Verifica se o token atual é um dos tipos esperados."""
@@ -165,9 +480,12 @@ class Parser:
             )
         
         # Verifica se é a keyword esperada (pode ser tipo KEYWORD ou o lexeme)
-        is_keyword = (token.type.upper() == keyword.upper() or 
-                     token.type == "KEYWORD" or
-                     token.lexeme.upper() == keyword.upper())
+        if keyword in self._kind_da_palavra:
+            is_keyword = token.kind in KINDS_PALAVRA
+        else:
+            is_keyword = (token.type.upper() == keyword.upper() or 
+                         token.type == "KEYWORD" or
+                         token.lexeme.upper() == keyword.upper())
         
         if not is_keyword:
             raise ParseError(
@@ -188,7 +506,7 @@ class Parser:
             )
         
         # Verifica se é operador e se o lexeme corresponde
-        if token.type != "OPERADOR" or token.lexeme != operator:
+        if token.kind != KIND_OPERADOR or token.lexeme != operator:
             # Também pode ser um separador para parênteses/colchetes
             if operator in {"(", ")", "[", "]"} and token.lexeme == operator:
                 self.advance()
@@ -207,20 +525,208 @@ class Parser:
         """Program = StatementList"""
         statements = self.parse_statement_list()
         return Program(statements=statements, line=1, col=1)
-    
+
+    def _parse_ll1(self) -> Program:
+        """
+        Program pela tabela LL(1) (ll1=True). A pilha tem terminais, não terminais e
+        ações de tabela_ll1: um terminal é comparado com o token atual e consumido; um
+        não terminal é trocado pelo lado direito da produção TABELA[não terminal][token]
+        (nas células com predicado, decidida olhando mais um token); uma ação monta
+        os nós na pilha de valores.
+        """
+        tabela, expansoes = tabela_ll1.TABELA, tabela_ll1.EXPANSOES
+        n_terminais = len(tabela_ll1.TERMINAIS)
+        n_simbolos = n_terminais + len(tabela_ll1.NAO_TERMINAIS)
+        acoes = ACOES_LL1_PRATT if self.pratt else ACOES_LL1
+        predicados = tuple(getattr(self, f"_predicado_{nome}") for nome in tabela_ll1.PREDICADOS)
+        do_kind, do_lexema, outro = _LL1_DO_KIND, _LL1_DO_LEXEMA, _LL1_OUTRO
+        # advance() feito aqui mesmo; self._token e self.current são atualizados no fim
+        # (e antes de cada predicado, que usa peek_token)
+        janela, fonte = self._janela, self._fonte
+        consumidos = 0
+
+        pilha = [n_terminais]  # o símbolo inicial
+        pop, extend = pilha.pop, pilha.extend
+        valores = []
+        anterior = None
+        token = self._token
+        terminal = do_kind.get(token.kind, outro)
+        if terminal is None:
+            terminal = do_lexema.get(token.lexeme, outro)
+        try:
+            while pilha:
+                simbolo = pop()
+                if simbolo >= n_simbolos:
+                    acoes[simbolo - n_simbolos](valores, anterior)
+                elif simbolo >= n_terminais:
+                    linha = tabela[simbolo - n_terminais]
+                    producao = linha[terminal]
+                    if producao < 0:
+                        self._token = token
+                        producao = self._producao_ll1(simbolo, producao, predicados, valores, anterior)
+                    extend(expansoes[producao])
+                elif simbolo == terminal:
+                    anterior = token
+                    consumidos += 1
+                    token = janela.popleft() if janela else next(fonte, None)
+                    if token is None:
+                        terminal = 0
+                    else:
+                        terminal = do_kind.get(token.kind, outro)
+                        if terminal is None:
+                            terminal = do_lexema.get(token.lexeme, outro)
+                else:
+                    self._token = token
+                    self._erro_ll1(simbolo, anterior)
+        finally:
+            self._token = token
+            self.current += consumidos
+        return valores.pop()
+
+    def _producao_ll1(self, simbolo, producao, predicados, valores, anterior) -> int:
+        """
+        Produção de uma célula da tabela LL(1) sem produção direta: decide o
+        predicado da célula; se não sobra produção, segue pela vazia do não terminal
+        (VAZIAS) ou lança o ParseError do token atual (_erro_ll1).
+        """
+        if producao != -1:
+            predicado, sim, nao = tabela_ll1.CELULAS_COM_PREDICADO[-2 - producao]
+            producao = sim if predicados[predicado]() else nao
+        if producao < 0:
+            nao_terminal = simbolo - len(tabela_ll1.TERMINAIS)
+            producao = tabela_ll1.VAZIAS[nao_terminal]
+            if producao < 0:
+                self._erro_ll1(simbolo, anterior)
+            if (tabela_ll1.NAO_TERMINAIS[nao_terminal] == "StatementList" and valores[-1]
+                    and isinstance(valores[-1][-1], PrintStatement)):
+                # logo depois de um Print, o ")" que sobrou é acusado ali, como em
+                # parse_print_statement
+                self._check_unexpected_token_after_expression()
+        return producao
+
+    def _predicado_chamada(self) -> bool:
+        """Um nome seguido destes tokens é chamada sem parênteses (como em _parse_primaria)."""
+        next_tok = self.current_token()
+        if next_tok.kind not in KINDS_ARGUMENTO:
+            return False
+        peek1 = self.peek_token(1)
+        return peek1 is not None and (peek1.lexeme == "," or peek1.kind in KINDS_ARGUMENTO)
+
+    def _erro_ll1(self, simbolo, anterior: Optional[Token]):
+        """
+        Lança, para o token atual, o ParseError que a descida recursiva lançaria onde a
+        tabela LL(1) esperava `simbolo` (o terminal que não casou ou o não terminal da
+        célula de erro); `anterior` é o último token consumido.
+        """
+        n_terminais = len(tabela_ll1.TERMINAIS)
+        if simbolo < n_terminais:
+            nome = tabela_ll1.TERMINAIS[simbolo]
+            if nome == "'='":
+                # parse_statement acusa o identificador que não é seguido de "="
+                raise ParseError("Esperado '=' após identificador", anterior)
+            self._consume_separator(nome[1:-1])  # ")" e "]": os outros terminais abrem a produção
+        nome = tabela_ll1.NAO_TERMINAIS[simbolo - n_terminais]
+        token = self.current_token()
+        if nome == "BlockEnd":
+            self.consume_keyword("End")
+        elif nome == "PrintValue":
+            if not token:
+                raise ParseError("Esperado expressão ou string após 'Print'", None)
+            if self._is_keyword(token, "END"):
+                raise ParseError("Esperado expressão após 'Print'", token)
+        elif nome == "ListRest" and not token:
+            self._consume_separator("]")
+        # o resto (Expression até PrimaryExpression, ArgumentList, ExpressionList e ListRest)
+        # é uma expressão que não começa no token atual
+        raise self._erro_primaria(token)
+
     def parse_statement_list(self) -> List[Statement]:
-        """StatementList = Statement { Statement }"""
-        statements = []
+        """StatementList = Statement { Statement }
         
-        while self.current_token() and self._is_statement_start():
-            stmt = self.parse_statement()
-            statements.append(stmt)
-            # Após parsear um statement, verifica se o próximo token é "End"
-            # Se for, não tenta parsear mais statements
-            if self.current_token() and self.current_token().lexeme.upper() == "END":
-                break
+        Os If ... End aninhados não são lidos por recursão: cada If aberto fica em
+        `abertos` com a lista de statements de fora, que volta a ser a atual no End.
+        """
+        statements = []
+        abertos = []  # (token do If, condição, statements do bloco de fora)
+        faltou_end = False  # recuperar=True: o arquivo acabou com If abertos
         
-        return statements
+        while True:
+            token = self.current_token()
+            # "End" encerra a lista (_is_statement_start é False para ele)
+            if token and self._is_statement_start():
+                inicio = self.current
+                try:
+                    if token.kind != KIND_IDENTIFICADOR and self._is_keyword(token, "IF"):
+                        # ConditionalStatement: "If" Expression StatementList "End"
+                        if_token = self.consume_keyword("If")
+                        try:
+                            condition = self.parse_expression()
+                        except ParseError as e:
+                            if not self.recuperar:
+                                raise
+                            # o If continua aberto: seu corpo e seu End são lidos normalmente
+                            erro = self._recuperar(e, inicio)
+                            condition = ErrorExpression(message=erro.message, line=erro.line, col=erro.col)
+                        abertos.append((if_token, condition, statements))
+                        statements = []
+                    else:
+                        statements.append(self.parse_statement())
+                except ParseError as e:
+                    if not self.recuperar:
+                        raise
+                    statements.append(self._recuperar(e, inicio))
+                continue
+            
+            if not abertos:
+                if token is None or not self.recuperar:
+                    return statements
+                # token que não começa statement fora de qualquer If (inclusive um End a mais)
+                erro = ParseError(
+                    f"Token inesperado após o fim do programa: {token.type!r} ('{token.lexeme}')", token
+                )
+                statements.append(self._recuperar(erro, self.current))
+                continue
+            if token is not None or not faltou_end:
+                try:
+                    self.consume_keyword("End")
+                except ParseError as e:
+                    if not self.recuperar:
+                        raise
+                    statements.append(self._recuperar(e, self.current))
+                    if token is not None:
+                        continue
+                    # fim do arquivo: um erro só, e todos os If ainda abertos são fechados
+                    faltou_end = True
+            if_token, condition, externos = abertos.pop()
+            externos.append(ConditionalStatement(condition=condition, body=statements or (),
+                                                 line=if_token.line, col=if_token.col))
+            statements = externos
+    
+    def _recuperar(self, erro: ParseError, inicio: int) -> ErrorStatement:
+        """
+        Modo pânico: registra `erro` e pula tokens até um ponto de sincronização
+        (identificador seguido de "=", If, Print ou End). `inicio` é self.current no
+        começo do statement: se nada foi consumido, pula ao menos um token.
+        """
+        self._erros_sintaticos.append(str(erro))
+        token = erro.token or self.current_token()
+        if self.current == inicio:
+            self.advance()
+        while self.current_token() and not self._is_ponto_de_sincronizacao():
+            self.advance()
+        if token is None:
+            return ErrorStatement(message=erro.message)
+        return ErrorStatement(message=erro.message, line=token.line, col=token.col)
+    
+    def _is_ponto_de_sincronizacao(self) -> bool:
+        """Verifica se o token atual começa um statement ou é um End (ver _recuperar)."""
+        token = self.current_token()
+        if token.kind == KIND_IDENTIFICADOR:
+            seguinte = self.peek_token(1)
+            return seguinte is not None and seguinte.lexeme == "="
+        return (self._is_keyword(token, "IF") or
+                self._is_keyword(token, "PRINT") or
+                self._is_keyword(token, "END"))
     
     def _is_statement_start(self) -> bool:
         """Verifica se o token atual inicia um statement."""
@@ -233,7 +739,7 @@ class Parser:
             return False
         
         # Verifica se é identificador ou keyword If/Print
-        return (token.type == "IDENTIFICADOR" or 
+        return (token.kind == KIND_IDENTIFICADOR or 
                 self._is_keyword(token, "IF") or 
                 self._is_keyword(token, "PRINT"))
     
@@ -241,6 +747,9 @@ class Parser:
         """Verifica se o token é uma keyword específica (case-insensitive)."""
         if not token:
             return False
+        kind = self._kind_da_palavra.get(keyword)
+        if kind is not None:
+            return token.kind == kind
         return (token.type.upper() == keyword.upper() or 
                 (token.type == "KEYWORD" and token.lexeme.upper() == keyword.upper()) or
                 token.lexeme.upper() == keyword.upper())
@@ -249,8 +758,7 @@ class Parser:
         """Verifica se o token é uma keyword de controle (If, Print, End)."""
         if not token:
             return False
-        return (token.type == "KEYWORD" and 
-                token.lexeme.upper() in ("IF", "PRINT", "END"))
+        return token.kind in KINDS_CONTROLE
     
     def parse_statement(self) -> Statement:
         """Statement = Assignment | ConditionalStatement | PrintStatement"""
@@ -259,7 +767,7 @@ class Parser:
             raise ParseError("Esperado statement, mas encontrado fim do arquivo")
         
         # Assignment: identifier "=" Expression
-        if token.type == "IDENTIFICADOR":
+        if token.kind == KIND_IDENTIFICADOR:
             # Lookahead para verificar se é atribuição
             if self.peek_token(1) and self.peek_token(1).lexeme == "=":
                 return self.parse_assignment()
@@ -280,7 +788,7 @@ class Parser:
     def parse_assignment(self) -> Assignment:
         """Assignment = identifier "=" Expression"""
         token = self.consume("IDENTIFICADOR")
-        identifier = token.lexeme
+        identifier = sys.intern(token.lexeme)
         
         # Consome "=" (pode ser OPERADOR ou ATRIBUICAO dependendo do lexer)
         assign_token = self.current_token()
@@ -303,7 +811,7 @@ class Parser:
         condition = self.parse_expression()
         
         # Parse StatementList (pode ter um ou mais statements)
-        body = self.parse_statement_list()
+        body = self.parse_statement_list() or ()
         
         self.consume_keyword("End")
         
@@ -318,7 +826,7 @@ class Parser:
             raise ParseError("Esperado expressão ou string após 'Print'", None)
         
         # Se for string literal, pode usar diretamente
-        if token.type == "STRING":
+        if token.kind == KIND_STRING:
             str_token = self.consume("STRING")
             # Remove aspas
             value = str_token.lexeme.strip('"')
@@ -338,73 +846,23 @@ class Parser:
     
     def parse_expression(self) -> Expression:
         """Expression = RelationalExpression"""
-        return self.parse_relational_expression()
-    
-    def _parse_binary_expression(self, parse_left, parse_right, valid_ops: set, expr_class):
-        """Método genérico para parsear expressões binárias (relacional, aditiva, multiplicativa)."""
-        left = parse_left()
-        operations = []
-        
-        while self.current_token() and self.current_token().type == "OPERADOR":
-            token = self.current_token()
-            # Para se encontrar keyword de controle
-            if self._is_control_keyword(token):
-                break
-            # Verifica se é um operador válido
-            if token.lexeme in valid_ops:
-                self.advance()
-                right = parse_right()
-                operations.append((token.lexeme, right))
-            else:
-                break
-        
-        return expr_class(
-            left=left,
-            operations=operations,
-            line=left.line,
-            col=left.col
-        )
+        return self._parse_expressao(_PRATT if self.pratt else _RELACIONAL)
     
     def parse_relational_expression(self) -> RelationalExpression:
         """RelationalExpression = AdditiveExpression { (">" | "<" | ">=" | "<=" | "==" | "!=") AdditiveExpression }"""
-        return self._parse_binary_expression(
-            self.parse_additive_expression,
-            self.parse_additive_expression,
-            {">", "<", ">=", "<=", "==", "!="},
-            RelationalExpression
-        )
+        return self._parse_expressao(_RELACIONAL)
     
     def parse_additive_expression(self) -> AdditiveExpression:
         """AdditiveExpression = MultiplicativeExpression { ("+" | "-") MultiplicativeExpression }"""
-        return self._parse_binary_expression(
-            self.parse_multiplicative_expression,
-            self.parse_multiplicative_expression,
-            {"+", "-"},
-            AdditiveExpression
-        )
+        return self._parse_expressao(_ADITIVA)
     
     def parse_multiplicative_expression(self) -> MultiplicativeExpression:
         """MultiplicativeExpression = UnaryExpression { ("*" | "/") UnaryExpression }"""
-        return self._parse_binary_expression(
-            self.parse_unary_expression,
-            self.parse_unary_expression,
-            {"*", "/"},
-            MultiplicativeExpression
-        )
+        return self._parse_expressao(_MULTIPLICATIVA)
     
     def parse_unary_expression(self) -> UnaryExpression:
         """UnaryExpression = ("+" | "-") UnaryExpression | PrimaryExpression"""
-        token = self.current_token()
-        
-        if token and token.type == "OPERADOR" and token.lexeme in {"+", "-"}:
-            operator = token.lexeme
-            self.advance()
-            expr = self.parse_unary_expression()
-            return UnaryExpression(operator=operator, expression=expr, line=token.line, col=token.col)
-        
-        # PrimaryExpression
-        expr = self.parse_primary_expression()
-        return UnaryExpression(operator=None, expression=expr, line=expr.line, col=expr.col)
+        return self._parse_expressao(_UNARIA)
     
     def parse_primary_expression(self) -> PrimaryExpression:
         """PrimaryExpression = integer_literal | decimal_literal | string_literal | 
@@ -413,38 +871,155 @@ class Parser:
         
         Nota: Left-factored para resolver conflito LL(1) com identifier
         """
+        return self._parse_expressao(_PRIMARIA)
+    
+    def _parse_expressao(self, alvo: int) -> Expression:
+        """
+        Lê a expressão que começa na regra `alvo` (_RELACIONAL ... _PRIMARIA, _PRATT)
+        sem recursão. Cada regra ainda incompleta (um nível binário esperando o operando
+        da direita, um unário esperando o operando, um "(" esperando o ")", uma lista ou
+        chamada esperando o próximo elemento) fica num quadro de `pilha`, então o
+        aninhamento só é limitado pela memória. A AST e os ParseError são os mesmos da
+        descida recursiva pela gramática.
+        """
+        pilha = []
+        minimo = 1  # precedência mínima do quadro _PRATT a abrir
+        while True:
+            # desce: abre as regras a partir de `alvo` até ler uma folha
+            valor = None
+            while valor is None:
+                if alvo < _UNARIA:
+                    # [quadro, nível, left, operations, operador pendente]
+                    pilha.append([_Q_BINARIA, alvo, None, [], None])
+                    alvo += 1
+                elif alvo == _UNARIA or alvo == _PRATT_UNARIA:
+                    token = self.current_token()
+                    if token and token.kind == KIND_OPERADOR and token.lexeme in {"+", "-"}:
+                        self.advance()
+                        pilha.append((_Q_UNARIA if alvo == _UNARIA else _Q_UNARYOP, token))
+                    else:
+                        if alvo == _UNARIA:
+                            pilha.append((_Q_UNARIA_SEM_OPERADOR,))
+                        alvo = _PRIMARIA
+                elif alvo == _PRATT:
+                    # [quadro, precedência mínima, left, token do operador pendente]
+                    pilha.append([_Q_PRATT, minimo, None, None])
+                    alvo = _PRATT_UNARIA
+                else:
+                    valor = self._parse_primaria(pilha)
+                    if valor is None:
+                        # a primária abriu um quadro e espera uma Expression
+                        alvo = _PRATT if self.pratt else _RELACIONAL
+                        minimo = 1
+            
+            # sobe: entrega `valor` aos quadros até um deles pedir outra subexpressão
+            while pilha:
+                quadro = pilha[-1]
+                tipo = quadro[0]
+                token = self.current_token()
+                
+                if tipo == _Q_BINARIA:
+                    if quadro[2] is None:
+                        quadro[2] = valor
+                    else:
+                        quadro[3].append((quadro[4], valor))
+                    nivel = quadro[1]
+                    if token and token.kind == KIND_OPERADOR and token.lexeme in _OPERADORES_DO_NIVEL[nivel]:
+                        self.advance()
+                        quadro[4] = sys.intern(token.lexeme)
+                        alvo = nivel + 1
+                        break
+                    pilha.pop()
+                    left = quadro[2]
+                    # sem operador no nível: a tupla vazia compartilhada, não uma lista por nó
+                    valor = _CLASSE_DO_NIVEL[nivel](left=left, operations=quadro[3] or (), line=left.line, col=left.col)
+                
+                elif tipo == _Q_PRATT:
+                    left = quadro[2]
+                    if left is None:
+                        left = valor
+                    else:
+                        left = BinaryOp(op=sys.intern(quadro[3].lexeme), left=left, right=valor, line=left.line, col=left.col)
+                    quadro[2] = left
+                    if token and token.kind == KIND_OPERADOR:
+                        precedencia = PRECEDENCIA.get(token.lexeme)
+                        if precedencia is not None and precedencia >= quadro[1]:
+                            self.advance()
+                            quadro[3] = token
+                            # o lado direito só leva operadores que ligam mais forte: associa à esquerda
+                            alvo = _PRATT
+                            minimo = precedencia + 1
+                            break
+                    pilha.pop()
+                    valor = left
+                
+                elif tipo == _Q_UNARIA_SEM_OPERADOR:
+                    pilha.pop()
+                    valor = UnaryExpression(operator=None, expression=valor, line=valor.line, col=valor.col)
+                
+                elif tipo == _Q_UNARIA:
+                    pilha.pop()
+                    operador = quadro[1]
+                    valor = UnaryExpression(operator=sys.intern(operador.lexeme), expression=valor,
+                                            line=operador.line, col=operador.col)
+                
+                elif tipo == _Q_UNARYOP:
+                    pilha.pop()
+                    operador = quadro[1]
+                    valor = UnaryOp(op=sys.intern(operador.lexeme), operand=valor, line=operador.line, col=operador.col)
+                
+                elif tipo == _Q_PARENTESES:
+                    pilha.pop()
+                    self._consume_separator(")")
+                    abre = quadro[1]
+                    valor = ParenthesizedExpression(expression=valor, line=abre.line, col=abre.col)
+                
+                else:
+                    # _Q_LISTA / _Q_CHAMADA: [quadro, token, elementos, aceita vírgula]
+                    quadro[2].append(valor)
+                    if quadro[3] and token and (token.lexeme == "," or (token.type == "SEPARADOR" and token.lexeme == ",")):
+                        self.advance()
+                        alvo = _PRATT if self.pratt else _RELACIONAL
+                        minimo = 1
+                        break
+                    pilha.pop()
+                    inicio = quadro[1]
+                    if tipo == _Q_LISTA:
+                        self._consume_separator("]")
+                        valor = ListExpression(elements=quadro[2], line=inicio.line, col=inicio.col)
+                    else:
+                        valor = FunctionCall(name=sys.intern(inicio.lexeme), arguments=quadro[2], line=inicio.line, col=inicio.col)
+            else:
+                return valor
+    
+    def _parse_primaria(self, pilha) -> Optional[PrimaryExpression]:
+        """
+        Um passo de PrimaryExpression em _parse_expressao: devolve o nó de uma folha ou,
+        para "(", "[" e chamadas com argumentos, empilha o quadro e devolve None.
+        """
         token = self.current_token()
-        if not token:
-            raise ParseError("Esperado expressão primária, mas encontrado fim do arquivo")
-        
         # Não pode ser keywords de controle em expressões
-        if self._is_control_keyword(token):
-            keyword = token.lexeme.upper()
-            if keyword == "END":
-                raise ParseError(
-                    f"Expressão incompleta: encontrado '{token.lexeme}' onde esperava-se expressão. Verifique se há um statement incompleto antes desta linha.",
-                    token
-                )
-            raise ParseError(f"Palavra-chave '{token.lexeme}' não pode aparecer em expressão", token)
+        if not token or self._is_control_keyword(token):
+            raise self._erro_primaria(token)
         
         # Literais
-        if token.type == "INTEIRO":
+        if token.kind == KIND_INTEIRO:
             self.advance()
             return IntegerLiteral(value=int(token.lexeme), line=token.line, col=token.col)
         
-        if token.type == "DECIMAL":
+        if token.kind == KIND_DECIMAL:
             self.advance()
             return DecimalLiteral(value=float(token.lexeme), line=token.line, col=token.col)
         
-        if token.type == "STRING":
+        if token.kind == KIND_STRING:
             self.advance()
             return StringLiteral(value=token.lexeme.strip('"'), line=token.line, col=token.col)
         
         # identifier ou identifier "(" OptionalArgumentList ")"
         # Também aceita KEYWORD que pode ser usado como identificador em expressões
-        if token.type == "IDENTIFICADOR" or (token.type == "KEYWORD" and 
-            token.lexeme not in ("If", "Print", "End")):
-            name = token.lexeme
+        # (If/Print/End já foram recusados acima)
+        if token.kind == KIND_IDENTIFICADOR or token.kind in KINDS_PALAVRA:
+            name = sys.intern(token.lexeme)
             self.advance()
             
             # Lookahead para verificar se é chamada de função
@@ -454,55 +1029,91 @@ class Parser:
                 return Identifier(name=name, line=token.line, col=token.col)
             
             # Verifica se há argumentos (token válido seguido de vírgula ou outro argumento)
-            if next_tok and next_tok.type in ("INTEIRO", "DECIMAL", "STRING", "IDENTIFICADOR", "KEYWORD"):
+            if next_tok and next_tok.kind in KINDS_ARGUMENTO:
                 peek1 = self.peek_token(1)
-                if peek1 and (peek1.lexeme == "," or peek1.type in ("INTEIRO", "DECIMAL", "STRING", "IDENTIFICADOR", "KEYWORD")):
-                    return self.parse_function_call(name, token)
+                if peek1 and (peek1.lexeme == "," or peek1.kind in KINDS_ARGUMENTO):
+                    argumentos = self._argumentos_da_chamada()
+                    if argumentos is None:
+                        return FunctionCall(name=name, arguments=(), line=token.line, col=token.col)
+                    pilha.append([_Q_CHAMADA, token, [], argumentos])
+                    return None
             
             return Identifier(name=name, line=token.line, col=token.col)
         
         # "[" OptionalExpressionList "]"
         if token.lexeme == "[" or (token.type == "SEPARADOR" and token.lexeme == "["):
-            return self.parse_list_expression()
+            self.advance()  # consume "["
+            # Verifica se há elementos (não é "]")
+            next_token = self.current_token()
+            if next_token and next_token.lexeme != "]" and not (next_token.type == "SEPARADOR" and next_token.lexeme == "]"):
+                pilha.append([_Q_LISTA, token, [], True])
+                return None
+            self._consume_separator("]")
+            return ListExpression(elements=(), line=token.line, col=token.col)
         
         # "(" Expression ")"
         if token.lexeme == "(" or (token.type == "SEPARADOR" and token.lexeme == "("):
             self.advance()
-            expr = self.parse_expression()
-            self._consume_separator(")")
-            return ParenthesizedExpression(expression=expr, line=token.line, col=token.col)
+            pilha.append((_Q_PARENTESES, token))
+            return None
         
-        raise ParseError(f"Token inesperado em expressão primária: {token.type!r} ({token.lexeme!r})", token)
+        raise self._erro_primaria(token)
     
-    def parse_function_call(self, name: str, name_token: Token) -> FunctionCall:
-        """identifier "(" OptionalArgumentList ")" 
-        
-        Nota: Como o lexer filtra SEPARADOR (incluindo "(" e ")"), 
-        detectamos chamadas de função pela presença de argumentos.
+    def _erro_primaria(self, token: Optional[Token]) -> ParseError:
+        """ParseError de uma PrimaryExpression que não pode começar em `token`."""
+        if not token:
+            return ParseError("Esperado expressão primária, mas encontrado fim do arquivo")
+        if self._is_control_keyword(token):
+            if token.lexeme.upper() == "END":
+                return ParseError(
+                    f"Expressão incompleta: encontrado '{token.lexeme}' onde esperava-se expressão. Verifique se há um statement incompleto antes desta linha.",
+                    token
+                )
+            return ParseError(f"Palavra-chave '{token.lexeme}' não pode aparecer em expressão", token)
+        return ParseError(f"Token inesperado em expressão primária: {token.type!r} ({token.lexeme!r})", token)
+    
+    def _argumentos_da_chamada(self) -> Optional[bool]:
+        """
+        Forma dos argumentos de uma chamada (o nome já foi consumido): None sem
+        argumentos, True para uma ArgumentList (com vírgulas) e False para uma única
+        Expression.
         """
-        # Como os parênteses foram filtrados, começamos direto pelos argumentos
-        arguments = []
-        
         # Verifica se há argumentos (próximo token não é um operador ou fim)
         next_tok = self.current_token()
-        if next_tok and next_tok.type in ("INTEIRO", "DECIMAL", "STRING", "IDENTIFICADOR", "KEYWORD", "OPERADOR"):
+        if next_tok and (next_tok.kind in KINDS_ARGUMENTO or next_tok.kind == KIND_OPERADOR):
             # Verifica se não é um operador que encerraria a expressão
-            if next_tok.type != "OPERADOR" or next_tok.lexeme not in ("=", ">", "<", ">=", "<=", "==", "!=", "+", "-", "*", "/"):
+            if next_tok.kind != KIND_OPERADOR or next_tok.lexeme not in ("=", ">", "<", ">=", "<=", "==", "!=", "+", "-", "*", "/"):
                 # Pode ter argumentos
                 peek1 = self.peek_token(1)
-                if peek1 and (peek1.lexeme == "," or peek1.type in ("INTEIRO", "DECIMAL", "STRING", "IDENTIFICADOR", "KEYWORD")):
+                if peek1 and (peek1.lexeme == "," or peek1.kind in KINDS_ARGUMENTO):
                     # Definitivamente tem argumentos
-                    arguments = self.parse_argument_list()
-                elif next_tok.type in ("INTEIRO", "DECIMAL", "STRING", "IDENTIFICADOR", "KEYWORD"):
+                    return True
+                elif next_tok.kind in KINDS_ARGUMENTO:
                     # Pode ter um único argumento
-                    arguments = [self.parse_expression()]
+                    return False
+        return None
+    
+    def parse_function_call(self, name: str, name_token: Token) -> FunctionCall:
+        """identifier "(" OptionalArgumentList ")" 
+        
+        Nota: Como o lexer filtra SEPARADOR (incluindo "(" e ")"), 
+        detectamos chamadas de função pela presença de argumentos.
+        """
+        # Como os parênteses foram filtrados, começamos direto pelos argumentos
+        argumentos = self._argumentos_da_chamada()
+        if argumentos is None:
+            arguments = ()
+        elif argumentos:
+            arguments = self.parse_argument_list()
+        else:
+            arguments = [self.parse_expression()]
         
         return FunctionCall(name=name, arguments=arguments, line=name_token.line, col=name_token.col)
     
     def _check_unexpected_token_after_expression(self):
         """Verifica se há tokens inesperados após uma expressão (como parênteses extras)."""
         next_token = self.current_token()
-        if next_token and next_token.type == "SEPARADOR" and next_token.lexeme == ")":
+        if next_token and next_token.kind == KIND_SEPARADOR and next_token.lexeme == ")":
             raise ParseError(
                 f"Token inesperado: ')' após expressão na linha {next_token.line}, coluna {next_token.col}. Esperado fim do statement ou nova linha.",
                 next_token
@@ -551,7 +1162,7 @@ class Parser:
             raise ParseError("Esperado '['", None)
         self.advance()  # consume "["
         
-        elements = []
+        elements = ()
         # Verifica se há elementos (não é "]")
         next_token = self.current_token()
         if next_token and next_token.lexeme != "]" and not (next_token.type == "SEPARADOR" and next_token.lexeme == "]"):
@@ -9,7 +9,8 @@ from lsd_ast import (
     Program, Statement, Assignment, ConditionalStatement, PrintStatement,
     Expression, RelationalExpression, AdditiveExpression, MultiplicativeExpression,
     UnaryExpression, PrimaryExpression, IntegerLiteral, DecimalLiteral,
-    StringLiteral, Identifier, FunctionCall, ListExpression, ParenthesizedExpression
+    StringLiteral, Identifier, FunctionCall, ListExpression,
+    BinaryOp, UnaryOp, ErrorExpression, OPERADORES_RELACIONAIS, desembrulhar, percorrer
 )
 
 
@@ -74,6 +75,7 @@ class SemanticAnalyzer:
         Analisa semanticamente o programa e retorna informações sobre tipos.
         Retorna: {'errors': [...], 'warnings': [...], 'symbols': {...}}
         """
+        program.materializar()  # linhas pendentes de Parser.reparse (mensagens de erro)
         self.errors = []
         self.warnings = []
         self.symbol_table = SymbolTable()
@@ -118,17 +120,26 @@ class SemanticAnalyzer:
     
     def _analyze_program(self, program: Program) -> None:
         """Analisa o programa completo."""
-        for statement in program.statements:
-            self._analyze_statement(statement)
+        self._analyze_statements(program.statements)
     
     def _analyze_statement(self, statement: Statement) -> None:
         """Analisa um statement."""
-        if isinstance(statement, Assignment):
-            self._analyze_assignment(statement)
-        elif isinstance(statement, ConditionalStatement):
-            self._analyze_conditional(statement)
-        elif isinstance(statement, PrintStatement):
-            self._analyze_print(statement)
+        self._analyze_statements((statement,))
+    
+    def _analyze_statements(self, statements: List[Statement]) -> None:
+        """Analisa statements em ordem; os corpos dos If entram numa pilha, sem recursão."""
+        pilha = [iter(statements)]
+        while pilha:
+            statement = next(pilha[-1], None)
+            if statement is None:
+                pilha.pop()
+            elif isinstance(statement, Assignment):
+                self._analyze_assignment(statement)
+            elif isinstance(statement, ConditionalStatement):
+                self._analyze_conditional(statement)
+                pilha.append(iter(statement.body))
+            elif isinstance(statement, PrintStatement):
+                self._analyze_print(statement)
     
     def _analyze_assignment(self, assignment: Assignment) -> None:
         """Analisa uma atribuição: identifier = Expression"""
@@ -163,7 +174,11 @@ class SemanticAnalyzer:
             )
     
     def _analyze_conditional(self, conditional: ConditionalStatement) -> None:
-        """Analisa um condicional: If Expression StatementList End"""
+        """Analisa a condição de um If Expression StatementList End (o corpo fica com _analyze_statements)"""
+        # Condição com erro de sintaxe (Parser com recuperar=True): já foi reportada
+        if isinstance(conditional.condition, ErrorExpression):
+            return
+        
         # A condição deve ser do tipo BOOL
         condition_type = self._infer_expression_type(conditional.condition)
         
@@ -172,10 +187,7 @@ class SemanticAnalyzer:
                 f"Condição do 'If' deve ser do tipo BOOL, mas encontrado {condition_type.value} "
                 f"(linha {conditional.line}, coluna {conditional.col})"
             )
-        
-        # Analisa o corpo do condicional
-        for statement in conditional.body:
-            self._analyze_statement(statement)
+
     
     def _analyze_print(self, print_stmt: PrintStatement) -> None:
         """Analisa um print: Print Expression ou Print string"""
@@ -188,8 +200,20 @@ class SemanticAnalyzer:
         # Qualquer tipo pode ser impresso, então não há erro aqui
     
     def _infer_expression_type(self, expression: Expression) -> Type:
-        """Infere o tipo de uma expressão."""
-        if isinstance(expression, RelationalExpression):
+        """Infere o tipo de uma expressão (com pilha explícita: ver lsd_ast.percorrer)."""
+        return percorrer(expression, self._expandir_tipo)
+    
+    def _expandir_tipo(self, expression: Expression):
+        """
+        Um passo de _infer_expression_type: o tipo de uma folha ou o gerador do nó,
+        que faz yield das subexpressões e recebe os tipos delas.
+        """
+        expression = desembrulhar(expression)
+        if isinstance(expression, BinaryOp):
+            return self._infer_binary_op(expression)
+        elif isinstance(expression, UnaryOp):
+            return self._infer_unary_op(expression)
+        elif isinstance(expression, RelationalExpression):
             return self._infer_relational_expression(expression)
         elif isinstance(expression, AdditiveExpression):
             return self._infer_additive_expression(expression)
@@ -205,7 +229,7 @@ class SemanticAnalyzer:
     def _infer_relational_expression(self, expr: RelationalExpression) -> Type:
         """Infere tipo de expressão relacional."""
         # Analisa o lado esquerdo
-        left_type = self._infer_expression_type(expr.left)
+        left_type = yield expr.left
         
         # Se não há operações relacionais, retorna o tipo do lado esquerdo
         if not expr.operations:
@@ -213,7 +237,7 @@ class SemanticAnalyzer:
         
         # Para cada operação relacional
         for op, right_expr in expr.operations:
-            right_type = self._infer_expression_type(right_expr)
+            right_type = yield right_expr
             
             # Verifica compatibilidade dos tipos
             if not self._are_comparable(left_type, right_type):
@@ -228,10 +252,10 @@ class SemanticAnalyzer:
     
     def _infer_additive_expression(self, expr: AdditiveExpression) -> Type:
         """Infere tipo de expressão aditiva."""
-        left_type = self._infer_expression_type(expr.left)
+        left_type = yield expr.left
         
         for op, right_expr in expr.operations:
-            right_type = self._infer_expression_type(right_expr)
+            right_type = yield right_expr
             
             # Verifica compatibilidade
             result_type = self._get_arithmetic_result_type(left_type, right_type, op)
@@ -246,10 +270,10 @@ class SemanticAnalyzer:
     
     def _infer_multiplicative_expression(self, expr: MultiplicativeExpression) -> Type:
         """Infere tipo de expressão multiplicativa."""
-        left_type = self._infer_expression_type(expr.left)
+        left_type = yield expr.left
         
         for op, right_expr in expr.operations:
-            right_type = self._infer_expression_type(right_expr)
+            right_type = yield right_expr
             
             # Verifica compatibilidade
             result_type = self._get_arithmetic_result_type(left_type, right_type, op)
@@ -262,9 +286,51 @@ class SemanticAnalyzer:
         
         return left_type
     
+    def _infer_binary_op(self, expr: BinaryOp) -> Type:
+        """Infere tipo de operação binária (AST compacta), com as regras dos níveis acima."""
+        if expr.op in OPERADORES_RELACIONAIS:
+            # a < b < c: como em RelationalExpression, cada lado direito da cadeia
+            # é comparado com o primeiro operando
+            cadeia = []
+            left = expr
+            while isinstance(left, BinaryOp) and left.op in OPERADORES_RELACIONAIS:
+                cadeia.append(left)
+                left = left.left
+            left_type = yield left
+            for node in reversed(cadeia):
+                right_type = yield node.right
+                if not self._are_comparable(left_type, right_type):
+                    self.errors.append(
+                        f"Tipos incompatíveis em operação relacional '{node.op}': "
+                        f"{left_type.value} e {right_type.value} não podem ser comparados "
+                        f"(linha {expr.line}, coluna {expr.col})"
+                    )
+            return Type.BOOL
+        
+        left_type = yield expr.left
+        right_type = yield expr.right
+        result_type = self._get_arithmetic_result_type(left_type, right_type, expr.op)
+        if result_type == Type.UNKNOWN:
+            self.errors.append(
+                f"Operação '{expr.op}' inválida entre tipos {left_type.value} e {right_type.value} "
+                f"(linha {expr.line}, coluna {expr.col})"
+            )
+        return result_type
+    
+    def _infer_unary_op(self, expr: UnaryOp) -> Type:
+        """Infere tipo de operação unária (AST compacta)."""
+        expr_type = yield expr.operand
+        if expr_type not in (Type.INT, Type.DECIMAL):
+            self.errors.append(
+                f"Operador unário '{expr.op}' não pode ser aplicado a tipo {expr_type.value} "
+                f"(linha {expr.line}, coluna {expr.col})"
+            )
+            return Type.UNKNOWN
+        return expr_type
+    
     def _infer_unary_expression(self, expr: UnaryExpression) -> Type:
         """Infere tipo de expressão unária."""
-        expr_type = self._infer_expression_type(expr.expression)
+        expr_type = yield expr.expression
         
         # Operadores unários + e - só funcionam com números
         if expr.operator in ("+", "-"):
@@ -277,8 +343,8 @@ class SemanticAnalyzer:
         
         return expr_type
     
-    def _infer_primary_expression(self, expr: PrimaryExpression) -> Type:
-        """Infere tipo de expressão primária."""
+    def _infer_primary_expression(self, expr: PrimaryExpression):
+        """Infere tipo de expressão primária (chamadas e listas devolvem o gerador)."""
         if isinstance(expr, IntegerLiteral):
             return Type.INT
         elif isinstance(expr, DecimalLiteral):
@@ -300,16 +366,15 @@ class SemanticAnalyzer:
             return self._infer_function_call(expr)
         elif isinstance(expr, ListExpression):
             return self._infer_list_expression(expr)
-        elif isinstance(expr, ParenthesizedExpression):
-            return self._infer_expression_type(expr.expression)
         else:
+            # ParenthesizedExpression já foi desembrulhada em _expandir_tipo
             return Type.UNKNOWN
     
     def _infer_function_call(self, func_call: FunctionCall) -> Type:
         """Infere tipo de chamada de função."""
         # Analisa os argumentos
         for arg in func_call.arguments:
-            self._infer_expression_type(arg)
+            yield arg
         
         # Funções conhecidas
         if func_call.name == "CalculateMean":
@@ -320,7 +385,7 @@ class SemanticAnalyzer:
                     f"(linha {func_call.line}, coluna {func_call.col})"
                 )
             else:
-                arg_type = self._infer_expression_type(func_call.arguments[0])
+                arg_type = yield func_call.arguments[0]
                 if arg_type != Type.LIST:
                     self.errors.append(
                         f"CalculateMean espera LIST, mas recebeu {arg_type.value} "
@@ -336,7 +401,7 @@ class SemanticAnalyzer:
                     f"(linha {func_call.line}, coluna {func_call.col})"
                 )
             else:
-                arg_type = self._infer_expression_type(func_call.arguments[0])
+                arg_type = yield func_call.arguments[0]
                 if arg_type != Type.LIST:
                     self.errors.append(
                         f"CalculateSum espera LIST, mas recebeu {arg_type.value} "
@@ -359,7 +424,9 @@ class SemanticAnalyzer:
             return Type.LIST
         
         # Verifica se todos os elementos têm tipos compatíveis
-        element_types = [self._infer_expression_type(elem) for elem in list_expr.elements]
+        element_types = []
+        for elem in list_expr.elements:
+            element_types.append((yield elem))
         
         # Verifica consistência de tipos (todos devem ser numéricos ou todos strings)
         first_type = element_types[0]
@@ -0,0 +1,321 @@
+"""
+Tabela LL(1) da LSD gerada por gerar_tabela_ll1.py a partir de docs/grammar.md — não editar à mão.
+Regenerar com: python gerar_tabela_ll1.py
+
+Produções:
+      0  Program → @lista StatementList @programa
+      1  StatementList → Statement @junta StatementList
+      2  StatementList → ε
+      3  Statement → identifier @token '=' Expression @atribuicao
+      4  Statement → 'If' @token Expression @lista StatementList BlockEnd @condicional
+      5  Statement → 'Print' @token PrintValue @escrita
+      6  BlockEnd → 'End'
+      7  BlockEnd → 'CalculateMean'
+      8  BlockEnd → 'CalculateSum'
+      9  BlockEnd → keyword
+     10  PrintValue → ! string_literal @texto
+     11  PrintValue → Expression
+     12  Expression → RelationalExpression
+     13  RelationalExpression → AdditiveExpression @lista RelationalTail @relacional
+     14  RelationalTail → ! RelOp @token AdditiveExpression @operacao RelationalTail
+     15  RelationalTail → ε
+     16  RelOp → '>'
+     17  RelOp → '<'
+     18  RelOp → '>='
+     19  RelOp → '<='
+     20  RelOp → '=='
+     21  RelOp → '!='
+     22  AdditiveExpression → MultiplicativeExpression @lista AdditiveTail @aditiva
+     23  AdditiveTail → ! AddOp @token MultiplicativeExpression @operacao AdditiveTail
+     24  AdditiveTail → ε
+     25  AddOp → '+'
+     26  AddOp → '-'
+     27  MultiplicativeExpression → UnaryExpression @lista MultiplicativeTail @multiplicativa
+     28  MultiplicativeTail → ! MulOp @token UnaryExpression @operacao MultiplicativeTail
+     29  MultiplicativeTail → ε
+     30  MulOp → '*'
+     31  MulOp → '/'
+     32  UnaryExpression → AddOp @token UnaryExpression @unaria
+     33  UnaryExpression → PrimaryExpression @sem_operador
+     34  PrimaryExpression → integer_literal @inteiro
+     35  PrimaryExpression → decimal_literal @decimal
+     36  PrimaryExpression → string_literal @string
+     37  PrimaryExpression → Name @token NameSuffix
+     38  PrimaryExpression → '[' @token ListRest
+     39  PrimaryExpression → '(' @token Expression ')' @parenteses
+     40  Name → identifier
+     41  Name → 'CalculateMean'
+     42  Name → 'CalculateSum'
+     43  Name → keyword
+     44  NameSuffix → {chamada} @lista ArgumentList @chamada
+     45  NameSuffix → @identificador
+     46  ArgumentList → Expression @junta ArgumentTail
+     47  ArgumentTail → ! ',' Expression @junta ArgumentTail
+     48  ArgumentTail → ε
+     49  ListRest → ']' @lista_vazia
+     50  ListRest → @lista ExpressionList ']' @lista_com_elementos
+     51  ExpressionList → Expression @junta ExpressionTail
+     52  ExpressionTail → ',' Expression @junta ExpressionTail
+     53  ExpressionTail → ε
+
+FIRST / FOLLOW:
+    Program
+        FIRST  = {'If', 'Print', identifier}
+        FOLLOW = {$}
+    StatementList
+        FIRST  = {'If', 'Print', identifier}
+        FOLLOW = {$, 'CalculateMean', 'CalculateSum', 'End', keyword}
+    Statement
+        FIRST  = {'If', 'Print', identifier}
+        FOLLOW = {$, 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', identifier, keyword}
+    BlockEnd
+        FIRST  = {'CalculateMean', 'CalculateSum', 'End', keyword}
+        FOLLOW = {$, 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', identifier, keyword}
+    PrintValue
+        FIRST  = {'(', '+', '-', 'CalculateMean', 'CalculateSum', '[', decimal_literal, identifier, integer_literal, keyword, string_literal}
+        FOLLOW = {$, 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', identifier, keyword}
+    Expression
+        FIRST  = {'(', '+', '-', 'CalculateMean', 'CalculateSum', '[', decimal_literal, identifier, integer_literal, keyword, string_literal}
+        FOLLOW = {$, '!=', ')', '*', '+', ',', '-', '/', '<', '<=', '==', '>', '>=', 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', ']', identifier, keyword}
+    RelationalExpression
+        FIRST  = {'(', '+', '-', 'CalculateMean', 'CalculateSum', '[', decimal_literal, identifier, integer_literal, keyword, string_literal}
+        FOLLOW = {$, '!=', ')', '*', '+', ',', '-', '/', '<', '<=', '==', '>', '>=', 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', ']', identifier, keyword}
+    RelationalTail
+        FIRST  = {'!=', '<', '<=', '==', '>', '>='}
+        FOLLOW = {$, '!=', ')', '*', '+', ',', '-', '/', '<', '<=', '==', '>', '>=', 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', ']', identifier, keyword}
+    RelOp
+        FIRST  = {'!=', '<', '<=', '==', '>', '>='}
+        FOLLOW = {'(', '+', '-', 'CalculateMean', 'CalculateSum', '[', decimal_literal, identifier, integer_literal, keyword, string_literal}
+    AdditiveExpression
+        FIRST  = {'(', '+', '-', 'CalculateMean', 'CalculateSum', '[', decimal_literal, identifier, integer_literal, keyword, string_literal}
+        FOLLOW = {$, '!=', ')', '*', '+', ',', '-', '/', '<', '<=', '==', '>', '>=', 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', ']', identifier, keyword}
+    AdditiveTail
+        FIRST  = {'+', '-'}
+        FOLLOW = {$, '!=', ')', '*', '+', ',', '-', '/', '<', '<=', '==', '>', '>=', 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', ']', identifier, keyword}
+    AddOp
+        FIRST  = {'+', '-'}
+        FOLLOW = {'(', '+', '-', 'CalculateMean', 'CalculateSum', '[', decimal_literal, identifier, integer_literal, keyword, string_literal}
+    MultiplicativeExpression
+        FIRST  = {'(', '+', '-', 'CalculateMean', 'CalculateSum', '[', decimal_literal, identifier, integer_literal, keyword, string_literal}
+        FOLLOW = {$, '!=', ')', '*', '+', ',', '-', '/', '<', '<=', '==', '>', '>=', 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', ']', identifier, keyword}
+    MultiplicativeTail
+        FIRST  = {'*', '/'}
+        FOLLOW = {$, '!=', ')', '*', '+', ',', '-', '/', '<', '<=', '==', '>', '>=', 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', ']', identifier, keyword}
+    MulOp
+        FIRST  = {'*', '/'}
+        FOLLOW = {'(', '+', '-', 'CalculateMean', 'CalculateSum', '[', decimal_literal, identifier, integer_literal, keyword, string_literal}
+    UnaryExpression
+        FIRST  = {'(', '+', '-', 'CalculateMean', 'CalculateSum', '[', decimal_literal, identifier, integer_literal, keyword, string_literal}
+        FOLLOW = {$, '!=', ')', '*', '+', ',', '-', '/', '<', '<=', '==', '>', '>=', 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', ']', identifier, keyword}
+    PrimaryExpression
+        FIRST  = {'(', 'CalculateMean', 'CalculateSum', '[', decimal_literal, identifier, integer_literal, keyword, string_literal}
+        FOLLOW = {$, '!=', ')', '*', '+', ',', '-', '/', '<', '<=', '==', '>', '>=', 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', ']', identifier, keyword}
+    Name
+        FIRST  = {'CalculateMean', 'CalculateSum', identifier, keyword}
+        FOLLOW = {$, '!=', '(', ')', '*', '+', ',', '-', '/', '<', '<=', '==', '>', '>=', 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', '[', ']', decimal_literal, identifier, integer_literal, keyword, string_literal}
+    NameSuffix
+        FIRST  = {'(', '+', '-', 'CalculateMean', 'CalculateSum', '[', decimal_literal, identifier, integer_literal, keyword, string_literal}
+        FOLLOW = {$, '!=', ')', '*', '+', ',', '-', '/', '<', '<=', '==', '>', '>=', 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', ']', identifier, keyword}
+    ArgumentList
+        FIRST  = {'(', '+', '-', 'CalculateMean', 'CalculateSum', '[', decimal_literal, identifier, integer_literal, keyword, string_literal}
+        FOLLOW = {$, '!=', ')', '*', '+', ',', '-', '/', '<', '<=', '==', '>', '>=', 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', ']', identifier, keyword}
+    ArgumentTail
+        FIRST  = {','}
+        FOLLOW = {$, '!=', ')', '*', '+', ',', '-', '/', '<', '<=', '==', '>', '>=', 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', ']', identifier, keyword}
+    ListRest
+        FIRST  = {'(', '+', '-', 'CalculateMean', 'CalculateSum', '[', ']', decimal_literal, identifier, integer_literal, keyword, string_literal}
+        FOLLOW = {$, '!=', ')', '*', '+', ',', '-', '/', '<', '<=', '==', '>', '>=', 'CalculateMean', 'CalculateSum', 'End', 'If', 'Print', ']', identifier, keyword}
+    ExpressionList
+        FIRST  = {'(', '+', '-', 'CalculateMean', 'CalculateSum', '[', decimal_literal, identifier, integer_literal, keyword, string_literal}
+        FOLLOW = {']'}
+    ExpressionTail
+        FIRST  = {','}
+        FOLLOW = {']'}
+"""
+
+ASSINATURA = 3137588717
+
+TERMINAIS = ('$', "'!='", "'('", "')'", "'*'", "'+'", "','", "'-'", "'/'", "'<'", "'<='", "'='", "'=='", "'>'", "'>='", "'CalculateMean'", "'CalculateSum'", "'End'", "'If'", "'Print'", "'['", "']'", 'decimal_literal', 'identifier', 'integer_literal', 'keyword', 'string_literal', 'outro')
+NAO_TERMINAIS = ('Program', 'StatementList', 'Statement', 'BlockEnd', 'PrintValue', 'Expression', 'RelationalExpression', 'RelationalTail', 'RelOp', 'AdditiveExpression', 'AdditiveTail', 'AddOp', 'MultiplicativeExpression', 'MultiplicativeTail', 'MulOp', 'UnaryExpression', 'PrimaryExpression', 'Name', 'NameSuffix', 'ArgumentList', 'ArgumentTail', 'ListRest', 'ExpressionList', 'ExpressionTail')
+ACOES = ('aditiva', 'atribuicao', 'chamada', 'condicional', 'decimal', 'escrita', 'identificador', 'inteiro', 'junta', 'lista', 'lista_com_elementos', 'lista_vazia', 'multiplicativa', 'operacao', 'parenteses', 'programa', 'relacional', 'sem_operador', 'string', 'texto', 'token', 'unaria')
+PREDICADOS = ('chamada',)
+
+# símbolos: terminais 0..len(TERMINAIS)-1, depois não terminais, depois ações
+# símbolos empilhados por cada célula, invertidos (o primeiro fica no topo da pilha)
+EXPANSOES = (
+    (67, 61),
+    (67, 29, 60, 55, 31, 29, 61, 33, 72, 18, 61),
+    (67, 29, 60, 57, 32, 72, 19, 61),
+    (67, 29, 60, 53, 33, 11, 72, 23, 61),
+    (),
+    (29, 60, 55, 31, 29, 61, 33, 72, 18),
+    (29, 60, 57, 32, 72, 19),
+    (29, 60, 53, 33, 11, 72, 23),
+    (55, 31, 29, 61, 33, 72, 18),
+    (57, 32, 72, 19),
+    (53, 33, 11, 72, 23),
+    (15,),
+    (16,),
+    (17,),
+    (25,),
+    (68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 66, 3, 33, 72, 2),
+    (68, 35, 61, 52, 38, 61, 64, 41, 61, 73, 43, 72, 5),
+    (68, 35, 61, 52, 38, 61, 64, 41, 61, 73, 43, 72, 7),
+    (68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 15),
+    (68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 16),
+    (68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 49, 72, 20),
+    (68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 56, 22),
+    (68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 23),
+    (68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 59, 24),
+    (68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 25),
+    (71, 26),
+    (68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 70, 26),
+    (35, 65, 37, 72, 1),
+    (35, 65, 37, 72, 9),
+    (35, 65, 37, 72, 10),
+    (35, 65, 37, 72, 12),
+    (35, 65, 37, 72, 13),
+    (35, 65, 37, 72, 14),
+    (1,),
+    (9,),
+    (10,),
+    (12,),
+    (13,),
+    (14,),
+    (52, 38, 61, 64, 41, 61, 69, 66, 3, 33, 72, 2),
+    (52, 38, 61, 64, 41, 61, 73, 43, 72, 5),
+    (52, 38, 61, 64, 41, 61, 73, 43, 72, 7),
+    (52, 38, 61, 64, 41, 61, 69, 46, 72, 15),
+    (52, 38, 61, 64, 41, 61, 69, 46, 72, 16),
+    (52, 38, 61, 64, 41, 61, 69, 49, 72, 20),
+    (52, 38, 61, 64, 41, 61, 69, 56, 22),
+    (52, 38, 61, 64, 41, 61, 69, 46, 72, 23),
+    (52, 38, 61, 64, 41, 61, 69, 59, 24),
+    (52, 38, 61, 64, 41, 61, 69, 46, 72, 25),
+    (52, 38, 61, 64, 41, 61, 69, 70, 26),
+    (38, 65, 40, 72, 5),
+    (38, 65, 40, 72, 7),
+    (5,),
+    (7,),
+    (64, 41, 61, 69, 66, 3, 33, 72, 2),
+    (64, 41, 61, 73, 43, 72, 5),
+    (64, 41, 61, 73, 43, 72, 7),
+    (64, 41, 61, 69, 46, 72, 15),
+    (64, 41, 61, 69, 46, 72, 16),
+    (64, 41, 61, 69, 49, 72, 20),
+    (64, 41, 61, 69, 56, 22),
+    (64, 41, 61, 69, 46, 72, 23),
+    (64, 41, 61, 69, 59, 24),
+    (64, 41, 61, 69, 46, 72, 25),
+    (64, 41, 61, 69, 70, 26),
+    (41, 65, 43, 72, 4),
+    (41, 65, 43, 72, 8),
+    (4,),
+    (8,),
+    (69, 66, 3, 33, 72, 2),
+    (73, 43, 72, 5),
+    (73, 43, 72, 7),
+    (69, 46, 72, 15),
+    (69, 46, 72, 16),
+    (69, 49, 72, 20),
+    (69, 56, 22),
+    (69, 46, 72, 23),
+    (69, 59, 24),
+    (69, 46, 72, 25),
+    (69, 70, 26),
+    (66, 3, 33, 72, 2),
+    (46, 72, 15),
+    (46, 72, 16),
+    (49, 72, 20),
+    (56, 22),
+    (46, 72, 23),
+    (59, 24),
+    (46, 72, 25),
+    (70, 26),
+    (23,),
+    (58,),
+    (48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 66, 3, 33, 72, 2),
+    (48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 73, 43, 72, 5),
+    (48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 73, 43, 72, 7),
+    (48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 15),
+    (48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 16),
+    (48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 49, 72, 20),
+    (48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 56, 22),
+    (48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 23),
+    (48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 59, 24),
+    (48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 25),
+    (48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 70, 26),
+    (48, 60, 33, 6),
+    (62, 21, 51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 66, 3, 33, 72, 2, 61),
+    (62, 21, 51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 73, 43, 72, 5, 61),
+    (62, 21, 51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 73, 43, 72, 7, 61),
+    (62, 21, 51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 15, 61),
+    (62, 21, 51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 16, 61),
+    (62, 21, 51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 49, 72, 20, 61),
+    (63, 21),
+    (62, 21, 51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 56, 22, 61),
+    (62, 21, 51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 23, 61),
+    (62, 21, 51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 59, 24, 61),
+    (62, 21, 51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 25, 61),
+    (62, 21, 51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 70, 26, 61),
+    (51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 66, 3, 33, 72, 2),
+    (51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 73, 43, 72, 5),
+    (51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 73, 43, 72, 7),
+    (51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 15),
+    (51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 16),
+    (51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 49, 72, 20),
+    (51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 56, 22),
+    (51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 23),
+    (51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 59, 24),
+    (51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 25),
+    (51, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 70, 26),
+    (51, 60, 33, 6),
+    (54, 48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 66, 3, 33, 72, 2, 61),
+    (54, 48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 73, 43, 72, 5, 61),
+    (54, 48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 73, 43, 72, 7, 61),
+    (54, 48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 15, 61),
+    (54, 48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 16, 61),
+    (54, 48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 49, 72, 20, 61),
+    (54, 48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 56, 22, 61),
+    (54, 48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 23, 61),
+    (54, 48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 59, 24, 61),
+    (54, 48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 46, 72, 25, 61),
+    (54, 48, 60, 68, 35, 61, 52, 38, 61, 64, 41, 61, 69, 70, 26, 61),
+    (67, 29, 61),
+)
+
+# TABELA[não terminal][terminal]: expansão; -1 = erro; -2 - k = CELULAS_COM_PREDICADO[k]
+TABELA = (
+    (0, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 1, 2, -1, -1, -1, 3, -1, -1, -1, -1),  # Program
+    (4, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 4, 4, 4, 5, 6, -1, -1, -1, 7, -1, 4, -1, -1),  # StatementList
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 8, 9, -1, -1, -1, 10, -1, -1, -1, -1),  # Statement
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 11, 12, 13, -1, -1, -1, -1, -1, -1, -1, 14, -1, -1),  # BlockEnd
+    (-1, -1, 15, -1, -1, 16, -1, 17, -1, -1, -1, -1, -1, -1, -1, 18, 19, -1, -1, -1, 20, -1, 21, 22, 23, 24, 25, -1),  # PrintValue
+    (-1, -1, 15, -1, -1, 16, -1, 17, -1, -1, -1, -1, -1, -1, -1, 18, 19, -1, -1, -1, 20, -1, 21, 22, 23, 24, 26, -1),  # Expression
+    (-1, -1, 15, -1, -1, 16, -1, 17, -1, -1, -1, -1, -1, -1, -1, 18, 19, -1, -1, -1, 20, -1, 21, 22, 23, 24, 26, -1),  # RelationalExpression
+    (4, 27, -1, 4, 4, 4, 4, 4, 4, 28, 29, -1, 30, 31, 32, 4, 4, 4, 4, 4, -1, 4, -1, 4, -1, 4, -1, -1),  # RelationalTail
+    (-1, 33, -1, -1, -1, -1, -1, -1, -1, 34, 35, -1, 36, 37, 38, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # RelOp
+    (-1, -1, 39, -1, -1, 40, -1, 41, -1, -1, -1, -1, -1, -1, -1, 42, 43, -1, -1, -1, 44, -1, 45, 46, 47, 48, 49, -1),  # AdditiveExpression
+    (4, 4, -1, 4, 4, 50, 4, 51, 4, 4, 4, -1, 4, 4, 4, 4, 4, 4, 4, 4, -1, 4, -1, 4, -1, 4, -1, -1),  # AdditiveTail
+    (-1, -1, -1, -1, -1, 52, -1, 53, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # AddOp
+    (-1, -1, 54, -1, -1, 55, -1, 56, -1, -1, -1, -1, -1, -1, -1, 57, 58, -1, -1, -1, 59, -1, 60, 61, 62, 63, 64, -1),  # MultiplicativeExpression
+    (4, 4, -1, 4, 65, 4, 4, 4, 66, 4, 4, -1, 4, 4, 4, 4, 4, 4, 4, 4, -1, 4, -1, 4, -1, 4, -1, -1),  # MultiplicativeTail
+    (-1, -1, -1, -1, 67, -1, -1, -1, 68, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1),  # MulOp
+    (-1, -1, 69, -1, -1, 70, -1, 71, -1, -1, -1, -1, -1, -1, -1, 72, 73, -1, -1, -1, 74, -1, 75, 76, 77, 78, 79, -1),  # UnaryExpression
+    (-1, -1, 80, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 81, 82, -1, -1, -1, 83, -1, 84, 85, 86, 87, 88, -1),  # PrimaryExpression
+    (-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 11, 12, -1, -1, -1, -1, -1, -1, 89, -1, 14, -1, -1),  # Name
+    (90, 90, -2, 90, 90, -3, 90, -4, 90, 90, 90, -1, 90, 90, 90, -5, -6, 90, 90, 90, -7, 90, -8, -9, -10, -11, -12, -1),  # NameSuffix
+    (-1, -1, 91, -1, -1, 92, -1, 93, -1, -1, -1, -1, -1, -1, -1, 94, 95, -1, -1, -1, 96, -1, 97, 98, 99, 100, 101, -1),  # ArgumentList
+    (4, 4, -1, 4, 4, 4, 102, 4, 4, 4, 4, -1, 4, 4, 4, 4, 4, 4, 4, 4, -1, 4, -1, 4, -1, 4, -1, -1),  # ArgumentTail
+    (-1, -1, 103, -1, -1, 104, -1, 105, -1, -1, -1, -1, -1, -1, -1, 106, 107, -1, -1, -1, 108, 109, 110, 111, 112, 113, 114, -1),  # ListRest
+    (-1, -1, 115, -1, -1, 116, -1, 117, -1, -1, -1, -1, -1, -1, -1, 118, 119, -1, -1, -1, 120, -1, 121, 122, 123, 124, 125, -1),  # ExpressionList
+    (-1, -1, -1, -1, -1, -1, 126, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, 4, -1, -1, -1, -1, -1, -1),  # ExpressionTail
+)
+
+# (índice em PREDICADOS, expansão se o predicado é verdadeiro, expansão senão ou -1)
+CELULAS_COM_PREDICADO = ((0, 127, -1), (0, 128, 90), (0, 129, 90), (0, 130, 90), (0, 131, 90), (0, 132, -1), (0, 133, -1), (0, 134, 90), (0, 135, -1), (0, 136, 90), (0, 137, -1))
+
+# VAZIAS[não terminal]: expansão da produção que deriva ε (-1 = não anulável); numa
+# célula de erro o parser segue por ela, como a descida recursiva, que só acusa o
+# erro no próximo símbolo obrigatório
+VAZIAS = (138, 4, -1, -1, -1, -1, -1, 4, -1, -1, 4, -1, -1, 4, -1, -1, -1, -1, 90, -1, 4, -1, -1, 4)
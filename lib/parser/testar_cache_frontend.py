@@ -0,0 +1,148 @@
+"""
+Teste do cache do front end (cache_frontend.py):
+
+- MODULOS_DO_FRONTEND é exatamente o conjunto de módulos do repositório que o
+  front end importa (senão uma mudança num módulo esquecido não invalidaria o cache);
+- em programas aleatórios, a execução com o cache quente dá a mesma AST, a mesma
+  análise semântica, a mesma saída do interpretador e o mesmo LLVM IR que sem
+  cache; programas com ParseError lançam o erro e não deixam entrada;
+- mudar o código, as opções do parser ou a versão do compilador invalida a entrada;
+- entrada corrompida vale como ausente; AST aninhada demais para o pickle funciona
+  sem cache;
+- o diretório respeita o limite de tamanho, removendo as entradas usadas há mais
+  tempo (LRU).
+
+Uso:
+    python testar_cache_frontend.py [quantidade_de_programas]
+"""
+
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lexer', 'afds'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+import cache_frontend
+from parser import ParseError
+from interpreter import Interpreter
+from code_generator import CodeGenerator
+from testar_pratt import PALAVRAS_CHAVE, programa
+
+
+def falhar(mensagem):
+    print(f"DIFERENÇA: {mensagem}")
+    sys.exit(1)
+
+
+def entradas():
+    return sorted(nome for nome in os.listdir(cache_frontend.FRONTEND_CACHE_DIR) if nome.endswith(".pickle"))
+
+
+def resultado(texto, pratt=False, usar_cache=True):
+    """(from_cache, tudo o que o front end e as etapas seguintes produzem) ou None se ParseError."""
+    try:
+        frontend = cache_frontend.analisar_frontend(texto, PALAVRAS_CHAVE, pratt, usar_cache)
+    except ParseError as e:
+        return None, str(e)
+    ast, analise = frontend['ast'], frontend['analysis']
+    saida = [ast, frontend['parse_errors'], analise['errors'], analise['warnings'],
+             sorted((nome, tipo.value) for nome, tipo in analise['symbols'].items())]
+    for etapa in (lambda: Interpreter().interpret(ast), lambda: CodeGenerator().generate(ast)):
+        try:
+            saida.append(etapa())
+        except Exception as e:
+            saida.append(f"{type(e).__name__}: {e}")
+    return frontend['from_cache'], saida
+
+
+def conferir_modulos():
+    codigo = ("import sys; sys.path[:0] = sys.argv[2:]; antes = set(sys.modules)\n"
+              "import parser, semantic_analyzer\n"
+              "print('\\n'.join(sorted(m for m in set(sys.modules) - antes\n"
+              "                        if getattr(sys.modules[m], '__file__', None)\n"
+              "                        and sys.modules[m].__file__.startswith(sys.argv[1]))))")
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    saida = subprocess.run([sys.executable, "-c", codigo, raiz,
+                            os.path.join(raiz, 'lexer', 'afds'), os.path.join(raiz, 'parser')],
+                           capture_output=True, text=True, check=True).stdout.split()
+    listados = sorted(os.path.basename(caminho)[:-3] for caminho in cache_frontend.MODULOS_DO_FRONTEND)
+    if sorted(saida + ["cache_frontend"]) != listados:
+        falhar(f"MODULOS_DO_FRONTEND {listados} != módulos importados {saida}")
+
+
+def main(quantidade=500):
+    conferir_modulos()
+    rnd = random.Random(2033)
+    diretorio = tempfile.mkdtemp(prefix="lsd_frontend_")
+    cache_frontend.FRONTEND_CACHE_DIR = diretorio
+    try:
+        # quente == frio == sem cache
+        exemplos = [os.path.join(os.path.dirname(__file__), '..', '..', nome)
+                    for nome in ("exemplo_completo.lsd", "gerar_llvm.lsd")]
+        textos = [open(caminho, encoding="utf-8").read() for caminho in exemplos]
+        textos += [programa(rnd) for _ in range(quantidade)]
+        for n, texto in enumerate(textos):
+            pratt = rnd.random() < 0.5
+            esperado = resultado(texto, pratt, usar_cache=False)
+            frio = resultado(texto, pratt)
+            quente = resultado(texto, pratt)
+            if esperado[0] is None:
+                if frio != esperado or quente != esperado:
+                    falhar(f"ParseError diferente com cache no programa {n}\n{texto}")
+                continue
+            if frio != (False, esperado[1]) or quente != (True, esperado[1]):
+                falhar(f"resultado diferente com cache no programa {n} (acertos {frio[0]}, {quente[0]})\n{texto}")
+        validos = len(entradas())
+
+        # invalidação: código, opções do parser e versão do compilador entram na chave
+        texto = textos[0] + "\nPrint 99"
+        resultado(texto)
+        if resultado(texto + "\n")[0] or resultado(texto, pratt=True)[0]:
+            falhar("código ou opção diferente acertou o cache")
+        versao = cache_frontend.versao_do_compilador()
+        cache_frontend._versao_do_compilador = versao + "-editado"
+        if resultado(texto)[0] or not resultado(texto)[0]:
+            falhar("versão do compilador diferente acertou o cache (ou não guardou)")
+        cache_frontend._versao_do_compilador = versao
+
+        # entrada corrompida = ausente, e é regravada
+        caminho = cache_frontend._frontend_cache_path(cache_frontend.frontend_cache_key(texto, PALAVRAS_CHAVE))
+        with open(caminho, "wb") as f:
+            f.write(b"\x80\x05lixo")
+        if resultado(texto) != resultado(texto, usar_cache=False) or not resultado(texto)[0]:
+            falhar("entrada corrompida não foi tratada como ausente")
+
+        # AST aninhada demais para o pickle: funciona, sem entrada nova
+        antes = entradas()
+        fundo = "x = " + "(" * 5000 + "1" + ")" * 5000 + "\nPrint x"
+        if resultado(fundo)[0] is not False or resultado(fundo)[1][-2] != ["1"] or entradas() != antes:
+            falhar("AST profunda")
+
+        # LRU: com limite de 4 entradas, a usada por último sobrevive e as mais antigas saem
+        cache_frontend.limpar_cache()
+        pequenos = [f"x = {n}\nPrint x" for n in range(1, 9)]
+        for n, texto in enumerate(pequenos[:4]):
+            resultado(texto)
+            caminho = cache_frontend._frontend_cache_path(cache_frontend.frontend_cache_key(texto, PALAVRAS_CHAVE))
+            os.utime(caminho, ns=(n * 10**9, n * 10**9))  # mtimes distintos mesmo com relógio grosseiro
+        tamanho = max(os.path.getsize(os.path.join(diretorio, nome)) for nome in entradas())
+        cache_frontend.FRONTEND_CACHE_MAX_BYTES = 4 * tamanho
+        if not resultado(pequenos[0])[0]:  # acerto: pequenos[0] passa a ser o usado por último
+            falhar("entrada do LRU não acertou")
+        resultado(pequenos[4])
+        resultado(pequenos[5])
+        acertos = [resultado(texto)[0] for texto in (pequenos[0], pequenos[4], pequenos[5], pequenos[3])]
+        if acertos != [True, True, True, True] or resultado(pequenos[1])[0] or len(entradas()) > 4:
+            falhar(f"LRU: acertos {acertos}, {len(entradas())} entradas")
+    finally:
+        shutil.rmtree(diretorio, ignore_errors=True)
+    print(f"OK: {len(textos)} programas ({validos} no cache) iguais com cache quente, frio e sem cache; "
+          "invalidação e LRU")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
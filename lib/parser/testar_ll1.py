@@ -0,0 +1,163 @@
+"""
+Teste diferencial do parser por tabela, Parser(lexer, ll1=True):
+
+- tabela_ll1.py é o que gerar_tabela_ll1.py gera hoje de docs/grammar.md (a
+  tabela não ficou para trás depois de uma edição da gramática);
+- em programas aleatórios (os de testar_pratt.py, mais entradas com palavras-chave
+  extras e blocos fechados por outras palavras-chave), com e sem pratt, a tabela
+  dá a mesma AST que a descida recursiva, e ParseError nas mesmas entradas, com a
+  mesma mensagem, linha e coluna (também em erros escritos à mão, como If sem End);
+- aninhamento fundo não esbarra no limite de recursão;
+- ll1=True recusa recuperar=True e lexers sem If/Print/End como palavras-chave.
+
+Uso:
+    python testar_ll1.py [quantidade_de_programas]
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lexer', 'afds'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lexer3 import Lexer
+from parser import Parser, ParseError
+import gerar_tabela_ll1
+from testar_pratt import OPERADORES, PALAVRAS_CHAVE, SOLTOS, VARIAVEIS, programa
+
+# "Total" é uma palavra-chave extra (kind KEYWORD): vale como nome em expressões
+PALAVRAS_CHAVE_LL1 = PALAVRAS_CHAVE + ["Total"]
+SOLTOS_LL1 = SOLTOS + ["CalculateMean", "CalculateSum", "Total", "2.5", "y"]
+
+
+# programas inválidos escritos à mão: um por tipo de erro da descida recursiva
+INVALIDOS = [
+    "x = 1 y", "x = 1\ny + 2", "x", "If x > 1\nPrint x\n", "If x > 1\nPrint x\n)",
+    "If x\nx = 1\n(", "Print (1 + )", "Print (1", "Print 1)", 'Print "a")', "x = [1, 2",
+    "x = [1, 2 3)", "x = [", "x = [)", "Print", "Print End", "Print If", "x = ", "x = End",
+    "x = CalculateSum 1, )", "x = 1 +", "x = (1 + 2", ") x = 1", "End", "x = 1\nEnd",
+]
+
+
+def falhar(mensagem):
+    print(f"DIFERENÇA: {mensagem}")
+    sys.exit(1)
+
+
+def expressao_valida(rnd, profundidade=0):
+    """Como testar_pratt.expressao, mas as chamadas começam por um argumento que o
+    parser reconhece (literal ou nome seguido de vírgula): quase sempre sem ParseError."""
+    escolha = rnd.random()
+    if profundidade > 3 or escolha < 0.3:
+        return rnd.choice([str(rnd.randint(1, 9)), f"{rnd.randint(1, 9)}.5", '"s"', "Total"] + VARIAVEIS)
+    if escolha < 0.6:
+        return (f"{expressao_valida(rnd, profundidade + 1)} {rnd.choice(OPERADORES)} "
+                f"{expressao_valida(rnd, profundidade + 1)}")
+    if escolha < 0.7:
+        return f"{rnd.choice('+-')} {expressao_valida(rnd, profundidade + 1)}"
+    if escolha < 0.8:
+        return f"({expressao_valida(rnd, profundidade + 1)})"
+    if escolha < 0.9:
+        return "[" + ", ".join(expressao_valida(rnd, profundidade + 1) for _ in range(rnd.randint(0, 3))) + "]"
+    argumentos = [rnd.choice(VARIAVEIS + ["1", '"s"'])]
+    argumentos += [expressao_valida(rnd, profundidade + 1) for _ in range(rnd.randint(1, 2))]
+    return f"{rnd.choice(['CalculateMean', 'CalculateSum', 'Total'])} {', '.join(argumentos)}"
+
+
+def programa_valido(rnd, profundidade=0):
+    linhas = []
+    for _ in range(rnd.randint(1, 6)):
+        escolha = rnd.random()
+        if escolha < 0.45:
+            linhas.append(f"{rnd.choice(VARIAVEIS)} = {expressao_valida(rnd)}")
+        elif escolha < 0.6:
+            linhas.append(f'Print "texto {rnd.randint(0, 9)}"')
+        elif escolha < 0.8 or profundidade > 2:
+            # Print "s" ... é sempre o Print de string: a expressão não começa por string
+            valor = expressao_valida(rnd)
+            linhas.append(f"Print ({valor})" if valor.startswith('"') else f"Print {valor}")
+        else:
+            corpo = programa_valido(rnd, profundidade + 1) if rnd.random() < 0.8 else ""
+            linhas.append(f"If {expressao_valida(rnd)}\n{corpo}\nEnd")
+    return "\n".join(linhas)
+
+
+def programa_ll1(rnd):
+    escolha = rnd.random()
+    if escolha < 0.3:
+        return programa(rnd)
+    if escolha < 0.45:
+        return " ".join(rnd.choice(SOLTOS_LL1) for _ in range(rnd.randint(1, 30)))
+    if escolha < 0.85:
+        return programa_valido(rnd)
+    # If fechado por palavra-chave que não é End, e nomes que são palavras-chave extras
+    fim = rnd.choice(["End", "End", "CalculateMean", "Total"])
+    return (f"If {expressao_valida(rnd)} + Total\nx = Total 1, {expressao_valida(rnd)}\n{fim}\n"
+            f"Print CalculateSum Total, {expressao_valida(rnd)}")
+
+
+def achatar(raiz):
+    """Nós e valores da AST em pré-ordem, sem recursão (o __eq__ das dataclasses é recursivo)."""
+    saida, pilha = [], [raiz]
+    while pilha:
+        atual = pilha.pop()
+        if isinstance(atual, (list, tuple)):
+            saida.append((type(atual).__name__, len(atual)))
+            pilha.extend(reversed(atual))
+        elif hasattr(atual, "__dataclass_fields__"):
+            saida.append(type(atual).__name__)
+            pilha.extend(getattr(atual, campo) for campo in reversed(atual.__dataclass_fields__))
+        else:
+            saida.append(atual)
+    return saida
+
+
+def analisar(texto, pratt, ll1):
+    parser = Parser(Lexer(palavras_chave=PALAVRAS_CHAVE_LL1), pratt=pratt, ll1=ll1)
+    try:
+        return achatar(parser.parse(texto)), parser.errors
+    except ParseError:
+        return ParseError, parser.errors  # os erros léxicos e a mensagem do ParseError
+
+
+def conferir_tabela():
+    with open(gerar_tabela_ll1.GRAMATICA_PADRAO, encoding="utf-8") as f:
+        esperado = gerar_tabela_ll1.gerar_tabela(gerar_tabela_ll1.bloco_da_gramatica(f.read()))
+    with open(gerar_tabela_ll1.SAIDA_PADRAO, encoding="utf-8") as f:
+        if f.read() != esperado:
+            falhar("tabela_ll1.py desatualizada: rode python gerar_tabela_ll1.py")
+
+
+def main(quantidade=3000):
+    conferir_tabela()
+    rnd = random.Random(2034)
+    exemplos = [os.path.join(os.path.dirname(__file__), '..', '..', nome)
+                for nome in ("exemplo_completo.lsd", "gerar_llvm.lsd")]
+    textos = [open(caminho, encoding="utf-8").read() for caminho in exemplos] + INVALIDOS
+    textos += [programa_ll1(rnd) for _ in range(quantidade)]
+    textos.append("x = " + "(" * 5000 + "-" * 5000 + "1" + ")" * 5000 + "\nPrint x")
+    for texto in INVALIDOS:
+        if analisar(texto, False, ll1=False)[0] is not ParseError:
+            falhar(f"programa inválido sem ParseError: {texto!r}")
+    com_erro = 0
+    for n, texto in enumerate(textos):
+        for pratt in (False, True):
+            esperado = analisar(texto, pratt, ll1=False)
+            if analisar(texto, pratt, ll1=True) != esperado:
+                falhar(f"AST ou erros diferentes no programa {n} (pratt={pratt}):\n{texto}\n"
+                       f"descida recursiva: {esperado[1]}\ntabela: {analisar(texto, pratt, ll1=True)[1]}")
+        com_erro += esperado[0] is ParseError
+
+    for opcoes in ({"recuperar": True}, {"lexer": Lexer(palavras_chave=["Print", "End"])}):
+        try:
+            Parser(**{"lexer": Lexer(), **opcoes}, ll1=True)
+        except ValueError:
+            continue
+        falhar(f"ll1=True aceitou {opcoes}")
+    print(f"OK: {len(textos)} programas ({com_erro} com ParseError), tabela LL(1) igual à "
+          "descida recursiva com e sem pratt")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3000)
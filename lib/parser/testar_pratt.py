@@ -0,0 +1,119 @@
+"""
+Teste diferencial do modo Parser(lexer, pratt=True): em programas aleatórios
+(expressões com todos os operadores, parênteses, unários encadeados, listas,
+chamadas e também entradas com erros de sintaxe), a AST compacta
+(BinaryOp/UnaryOp) deve dar os mesmos erros de parsing, a mesma análise
+semântica, a mesma saída do interpretador e o mesmo LLVM IR que a AST com os
+níveis da gramática.
+
+Uso:
+    python testar_pratt.py [quantidade_de_programas]
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lexer', 'afds'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lexer3 import Lexer
+from parser import Parser, ParseError
+from lsd_ast import (
+    RelationalExpression, AdditiveExpression, MultiplicativeExpression, UnaryExpression
+)
+from semantic_analyzer import SemanticAnalyzer
+from interpreter import Interpreter
+from code_generator import CodeGenerator
+
+PALAVRAS_CHAVE = ["If", "Print", "End", "CalculateMean", "CalculateSum"]
+OPERADORES = [">", "<", ">=", "<=", "==", "!=", "+", "-", "*", "/"]
+VARIAVEIS = ["x", "y", "soma", "media"]
+# pedaços para as entradas com erro
+SOLTOS = OPERADORES + ["(", ")", "[", "]", ",", "If", "End", "Print", "=", "1", "x", '"s"', "\n"]
+
+
+def expressao(rnd, profundidade=0):
+    escolha = rnd.random()
+    if profundidade > 3 or escolha < 0.3:
+        return rnd.choice([str(rnd.randint(0, 9)), f"{rnd.randint(0, 9)}.5", '"s"'] + VARIAVEIS)
+    if escolha < 0.65:
+        return f"{expressao(rnd, profundidade + 1)} {rnd.choice(OPERADORES)} {expressao(rnd, profundidade + 1)}"
+    if escolha < 0.75:
+        return f"{rnd.choice('+-')} {expressao(rnd, profundidade + 1)}"
+    if escolha < 0.85:
+        return f"({expressao(rnd, profundidade + 1)})"
+    if escolha < 0.93:
+        return "[" + ", ".join(expressao(rnd, profundidade + 1) for _ in range(rnd.randint(0, 3))) + "]"
+    # chamada sem parênteses: CalculateMean valores / CalculateSum x, 1
+    argumentos = ", ".join(expressao(rnd, profundidade + 1) for _ in range(rnd.randint(1, 2)))
+    return f"{rnd.choice(['CalculateMean', 'CalculateSum'])} {argumentos}"
+
+
+def programa(rnd):
+    if rnd.random() < 0.2:
+        return " ".join(rnd.choice(SOLTOS) for _ in range(rnd.randint(1, 30)))
+    linhas = []
+    for _ in range(rnd.randint(1, 8)):
+        escolha = rnd.random()
+        if escolha < 0.5:
+            linhas.append(f"{rnd.choice(VARIAVEIS)} = {expressao(rnd)}")
+        elif escolha < 0.75:
+            linhas.append(f"Print {expressao(rnd)}")
+        else:
+            linhas.append(f"If {expressao(rnd)}\n{rnd.choice(VARIAVEIS)} = {expressao(rnd)}\nEnd")
+    return "\n".join(linhas)
+
+
+def executar(texto, pratt):
+    parser = Parser(Lexer(palavras_chave=PALAVRAS_CHAVE), pratt=pratt)
+    try:
+        ast = parser.parse(texto)
+    except ParseError as e:
+        return ("ParseError", str(e), parser.errors), None
+    analise = SemanticAnalyzer().analyze(ast)
+    saida = [parser.errors, analise['errors'], analise['warnings'],
+             sorted((nome, tipo.value) for nome, tipo in analise['symbols'].items())]
+    for etapa in (lambda: Interpreter().interpret(ast), lambda: CodeGenerator().generate(ast)):
+        try:
+            saida.append(etapa())
+        except Exception as e:
+            saida.append(f"{type(e).__name__}: {e}")
+    return saida, ast
+
+
+def sem_niveis(node):
+    """True se a AST compacta não tem nenhum nó dos níveis da gramática."""
+    niveis = (RelationalExpression, AdditiveExpression, MultiplicativeExpression, UnaryExpression)
+    pilha = [node]
+    while pilha:
+        atual = pilha.pop()
+        if isinstance(atual, niveis):
+            return False
+        if isinstance(atual, list):
+            pilha.extend(atual)
+        elif hasattr(atual, "__dataclass_fields__"):
+            pilha.extend(getattr(atual, campo) for campo in atual.__dataclass_fields__)
+    return True
+
+
+def main(quantidade=2000):
+    rnd = random.Random(2025)
+    exemplos = [os.path.join(os.path.dirname(__file__), '..', '..', nome)
+                for nome in ("exemplo_completo.lsd", "gerar_llvm.lsd")]
+    textos = [open(caminho, encoding="utf-8").read() for caminho in exemplos]
+    textos += [programa(rnd) for _ in range(quantidade)]
+    for n, texto in enumerate(textos):
+        esperado, _ = executar(texto, pratt=False)
+        obtido, ast = executar(texto, pratt=True)
+        if obtido != esperado:
+            print(f"DIFERENÇA no programa {n}:\n{texto}")
+            sys.exit(1)
+        if ast is not None and not sem_niveis(ast):
+            print(f"AST do modo pratt com nós de nível no programa {n}:\n{texto}")
+            sys.exit(1)
+    print(f"OK: {len(textos)} programas, AST compacta (pratt) equivalente à AST com níveis")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
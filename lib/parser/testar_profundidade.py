@@ -0,0 +1,82 @@
+"""
+Teste de aninhamento profundo: parênteses, unários encadeados, operações
+encadeadas e If ... End aninhados, com profundidade bem acima do limite de
+recursão do Python, devem passar pelo parser (nos dois modos), pela análise
+semântica, pelo interpretador e pelo gerador de LLVM IR sem RecursionError e
+com o resultado esperado.
+
+Uso:
+    python testar_profundidade.py [profundidade]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lexer', 'afds'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lexer3 import Lexer
+from parser import Parser
+from lsd_ast import ConditionalStatement
+from semantic_analyzer import SemanticAnalyzer
+from interpreter import Interpreter
+from code_generator import CodeGenerator
+
+
+def programas(profundidade):
+    """(nome, texto, saída esperada do interpretador)"""
+    par = profundidade % 2 == 0
+    return [
+        ("parênteses", "x = " + "(" * profundidade + "1 + 2" + ")" * profundidade + "\nPrint x", ["3"]),
+        ("unários", "x = " + "- " * profundidade + "5\nPrint x", ["5" if par else "-5"]),
+        ("somas", "x = 1" + " + 1" * profundidade + "\nPrint x", [str(profundidade + 1)]),
+        ("listas", "x = " + "[" * profundidade + "1" + "]" * profundidade + "\nPrint 1", ["1"]),
+        ("ifs", "x = 1\n" + "If x == 1\n" * profundidade + "Print x\n" + "End\n" * profundidade, ["1"]),
+        ("ifs falsos", "x = 1\n" + "If x > 1\n" * profundidade + "Print x\n" + "End\n" * profundidade, []),
+    ]
+
+
+def profundidade_dos_ifs(program):
+    """Quantos If aninhados há no primeiro If do programa (sem recursão)."""
+    nivel = 0
+    statements = program.statements
+    while True:
+        ifs = [s for s in statements if isinstance(s, ConditionalStatement)]
+        if not ifs:
+            return nivel
+        nivel += 1
+        statements = ifs[0].body
+
+
+def main(profundidade=100000):
+    for nome, texto, esperado in programas(profundidade):
+        for pratt in (False, True):
+            modo = f"{nome}, {'pratt' if pratt else 'níveis'}"
+            parser = Parser(Lexer(), pratt=pratt)
+            ast = parser.parse(texto)
+            if parser.errors:
+                print(f"DIFERENÇA ({modo}): erros de parsing {parser.errors[:3]}")
+                sys.exit(1)
+            if nome.startswith("ifs") and profundidade_dos_ifs(ast) != profundidade:
+                print(f"DIFERENÇA ({modo}): {profundidade_dos_ifs(ast)} If aninhados")
+                sys.exit(1)
+            analise = SemanticAnalyzer().analyze(ast)
+            if analise['errors']:
+                print(f"DIFERENÇA ({modo}): erros semânticos {analise['errors'][:3]}")
+                sys.exit(1)
+            saida = Interpreter().interpret(ast)
+            if saida != esperado:
+                print(f"DIFERENÇA ({modo}): saída {saida[:3]}, esperado {esperado}")
+                sys.exit(1)
+            if nome != "listas":
+                llvm = CodeGenerator().generate(ast)
+                ramos = llvm.count("br i1 ")
+                if "ret i32 0" not in llvm or ramos != (profundidade if nome.startswith("ifs") else 0):
+                    print(f"DIFERENÇA ({modo}): LLVM IR incompleto ({ramos} branches)")
+                    sys.exit(1)
+    print(f"OK: aninhamento de profundidade {profundidade} sem recursão no parser, "
+          "na análise, no interpretador e no gerador de código")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
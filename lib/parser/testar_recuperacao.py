@@ -0,0 +1,103 @@
+"""
+Teste do modo Parser(lexer, recuperar=True):
+
+- em programas aleatórios (válidos e com erros), o modo com recuperação nunca
+  lança ParseError; sem erros ele dá a mesma AST que o modo normal, e com erros
+  o primeiro erro de sintaxe é o mesmo que o modo normal lança;
+- em programas válidos com erros semeados em linhas sorteadas, uma só passada
+  acha um erro por linha semeada, na linha certa.
+
+Uso:
+    python testar_recuperacao.py [quantidade_de_programas]
+"""
+
+import os
+import random
+import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lexer', 'afds'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lexer3 import Lexer
+from parser import Parser, ParseError
+from lsd_ast import ErrorStatement, ErrorExpression
+from testar_pratt import PALAVRAS_CHAVE, programa
+
+
+def analisar(texto, recuperar, pratt=False):
+    parser = Parser(Lexer(palavras_chave=PALAVRAS_CHAVE), pratt=pratt, recuperar=recuperar)
+    try:
+        return parser.parse(texto), parser.errors
+    except ParseError:
+        return None, parser.errors
+
+
+def semear(rnd, texto, quantidade):
+    """
+    Insere " * " depois da primeira palavra de até `quantidade` linhas (menos as "End"),
+    sem duas linhas seguidas: o modo pânico pula a linha com erro até o próximo início
+    de statement, e uma linha seguinte com erro não começa statement. Cada linha
+    semeada vira exatamente um erro de sintaxe. Retorna o texto e as linhas semeadas.
+    """
+    linhas = texto.split("\n")
+    candidatas = [n for n, linha in enumerate(linhas) if linha.strip() and linha.strip() != "End"]
+    escolhidas = []
+    for n in sorted(rnd.sample(candidatas, min(quantidade, len(candidatas)))):
+        if not escolhidas or escolhidas[-1] + 1 < n:
+            escolhidas.append(n)
+    for n in escolhidas:
+        primeira, _, resto = linhas[n].partition(" ")
+        linhas[n] = f"{primeira} * {resto}"
+    return "\n".join(linhas), [n + 1 for n in escolhidas]
+
+
+def nos_de_erro(ast):
+    pilha = list(ast.statements)
+    contagem = 0
+    while pilha:
+        node = pilha.pop()
+        if isinstance(node, ErrorStatement):
+            contagem += 1
+        elif hasattr(node, "body"):
+            contagem += isinstance(node.condition, ErrorExpression)
+            pilha.extend(node.body)
+    return contagem
+
+
+def main(quantidade=2000):
+    rnd = random.Random(2029)
+    validos = []
+    for n in range(quantidade):
+        texto = programa(rnd)
+        pratt = rnd.random() < 0.5
+        esperado, erros_esperados = analisar(texto, False, pratt)
+        obtido, erros = analisar(texto, True, pratt)
+        if obtido is None:
+            print(f"DIFERENÇA no programa {n}: ParseError com recuperar=True\n{texto}")
+            sys.exit(1)
+        if esperado is not None:
+            if obtido != esperado or erros != erros_esperados:
+                print(f"DIFERENÇA no programa {n}: AST ou erros diferentes sem erros de sintaxe\n{texto}")
+                sys.exit(1)
+            validos.append(texto)
+        elif erros[:len(erros_esperados)] != erros_esperados or nos_de_erro(obtido) != len(erros) - len(erros_esperados) + 1:
+            print(f"DIFERENÇA no programa {n}: primeiro erro ou nós de erro\n{texto}\n{erros_esperados}\n{erros}")
+            sys.exit(1)
+
+    semeados = 0
+    for n in range(quantidade // 10):
+        texto = "\n".join(rnd.sample(validos, rnd.randint(2, 10)))
+        texto, linhas = semear(rnd, texto, rnd.randint(1, 12))
+        ast, erros = analisar(texto, True, rnd.random() < 0.5)
+        obtidas = [int(re.search(r"at line (\d+)", erro).group(1))
+                   for erro in erros if not erro.startswith("Erro léxico")]
+        if obtidas != linhas or nos_de_erro(ast) != len(linhas):
+            print(f"DIFERENÇA no texto semeado {n}: linhas {linhas}, erros {erros}\n{texto}")
+            sys.exit(1)
+        semeados += len(linhas)
+    print(f"OK: {quantidade} programas aleatórios e {semeados} erros semeados achados em uma passada")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
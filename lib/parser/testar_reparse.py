@@ -0,0 +1,98 @@
+"""
+Teste diferencial de Parser.reparse: em programas aleatórios, cada edição
+(inserir um statement, trocar um número, apagar ou trocar uma linha, lixo em
+posição sorteada) reaplicada sobre o Program anterior deve dar — depois de
+materializar() as linhas pendentes — a mesma AST que o parse completo do texto
+editado, nos dois modos (níveis e pratt) e com recuperar=True; e quando o
+parse completo lança ParseError, o reparse também lança.
+
+Uso:
+    python testar_reparse.py [quantidade_de_programas]
+"""
+
+import copy
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lexer', 'afds'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lexer3 import Lexer
+from parser import Parser, ParseError
+from testar_pratt import PALAVRAS_CHAVE
+
+SEPARADORES = ["\n", "\n", "\n\n", " ", "\n// comentário\n"]
+LIXO = ["", "\n", "x = 1\n", " + 1", "If x > 2\n", "End\n", "Print 2\n", "y", "7", "\nz = 3", "\n\n", " ", "$"]
+
+
+def statement(rnd, profundidade=0):
+    escolha = rnd.random()
+    if escolha < 0.5:
+        return f"{rnd.choice('xyz')} = {rnd.randint(1, 9)} + {rnd.choice('xyz')}"
+    if escolha < 0.75 or profundidade > 2:
+        return "Print " + rnd.choice(["x", "1", '"s"'])
+    corpo = [statement(rnd, profundidade + 1) for _ in range(rnd.randint(0, 3))]
+    return "\n".join(["If x > 1"] + corpo + ["End"])
+
+
+def edicao(rnd, texto):
+    """(inicio, fim, texto_novo) de uma edição sorteada."""
+    quebras = [0] + [k + 1 for k, ch in enumerate(texto) if ch == "\n"]
+    digitos = [k for k, ch in enumerate(texto) if ch.isdigit()]
+    escolha = rnd.random()
+    if escolha < 0.3:
+        inicio = rnd.choice(quebras)
+        return inicio, inicio, statement(rnd) + "\n"
+    if escolha < 0.6 and digitos:
+        inicio = rnd.choice(digitos)
+        return inicio, inicio + 1, rnd.choice(["5", "12", "(3 * 4)", "1\n"])
+    if escolha < 0.75:
+        inicio = rnd.choice(quebras)
+        return inicio, texto.find("\n", inicio) + 1 or len(texto), rnd.choice(["", "Print 5\n"])
+    inicio = rnd.randint(0, len(texto))
+    return inicio, min(len(texto), inicio + rnd.choice([0, 0, 1, 3, 10])), rnd.choice(LIXO)
+
+
+def analisar(parser, funcao, *argumentos):
+    try:
+        return funcao(*argumentos), parser.errors
+    except ParseError:
+        return None, parser.errors
+
+
+def main(quantidade=400):
+    rnd = random.Random(2031)
+    lexer = Lexer(palavras_chave=PALAVRAS_CHAVE)
+    edicoes = reparses_com_erro = 0
+    for n in range(quantidade):
+        pratt = rnd.random() < 0.5
+        recuperar = rnd.random() < 0.3
+        texto = rnd.choice(SEPARADORES).join(statement(rnd) for _ in range(rnd.randint(1, 15)))
+        programa = Parser(lexer, pratt=pratt, recuperar=recuperar).parse(texto)
+        for _ in range(20):
+            inicio, fim, novo = edicao(rnd, texto)
+            editado = texto[:inicio] + novo + texto[fim:]
+            parser = Parser(lexer, pratt=pratt, recuperar=recuperar)
+            esperado, erros_esperados = analisar(parser, parser.parse, editado)
+            parser = Parser(lexer, pratt=pratt, recuperar=recuperar)
+            obtido, erros = analisar(parser, parser.reparse, programa, texto, (inicio, fim), novo)
+            edicoes += 1
+            if esperado is None:
+                if obtido is not None:
+                    print(f"DIFERENÇA no programa {n}: reparse sem ParseError\n{texto!r} {(inicio, fim)} {novo!r}")
+                    sys.exit(1)
+                reparses_com_erro += 1
+                break
+            materializado = copy.deepcopy(obtido)
+            materializado.materializar()
+            if materializado != esperado or erros != erros_esperados:
+                print(f"DIFERENÇA no programa {n}: AST ou erros\n{texto!r} {(inicio, fim)} {novo!r}")
+                sys.exit(1)
+            programa, texto = obtido, editado
+    print(f"OK: {edicoes} edições em {quantidade} programas, reparse igual ao parse completo "
+          f"({reparses_com_erro} com ParseError nos dois)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 400)